@@ -207,6 +207,28 @@ parser_download.add_argument(
     metavar="YYYY-MM-DD",
     help="explicit start date for incremental strategies (overrides cache query)",
 )
+parser_download.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    default=None,
+    metavar="N",
+    help="number of concurrent downloads per template, or of concurrent tasks "
+    "with --plan (default: 1, or the plan's defaults.parallelism); "
+    "requests stay capped and rate limited per host",
+)
+parser_download.add_argument(
+    "--process",
+    action="store_true",
+    help="process entries as they download, overlapping network and parsing",
+)
+parser_download.add_argument(
+    "--process-jobs",
+    type=int,
+    default=4,
+    metavar="N",
+    help="number of processing threads with --process (default: 4)",
+)
 add_verbosity_args(parser_download)
 
 parser_import = subparsers.add_parser(
@@ -254,6 +276,21 @@ parser_process.add_argument(
     action="store_true",
     help="show skipped (cached) entries in progress display; default: hidden",
 )
+parser_process.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    default=4,
+    metavar="N",
+    help="number of entries processed concurrently (default: 4)",
+)
+parser_process.add_argument(
+    "--executor",
+    choices=["thread", "process"],
+    default="thread",
+    help="run parsing in worker threads (default) or worker processes; "
+    "processes use several cores for pandas/lxml-heavy templates",
+)
 add_verbosity_args(parser_process)
 
 parser_create_views = subparsers.add_parser(
@@ -605,6 +642,26 @@ parser_cache_drop.add_argument(
     help="skip confirmation prompt",
 )
 
+parser_cache_compact = cache_subparsers.add_parser(
+    "compact",
+    help="summarize old download trials and vacuum the metadata database",
+)
+parser_cache_compact.add_argument(
+    "--days",
+    type=int,
+    default=None,
+    metavar="DAYS",
+    help=(
+        "keep every trial newer than this many days "
+        "(default: [trial_retention] days in config.toml, else 90)"
+    ),
+)
+parser_cache_compact.add_argument(
+    "--no-vacuum",
+    action="store_true",
+    help="skip VACUUM (faster; the file does not shrink)",
+)
+
 
 def _format_datasets_table(datasets) -> str:
     """Format datasets as a table string."""
@@ -988,6 +1045,12 @@ def _run_command(args) -> None:  # noqa: PLR0912, PLR0915
                 file=sys.stderr,
             )
             sys.exit(1)
+        if plan_file and args.process:
+            print(
+                "Error: --process is not supported with --plan",
+                file=sys.stderr,
+            )
+            sys.exit(1)
         if not plan_file and not templates:
             print(
                 "Error: either --plan or at least one template name is required",
@@ -1032,6 +1095,7 @@ def _run_command(args) -> None:  # noqa: PLR0912, PLR0915
                     calendar_override=args.calendar,
                     verbosity=verbosity,
                     report_file=report_file,
+                    parallelism=args.jobs,
                 )
             except ValueError as exc:
                 print(f"Error: {exc}", file=sys.stderr)
@@ -1059,6 +1123,9 @@ def _run_command(args) -> None:  # noqa: PLR0912, PLR0915
                     calendar=calendar,
                     verbosity=verbosity,
                     report_file=report_file,
+                    max_workers=args.jobs or 1,
+                    process=args.process,
+                    process_workers=args.process_jobs,
                     **({"since": since} if since else {}),
                     **download_kwargs,
                 )
@@ -1098,7 +1165,9 @@ def _run_command(args) -> None:  # noqa: PLR0912, PLR0915
                     reprocess=args.reprocess,
                     verbosity=verbosity,
                     report_file=report_file,
+                    max_workers=args.jobs,
                     show_skipped=args.show_skipped,
+                    executor=args.executor,
                 )
     elif args.command == "create-views":
         layers = [args.layer] if hasattr(args, "layer") and args.layer else None
@@ -1572,6 +1641,20 @@ def _run_command(args) -> None:  # noqa: PLR0912, PLR0915
                 print(str(e), file=sys.stderr)
                 sys.exit(1)
             print(f"Dropped cache entry {args.meta_id}.")
+        elif args.cache_command == "compact":
+            from .engine.compaction import compact_meta_db
+
+            result = compact_meta_db(days=args.days, vacuum=not args.no_vacuum)
+            print(
+                f"Summarized {result.trials_summarized} of "
+                f"{result.trials_before} download trials "
+                f"({result.trials_kept} kept)."
+            )
+            if not args.no_vacuum:
+                print(
+                    f"meta.db: {result.bytes_before / 1e6:.1f} MB -> "
+                    f"{result.bytes_after / 1e6:.1f} MB"
+                )
         else:
             parser_cache.print_help()
             sys.exit(1)
@@ -1,25 +1,50 @@
 import binascii
+import hashlib
 import io
 import json
+import os
+import re
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import IO
+from datetime import date, timedelta
+from functools import partial
+from pathlib import Path
+from typing import IO, Any
 
+import pandas as pd
 import requests
 from bcb import PTAX, sgs
+from bcb.exceptions import SGSError
 from bcb.http import _CLIENT
 
+from brasa.downloaders import transport
 from brasa.engine.exceptions import (
     DownloadException,
     NoDataException,
+    NotModifiedException,
 )
+from brasa.engine.template import RetryPolicy
+from brasa.util import DownloadedFile
 
 _CLIENT.timeout = 60.0
+# SGS and PTAX requests take the same per-host throttle slots as the
+# downloaders that use the shared transport
+if not isinstance(_CLIENT._transport, transport.ThrottledHTTPXTransport):
+    _CLIENT._transport = transport.ThrottledHTTPXTransport(_CLIENT._transport)
 
 # Default (connect, read) timeout for HTTP downloads. Read is generous because
 # some B3 endpoints take ~20s to assemble a file before responding (WIL-97).
 _DEFAULT_DOWNLOAD_TIMEOUT = (10, 120)
 
+# SGS answers HTTP 404 "Value(s) not found" for a range without observations;
+# other 404s (e.g. an unknown series code) are real errors.
+_SGS_NO_VALUES = re.compile(r"\bValue\(s\) not found\b")
+
+# Chunk size used when streaming a response body to disk.
+_STREAM_CHUNK_SIZE = 1 << 16
+
 
 def validate_download_content(content: bytes, fmt: str) -> None:
     """Validate raw download bytes against the declared format.
@@ -37,11 +62,35 @@ def validate_download_content(content: bytes, fmt: str) -> None:
     if len(content) == 0:
         raise DownloadException("empty response body")
     if fmt == "zip":
-        if not zipfile.is_zipfile(io.BytesIO(content)):
-            raise DownloadException("response body is not a valid zip")
-        with zipfile.ZipFile(io.BytesIO(content)) as zf:
-            if len(zf.namelist()) == 0:
-                raise NoDataException("empty zip: no data for this request")
+        _validate_zip(io.BytesIO(content))
+
+
+def validate_download_file(path: str | Path, fmt: str) -> None:
+    """Validate a response body already written to disk.
+
+    Same rules as :func:`validate_download_content`, read from the file
+    instead of an in-memory body.
+
+    Args:
+        path: Path of the downloaded body.
+        fmt: The template's declared download format (e.g. "zip").
+
+    Raises:
+        DownloadException: Empty file, or a non-zip file when ``fmt == "zip"``.
+        NoDataException: A valid but empty (0-entry) zip.
+    """
+    if Path(path).stat().st_size == 0:
+        raise DownloadException("empty response body")
+    if fmt == "zip":
+        _validate_zip(path)
+
+
+def _validate_zip(source) -> None:
+    if not zipfile.is_zipfile(source):
+        raise DownloadException("response body is not a valid zip")
+    with zipfile.ZipFile(source) as zf:
+        if len(zf.namelist()) == 0:
+            raise NoDataException("empty zip: no data for this request")
 
 
 @contextmanager
@@ -58,7 +107,13 @@ def disable_ssl_warnings():
 class SimpleDownloader:
     # Config applied by the download helpers after construction (see helpers.py).
     timeout = None
+    pool_size = None
+    stream = False
+    part_path = None
+    headers = None
     fmt = ""
+    # Whether the download may be sent as a conditional GET (see transport.py).
+    conditional = True
 
     def __init__(self, url, verify_ssl):
         self.verify_ssl = verify_ssl
@@ -74,14 +129,20 @@ class SimpleDownloader:
         return self.response.status_code
 
     def download(self) -> IO | None:
+        if self.stream:
+            return self._download_to_disk()
+
         with disable_ssl_warnings():
-            res = requests.get(
+            res = transport.get(
                 self.url,
+                headers=self.headers,
                 verify=self.verify_ssl,
                 timeout=self.timeout or _DEFAULT_DOWNLOAD_TIMEOUT,
+                pool_size=self.pool_size,
             )
             self.response = res
 
+        self._raise_if_not_modified(res)
         if res.status_code != 200:
             msg = f"status_code = {res.status_code} url = {self.url}"
             raise DownloadException(msg)
@@ -89,6 +150,114 @@ class SimpleDownloader:
         validate_download_content(res.content, self.fmt)
         return io.BytesIO(res.content)
 
+    def _raise_if_not_modified(self, res) -> None:
+        if res.status_code == 304:
+            raise NotModifiedException(
+                f"not modified since previous download (HTTP 304) url = {self.url}"
+            )
+
+    def _download_to_disk(self) -> DownloadedFile:
+        """Stream the response body to disk, hashing it on the way.
+
+        With a ``part_path`` (set by the engine for resumable downloads) the
+        body is written there and kept when the transfer breaks, provided the
+        server advertised ``Accept-Ranges: bytes``. The next call asks only
+        for the missing bytes with a ``Range`` request, sent with ``If-Range``
+        set to the ETag or Last-Modified of the response that started the
+        part; a server whose file changed since, or that ignores the range,
+        answers 200 and the body is fetched in full. A 206 that does not
+        continue the part, or a 416, discards it.
+
+        Returns:
+            The body as a DownloadedFile carrying its MD5 digest.
+
+        Raises:
+            DownloadException: Non-200 status, interrupted transfer or invalid
+                content.
+            NoDataException: A valid but empty zip.
+        """
+        if self.part_path:
+            path = Path(self.part_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            fd, name = tempfile.mkstemp(prefix="brasa-", suffix=".part")
+            os.close(fd)
+            path = Path(name)
+        offset = path.stat().st_size if path.exists() else 0
+        headers = self._resume_headers(path, offset)
+
+        with disable_ssl_warnings():
+            res = transport.get(
+                self.url,
+                headers=headers or None,
+                verify=self.verify_ssl,
+                timeout=self.timeout or _DEFAULT_DOWNLOAD_TIMEOUT,
+                pool_size=self.pool_size,
+                stream=True,
+            )
+            self.response = res
+
+        keep_part = False
+        with res:
+            try:
+                self._raise_if_not_modified(res)
+                content_range = res.headers.get("Content-Range", "")
+                if (
+                    offset
+                    and res.status_code == 206
+                    and content_range.startswith(f"bytes {offset}-")
+                ):
+                    with path.open("rb") as fp:
+                        file_hash = hashlib.file_digest(fp, "md5")
+                    mode = "ab"
+                elif res.status_code == 200:
+                    file_hash = hashlib.md5()
+                    mode = "wb"
+                else:
+                    # 206 for another range or 416: the kept bytes no longer
+                    # match the remote file
+                    keep_part = bool(offset) and res.status_code not in (206, 416)
+                    msg = f"status_code = {res.status_code} url = {self.url}"
+                    raise DownloadException(msg)
+
+                resumable = bool(self.part_path) and (
+                    mode == "ab"
+                    or res.headers.get("Accept-Ranges", "").lower() == "bytes"
+                )
+                if resumable and mode == "wb":
+                    transport.save_resume_validator(path, res.headers)
+                with path.open(mode) as fp:
+                    try:
+                        for chunk in res.iter_content(_STREAM_CHUNK_SIZE):
+                            fp.write(chunk)
+                            file_hash.update(chunk)
+                    except requests.RequestException as exc:
+                        keep_part = resumable
+                        action = "resuming" if resumable else "restarting"
+                        raise DownloadException(
+                            f"transfer interrupted after {fp.tell()} bytes, "
+                            f"{action}: {exc} url = {self.url}"
+                        ) from exc
+                validate_download_file(path, self.fmt)
+            except BaseException:
+                if not keep_part:
+                    transport.discard_partial_download(path)
+                raise
+        if self.part_path:
+            # The body is complete; download_marketdata removes the part itself
+            transport.discard_resume_validator(path)
+        return DownloadedFile(path, file_hash.hexdigest())
+
+    def _resume_headers(self, path: Path, offset: int) -> dict[str, str]:
+        """Request headers, asking for the bytes after *offset* of *path*."""
+        headers = dict(self.headers or {})
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            validator = transport.resume_validator(path)
+            if validator:
+                headers["If-Range"] = validator
+        return headers
+
 
 class DatetimeDownloader(SimpleDownloader):
     def __init__(self, url, verify_ssl, **kwargs):
@@ -138,7 +307,10 @@ class B3URLEncodedDownloader(SimpleDownloader):
 
     @property
     def url(self) -> str:
-        params = json.dumps(self.args)
+        return self._encoded_url(self.args)
+
+    def _encoded_url(self, args: dict) -> str:
+        params = json.dumps(args)
         params_enc = (
             binascii.b2a_base64(bytes(params, "utf8"), newline=False)
             .decode("utf8")
@@ -148,6 +320,22 @@ class B3URLEncodedDownloader(SimpleDownloader):
 
 
 class B3PagedURLEncodedDownloader(B3URLEncodedDownloader):
+    """Downloader for B3's paged JSON endpoints.
+
+    Page 1 reveals ``totalPages``; the remaining pages are fetched
+    concurrently (at most ``page_concurrency`` in flight) and their results
+    reassembled in page order. Each of those pages is retried on its own,
+    following the template's retry policy, so one flaky page does not
+    refetch the whole set. Page 1 is retried by the engine's retry loop.
+    """
+
+    # Validators of the stored response belong to the last page only.
+    conditional = False
+    page_size = 100
+    page_concurrency = 4
+    # Retry policy of the pages after the first, the template's (see helpers.py).
+    retry_policy = RetryPolicy()
+
     def __init__(self, url, verify_ssl, **kwargs):
         super().__init__(url, verify_ssl)
         self.args = kwargs
@@ -155,20 +343,63 @@ class B3PagedURLEncodedDownloader(B3URLEncodedDownloader):
 
     @property
     def url(self) -> str:
-        self.args["pageNumber"] = self.page
-        self.args["pageSize"] = 100
-        return super().url
+        return self.page_url(self.page)
+
+    def page_url(self, page: int) -> str:
+        return self._encoded_url(
+            {**self.args, "pageNumber": page, "pageSize": self.page_size}
+        )
+
+    def _fetch_page(self, page: int) -> tuple[dict, Any]:
+        """Fetch and decode one page.
+
+        Args:
+            page: 1-based page number.
+
+        Returns:
+            Tuple of (decoded JSON object, response).
+
+        Raises:
+            DownloadException: Non-200 status or empty body.
+        """
+        url = self.page_url(page)
+        with disable_ssl_warnings():
+            res = transport.get(
+                url,
+                verify=self.verify_ssl,
+                timeout=self.timeout or _DEFAULT_DOWNLOAD_TIMEOUT,
+                pool_size=self.pool_size,
+            )
+        if res.status_code != 200:
+            raise DownloadException(f"status_code = {res.status_code} url = {url}")
+        validate_download_content(res.content, self.fmt)
+        return json.loads(res.content), res
+
+    def _fetch_page_with_retry(self, page: int) -> tuple[dict, Any]:
+        fetched, _ = self.retry_policy.call(partial(self._fetch_page, page))
+        return fetched
 
     def download(self) -> IO | None:
-        fp = super().download()
-        obj = json.load(fp)
+        obj, self.response = self._fetch_page(1)
         total_pages = obj["page"]["totalPages"] or 0
-        results = obj["results"] or []
-        while self.page < total_pages:
-            self.page += 1
-            fp = super().download()
-            obj = json.load(fp)
-            results.extend(obj["results"] or [])
+        pages = [obj]
+        if total_pages > 1:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(self.page_concurrency, total_pages - 1))
+            ) as executor:
+                fetched = list(
+                    executor.map(
+                        transport.bind_context(self._fetch_page_with_retry),
+                        range(2, total_pages + 1),
+                    )
+                )
+            pages.extend(page_obj for page_obj, _ in fetched)
+            self.response = fetched[-1][1]
+            self.page = total_pages
+        results = []
+        for page_obj in pages:
+            results.extend(page_obj["results"] or [])
+        obj = pages[-1]
         data = {"results": results}
         if "header" in obj:
             data["header"] = obj["header"]
@@ -190,11 +421,12 @@ class SettlementPricesDownloader(DatetimeDownloader):
             "dData1": self.refdate.strftime("%d/%m/%Y"),
         }
         with disable_ssl_warnings():
-            res = requests.post(
+            res = transport.post(
                 self.url,
                 params=body,
                 verify=self.verify_ssl,
                 timeout=self.timeout or _DEFAULT_DOWNLOAD_TIMEOUT,
+                pool_size=self.pool_size,
             )
             self.response = res
 
@@ -217,9 +449,11 @@ class B3FilesURLDownloader(DatetimeDownloader):
         )
 
     def download(self) -> IO | None:
-        res = requests.get(
+        res = transport.get(
             self.refdate.strftime(self._url),
+            verify=self.verify_ssl,
             timeout=self.timeout or _DEFAULT_DOWNLOAD_TIMEOUT,
+            pool_size=self.pool_size,
         )
         self.response = res
         if res.status_code != 200:
@@ -229,45 +463,136 @@ class B3FilesURLDownloader(DatetimeDownloader):
         return super().download()
 
 
-class BCBSGSDownloader:
+def date_windows(start: Any, end: Any, days: int | None) -> list[tuple[Any, Any]]:
+    """Split the inclusive span ``start..end`` into windows of *days* days.
+
+    Windows are consecutive and do not overlap. A span that fits in one
+    window, a non-positive *days*, or bounds that are not dates return the
+    span unchanged as the only window.
+
+    Args:
+        start: First date of the span (``date`` or ``datetime``).
+        end: Last date of the span, same type as *start*.
+        days: Maximum window length in days.
+
+    Returns:
+        List of ``(window_start, window_end)`` pairs in date order.
+    """
+    if not days or days <= 0 or not isinstance(start, date) or start > end:
+        return [(start, end)]
+    windows = []
+    step = timedelta(days=days)
+    one_day = timedelta(days=1)
+    while start + step <= end:
+        windows.append((start, start + step - one_day))
+        start += step
+    windows.append((start, end))
+    return windows
+
+
+class _WindowedBCBDownloader:
+    """Base for BCB range downloaders that fetch long spans in windows.
+
+    The download args (and therefore the cache metadata) keep the whole
+    ``start..end`` span; only the requests are split. Windows are fetched
+    concurrently, at most ``window_concurrency`` at a time, and each one is
+    retried by python-bcb's HTTP client, so a transient failure costs one
+    window instead of the whole range. Every request, retries included,
+    holds a throttle slot on its host.
+    """
+
+    window_days: int | None = None
+    window_concurrency = 2
+
     def __init__(self, **kwargs):
         self.args = kwargs
 
+    def windows(self) -> list[tuple[Any, Any]]:
+        """Return the ``(start, end)`` windows requested for the args."""
+        return date_windows(self.args["start"], self.args["end"], self.window_days)
+
+    def _fetch_windows(self, fetch) -> list:
+        windows = self.windows()
+        if len(windows) == 1:
+            return [fetch(*windows[0])]
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.window_concurrency, len(windows)))
+        ) as executor:
+            return list(
+                executor.map(
+                    transport.bind_context(lambda window: fetch(*window)), windows
+                )
+            )
+
+
+class BCBSGSDownloader(_WindowedBCBDownloader):
+    """SGS series downloader; splits long spans into windows of 10 years.
+
+    The SGS API rejects daily-series queries longer than ten years, and long
+    histories are the requests that time out.
+    """
+
+    window_days = 3650
+
     def download(self) -> IO | None:
+        code = self.args["code"]
+
+        def fetch(start, end):
+            try:
+                return sgs.get_json(code, start=start, end=end)
+            except SGSError as exc:
+                # A window without observations must not fail the whole span
+                if _SGS_NO_VALUES.search(str(exc)):
+                    return None
+                raise
+
         try:
-            text = sgs.get_json(
-                self.args["code"],
-                start=self.args["start"],
-                end=self.args["end"],
-            )
+            texts = self._fetch_windows(fetch)
         except Exception as exc:
             raise DownloadException(
-                f"SGS download failed for code {self.args['code']}: {exc}"
+                f"SGS download failed for code {code}: {exc}"
             ) from exc
+        texts = [text for text in texts if text is not None]
+        if not texts:
+            raise DownloadException(
+                f"SGS download failed for code {code}: no values between "
+                f"{self.args['start']} and {self.args['end']}"
+            )
+        if len(texts) == 1:
+            text = texts[0]
+        else:
+            text = json.dumps([row for t in texts for row in json.loads(t)])
         temp = io.BytesIO(bytes(text, "utf8"))
         return temp
 
 
-class BCBCurrencyDownloader:
-    def __init__(self, **kwargs):
-        self.args = kwargs
+class BCBCurrencyDownloader(_WindowedBCBDownloader):
+    """PTAX ``CotacaoMoedaPeriodo`` downloader; fetches one year per request."""
+
+    window_days = 365
 
     def download(self) -> IO | None:
+        currency = self.args["currency"]
         try:
             ptax = PTAX()
             endpoint = ptax.get_endpoint("CotacaoMoedaPeriodo")
-            df = (
-                endpoint.query()
-                .parameters(
-                    moeda=self.args["currency"],
-                    dataInicial=self.args["start"].strftime("%m/%d/%Y"),
-                    dataFinalCotacao=self.args["end"].strftime("%m/%d/%Y"),
+
+            def fetch(start, end):
+                return (
+                    endpoint.query()
+                    .parameters(
+                        moeda=currency,
+                        dataInicial=start.strftime("%m/%d/%Y"),
+                        dataFinalCotacao=end.strftime("%m/%d/%Y"),
+                    )
+                    .collect()
                 )
-                .collect()
-            )
+
+            frames = self._fetch_windows(fetch)
         except Exception as exc:
             raise DownloadException(
-                f"PTAX download failed for currency {self.args['currency']}: {exc}"
+                f"PTAX download failed for currency {currency}: {exc}"
             ) from exc
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
         text = df.to_json(orient="records", date_format="iso")
         return io.BytesIO(text.encode("utf8"))
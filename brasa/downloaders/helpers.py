@@ -1,10 +1,10 @@
-import io
 import json
 import logging
 from datetime import date, datetime
 from pathlib import Path
 from typing import IO
 
+from brasa.downloaders import transport
 from brasa.downloaders.downloaders import (
     B3FilesURLDownloader,
     B3PagedURLEncodedDownloader,
@@ -19,23 +19,36 @@ from brasa.downloaders.downloaders import (
 )
 from brasa.engine import MarketDataDownloader
 from brasa.engine.exceptions import DownloadException, InvalidContentException
+from brasa.util import open_raw_file
 
 logger = logging.getLogger(__name__)
 
 
 def _apply_download_config(downloader, md_downloader):
-    """Copy format + timeout config from the template onto the downloader.
+    """Copy format, timeout, pool and streaming config onto the downloader.
+
+    Conditional request headers and the resumable ``.part`` path active in
+    the calling context (see ``transport.conditional_request`` and
+    ``transport.resumable_download``) are applied as well.
 
     Args:
         downloader: A SimpleDownloader-derived instance.
-        md_downloader: The MarketDataDownloader carrying ``format``/``timeout``.
+        md_downloader: The MarketDataDownloader carrying ``format``/``timeout``/
+            ``pool_size``/``stream``.
 
     Returns:
-        The same downloader, with ``fmt`` and (when set) ``timeout`` applied.
+        The same downloader, with ``fmt`` and ``stream`` and (when set)
+        ``timeout``, ``pool_size`` and conditional ``headers`` applied.
     """
     downloader.fmt = md_downloader.format
+    downloader.stream = md_downloader.stream
+    if downloader.conditional:
+        downloader.headers = transport.conditional_headers() or None
+    downloader.part_path = transport.resume_path()
     if md_downloader.timeout is not None:
         downloader.timeout = md_downloader.timeout
+    if md_downloader.pool_size is not None:
+        downloader.pool_size = md_downloader.pool_size
     return downloader
 
 
@@ -59,43 +72,115 @@ datetime_download = _make_download(DatetimeDownloader)
 b3_pregao_download = _make_download(B3PregaoDownloader)
 format_download = _make_download(FormatURLDownloader)
 b3_url_encoded_download = _make_download(B3URLEncodedDownloader)
-b3_paged_url_encoded_download = _make_download(B3PagedURLEncodedDownloader)
 settlement_prices_download = _make_download(SettlementPricesDownloader)
 b3_files_download = _make_download(B3FilesURLDownloader)
 
 
+def b3_paged_url_encoded_download(
+    md_downloader: MarketDataDownloader, **kwargs
+) -> tuple[IO | None, dict[str, str]]:
+    """Download every page of a B3 paged endpoint.
+
+    Besides the common config, the template's retry policy is applied to
+    each page after the first, and ``page_concurrency`` (when set) bounds
+    the number of pages fetched at once.
+    """
+    downloader = _apply_download_config(
+        B3PagedURLEncodedDownloader(
+            md_downloader.url, md_downloader.verify_ssl, **kwargs
+        ),
+        md_downloader,
+    )
+    downloader.retry_policy = md_downloader.retry_policy()
+    if md_downloader.page_concurrency is not None:
+        downloader.page_concurrency = md_downloader.page_concurrency
+    return downloader.download(), dict(downloader.response.headers)
+
+
+def _apply_window_config(downloader, md_downloader):
+    """Copy ``window_days``/``window_concurrency`` onto a BCB range downloader."""
+    if md_downloader.window_days is not None:
+        downloader.window_days = md_downloader.window_days
+    if md_downloader.window_concurrency is not None:
+        downloader.window_concurrency = md_downloader.window_concurrency
+    return downloader
+
+
 def bcb_sgs_download(
-    _md_downloader: MarketDataDownloader, **kwargs
+    md_downloader: MarketDataDownloader, **kwargs
 ) -> tuple[IO | None, dict[str, str]]:
-    downloader = BCBSGSDownloader(**kwargs)
+    downloader = _apply_window_config(BCBSGSDownloader(**kwargs), md_downloader)
     return downloader.download(), {}
 
 
 def bcb_currency_download(
-    _md_downloader: MarketDataDownloader, **kwargs
+    md_downloader: MarketDataDownloader, **kwargs
 ) -> tuple[IO | None, dict[str, str]]:
-    downloader = BCBCurrencyDownloader(**kwargs)
+    downloader = _apply_window_config(BCBCurrencyDownloader(**kwargs), md_downloader)
     return downloader.download(), {}
 
 
 def validate_empty_file(fname: str) -> None:
-    with Path(fname).open("rb") as fp:
-        fp.seek(0, io.SEEK_END)
-        size = fp.tell()
-    if size == 0:
-        raise InvalidContentException("Downloaded file is empty")
+    with open_raw_file(fname) as fp:
+        if not fp.read(1):
+            raise InvalidContentException("Downloaded file is empty")
 
 
 def validate_json_empty_file(fname: str) -> None:
-    with Path(fname).open("rb") as fp:
-        if fp.readlines() == []:
-            raise InvalidContentException("JSON file is empty")
-        fp.seek(0)
-        obj = json.load(fp)
-        if len(obj) == 0:
-            raise InvalidContentException("JSON file is empty")
-        if isinstance(obj, dict) and "results" in obj and not obj["results"]:
-            raise InvalidContentException("JSON 'results' is empty")
+    with open_raw_file(fname) as fp:
+        _check_json_content(fp.read())
+
+
+def _check_json_content(content: bytes) -> None:
+    if not content:
+        raise InvalidContentException("JSON file is empty")
+    obj = json.loads(content)
+    if len(obj) == 0:
+        raise InvalidContentException("JSON file is empty")
+    if isinstance(obj, dict) and "results" in obj and not obj["results"]:
+        raise InvalidContentException("JSON 'results' is empty")
+
+
+class EmptyFileValidator:
+    """Streaming counterpart of :func:`validate_empty_file`.
+
+    Fed the body chunk by chunk while it is compressed; :meth:`finish`
+    raises the same errors as the file validator.
+    """
+
+    def __init__(self) -> None:
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+
+    def finish(self) -> None:
+        if not self.size:
+            raise InvalidContentException("Downloaded file is empty")
+
+
+class JSONEmptyFileValidator:
+    """Streaming counterpart of :func:`validate_json_empty_file`.
+
+    JSON cannot be judged before the document is complete, so the chunks
+    are kept and parsed by :meth:`finish`.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def update(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+
+    def finish(self) -> None:
+        _check_json_content(b"".join(self._chunks))
+
+
+# MarketDataDownloader.stream_validator() looks up the streaming counterpart
+# of a template's validator here; validators without one run on the stored
+# file instead.
+validate_empty_file.stream_validator = EmptyFileValidator
+validate_json_empty_file.stream_validator = JSONEmptyFileValidator
 
 
 def _render_import_path(raw_path: str, kwargs: dict) -> str:
@@ -0,0 +1,379 @@
+"""Process-wide pooled HTTP transport shared by the HTTP downloaders.
+
+Every request made by a downloader goes through :func:`request` (or the
+:func:`get`/:func:`post` shortcuts), which keeps one keep-alive connection
+pool per host for the lifetime of the process. Consecutive files from the
+same host therefore reuse TCP/TLS connections instead of paying a new
+handshake each time.
+
+Pools are shared by all threads; each thread gets its own
+:class:`requests.Session` (sessions carry a cookie jar and are not
+thread-safe) with the shared per-host adapters mounted on it.
+
+Each request also holds a :func:`brasa.engine.throttle.request_slot` on the
+host of its URL, so the per-host concurrency cap and token bucket apply to
+every HTTP request rather than to whole acquisitions. A streamed response
+keeps its slot until it is closed. python-bcb's HTTP client is routed through
+the same slots by :class:`ThrottledHTTPXTransport`. Threads started by a
+downloader must run under :func:`bind_context` to inherit the throttling
+settings of the acquisition.
+
+:func:`conditional_request` scopes the cache validators (ETag,
+Last-Modified) of a previous download to the current thread, so downloaders
+can turn the next fetch into a conditional GET. :func:`resumable_download`
+likewise scopes the ``.part`` file a streamed download keeps between
+attempts, so an interrupted transfer resumes with a ``Range`` request. The
+validator of the response that started the part is kept next to it and sent
+as ``If-Range``, so a remote file that changed in between is fetched in full
+instead of being appended to the old bytes.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from brasa.engine.core import Singleton
+from brasa.engine.throttle import request_slot
+
+# Keep-alive connections retained per host when the template does not set
+# ``pool_size``.
+DEFAULT_POOL_SIZE = 10
+
+# Response validator header -> conditional request header.
+_VALIDATOR_HEADERS = {
+    "etag": "If-None-Match",
+    "last-modified": "If-Modified-Since",
+}
+
+_conditional_headers: ContextVar[dict[str, str] | None] = ContextVar(
+    "conditional_headers", default=None
+)
+_resume_path: ContextVar[str | None] = ContextVar("resume_path", default=None)
+
+
+@dataclass
+class ConnectionStats:
+    """Request and connection counters for one host.
+
+    Attributes:
+        requests: Requests sent through the transport.
+        new_connections: Connections opened (each one a TCP/TLS handshake).
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests served over an already open connection."""
+        return max(0, self.requests - self.new_connections)
+
+    def _add(self, requests: int = 0, new_connections: int = 0) -> None:
+        with self._lock:
+            self.requests += requests
+            self.new_connections += new_connections
+
+
+def _counting_pool(base: type[HTTPConnectionPool], stats: ConnectionStats) -> type:
+    class _CountingPool(base):
+        def _new_conn(self):
+            stats._add(new_connections=1)
+            return super()._new_conn()
+
+    return _CountingPool
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report new connections to *stats*."""
+
+    def __init__(self, stats: ConnectionStats, pool_size: int) -> None:
+        self._stats = stats
+        super().__init__(pool_connections=1, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._stats),
+            "https": _counting_pool(HTTPSConnectionPool, self._stats),
+        }
+
+
+class HTTPTransport(Singleton):
+    """Shared per-host keep-alive pools plus connection counters.
+
+    The pool size of a host is fixed the first time that host is used; later
+    requests with a different ``pool_size`` reuse the existing pool.
+    """
+
+    def init(self) -> None:
+        """Initialize the transport state."""
+        self._lock = threading.Lock()
+        self._adapters: dict[str, _PooledAdapter] = {}
+        self._stats: dict[str, ConnectionStats] = {}
+        self._local = threading.local()
+
+    def _adapter(self, prefix: str, host: str, pool_size: int | None) -> HTTPAdapter:
+        with self._lock:
+            adapter = self._adapters.get(prefix)
+            if adapter is None:
+                stats = self._stats.setdefault(host, ConnectionStats())
+                adapter = _PooledAdapter(stats, max(1, pool_size or DEFAULT_POOL_SIZE))
+                self._adapters[prefix] = adapter
+            return adapter
+
+    def session(self, url: str, pool_size: int | None = None) -> requests.Session:
+        """Return this thread's session with the pool for *url*'s host mounted.
+
+        Args:
+            url: The request URL.
+            pool_size: Keep-alive connections to retain for the host.
+
+        Returns:
+            A :class:`requests.Session` owned by the calling thread.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        parts = urlparse(url)
+        prefix = f"{parts.scheme}://{parts.netloc}/"
+        if prefix not in session.adapters:
+            session.mount(prefix, self._adapter(prefix, parts.netloc, pool_size))
+        return session
+
+    def request(
+        self, method: str, url: str, pool_size: int | None = None, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request through the pooled session for *url*'s host.
+
+        The request holds a throttle slot on the host until the response is
+        read or, with ``stream=True``, until the response is closed.
+
+        Args:
+            method: HTTP method.
+            url: The request URL.
+            pool_size: Keep-alive connections to retain for the host.
+            **kwargs: Passed to :meth:`requests.Session.request`.
+
+        Returns:
+            The response.
+        """
+        session = self.session(url, pool_size)
+        with self._lock:
+            stats = self._stats.setdefault(urlparse(url).netloc, ConnectionStats())
+        stats._add(requests=1)
+        with ExitStack() as stack:
+            stack.enter_context(request_slot(urlparse(url).netloc))
+            response = session.request(method, url, **kwargs)
+            if kwargs.get("stream"):
+                _release_on_close(response, stack.pop_all())
+        return response
+
+    def stats(self) -> dict[str, ConnectionStats]:
+        """Return the connection counters, keyed by host."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self) -> None:
+        """Close every pool and clear the counters."""
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+            self._stats.clear()
+            self._local = threading.local()
+
+
+def _release_on_close(response: requests.Response, stack: ExitStack) -> None:
+    close = response.close
+
+    def _close() -> None:
+        try:
+            close()
+        finally:
+            stack.close()
+
+    response.close = _close
+    # Responses dropped without close() release the slot when collected
+    weakref.finalize(response, stack.close)
+
+
+class ThrottledHTTPXTransport(httpx.BaseTransport):
+    """httpx transport that holds a throttle slot for each request.
+
+    Wraps the transport of python-bcb's shared client, so SGS and PTAX
+    requests share the per-host caps and token buckets of the downloaders
+    that use :class:`HTTPTransport`.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send *request* while holding a slot on its host."""
+        host = request.url.host
+        if request.url.port:
+            host = f"{host}:{request.url.port}"
+        with request_slot(host):
+            response = self._transport.handle_request(request)
+            response.read()
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        self._transport.close()
+
+
+def bind_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Return *func* bound to a copy of the caller's context.
+
+    Worker threads do not inherit context variables, so a function handed to
+    an executor would lose the acquisition's throttling settings (and the
+    conditional and resume state of this module). Each call of the returned
+    function runs in its own copy of the context captured here.
+
+    Args:
+        func: Function to call on another thread.
+
+    Returns:
+        A wrapper with the same arguments and return value.
+    """
+    ctx = contextvars.copy_context()
+
+    def _call(*args: Any, **kwargs: Any) -> Any:
+        return ctx.copy().run(func, *args, **kwargs)
+
+    return _call
+
+
+def request(
+    method: str, url: str, pool_size: int | None = None, **kwargs: Any
+) -> requests.Response:
+    """Send a request through the shared :class:`HTTPTransport`."""
+    return HTTPTransport().request(method, url, pool_size=pool_size, **kwargs)
+
+
+def get(url: str, pool_size: int | None = None, **kwargs: Any) -> requests.Response:
+    """Send a GET request through the shared :class:`HTTPTransport`."""
+    return request("GET", url, pool_size=pool_size, **kwargs)
+
+
+def post(url: str, pool_size: int | None = None, **kwargs: Any) -> requests.Response:
+    """Send a POST request through the shared :class:`HTTPTransport`."""
+    return request("POST", url, pool_size=pool_size, **kwargs)
+
+
+@contextmanager
+def conditional_request(response_headers: dict[str, Any] | None) -> Iterator[None]:
+    """Make downloads in this block conditional on a previous response.
+
+    The ``ETag`` and ``Last-Modified`` headers of *response_headers* become
+    ``If-None-Match`` and ``If-Modified-Since`` in :func:`conditional_headers`
+    for the current thread (or task) until the block exits.
+
+    Args:
+        response_headers: Headers stored from the previous download, or None.
+    """
+    headers = {}
+    for name, value in (response_headers or {}).items():
+        conditional = _VALIDATOR_HEADERS.get(str(name).lower())
+        if conditional and value:
+            headers[conditional] = str(value)
+    token = _conditional_headers.set(headers)
+    try:
+        yield
+    finally:
+        _conditional_headers.reset(token)
+
+
+def conditional_headers() -> dict[str, str]:
+    """Return the conditional request headers active in this context."""
+    return dict(_conditional_headers.get() or {})
+
+
+@contextmanager
+def resumable_download(part_path: str | None) -> Iterator[None]:
+    """Keep the partial body of streamed downloads in this block at *part_path*.
+
+    A part left by an earlier run without a saved validator (see
+    :func:`save_resume_validator`) cannot be checked against the remote file,
+    so it is discarded here; parts written by attempts inside the block are
+    kept.
+
+    Args:
+        part_path: File that holds the bytes received so far, or None to
+            stream to a throwaway temporary file.
+    """
+    if part_path and resume_validator(part_path) is None:
+        discard_partial_download(part_path)
+    token = _resume_path.set(part_path)
+    try:
+        yield
+    finally:
+        _resume_path.reset(token)
+
+
+def resume_path() -> str | None:
+    """Return the ``.part`` file path active in this context, if any."""
+    return _resume_path.get()
+
+
+def _validator_path(part_path: str | Path) -> Path:
+    return Path(f"{part_path}.validator")
+
+
+def save_resume_validator(part_path: str | Path, headers: Any) -> None:
+    """Save the validator of the response whose body starts *part_path*.
+
+    A strong ``ETag`` is preferred over ``Last-Modified``, as ``If-Range``
+    requires; without either nothing is saved.
+
+    Args:
+        part_path: The ``.part`` file being written.
+        headers: Headers of the 200 response that started it.
+    """
+    etag = headers.get("ETag") or ""
+    validator = (
+        etag if etag and not etag.startswith("W/") else headers.get("Last-Modified")
+    )
+    path = _validator_path(part_path)
+    if validator:
+        path.write_text(validator)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def resume_validator(part_path: str | Path) -> str | None:
+    """Return the ``If-Range`` value saved for *part_path*, if any."""
+    try:
+        return _validator_path(part_path).read_text() or None
+    except FileNotFoundError:
+        return None
+
+
+def discard_resume_validator(part_path: str | Path) -> None:
+    """Delete the validator saved for *part_path*."""
+    _validator_path(part_path).unlink(missing_ok=True)
+
+
+def discard_partial_download(part_path: str | Path) -> None:
+    """Delete a ``.part`` file and its saved validator."""
+    Path(part_path).unlink(missing_ok=True)
+    discard_resume_validator(part_path)
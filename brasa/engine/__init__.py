@@ -76,6 +76,7 @@ from .exceptions import (
     DownloadException,
     DuplicatedFolderException,
     InvalidContentException,
+    NotModifiedException,
 )
 
 # Layers
@@ -143,6 +144,7 @@ __all__ = [
     "MarketDataTemplate",
     "MarketDataWriter",
     "MigrationReport",
+    "NotModifiedException",
     "OrchestratorReport",
     "PipelineOrchestrator",
     "ProgressDisplay",
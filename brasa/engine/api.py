@@ -5,20 +5,21 @@ including file format handling (zip, base64), validation, and compression.
 """
 
 import contextlib
+import json
 import logging
-import threading
-import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from contextlib import closing
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 
-from brasa.util import DownloadArgs, KwargsIterator
+from brasa.util import DownloadArgs, KwargsIterator, generate_checksum_for_template
 
-from .cache import CacheManager, CacheMetadata, DownloadResult
+from .cache import CacheManager, CacheMetadata, CacheSnapshot, DownloadResult
 from .exceptions import DownloadException
+from .overlap import OrderedResults, ProcessingQueue
 from .reporting import (
     TaskReport,
     TaskResult,
@@ -33,6 +34,9 @@ from .template import retrieve_template
 
 logger = logging.getLogger(__name__)
 
+# Executors of process_marketdata: worker threads or worker processes.
+PROCESSING_EXECUTORS = ("thread", "process")
+
 
 def _save_report_if_requested(report_file: str | Path | None, report) -> None:
     """Save a report to disk, inferring JSON vs TXT format from the extension."""
@@ -42,34 +46,44 @@ def _save_report_if_requested(report_file: str | Path | None, report) -> None:
         report.save_report(report_path, format=file_format)
 
 
-def _should_download(cache: CacheManager, meta: CacheMetadata, force: bool) -> bool:  # noqa: PLR0911
+def _should_download(  # noqa: PLR0911
+    cache: CacheManager,
+    meta: CacheMetadata,
+    force: bool,
+    snapshot: CacheSnapshot | None = None,
+) -> bool:
     """Determine if data should be downloaded.
 
     Args:
         cache: Cache manager instance.
         meta: Cache metadata for the template.
         force: If True, force re-download.
+        snapshot: Prefetched cache state (see ``CacheManager.snapshot``)
+            answering the metadata and trial reads; the cache is queried
+            when None.
 
     Returns:
         True if data should be downloaded, False otherwise.
     """
+    state = snapshot or cache
     if force:
-        if cache.has_meta(meta):
-            cache.load_meta(meta)
+        if state.has_meta(meta):
+            state.load_meta(meta)
             cache.remove_meta(meta)
         return True
 
-    if cache.has_meta(meta):
-        cache.load_meta(meta)
+    has_meta = state.has_meta(meta)
+    if has_meta:
+        state.load_meta(meta)
         # If metadata is marked as invalid, skip unless forced
         if meta.is_invalid_download:
             return False
 
     # REQ-011: Treat last status D (DUPLICATED) as skip-eligible
-    last_status = cache.get_last_download_status(meta)
+    last_status = state.get_last_download_status(meta)
     if last_status and last_status["code"] == "D":
         # REQ-012: Guard - redownload if raw files are missing
-        if cache.has_meta(meta):
+        if has_meta:
             raw_files_exist = all(
                 Path(cache.cache_path(f)).exists() for f in meta.downloaded_files
             )
@@ -81,9 +95,8 @@ def _should_download(cache: CacheManager, meta: CacheMetadata, force: bool) -> b
     if last_status and last_status["code"] == "I":
         return False
 
-    if not cache.has_successful_trial(meta):
-        if cache.has_meta(meta):
-            cache.load_meta(meta)
+    if not state.has_successful_trial(meta):
+        if has_meta:
             check = all(
                 Path(cache.cache_path(f)).exists() for f in meta.downloaded_files
             )
@@ -201,6 +214,12 @@ def _build_result_from_download(
     if dl.retry_success_on_attempt is not None:
         result.extra_info["retry_success_on_attempt"] = str(dl.retry_success_on_attempt)
 
+    # Raw-file I/O of the single checksum/validate/compress pass
+    if dl.raw_io is not None:
+        result.extra_info["raw_passes"] = str(dl.raw_io.passes)
+        result.extra_info["raw_bytes_written"] = str(dl.raw_io.bytes_written)
+        result.extra_info["raw_io"] = json.dumps(dl.raw_io.to_dict())
+
     return result
 
 
@@ -211,6 +230,8 @@ def _build_result_skipped(
     args: dict,
     duration: float,
     operation: str = "download",
+    *,
+    snapshot: CacheSnapshot | None = None,
 ) -> "TaskResult":
     """Build a SKIPPED TaskResult with an appropriate reason.
 
@@ -221,6 +242,7 @@ def _build_result_skipped(
         args: Download arguments for this iteration.
         duration: Elapsed time in seconds.
         operation: Label for the operation type ("download" or "import").
+        snapshot: Prefetched cache state the skip was decided from.
 
     Returns:
         A TaskResult with SKIPPED status and reason.
@@ -229,7 +251,7 @@ def _build_result_skipped(
     if meta.is_invalid_download:
         skip_reason = f"invalid download: {meta.invalid_download_reason}"
     else:
-        last = cache.get_last_download_status(meta)
+        last = (snapshot or cache).get_last_download_status(meta)
         if last and last["code"] == "D":
             skip_reason = "duplicated (cached)"
         elif last and last["code"] == "I":
@@ -249,6 +271,81 @@ def _build_result_skipped(
     return result
 
 
+def _acquire_entry(
+    cache: CacheManager,
+    template,
+    template_name: str,
+    args: dict,
+    *,
+    operation: str,
+    force: bool,
+    acquisition_function=None,
+    retry_attempts_override=None,
+    snapshot: CacheSnapshot | None = None,
+    on_acquired=None,
+) -> TaskResult:
+    """Acquire a single kwargs combination and build its TaskResult.
+
+    Safe to run on a worker thread: cache writes are serialized by
+    CacheManager and every HTTP request takes a slot of the shared
+    HostThrottle. The skip decision reads *snapshot* when given (see
+    :func:`_should_download`). ``on_acquired(meta, result)``, when given,
+    is called with the entry and its result before returning.
+    """
+    from .throttle import acquisition_limits
+
+    start_time = datetime.now()
+
+    meta = CacheMetadata(template.id)
+    meta.extra_key = template.downloader.extra_key
+    meta.download_args = DownloadArgs(args)
+    meta.downloaded_files = []
+    meta.is_processed = False
+
+    with capture_warnings() as captured_warnings:
+        should_download = _should_download(cache, meta, force, snapshot)
+
+        if force:
+            meta.is_processed = False
+
+        if should_download:
+            with acquisition_limits(template.downloader):
+                dl = cache.download_marketdata(
+                    meta,
+                    acquisition_function=acquisition_function,
+                    retry_attempts_override=retry_attempts_override,
+                )
+
+            if cache.has_meta(meta):
+                cache.load_meta(meta)
+
+            duration = (datetime.now() - start_time).total_seconds()
+            result = _build_result_from_download(
+                dl,
+                template_name,
+                args,
+                duration,
+                meta,
+                captured_warnings,
+                operation=operation,
+            )
+        else:
+            duration = (datetime.now() - start_time).total_seconds()
+            result = _build_result_skipped(
+                cache,
+                meta,
+                template_name,
+                args,
+                duration,
+                operation=operation,
+                snapshot=snapshot,
+            )
+
+    if on_acquired is not None:
+        on_acquired(meta, result)
+    return result
+
+
 def _run_acquisition(
     template,
     template_name: str,
@@ -261,6 +358,9 @@ def _run_acquisition(
     acquisition_function=None,
     retry_attempts_override=None,
     implicit_reports: list | None = None,
+    max_workers: int = 1,
+    process: bool = False,
+    process_workers: int = 4,
 ) -> TaskReport:
     """Shared acquisition loop for download and import.
 
@@ -268,6 +368,24 @@ def _run_acquisition(
     import depending on ``acquisition_function``), and assembles a TaskReport
     labelled with ``operation``.
 
+    The metadata and latest trials of every entry are read up front in a
+    few batched queries (``CacheManager.snapshot``), so entries that are
+    skipped cost no database round trip of their own. Their metadata and
+    trial writes are queued and written in batches
+    (``CacheManager.write_behind``).
+
+    With ``max_workers > 1`` entries are acquired on a thread pool. Requests
+    are still capped per host and spaced by ``download_delay`` (see
+    :mod:`brasa.engine.throttle`), and results are added to the report in
+    kwargs order, exactly as a serial run would.
+
+    With ``process=True`` every acquired entry that is not processed yet is
+    handed to a bounded :class:`~brasa.engine.overlap.ProcessingQueue` and
+    parsed by ``process_workers`` threads while the next entries download.
+    Its processing outcome and latency are attached to its result, which is
+    added to the report only after processing (see
+    :class:`~brasa.engine.overlap.OrderedResults`).
+
     Args:
         template: The resolved MarketDataTemplate object.
         template_name: Template name for reporting.
@@ -279,13 +397,17 @@ def _run_acquisition(
         acquisition_function: Optional override for the acquisition function.
         retry_attempts_override: Override for retry attempts count.
         implicit_reports: Dependency reports to attach to the final report.
+        max_workers: Number of concurrent acquisitions (1 = serial).
+        process: If True, process the acquired entries as they arrive.
+        process_workers: Number of processing threads when *process* is set.
 
     Returns:
         TaskReport with results of all acquisition operations.
     """
+    from functools import partial
+
     cache = CacheManager()
     kwargs_iter = KwargsIterator(kwargs)
-    download_delay = template.downloader.download_delay
 
     report = TaskReport(
         operation=operation,
@@ -294,63 +416,87 @@ def _run_acquisition(
     )
     report.start(total=len(kwargs_iter))
 
-    for args in kwargs_iter:
-        start_time = datetime.now()
+    extra_key = template.downloader.extra_key
+    snapshot = cache.snapshot(
+        generate_checksum_for_template(template.id, DownloadArgs(args), extra_key)
+        for args in kwargs_iter
+    )
 
-        meta = CacheMetadata(template.id)
-        meta.extra_key = template.downloader.extra_key
-        meta.download_args = DownloadArgs(args)
-        meta.downloaded_files = []
-        meta.is_processed = False
+    acquire = partial(
+        _acquire_entry,
+        cache,
+        template,
+        template_name,
+        operation=operation,
+        force=force,
+        acquisition_function=acquisition_function,
+        retry_attempts_override=retry_attempts_override,
+        snapshot=snapshot,
+    )
 
-        with capture_warnings() as captured_warnings:
-            should_download = _should_download(cache, meta, force)
+    with cache.write_behind():
+        processing = None
+        if process:
+            processing = ProcessingQueue(
+                partial(_process_entry, cache, template_name, reprocess=False),
+                workers=process_workers,
+            )
+            acquire = partial(
+                acquire, on_acquired=partial(_queue_for_processing, processing)
+            )
+        results = OrderedResults(report.add_result, processing)
+        try:
+            if max_workers <= 1:
+                for args in kwargs_iter:
+                    results.append(acquire(args))
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(acquire, args) for args in kwargs_iter]
+                    # Consume in submission order so the report matches a
+                    # serial run
+                    for future in futures:
+                        results.append(future.result())
+        finally:
+            # Drain the queue before the batched writes are flushed
+            if processing is not None:
+                processing.close()
+        results.release()
 
-            if force:
-                meta.is_processed = False
+    report.finish()
+    report.dependency_reports = implicit_reports or []
 
-            if should_download:
-                if download_delay > 0:
-                    time.sleep(download_delay)
+    if processing is not None:
+        _touch_output_marker(cache, template, processing.results)
 
-                dl = cache.download_marketdata(
-                    meta,
-                    acquisition_function=acquisition_function,
-                    retry_attempts_override=retry_attempts_override,
-                )
+    _compact_if_due()
 
-                if cache.has_meta(meta):
-                    cache.load_meta(meta)
+    _save_report_if_requested(report_file, report)
 
-                duration = (datetime.now() - start_time).total_seconds()
-                result = _build_result_from_download(
-                    dl,
-                    template_name,
-                    args,
-                    duration,
-                    meta,
-                    captured_warnings,
-                    operation=operation,
-                )
-            else:
-                duration = (datetime.now() - start_time).total_seconds()
-                result = _build_result_skipped(
-                    cache,
-                    meta,
-                    template_name,
-                    args,
-                    duration,
-                    operation=operation,
-                )
+    return report
 
-        report.add_result(result)
 
-    report.finish()
-    report.dependency_reports = implicit_reports or []
+def _queue_for_processing(
+    processing: ProcessingQueue, meta: CacheMetadata, result: TaskResult
+) -> None:
+    """Hand an acquired entry to *processing* unless there is nothing to do."""
+    if (
+        result.status in (TaskStatus.PASSED, TaskStatus.WARNING, TaskStatus.SKIPPED)
+        and meta.downloaded_files
+        and not meta.is_processed
+        and not meta.is_invalid_download
+    ):
+        processing.put(meta, result)
 
-    _save_report_if_requested(report_file, report)
 
-    return report
+def _compact_if_due() -> None:
+    """Apply the automatic trial retention policy after an acquisition run."""
+    from .compaction import maybe_compact
+
+    try:
+        maybe_compact()
+    except sqlite3.Error as exc:
+        # Another process holding the database must not fail the run
+        logger.warning("Skipped automatic cache compaction: %s", exc)
 
 
 def download_marketdata(
@@ -360,6 +506,10 @@ def download_marketdata(
     calendar: str = "B3",
     verbosity: Verbosity = Verbosity.NORMAL,
     report_file: str | Path | None = None,
+    *,
+    max_workers: int = 1,
+    process: bool = False,
+    process_workers: int = 4,
     **kwargs,
 ) -> TaskReport:
     """Download market data for multiple dates/parameters.
@@ -371,6 +521,13 @@ def download_marketdata(
     are automatically executed and their output is used to populate any
     missing download args before downloads begin.
 
+    With ``process=True`` downloaded entries are processed while the next
+    ones download: each acquired entry goes onto a bounded queue drained by
+    ``process_workers`` processing threads, and downloads wait while the
+    queue is full. Each entry's result then also carries its processing
+    status and its download, queue and processing times in ``extra_info``
+    (see :mod:`brasa.engine.overlap`).
+
     Args:
         template_name: Name of the template to use.
         force: If True, force re-download even if data exists.
@@ -379,6 +536,11 @@ def download_marketdata(
         calendar: Calendar for smart update date operations (default: "B3").
         verbosity: Output verbosity level (QUIET, NORMAL, VERBOSE).
         report_file: Optional path to save the report (JSON or TXT).
+        max_workers: Number of concurrent downloads. Requests stay capped
+            per host and spaced by the template's ``download_delay``.
+            Default is 1 (serial).
+        process: If True, process downloaded entries as they arrive.
+        process_workers: Number of processing threads when *process* is set.
         **kwargs: Template-specific download arguments. Lists are expanded
                   to download for each combination.
 
@@ -430,6 +592,9 @@ def download_marketdata(
         verbosity=verbosity,
         report_file=report_file,
         implicit_reports=implicit_reports,
+        max_workers=max_workers,
+        process=process,
+        process_workers=process_workers,
     )
 
 
@@ -484,11 +649,13 @@ def import_marketdata(
     )
 
 
-def _touch_output_marker(cache: CacheManager, template, report: "TaskReport") -> None:
-    """Touch .last_processed marker if any results in the report passed."""
+def _touch_output_marker(
+    cache: CacheManager, template, results: list[TaskResult]
+) -> None:
+    """Touch .last_processed marker if any of the processing results passed."""
     from .dependency_resolver import _touch_marker
 
-    has_processed = any(r.status == TaskStatus.PASSED for r in report.results)
+    has_processed = any(r.status == TaskStatus.PASSED for r in results)
     if has_processed:
         try:
             if hasattr(template, "datasets") and template.datasets:
@@ -515,16 +682,16 @@ def _count_processed_items(
     Returns:
         Number of processed items.
     """
-    with closing(cache.meta_db_connection) as conn, conn:
+    with cache.meta_db() as conn:
         c = conn.cursor()
         if meta_id is not None:
             c.execute(
-                "select count(*) from cache_metadata where template = ? and id = ? and processed_files = 'true'",
+                "select count(*) from cache_metadata where template = ? and id = ? and is_processed = 1",
                 (template_name, meta_id),
             )
         else:
             c.execute(
-                "select count(*) from cache_metadata where template = ? and processed_files = 'true'",
+                "select count(*) from cache_metadata where template = ? and is_processed = 1",
                 (template_name,),
             )
         return c.fetchone()[0]
@@ -551,7 +718,7 @@ def _get_stale_extra_key_ids(template_name: str, cache: CacheManager) -> set[str
     from collections import defaultdict
 
     stale: set[str] = set()
-    with closing(cache.meta_db_connection) as conn, conn:
+    with cache.meta_db() as conn:
         c = conn.cursor()
         c.execute(
             "select id, download_args, extra_key "
@@ -573,7 +740,111 @@ def _get_stale_extra_key_ids(template_name: str, cache: CacheManager) -> set[str
     return stale
 
 
-def process_marketdata(  # noqa: PLR0915
+def _process_entry(
+    cache: CacheManager,
+    template_name: str,
+    meta: CacheMetadata,
+    *,
+    reprocess: bool,
+    read=None,
+) -> TaskResult:
+    """Process a single cache entry and build its TaskResult.
+
+    Args:
+        cache: CacheManager instance.
+        template_name: Name of the template.
+        meta: The cache entry.
+        reprocess: If True, process the entry even if it is processed.
+        read: ``read(meta, captured_warnings)`` parsing the entry; runs
+            :func:`~brasa.engine.processing._read_marketdata` by default.
+
+    Returns:
+        TaskResult with processing result information.
+    """
+    from .processing import _read_marketdata
+
+    start_time = datetime.now()
+
+    with capture_warnings() as captured_warnings:
+        try:
+            should_process = reprocess or not meta.is_processed
+
+            if should_process:
+                meta.processing_errors = ""
+
+                # File I/O - parallelizable
+                if read is None:
+                    _read_marketdata(meta)
+                else:
+                    read(meta, captured_warnings)
+
+                # Queued for the batched writer, after the parquet is
+                # on disk
+                cache.save_meta(meta)
+
+                duration = (datetime.now() - start_time).total_seconds()
+
+                result = create_task_result_success(
+                    operation="process",
+                    template_name=template_name,
+                    args=meta.download_args,
+                    duration=duration,
+                    downloaded_files=meta.downloaded_files,
+                    is_processed=meta.is_processed,
+                    captured_warnings=captured_warnings,
+                )
+            else:
+                # Task was skipped (already processed)
+                duration = (datetime.now() - start_time).total_seconds()
+
+                result = create_task_result_skipped(
+                    operation="process",
+                    template_name=template_name,
+                    args=meta.download_args,
+                    duration=duration,
+                    downloaded_files=meta.downloaded_files,
+                    is_processed=meta.is_processed,
+                )
+
+        except Exception as ex:
+            duration = (datetime.now() - start_time).total_seconds()
+
+            # Save error to metadata
+            meta.processing_errors = str(ex)
+            with contextlib.suppress(Exception):
+                cache.save_meta(meta)
+
+            result = create_task_result_from_exception(
+                exception=ex,
+                operation="process",
+                template_name=template_name,
+                args=meta.download_args,
+                duration=duration,
+                downloaded_files=meta.downloaded_files,
+                is_processed=meta.is_processed,
+                captured_warnings=captured_warnings,
+                is_expected_error=False,
+            )
+
+    return result
+
+
+def _worker_process_pool(
+    cache: CacheManager, template_name: str, max_workers: int
+) -> ProcessPoolExecutor:
+    """Create the worker processes of ``process_marketdata(executor="process")``."""
+    from .processing import _init_process_worker
+
+    # spawn: workers must not inherit the parent's threads and locks
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_process_worker,
+        initargs=(cache.cache_folder, template_name),
+    )
+
+
+def process_marketdata(
     template_name: str,
     reprocess: bool = False,
     verbosity: Verbosity = Verbosity.NORMAL,
@@ -581,13 +852,22 @@ def process_marketdata(  # noqa: PLR0915
     max_workers: int = 4,
     meta_id: str | None = None,
     show_skipped: bool = False,
+    *,
+    executor: str = "thread",
 ) -> TaskReport:
     """Process all downloaded data for a template.
 
     Reads raw downloaded files and converts them to parquet format.
-    Uses parallel processing for file I/O with serialized database writes.
+    Uses parallel processing for file I/O; metadata updates are queued and
+    written in batches by a single writer (``CacheManager.write_behind``).
     Shows pytest-style progress display during processing.
 
+    With ``executor="process"`` entries are parsed, transformed and written
+    to parquet in ``max_workers`` worker processes, which sidesteps the GIL
+    for pandas/lxml-bound templates. Workers only report back whether the
+    entry was processed, its warnings and the datasets to register; the
+    metadata and catalog writes stay in this process.
+
     Args:
         template_name: Name of the template to process.
         reprocess: If True, reprocess even if already processed.
@@ -596,16 +876,27 @@ def process_marketdata(  # noqa: PLR0915
         max_workers: Maximum number of parallel workers for processing.
         meta_id: If provided, process only the cache entry with this ID.
         show_skipped: If False, suppress S symbols in progress display.
+        executor: ``"thread"`` (default) or ``"process"``.
 
     Returns:
         TaskReport with results of all processing operations.
+
+    Raises:
+        ValueError: If *executor* is not a known executor.
     """
-    from .processing import _read_marketdata
+    from .catalog import DatasetCatalog
+    from .processing import _read_marketdata_in_worker
+
+    if executor not in PROCESSING_EXECUTORS:
+        raise ValueError(
+            f"Unknown executor {executor!r}; "
+            f"expected one of {', '.join(PROCESSING_EXECUTORS)}"
+        )
 
     template = retrieve_template(template_name)
     cache = CacheManager()
 
-    with closing(cache.meta_db_connection) as conn, conn:
+    with cache.meta_db() as conn:
         c = conn.cursor()
         if meta_id is not None:
             c.execute(
@@ -642,95 +933,55 @@ def process_marketdata(  # noqa: PLR0915
         show_skipped=show_skipped,
     )
 
-    # Lock for serializing SQLite writes
-    db_lock = threading.Lock()
-
-    def process_single(meta_row: tuple) -> TaskResult:
-        """Process a single cache entry.
-
-        Args:
-            meta_row: Tuple containing the metadata row ID.
+    process_pool = (
+        _worker_process_pool(cache, template.id, max_workers)
+        if executor == "process" and rows
+        else None
+    )
 
-        Returns:
-            TaskResult with processing result information.
-        """
-        start_time = datetime.now()
+    def read_in_worker(meta: CacheMetadata, captured_warnings: list[str]) -> None:
+        """Parse, transform and write an entry in a worker process."""
+        future = process_pool.submit(_read_marketdata_in_worker, meta)
+        is_processed, warnings, registrations = future.result()
+        catalog = DatasetCatalog()
+        for registration in registrations:
+            catalog.register_dataset(**registration)
+        meta.is_processed = is_processed
+        captured_warnings.extend(warnings)
 
+    def process_single(meta_row: tuple) -> TaskResult:
+        """Process the cache entry with the row ID ``meta_row[0]``."""
         _meta = cache._load_meta_dict_by_id(meta_row[0])
         meta = CacheMetadata(template.id)
         meta.from_dict(_meta)
+        return _process_entry(
+            cache,
+            template_name,
+            meta,
+            reprocess=reprocess,
+            read=None if process_pool is None else read_in_worker,
+        )
 
-        with capture_warnings() as captured_warnings:
-            try:
-                should_process = reprocess or not meta.is_processed
-
-                if should_process:
-                    meta.processing_errors = ""
-
-                    # File I/O - parallelizable
-                    _read_marketdata(meta)
-
-                    # Serialized DB write
-                    with db_lock:
-                        cache.save_meta(meta)
-
-                    duration = (datetime.now() - start_time).total_seconds()
-
-                    result = create_task_result_success(
-                        operation="process",
-                        template_name=template_name,
-                        args=meta.download_args,
-                        duration=duration,
-                        downloaded_files=meta.downloaded_files,
-                        is_processed=meta.is_processed,
-                        captured_warnings=captured_warnings,
-                    )
-                else:
-                    # Task was skipped (already processed)
-                    duration = (datetime.now() - start_time).total_seconds()
-
-                    result = create_task_result_skipped(
-                        operation="process",
-                        template_name=template_name,
-                        args=meta.download_args,
-                        duration=duration,
-                        downloaded_files=meta.downloaded_files,
-                        is_processed=meta.is_processed,
-                    )
-
-            except Exception as ex:
-                duration = (datetime.now() - start_time).total_seconds()
-
-                # Save error to metadata (serialized)
-                meta.processing_errors = str(ex)
-                with db_lock, contextlib.suppress(Exception):
-                    cache.save_meta(meta)
-
-                result = create_task_result_from_exception(
-                    exception=ex,
-                    operation="process",
-                    template_name=template_name,
-                    args=meta.download_args,
-                    duration=duration,
-                    downloaded_files=meta.downloaded_files,
-                    is_processed=meta.is_processed,
-                    captured_warnings=captured_warnings,
-                    is_expected_error=False,
-                )
-
-        return result
-
-    # Process in parallel using ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_single, row): row for row in rows}
-
-        for future in as_completed(futures):
-            result = future.result()
-            report.add_result(result)
+    # Process in parallel using ThreadPoolExecutor (the threads hand the
+    # parsing to the process pool, if any); metadata updates are written in
+    # batches by a single writer
+    try:
+        with (
+            cache.write_behind(),
+            ThreadPoolExecutor(max_workers=max_workers) as pool,
+        ):
+            futures = {pool.submit(process_single, row): row for row in rows}
+
+            for future in as_completed(futures):
+                result = future.result()
+                report.add_result(result)
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown()
 
     report.finish()
 
-    _touch_output_marker(cache, template, report)
+    _touch_output_marker(cache, template, report.results)
 
     _save_report_if_requested(report_file, report)
 
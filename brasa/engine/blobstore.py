@@ -0,0 +1,227 @@
+"""Content-addressed store for raw download files.
+
+With ``dedup = true`` in the ``[raw_storage]`` table of ``config.toml``,
+each stored raw file is moved into ``blobs/`` under a key derived from its
+content, and the file in ``raw/<template>/<checksum>/`` becomes a hardlink
+to that blob. Identical payloads fetched by several templates (BVBG bundles
+read by more than one template) or refetched under a new ``extra_key`` then
+take the disk space of a single file.
+
+References are counted in the ``raw_blob_refs`` table of the metadata
+database (created by a schema migration), one row per raw file, so a
+blob is deleted only when the last raw file linked to it is released
+(:meth:`BlobStore.release`).
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .config import load_config
+
+if TYPE_CHECKING:
+    from .cache import CacheManager
+
+
+def raw_dedup_enabled() -> bool:
+    """Whether raw files go through the blob store.
+
+    Read from the ``dedup`` key of the ``[raw_storage]`` table of
+    ``config.toml``; off by default.
+    """
+    value = load_config().get("raw_storage")
+    return isinstance(value, dict) and bool(value.get("dedup", False))
+
+
+def blob_key(digest: str, suffix: str) -> str:
+    """Return the blob key of a file.
+
+    Args:
+        digest: SHA-256 hex digest of the decoded content.
+        suffix: Codec suffix of the stored file (``.gz``, ``.zst``). Part of
+            the key because readers pick the codec from the file suffix.
+
+    Returns:
+        The key, also the blob's file name.
+    """
+    return f"{digest}{suffix}"
+
+
+class BlobStore:
+    """Blobs in ``<cache>/blobs/`` and the raw files linked to them.
+
+    Adding and releasing references run inside immediate transactions, so
+    concurrent downloads (threads or processes sharing the cache) never
+    delete a blob another one is linking to.
+
+    Args:
+        man: CacheManager whose cache holds the blobs; the singleton by
+            default.
+    """
+
+    _folder = "blobs"
+
+    def __init__(self, man: CacheManager | None = None) -> None:
+        if man is None:
+            from .cache import CacheManager
+
+            man = CacheManager()
+        self.man = man
+
+    @property
+    def root(self) -> Path:
+        """Folder holding the blobs."""
+        return Path(self.man.cache_path(self._folder))
+
+    def blob_path(self, key: str) -> Path:
+        """Path of blob *key*, fanned out by its first two characters."""
+        return self.root / key[:2] / key
+
+    def _connect(self) -> sqlite3.Connection:
+        db_path = self.man.cache_path(self.man.meta_db_filename)
+        return sqlite3.connect(db_path, timeout=30, isolation_level=None)
+
+    def add(self, source: Path, key: str, fname: str) -> bool:
+        """Store *source* as blob *key* and make raw file *fname* a link to it.
+
+        *source* is consumed: it becomes the blob, or is deleted when the
+        blob already exists. When the filesystem refuses hardlinks the raw
+        file gets its own copy and holds no reference.
+
+        Args:
+            source: Compressed file to store.
+            key: Blob key (see :func:`blob_key`).
+            fname: Raw file path relative to the cache.
+
+        Returns:
+            True if *fname* is linked to the blob.
+        """
+        blob = self.blob_path(key)
+        target = Path(self.man.cache_path(fname))
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("begin immediate")
+            try:
+                created = not blob.exists()
+                if created:
+                    source.replace(blob)
+                try:
+                    os.link(blob, target)
+                except OSError:
+                    if created:
+                        blob.replace(target)
+                    else:
+                        source.replace(target)
+                    conn.execute("commit")
+                    return False
+                if not created:
+                    source.unlink()
+                conn.execute(
+                    "insert or replace into raw_blob_refs (path, blob) values (?, ?)",
+                    (fname, key),
+                )
+                conn.execute("commit")
+            except BaseException:
+                conn.execute("rollback")
+                raise
+        return True
+
+    def _release(self, conn: sqlite3.Connection, paths: Iterable[str]) -> list[str]:
+        keys = set()
+        for path in paths:
+            row = conn.execute(
+                "select blob from raw_blob_refs where path = ?", (path,)
+            ).fetchone()
+            if row is not None:
+                conn.execute("delete from raw_blob_refs where path = ?", (path,))
+                keys.add(row[0])
+        freed = []
+        for key in sorted(keys):
+            (count,) = conn.execute(
+                "select count(*) from raw_blob_refs where blob = ?", (key,)
+            ).fetchone()
+            if count == 0:
+                self.blob_path(key).unlink(missing_ok=True)
+                freed.append(key)
+        return freed
+
+    def release(self, folder: str) -> list[str]:
+        """Drop the references of the raw files in *folder*.
+
+        Blobs left without references are deleted. Call it when a download
+        folder is removed; the folder itself is not touched.
+
+        Args:
+            folder: Download folder relative to the cache
+                (``CacheMetadata.download_folder``).
+
+        Returns:
+            Keys of the deleted blobs.
+        """
+        prefix = str(Path(folder)) + os.sep
+        with closing(self._connect()) as conn:
+            conn.execute("begin immediate")
+            try:
+                paths = [
+                    row[0]
+                    for row in conn.execute(
+                        "select path from raw_blob_refs where substr(path, 1, ?) = ?",
+                        (len(prefix), prefix),
+                    )
+                ]
+                freed = self._release(conn, paths)
+                conn.execute("commit")
+            except BaseException:
+                conn.execute("rollback")
+                raise
+        return freed
+
+    def release_paths(self, paths: Iterable[str]) -> list[str]:
+        """Drop the references of individual raw files.
+
+        Args:
+            paths: Raw file paths relative to the cache.
+
+        Returns:
+            Keys of the blobs deleted because nothing references them.
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("begin immediate")
+            try:
+                freed = self._release(conn, paths)
+                conn.execute("commit")
+            except BaseException:
+                conn.execute("rollback")
+                raise
+        return freed
+
+    def refcount(self, key: str) -> int:
+        """Number of raw files linked to blob *key*."""
+        with closing(self._connect()) as conn:
+            (count,) = conn.execute(
+                "select count(*) from raw_blob_refs where blob = ?", (key,)
+            ).fetchone()
+        return count
+
+    def stale_refs(self) -> list[str]:
+        """Referencing raw files that no longer exist (removed by hand)."""
+        with closing(self._connect()) as conn:
+            paths = [row[0] for row in conn.execute("select path from raw_blob_refs")]
+        return [p for p in paths if not Path(self.man.cache_path(p)).exists()]
+
+    def orphan_blobs(self) -> list[Path]:
+        """Blob files no raw file references."""
+        if not self.root.exists():
+            return []
+        with closing(self._connect()) as conn:
+            keys = {row[0] for row in conn.execute("select blob from raw_blob_refs")}
+        return sorted(
+            blob
+            for blob in self.root.glob("*/*")
+            if blob.is_file() and blob.name not in keys
+        )
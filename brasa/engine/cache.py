@@ -11,7 +11,10 @@ import json
 import re
 import shutil
 import sqlite3
-from contextlib import closing
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -23,10 +26,14 @@ import pandas as pd
 from brasa.util import DownloadArgs, generate_checksum_for_template
 
 from .config import resolve_data_path
+from .connections import connection_pool, open_connection
 from .core import Singleton, json_convert_from_object, json_convert_to_object
+from .migrations import migrate_meta_db
 from .resources import package_path
+from .writebehind import MetaWriteBuffer
 
 if TYPE_CHECKING:
+    from .download import RawIOStats
     from .template import MarketDataTemplate
 
 
@@ -52,6 +59,8 @@ class DownloadResult:
             template retry_attempts. None when not configured.
         retry_success_on_attempt: 1-based attempt number that succeeded,
             or None if all attempts failed.
+        raw_io: Bytes read and written by each raw-file stage (checksum,
+            decode, validate, compress) of a stored download, else None.
     """
 
     status_code: str
@@ -64,6 +73,7 @@ class DownloadResult:
     retry_attempts_used: int | None = None
     retry_attempts_configured: int | None = None
     retry_success_on_attempt: int | None = None
+    raw_io: RawIOStats | None = None
 
 
 class CacheMetadata:
@@ -164,13 +174,52 @@ class CacheMetadata:
             )
 
 
+# cache_metadata columns written by save_meta, in table order.
+_META_COLUMNS = (
+    "id",
+    "download_checksum",
+    "timestamp",
+    "response",
+    "download_args",
+    "template",
+    "downloaded_files",
+    "processed_files",
+    "extra_key",
+    "processing_errors",
+    "is_invalid_download",
+    "invalid_download_reason",
+)
+_UPSERT_META_SQL = (
+    f"insert into cache_metadata ({', '.join(_META_COLUMNS)}) "
+    f"values ({', '.join('?' * len(_META_COLUMNS))}) on conflict(id) do update set "
+    + ", ".join(f"{col} = excluded.{col}" for col in _META_COLUMNS[1:])
+)
+_INSERT_TRIAL_SQL = (
+    "INSERT INTO download_trials "
+    "(cache_id, timestamp, downloaded, status_code, status_name, reason, http_status) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_DELETE_META_SQL = "delete from cache_metadata where id = ?"
+_DELETE_TRIALS_SQL = "delete from download_trials where cache_id = ?"
+_DELETE_TRIAL_SUMMARY_SQL = "delete from download_trials_summary where cache_id = ?"
+
+
 class CacheManager(Singleton):
     """Singleton manager for the market data cache.
 
     Handles file system structure, SQLite metadata storage, and
     coordination of download/processing operations.
+
+    Metadata and trial writes are serialized through ``_write_lock`` so that
+    concurrent acquisition/processing threads never interleave a
+    read-then-write on the metadata database. Inside :meth:`write_behind`
+    they are queued and written in batches instead.
     """
 
+    _write_lock = threading.RLock()
+    _write_buffer: MetaWriteBuffer | None = None
+    _write_behind_users = 0
+
     _meta_db_filename = "meta.db"
     _meta_folder = "meta"
     _duckdb_filename = "brasa.duckdb"
@@ -185,6 +234,8 @@ class CacheManager(Singleton):
         self._ensure_dir(self._db_folder)
         if not Path(self.cache_path(self.meta_db_filename)).exists():
             self.create_meta_db()
+        else:
+            migrate_meta_db(self.cache_path(self.meta_db_filename))
         # Initialize the dataset catalog table
         self._init_dataset_catalog()
 
@@ -226,7 +277,7 @@ class CacheManager(Singleton):
         return str(Path(self._db_folder) / self._duckdb_filename)
 
     def create_meta_db(self) -> None:
-        """Create the SQLite metadata database."""
+        """Create the SQLite metadata database at the current schema version."""
         db_conn = sqlite3.connect(database=self.cache_path(self.meta_db_filename))
         c = db_conn.cursor()
         sql_path = package_path("sql", "create-meta-db.sql")
@@ -234,6 +285,7 @@ class CacheManager(Singleton):
             c.executescript(f.read())
         db_conn.commit()
         db_conn.close()
+        migrate_meta_db(self.cache_path(self.meta_db_filename))
 
     def _init_dataset_catalog(self) -> None:
         """Initialize the dataset catalog table if it doesn't exist."""
@@ -247,10 +299,81 @@ class CacheManager(Singleton):
 
     @property
     def meta_db_connection(self) -> sqlite3.Connection:
-        """Get a connection to the metadata database with FK enforcement on."""
-        conn = sqlite3.connect(database=self.cache_path(self.meta_db_filename))
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        """Open a new connection to the metadata database (caller closes it).
+
+        Internal queries go through :meth:`meta_db`, which reuses one
+        connection per thread.
+        """
+        return open_connection(self.cache_path(self.meta_db_filename))
+
+    def meta_db(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Transaction on the calling thread's metadata database connection.
+
+        The connection is long-lived, runs in WAL mode and keeps its
+        prepared statements (see :mod:`brasa.engine.connections`). The
+        block commits on exit and rolls back if it raises.
+
+        Returns:
+            Context manager yielding the connection.
+        """
+        return connection_pool(self.cache_path(self.meta_db_filename)).transaction()
+
+    @contextmanager
+    def write_behind(self, **kwargs: Any) -> Iterator[MetaWriteBuffer]:
+        """Queue metadata and trial writes for batched writing in the block.
+
+        ``save_meta``, ``save_trial``, ``clean_meta_db`` and trial deletes
+        are applied in order by a single writer thread, in transactions of
+        up to ``batch_size`` writes (see :mod:`brasa.engine.writebehind`).
+        ``has_meta`` and ``load_meta`` see queued rows, and the trial
+        queries flush the queue first. Everything is written when the block
+        exits. Nested or concurrent blocks share one buffer, written when
+        the last of them exits.
+
+        Args:
+            **kwargs: ``batch_size`` and ``flush_interval`` of the buffer.
+
+        Yields:
+            The active MetaWriteBuffer.
+        """
+        with self._write_lock:
+            if self._write_buffer is None:
+                self._write_buffer = MetaWriteBuffer(self, **kwargs)
+                self._write_behind_users = 0
+            buffer = self._write_buffer
+            self._write_behind_users += 1
+        try:
+            yield buffer
+        finally:
+            with self._write_lock:
+                self._write_behind_users -= 1
+                last = self._write_behind_users == 0
+                if last:
+                    self._write_buffer = None
+            if last:
+                buffer.close()
+
+    def _write(
+        self,
+        sql: str,
+        params: tuple,
+        *,
+        meta_id: str | None = None,
+        row: tuple | None = None,
+    ) -> None:
+        """Execute a metadata write now, or queue it inside write_behind()."""
+        buffer = self._write_buffer
+        if buffer is not None:
+            buffer.put(sql, params, meta_id=meta_id, row=row)
+            return
+        with self._write_lock, self.meta_db() as conn:
+            conn.execute(sql, params)
+
+    def _flush_writes(self) -> None:
+        """Commit queued writes before a query that must see them."""
+        buffer = self._write_buffer
+        if buffer is not None:
+            buffer.flush()
 
     def db_folder(self, template: MarketDataTemplate) -> str:
         """Get the database folder for a template, including layer.
@@ -311,9 +434,17 @@ class CacheManager(Singleton):
 
         return db_folders
 
-    def create_download_folder(self, meta: CacheMetadata):
-        """Create the download folder for a cache entry."""
-        self._ensure_dir(meta.download_folder)
+    def create_download_folder(self, meta: CacheMetadata, exist_ok: bool = True):
+        """Create the download folder for a cache entry.
+
+        Args:
+            meta: Cache entry whose ``download_folder`` is created.
+            exist_ok: If False, raise ``FileExistsError`` when the folder
+                already exists. Creation is atomic, so exactly one of several
+                concurrent callers for the same folder succeeds.
+        """
+        path = Path(self.cache_path(meta.download_folder))
+        path.mkdir(parents=True, exist_ok=exist_ok)
 
     @property
     def meta_db_filename(self) -> str:
@@ -328,7 +459,11 @@ class CacheManager(Singleton):
 
     def has_meta(self, meta: CacheMetadata) -> bool:
         """Check if metadata exists for a cache entry."""
-        with closing(self.meta_db_connection) as conn, conn:
+        if self._write_buffer is not None:
+            pending, row = self._write_buffer.pending_meta(meta.id)
+            if pending:
+                return row is not None
+        with self.meta_db() as conn:
             c = conn.cursor()
             c.execute("select * from cache_metadata where id = ?", (meta.id,))
             return len(c.fetchall()) == 1
@@ -340,93 +475,155 @@ class CacheManager(Singleton):
 
     def _load_meta_dict_by_id(self, id: str) -> dict | None:
         """Load metadata as a dictionary by ID."""
-        with closing(self.meta_db_connection) as conn, conn:
+        if self._write_buffer is not None:
+            pending, row = self._write_buffer.pending_meta(id)
+            if pending:
+                return None if row is None else self._meta_row_to_dict(row)
+        with self.meta_db() as conn:
             c = conn.cursor()
             c.execute("select * from cache_metadata where id = ?", (id,))
             if meta_row := c.fetchall():
-                meta_row = meta_row[0]
-                _meta = {
-                    "download_checksum": meta_row[1],
-                    "timestamp": datetime.fromisoformat(meta_row[2]),
-                    "response": json.loads(
-                        meta_row[3], object_hook=json_convert_to_object
-                    ),
-                    "download_args": DownloadArgs.from_json(meta_row[4]),
-                    "template": meta_row[5],
-                    "downloaded_files": json.loads(
-                        meta_row[6], object_hook=json_convert_to_object
-                    ),
-                    "processed_files": json.loads(
-                        meta_row[7], object_hook=json_convert_to_object
-                    ),
-                    "extra_key": meta_row[8],
-                    "processing_errors": meta_row[9],
-                    "is_invalid_download": meta_row[10] == "1"
-                    if len(meta_row) > 10
-                    else False,
-                    "invalid_download_reason": meta_row[11]
-                    if len(meta_row) > 11
-                    else "",
-                }
-                return _meta
+                return self._meta_row_to_dict(meta_row[0])
         return None
 
+    @staticmethod
+    def _meta_row_to_dict(meta_row: tuple) -> dict:
+        """Convert a ``cache_metadata`` row into a CacheMetadata dict."""
+        return {
+            "download_checksum": meta_row[1],
+            "timestamp": datetime.fromisoformat(meta_row[2]),
+            "response": json.loads(meta_row[3], object_hook=json_convert_to_object),
+            "download_args": DownloadArgs.from_json(meta_row[4]),
+            "template": meta_row[5],
+            "downloaded_files": json.loads(
+                meta_row[6], object_hook=json_convert_to_object
+            ),
+            "processed_files": json.loads(
+                meta_row[7], object_hook=json_convert_to_object
+            ),
+            "extra_key": meta_row[8],
+            "processing_errors": meta_row[9],
+            "is_invalid_download": meta_row[10] == "1" if len(meta_row) > 10 else False,
+            "invalid_download_reason": meta_row[11] if len(meta_row) > 11 else "",
+        }
+
+    def partial_download_path(self, meta: CacheMetadata) -> str:
+        """Path of the ``.part`` file that keeps an interrupted download.
+
+        The file sits in ``raw/<template>/`` next to the checksum folders and
+        is named after the cache id, so a later attempt for the same entry
+        resumes it.
+
+        Args:
+            meta: The cache entry being downloaded.
+
+        Returns:
+            Absolute path of the partial download file.
+        """
+        return self.cache_path(
+            str(Path(self._raw_folder) / meta.template / f"{meta.id}.part")
+        )
+
+    def create_staging_folder(self, meta: CacheMetadata) -> str:
+        """Create a private folder where a download's raw files are assembled.
+
+        It sits in ``raw/<template>/`` so its files can be moved into the
+        checksum folder by rename. The caller removes it.
+
+        Args:
+            meta: The cache entry being downloaded.
+
+        Returns:
+            Absolute path of the new folder.
+        """
+        template_folder = Path(
+            self.cache_path(str(Path(self._raw_folder) / meta.template))
+        )
+        template_folder.mkdir(parents=True, exist_ok=True)
+        return tempfile.mkdtemp(
+            prefix=f".{meta.id}-", suffix=".staging", dir=template_folder
+        )
+
+    def load_previous_response(self, meta: CacheMetadata) -> dict | None:
+        """Load the stored response headers of the latest sibling entry.
+
+        Siblings share the template and download arguments but have another
+        cache id, e.g. earlier days of an ``extra-key: date`` snapshot.
+
+        Args:
+            meta: The cache entry about to be downloaded.
+
+        Returns:
+            The most recent sibling's response headers, or None.
+        """
+        download_args = meta.download_args
+        if not isinstance(download_args, DownloadArgs):
+            download_args = DownloadArgs(download_args)
+        with self.meta_db() as conn:
+            c = conn.cursor()
+            c.execute(
+                "select response from cache_metadata "
+                "where template = ? and download_args = ? and id != ? "
+                "order by timestamp desc limit 1",
+                (meta.template, download_args.to_json(), meta.id),
+            )
+            row = c.fetchone()
+        if row is None or row[0] is None:
+            return None
+        response = json.loads(row[0])
+        return response if isinstance(response, dict) else None
+
     def save_meta(self, meta: CacheMetadata) -> None:
-        """Save metadata to the database."""
+        """Save metadata to the database.
+
+        The typed columns promoted from ``download_args`` and the processing
+        state (``refdate``, ``start_date``, ``end_date``, ``year``,
+        ``is_processed``) are filled by triggers of the schema. Inside
+        :meth:`write_behind` the row is queued instead of written.
+        """
         # Normalize download_args in case a plain dict was assigned directly
         download_args = meta.download_args
         if not isinstance(download_args, DownloadArgs):
             download_args = DownloadArgs(download_args)
-        with closing(self.meta_db_connection) as conn, conn:
-            c = conn.cursor()
-            c.execute("select * from cache_metadata where id = ?", (meta.id,))
-            if c.fetchall():
-                params = (
-                    meta.download_checksum,
-                    meta.timestamp.isoformat(),
-                    json.dumps(meta.response, default=json_convert_from_object),
-                    download_args.to_json(),
-                    meta.template,
-                    json.dumps(meta.downloaded_files, default=json_convert_from_object),
-                    json.dumps(meta.is_processed),
-                    meta.extra_key,
-                    meta.processing_errors,
-                    "1" if meta.is_invalid_download else "0",
-                    meta.invalid_download_reason,
-                    meta.id,
-                )
-                c.execute(
-                    "update cache_metadata set download_checksum = ?, timestamp = ?, response = ?, download_args = ?, template = ?, downloaded_files = ?, processed_files = ?, extra_key = ?, processing_errors = ?, is_invalid_download = ?, invalid_download_reason = ? where id = ?",
-                    params,
-                )
-            else:
-                params = (
-                    meta.id,
-                    meta.download_checksum,
-                    meta.timestamp.isoformat(),
-                    json.dumps(meta.response, default=json_convert_from_object),
-                    download_args.to_json(),
-                    meta.template,
-                    json.dumps(meta.downloaded_files, default=json_convert_from_object),
-                    json.dumps(meta.is_processed),
-                    meta.extra_key,
-                    meta.processing_errors,
-                    "1" if meta.is_invalid_download else "0",
-                    meta.invalid_download_reason,
-                )
-                c.execute(
-                    "insert into cache_metadata values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    params,
-                )
+        row = (
+            meta.id,
+            meta.download_checksum,
+            meta.timestamp.isoformat(),
+            json.dumps(meta.response, default=json_convert_from_object),
+            download_args.to_json(),
+            meta.template,
+            json.dumps(meta.downloaded_files, default=json_convert_from_object),
+            json.dumps(meta.is_processed),
+            meta.extra_key,
+            meta.processing_errors,
+            "1" if meta.is_invalid_download else "0",
+            meta.invalid_download_reason,
+        )
+        self._write(_UPSERT_META_SQL, row, meta_id=meta.id, row=row)
 
     def clean_meta_raw_folder(self, meta: CacheMetadata) -> None:
         """Clean the raw download folder for a cache entry."""
         # warn(f"Cleaning meta download {meta.download_args}", stacklevel=2)
         if meta.download_folder == "":
             return
-        folder = self.cache_path(meta.download_folder)
-        if Path(folder).exists():
-            shutil.rmtree(folder, ignore_errors=False)
+        self.remove_raw_folder(meta.download_folder)
+
+    def remove_raw_folder(self, folder: str) -> None:
+        """Delete a raw download folder and release the blobs it links to.
+
+        Blobs of the content-addressed store are deleted once no other
+        download folder references them.
+
+        Args:
+            folder: Download folder relative to the cache
+                (``CacheMetadata.download_folder``).
+        """
+        from .blobstore import BlobStore
+
+        path = Path(self.cache_path(folder))
+        if path.exists():
+            shutil.rmtree(path, ignore_errors=False)
+        BlobStore(self).release(folder)
 
     def clean_meta_db(self, meta: CacheMetadata) -> None:
         """Remove metadata from the database.
@@ -436,15 +633,12 @@ class CacheManager(Singleton):
         trials must persist for REQ-010/REQ-011 scheduling. Trial deletion is
         scoped to drop() only.
         """
-        with closing(self.meta_db_connection) as conn, conn:
-            c = conn.cursor()
-            c.execute("delete from cache_metadata where id = ?", (meta.id,))
+        self._write(_DELETE_META_SQL, (meta.id,), meta_id=meta.id)
 
     def _delete_trials(self, meta: CacheMetadata) -> None:
-        """Delete all download_trials rows for a cache entry."""
-        with closing(self.meta_db_connection) as conn, conn:
-            c = conn.cursor()
-            c.execute("delete from download_trials where cache_id = ?", (meta.id,))
+        """Delete all download_trials rows (and their compacted summary) of an entry."""
+        self._write(_DELETE_TRIALS_SQL, (meta.id,))
+        self._write(_DELETE_TRIAL_SUMMARY_SQL, (meta.id,))
 
     def remove_meta(self, meta: CacheMetadata) -> None:
         """Remove all traces of a cache entry (files and metadata).
@@ -503,23 +697,16 @@ class CacheManager(Singleton):
             status_code = "." if downloaded else "F"
             status_name = "PASSED" if downloaded else "FAILED"
 
-        with closing(self.meta_db_connection) as conn, conn:
-            c = conn.cursor()
-            params = (
-                meta.id,
-                meta.timestamp.isoformat(),
-                downloaded,
-                status_code,
-                status_name,
-                reason,
-                http_status,
-            )
-            c.execute(
-                "INSERT INTO download_trials "
-                "(cache_id, timestamp, downloaded, status_code, status_name, reason, http_status) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                params,
-            )
+        params = (
+            meta.id,
+            meta.timestamp.isoformat(),
+            downloaded,
+            status_code,
+            status_name,
+            reason,
+            http_status,
+        )
+        self._write(_INSERT_TRIAL_SQL, params)
 
     def get_last_download_status(self, meta: CacheMetadata) -> dict | None:
         """Get the most recent download status for a cache entry.
@@ -535,7 +722,8 @@ class CacheManager(Singleton):
             Dict with keys code, name, reason, http_status or None
             if no trials exist.
         """
-        with closing(self.meta_db_connection) as conn, conn:
+        self._flush_writes()
+        with self.meta_db() as conn:
             c = conn.cursor()
             c.execute(
                 "SELECT status_code, status_name, reason, http_status "
@@ -555,7 +743,8 @@ class CacheManager(Singleton):
 
     def has_successful_trial(self, meta: CacheMetadata) -> bool:
         """Check if there was a successful download trial."""
-        with closing(self.meta_db_connection) as conn, conn:
+        self._flush_writes()
+        with self.meta_db() as conn:
             c = conn.cursor()
             c.execute(
                 "select * from download_trials where cache_id = ? and downloaded = '1'",
@@ -563,6 +752,17 @@ class CacheManager(Singleton):
             )
             return len(c.fetchall()) > 0
 
+    def snapshot(self, ids: Iterable[str]) -> CacheSnapshot:
+        """Read the metadata and latest trials of many entries at once.
+
+        Args:
+            ids: Cache entry ids (``CacheMetadata.id``).
+
+        Returns:
+            A CacheSnapshot answering the cache reads for those entries.
+        """
+        return CacheSnapshot(self, ids)
+
     def count_trials(
         self,
         meta: CacheMetadata,
@@ -570,6 +770,12 @@ class CacheManager(Singleton):
     ) -> int:
         """Count download trial rows for a cache entry.
 
+        Trials rolled into ``download_trials_summary`` by compaction (see
+        :mod:`brasa.engine.compaction`) are included. With *since*, a
+        summary row counts in full when its last trial is not older than
+        *since*; compacted trials are older than the retention window, so
+        this only matters for a *since* beyond it.
+
         Args:
             meta: Cache metadata identifying the entry.
             since: Optional ISO-format timestamp lower bound
@@ -579,21 +785,27 @@ class CacheManager(Singleton):
         Returns:
             Number of matching trial rows.
         """
-        with closing(self.meta_db_connection) as conn, conn:
+        self._flush_writes()
+        with self.meta_db() as conn:
             c = conn.cursor()
             if since:
                 c.execute(
-                    "SELECT COUNT(*) FROM download_trials "
-                    "WHERE cache_id = ? AND timestamp >= ?",
-                    (meta.id, since),
+                    "SELECT (SELECT COUNT(*) FROM download_trials "
+                    "WHERE cache_id = ? AND timestamp >= ?) + "
+                    "(SELECT TOTAL(trials) FROM download_trials_summary "
+                    "WHERE cache_id = ? AND last_timestamp >= ?)",
+                    (meta.id, since, meta.id, since),
                 )
             else:
                 c.execute(
-                    "SELECT COUNT(*) FROM download_trials WHERE cache_id = ?",
-                    (meta.id,),
+                    "SELECT (SELECT COUNT(*) FROM download_trials "
+                    "WHERE cache_id = ?) + "
+                    "(SELECT TOTAL(trials) FROM download_trials_summary "
+                    "WHERE cache_id = ?)",
+                    (meta.id, meta.id),
                 )
             row = c.fetchone()
-            return row[0] if row else 0
+            return int(row[0]) if row else 0
 
     def parquet_file_name(self, fname_part: str) -> str:
         """Generate a parquet filename from a part identifier."""
@@ -691,7 +903,7 @@ class CacheManager(Singleton):
         Returns:
             A DownloadResult describing the outcome.
         """
-        from .download import _download_marketdata
+        from .download import RawIOStats, _download_marketdata
         from .exceptions import (
             CorruptedContentException,
             DownloadException,
@@ -723,12 +935,14 @@ class CacheManager(Singleton):
 
         result: DownloadResult | None = None
         retry_info: dict = {}
+        io_stats = RawIOStats()
         try:
             retry_info = _download_marketdata(
                 meta,
                 on_attempt_failure=_on_attempt_failure,
                 acquisition_function=acquisition_function,
                 retry_attempts_override=retry_attempts_override,
+                io_stats=io_stats,
                 **meta.download_args.to_dict(),
             )
             self.save_trial(
@@ -744,6 +958,7 @@ class CacheManager(Singleton):
                 retry_attempts_used=retry_info.get("attempts_used"),
                 retry_attempts_configured=retry_info.get("attempts_configured"),
                 retry_success_on_attempt=retry_info.get("success_on_attempt"),
+                raw_io=io_stats,
             )
         except Exception as e:
             # (code, name, downloaded, clean_db, clean_raw, extract_http,
@@ -827,15 +1042,14 @@ class CacheManager(Singleton):
             by template name.  ``count`` is the number of unprocessed
             cache entries for that template.
         """
-        with closing(self.meta_db_connection) as conn, conn:
+        with self.meta_db() as conn:
             c = conn.cursor()
             c.execute(
                 "SELECT template, COUNT(*) as count "
                 "FROM cache_metadata "
                 "WHERE downloaded_files NOT IN ('[]', '', 'null') "
                 "  AND downloaded_files IS NOT NULL "
-                "  AND (processed_files IN ('{}', '', 'null', 'false') "
-                "       OR processed_files IS NULL) "
+                "  AND is_processed = 0 "
                 "  AND (is_invalid_download IS NULL "
                 "       OR is_invalid_download != '1') "
                 "GROUP BY template "
@@ -856,3 +1070,82 @@ class CacheManager(Singleton):
         else:
             warn("No downloaded files", stacklevel=2)
             return None
+
+
+class CacheSnapshot:
+    """Cache state of many entries, read in a few set-based queries.
+
+    Answers ``has_meta``, ``load_meta``, ``get_last_download_status`` and
+    ``has_successful_trial`` like :class:`CacheManager` does, from rows
+    fetched once for all the entries of an acquisition run instead of one
+    connection per call and entry. Entries outside the snapshot are read
+    from the cache. Writes queued by :meth:`CacheManager.write_behind` are
+    flushed before the rows are read. The snapshot is not refreshed: read
+    the cache itself once an entry has been acquired.
+    """
+
+    # SQLite's historical limit on host parameters per statement is 999
+    _batch_size = 500
+
+    def __init__(self, man: CacheManager, ids: Iterable[str]) -> None:
+        self._man = man
+        self._ids = set(ids)
+        self._meta: dict[str, dict] = {}
+        self._last_status: dict[str, dict] = {}
+        self._successful: set[str] = set()
+        ids = sorted(self._ids)
+        man._flush_writes()
+        with man.meta_db() as conn:
+            for start in range(0, len(ids), self._batch_size):
+                self._fetch(conn, ids[start : start + self._batch_size])
+
+    def _fetch(self, conn: sqlite3.Connection, ids: list[str]) -> None:
+        marks = ", ".join("?" * len(ids))
+        for row in conn.execute(
+            f"select * from cache_metadata where id in ({marks})", ids
+        ):
+            self._meta[row[0]] = CacheManager._meta_row_to_dict(row)
+        for row in conn.execute(
+            "select cache_id, status_code, status_name, reason, http_status "
+            "from download_trials where rowid in ("
+            "select max(rowid) from download_trials "
+            f"where cache_id in ({marks}) group by cache_id)",
+            ids,
+        ):
+            self._last_status[row[0]] = {
+                "code": row[1],
+                "name": row[2],
+                "reason": row[3] or "",
+                "http_status": row[4],
+            }
+        for row in conn.execute(
+            "select distinct cache_id from download_trials "
+            f"where downloaded = '1' and cache_id in ({marks})",
+            ids,
+        ):
+            self._successful.add(row[0])
+
+    def has_meta(self, meta: CacheMetadata) -> bool:
+        """Check if metadata exists for a cache entry."""
+        if meta.id not in self._ids:
+            return self._man.has_meta(meta)
+        return meta.id in self._meta
+
+    def load_meta(self, meta: CacheMetadata) -> None:
+        """Load the entry's metadata into a CacheMetadata instance."""
+        if meta.id not in self._ids:
+            self._man.load_meta(meta)
+            return
+        meta.from_dict(dict(self._meta[meta.id]))
+
+    def get_last_download_status(self, meta: CacheMetadata) -> dict | None:
+        """Return the entry's most recent download status, or None."""
+        if meta.id not in self._ids:
+            return self._man.get_last_download_status(meta)
+        return self._last_status.get(meta.id)
+
+    def has_successful_trial(self, meta: CacheMetadata) -> bool:
+        """Check if there was a successful download trial."""
+        if meta.id not in self._ids:
+            return self._man.has_successful_trial(meta)
+        return meta.id in self._successful
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from contextlib import closing
+from contextlib import AbstractContextManager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +19,7 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 from .cache import CacheManager
+from .connections import open_connection
 from .core import Singleton
 from .layers import DataLayer
 from .resources import package_path
@@ -166,10 +167,15 @@ class DatasetCatalog(Singleton):
 
     @property
     def _connection(self) -> sqlite3.Connection:
-        """Get a connection to the metadata database."""
+        """Open a new connection to the metadata database (caller closes it)."""
         self._ensure_initialized()
         man = CacheManager()
-        return sqlite3.connect(database=man.cache_path(man.meta_db_filename))
+        return open_connection(man.cache_path(man.meta_db_filename))
+
+    def _transaction(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Transaction on the thread's metadata database connection."""
+        self._ensure_initialized()
+        return CacheManager().meta_db()
 
     @staticmethod
     def _schema_to_json(schema: pa.Schema) -> str:
@@ -273,7 +279,7 @@ class DatasetCatalog(Singleton):
         created = created_at.isoformat() if created_at else now
         updated = updated_at.isoformat() if updated_at else now
 
-        with closing(self._connection) as conn, conn:
+        with self._transaction() as conn:
             c = conn.cursor()
             c.execute("SELECT id FROM dataset_catalog WHERE id = ?", (dataset_id,))
             if c.fetchone():
@@ -320,7 +326,7 @@ class DatasetCatalog(Singleton):
         """
         dataset_id = self._make_dataset_id(layer, dataset_name)
 
-        with closing(self._connection) as conn, conn:
+        with self._transaction() as conn:
             c = conn.cursor()
             c.execute("SELECT * FROM dataset_catalog WHERE id = ?", (dataset_id,))
             row = c.fetchone()
@@ -348,7 +354,7 @@ class DatasetCatalog(Singleton):
         Returns:
             List of DatasetInfo objects.
         """
-        with closing(self._connection) as conn, conn:
+        with self._transaction() as conn:
             c = conn.cursor()
             if layer:
                 c.execute(
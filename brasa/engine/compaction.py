@@ -0,0 +1,229 @@
+"""Retention and compaction of the download trial history.
+
+``download_trials`` gets a row per download attempt: retries, DUPLICATED
+skips and daily snapshot checks add rows forever. :func:`compact_meta_db`
+(``brasa cache compact``) keeps, for every cache id,
+
+- its last trial, which decides whether an entry is skipped;
+- its last successful trial, which ``has_successful_trial`` looks for;
+- every trial newer than the history window,
+
+and rolls the other rows into ``download_trials_summary``, one row per
+cache id and status code with the number of trials and their first and
+last timestamps. ``CacheManager.count_trials`` adds those counts back, so
+trial counts survive compaction. The database is then vacuumed and
+analyzed.
+
+The policy is read from the ``[trial_retention]`` table of
+``config.toml``::
+
+    [trial_retention]
+    days = 90  # history window kept in full
+    auto = true  # compact after downloads ...
+    interval_days = 7  # ... at most this often
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .config import load_config
+
+if TYPE_CHECKING:
+    from .cache import CacheManager
+
+_TASK = "compact"
+
+
+@dataclass
+class TrialRetention:
+    """Retention policy of the download trial history.
+
+    Attributes:
+        days: Trials newer than this many days are kept in full.
+        auto: Whether downloads compact the database automatically.
+        interval_days: Minimum days between automatic compactions.
+    """
+
+    days: int = 90
+    auto: bool = False
+    interval_days: int = 7
+
+
+def trial_retention() -> TrialRetention:
+    """Read the retention policy from ``[trial_retention]`` in config.toml."""
+    value = load_config().get("trial_retention")
+    if not isinstance(value, dict):
+        return TrialRetention()
+    default = TrialRetention()
+    return TrialRetention(
+        days=int(value.get("days", default.days)),
+        auto=bool(value.get("auto", default.auto)),
+        interval_days=int(value.get("interval_days", default.interval_days)),
+    )
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of a compaction.
+
+    Attributes:
+        trials_before: Rows in ``download_trials`` before compacting.
+        trials_summarized: Rows rolled into ``download_trials_summary``.
+        bytes_before: Size of ``meta.db`` (with its WAL) before.
+        bytes_after: Size after vacuuming, or before it when not vacuumed.
+    """
+
+    trials_before: int
+    trials_summarized: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def trials_kept(self) -> int:
+        """Rows left in ``download_trials``."""
+        return self.trials_before - self.trials_summarized
+
+
+def _db_size(db_path: str) -> int:
+    return sum(
+        path.stat().st_size
+        for path in (Path(db_path), Path(f"{db_path}-wal"))
+        if path.exists()
+    )
+
+
+def _summarize_trials(conn: sqlite3.Connection, cutoff: str) -> int:
+    # Trials are ranked by timestamp: download_trials has no INTEGER PRIMARY
+    # KEY, so VACUUM may renumber its rowids, which only break ties
+    conn.execute(
+        "create temp table compacted as "
+        "select trial from ("
+        "  select rowid as trial, timestamp, downloaded,"
+        "  row_number() over ("
+        "    partition by cache_id order by timestamp desc, rowid desc"
+        "  ) as newest,"
+        "  row_number() over ("
+        "    partition by cache_id, downloaded = '1'"
+        "    order by timestamp desc, rowid desc"
+        "  ) as newest_of_kind"
+        "  from download_trials"
+        ") "
+        "where timestamp < ? and newest > 1 "
+        "and not (downloaded = '1' and newest_of_kind = 1)",
+        (cutoff,),
+    )
+    try:
+        conn.execute(
+            "insert into download_trials_summary "
+            "(cache_id, template, status_code, trials, first_timestamp, "
+            "last_timestamp) "
+            "select t.cache_id, m.template, coalesce(t.status_code, ''), "
+            "count(*), min(t.timestamp), max(t.timestamp) "
+            "from download_trials t left join cache_metadata m on m.id = t.cache_id "
+            "where t.rowid in (select trial from compacted) "
+            "group by t.cache_id, t.status_code "
+            "on conflict(cache_id, status_code) do update set "
+            "template = coalesce(excluded.template, template), "
+            "trials = trials + excluded.trials, "
+            "first_timestamp = min(first_timestamp, excluded.first_timestamp), "
+            "last_timestamp = max(last_timestamp, excluded.last_timestamp)"
+        )
+        deleted = conn.execute(
+            "delete from download_trials where rowid in (select trial from compacted)"
+        ).rowcount
+    finally:
+        conn.execute("drop table temp.compacted")
+    return deleted
+
+
+def compact_meta_db(
+    man: CacheManager | None = None,
+    days: int | None = None,
+    vacuum: bool = True,
+) -> CompactionResult:
+    """Summarize old download trials and compact the metadata database.
+
+    Args:
+        man: CacheManager of the cache; the singleton by default.
+        days: History window in days; ``[trial_retention] days`` by default.
+        vacuum: Whether to VACUUM after summarizing (ANALYZE always runs).
+
+    Returns:
+        What was summarized and the database size before and after.
+    """
+    if man is None:
+        from .cache import CacheManager
+
+        man = CacheManager()
+    if days is None:
+        days = trial_retention().days
+    cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+    db_path = man.cache_path(man.meta_db_filename)
+    bytes_before = _db_size(db_path)
+
+    with (
+        man._write_lock,
+        closing(sqlite3.connect(db_path, timeout=30, isolation_level=None)) as conn,
+    ):
+        conn.execute("begin immediate")
+        try:
+            (trials_before,) = conn.execute(
+                "select count(*) from download_trials"
+            ).fetchone()
+            summarized = _summarize_trials(conn, cutoff)
+            conn.execute(
+                "insert or replace into cache_maintenance (task, last_run) "
+                "values (?, ?)",
+                (_TASK, datetime.now().isoformat()),
+            )
+            conn.execute("commit")
+        except BaseException:
+            conn.execute("rollback")
+            raise
+        if vacuum:
+            conn.execute("vacuum")
+            conn.execute("pragma wal_checkpoint(truncate)")
+        conn.execute("analyze")
+
+    return CompactionResult(
+        trials_before=trials_before,
+        trials_summarized=summarized,
+        bytes_before=bytes_before,
+        bytes_after=_db_size(db_path) if vacuum else bytes_before,
+    )
+
+
+def maybe_compact(man: CacheManager | None = None) -> CompactionResult | None:
+    """Compact the metadata database if the automatic policy says so.
+
+    Runs :func:`compact_meta_db` when ``[trial_retention] auto`` is on and
+    the last compaction is older than ``interval_days``.
+
+    Args:
+        man: CacheManager of the cache; the singleton by default.
+
+    Returns:
+        The compaction result, or None when nothing was done.
+    """
+    policy = trial_retention()
+    if not policy.auto:
+        return None
+    if man is None:
+        from .cache import CacheManager
+
+        man = CacheManager()
+    with man.meta_db() as conn:
+        row = conn.execute(
+            "select last_run from cache_maintenance where task = ?", (_TASK,)
+        ).fetchone()
+    if row is not None:
+        last_run = datetime.fromisoformat(row[0])
+        if datetime.now() - last_run < timedelta(days=policy.interval_days):
+            return None
+    return compact_meta_db(man, days=policy.days)
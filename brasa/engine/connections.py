@@ -0,0 +1,137 @@
+"""Long-lived SQLite connections to the metadata database.
+
+Every thread keeps one connection per database file, opened on first use
+and reused by all later queries of that thread, so the per-call
+``sqlite3.connect`` (file open, schema parse, pragma setup) is paid once
+and the connection's statement cache holds the prepared statements of the
+frequent queries (``save_meta``, ``save_trial``, ``has_meta``).
+
+Connections are tuned for concurrent acquisition and processing threads
+and separate ``brasa`` processes sharing a data path:
+
+- ``journal_mode=WAL``: readers do not block the writer and vice versa,
+  which removes most ``database is locked`` stalls;
+- ``synchronous=NORMAL``: with WAL, commits are not fsynced one by one;
+  a power loss may drop the last transactions but cannot corrupt the
+  database;
+- a busy timeout, so writers wait for each other instead of failing.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# Seconds a connection waits for a lock held by another connection.
+BUSY_TIMEOUT = 30.0
+# Prepared statements kept per connection.
+STATEMENT_CACHE_SIZE = 256
+
+
+def open_connection(db_path: str) -> sqlite3.Connection:
+    """Open a connection to *db_path* with the brasa pragmas applied.
+
+    Args:
+        db_path: Path of the SQLite database file.
+
+    Returns:
+        A new connection; the caller closes it.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        timeout=BUSY_TIMEOUT,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    conn.execute("pragma journal_mode = wal")
+    conn.execute("pragma synchronous = normal")
+    conn.execute("pragma foreign_keys = on")
+    return conn
+
+
+def _file_id(db_path: str) -> tuple[int, int] | None:
+    try:
+        stat = Path(db_path).stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class ConnectionPool:
+    """One long-lived connection per thread to a SQLite database.
+
+    A connection is reopened when it was inherited from a parent process
+    (after ``fork``) or when the database file was replaced on disk.
+
+    Args:
+        db_path: Path of the SQLite database file.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._local = threading.local()
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it if needed."""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None and (
+            local.pid != os.getpid() or local.file_id != _file_id(self.db_path)
+        ):
+            if local.pid == os.getpid():
+                conn.close()
+            conn = None
+        if conn is None:
+            conn = open_connection(self.db_path)
+            local.conn = conn
+            local.pid = os.getpid()
+            local.file_id = _file_id(self.db_path)
+            local.depth = 0
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a transaction on the thread's connection.
+
+        The transaction commits when the outermost block exits and rolls
+        back if it raises; nested blocks join the enclosing transaction.
+
+        Yields:
+            The thread's connection.
+        """
+        conn = self.connection()
+        local = self._local
+        local.depth += 1
+        try:
+            if local.depth > 1:
+                yield conn
+            else:
+                with conn:
+                    yield conn
+        finally:
+            local.depth -= 1
+
+    def close(self) -> None:
+        """Close the calling thread's connection, if open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            if self._local.pid == os.getpid():
+                conn.close()
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def connection_pool(db_path: str) -> ConnectionPool:
+    """Return the process-wide ConnectionPool of *db_path*."""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = ConnectionPool(db_path)
+            _pools[db_path] = pool
+        return pool
@@ -7,6 +7,7 @@ the engine package, including the Singleton pattern and JSON serialization helpe
 import abc
 import pydoc
 import re
+import threading
 from collections.abc import Callable
 from datetime import date, datetime
 
@@ -54,19 +55,27 @@ def load_function_by_name(func_name: str) -> Callable:
     return func
 
 
+_singleton_lock = threading.RLock()
+
+
 class Singleton(abc.ABC):
     """Abstract base class implementing the Singleton pattern.
 
     Subclasses must implement the `init` method instead of `__init__`.
+    Creation is serialized, so concurrent first calls share one instance.
     """
 
     def __new__(cls, *args, **kwds):
         it = cls.__dict__.get("__it__")
         if it is not None:
             return it
-        it = object.__new__(cls)
-        it.init(*args, **kwds)
-        cls.__it__ = it
+        with _singleton_lock:
+            it = cls.__dict__.get("__it__")
+            if it is not None:
+                return it
+            it = object.__new__(cls)
+            it.init(*args, **kwds)
+            cls.__it__ = it
         return it
 
     @abc.abstractmethod
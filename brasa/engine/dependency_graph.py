@@ -26,7 +26,6 @@ Classes:
 from __future__ import annotations
 
 import graphlib
-import json
 import logging
 from contextlib import closing
 from dataclasses import dataclass, field
@@ -649,8 +648,8 @@ class TemplateDependencyGraph:
         Status values:
 
         * ``"never-run"`` — no cache_metadata rows for this template.
-        * ``"stale"`` — at least one row has empty processed_files.
-        * ``"ok"`` — all rows have non-empty processed_files.
+        * ``"stale"`` — at least one row is not processed (``is_processed``).
+        * ``"ok"`` — all rows are processed.
 
         Args:
             template_id: A download template id.
@@ -668,27 +667,16 @@ class TemplateDependencyGraph:
         with closing(cache.meta_db_connection) as conn, conn:
             c = conn.cursor()
             c.execute(
-                "SELECT processed_files FROM cache_metadata WHERE template = ?",
+                "SELECT COUNT(*), TOTAL(is_processed = 0) FROM cache_metadata "
+                "WHERE template = ?",
                 (template_id,),
             )
-            rows = c.fetchall()
+            total, unprocessed = c.fetchone()
 
-        if not rows:
+        if not total:
             return ("never-run", "no downloads found")
 
-        unprocessed = 0
-        for (processed_files_json,) in rows:
-            if not processed_files_json:
-                unprocessed += 1
-                continue
-            try:
-                parsed = json.loads(processed_files_json)
-            except (json.JSONDecodeError, TypeError):
-                unprocessed += 1
-                continue
-            if not parsed:
-                unprocessed += 1
-
+        unprocessed = int(unprocessed)
         if unprocessed > 0:
             suffix = "entry" if unprocessed == 1 else "entries"
             return ("stale", f"{unprocessed} unprocessed {suffix}")
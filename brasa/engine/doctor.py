@@ -578,8 +578,8 @@ def check_orphan_raw() -> list[Issue]:
 
     def _fix() -> None:
         for d in orphan_dirs:
-            if Path(d).exists():
-                shutil.rmtree(d, ignore_errors=True)
+            # Releases the blobs the folder links to as well
+            man.remove_raw_folder(str(Path(d).relative_to(man.cache_folder)))
 
     return [
         Issue(
@@ -637,6 +637,47 @@ def check_missing_raw() -> list[Issue]:
     ]
 
 
+def check_orphan_blobs() -> list[Issue]:
+    """Find unreferenced blobs and references to deleted raw files.
+
+    Only relevant with ``dedup`` enabled in ``[raw_storage]``: a raw folder
+    removed by hand leaves its blob references behind, and a crash can
+    leave a blob nothing links to.
+
+    Returns:
+        List of issues found.
+    """
+    from .blobstore import BlobStore
+
+    store = BlobStore()
+    if not store.root.exists():
+        return []
+    stale = store.stale_refs()
+    orphans = store.orphan_blobs()
+    if not stale and not orphans:
+        return []
+
+    def _fix() -> None:
+        store.release_paths(stale)
+        for blob in store.orphan_blobs():
+            blob.unlink(missing_ok=True)
+
+    return [
+        Issue(
+            category="Raw Files",
+            code="orphan-blobs",
+            severity="warning",
+            description=(
+                f"{len(orphans)} unreferenced blob(s), "
+                f"{len(stale)} reference(s) to deleted raw files"
+            ),
+            details=[str(b) for b in orphans] + stale,
+            fixable=True,
+            fix_fn=_fix,
+        )
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Category: DB / Parquet
 # ---------------------------------------------------------------------------
@@ -986,9 +1027,7 @@ def check_invalid_downloads() -> list[Issue]:
             checksum = row["download_checksum"]
             template = row["template"]
             if checksum and template:
-                raw_dir = Path(man.cache_path(man._raw_folder)) / template / checksum
-                if raw_dir.exists():
-                    shutil.rmtree(raw_dir, ignore_errors=True)
+                man.remove_raw_folder(str(Path(man._raw_folder) / template / checksum))
         # Delete metadata rows
         for meta_id in meta_ids:
             _delete_meta_row(meta_id)
@@ -1847,7 +1886,7 @@ def check_download_refdate_gaps(
 # ---------------------------------------------------------------------------
 
 _CATEGORY_KEYS = {
-    "raw": ["orphan-raw", "missing-raw"],
+    "raw": ["orphan-raw", "missing-raw", "orphan-blobs"],
     "db": [
         "orphan-db",
         "missing-db",
@@ -1928,6 +1967,7 @@ def run_doctor(
     check_map: dict[str, Callable[[], list[Issue]]] = {
         "orphan-raw": check_orphan_raw,
         "missing-raw": check_missing_raw,
+        "orphan-blobs": check_orphan_blobs,
         "orphan-db": check_orphan_db,
         "missing-db": check_missing_db,
         "empty-parquet": check_empty_parquet,
@@ -2,21 +2,27 @@
 
 This module handles the downloading of market data from remote sources,
 including file format handling (zip, base64), validation, and compression.
+The checksum, validation and compression of a body share a single read
+(see :func:`_store_raw_files`).
 """
 
 import base64
-import gzip
+import hashlib
 import shutil
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from brasa.util import (
     DownloadArgs,
-    generate_checksum_from_file,
-    generate_checksum_from_zip,
-    unzip_recursive,
+    DownloadedFile,
+    RawCodec,
+    checksum_and_extract_zip,
+    compress_chunks,
 )
 
+from .blobstore import BlobStore, blob_key, raw_dedup_enabled
 from .cache import CacheManager, CacheMetadata
+from .config import load_config
 from .exceptions import (
     DownloadException,
     DuplicatedFolderException,
@@ -25,95 +31,344 @@ from .exceptions import (
 )
 from .template import retrieve_template
 
+# Read size for bodies streamed through the fused raw-file stage.
+_RAW_CHUNK_SIZE = 1 << 16
 
-def _process_downloaded_format(
+
+@dataclass
+class StageBytes:
+    """Bytes read and written by one raw-file stage.
+
+    Attributes:
+        read: Bytes the stage consumed.
+        written: Bytes the stage produced.
+    """
+
+    read: int = 0
+    written: int = 0
+
+
+@dataclass
+class RawIOStats:
+    """I/O of the raw-file stages of one download.
+
+    The checksum, decode (zip/base64), validate and compress stages run
+    over the same read of the body, so ``passes`` is 1 unless the
+    template's validator has no streaming counterpart and re-reads the
+    stored files.
+
+    Attributes:
+        stages: Bytes per stage: ``checksum``, ``decode``, ``validate``,
+            ``compress``.
+        passes: Reads over the downloaded content.
+    """
+
+    stages: dict[str, StageBytes] = field(default_factory=dict)
+    passes: int = 0
+
+    def add(self, stage: str, read: int = 0, written: int = 0) -> None:
+        """Add to the byte counts of *stage*."""
+        counts = self.stages.setdefault(stage, StageBytes())
+        counts.read += read
+        counts.written += written
+
+    @property
+    def bytes_written(self) -> int:
+        """Compressed bytes stored in the download folder."""
+        counts = self.stages.get("compress")
+        return counts.written if counts else 0
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "passes": self.passes,
+            "stages": {
+                name: {"read": counts.read, "written": counts.written}
+                for name, counts in self.stages.items()
+            },
+        }
+
+
+def configured_raw_codec() -> RawCodec:
+    """Load the raw-file codec from the user config file.
+
+    Read from the ``[raw_storage]`` table of ``config.toml``::
+
+        [raw_storage]
+        codec = "zstd"
+        level = 3
+        threads = -1
+
+    Returns:
+        The configured RawCodec; gzip when the table is absent.
+    """
+    value = load_config().get("raw_storage")
+    return RawCodec.from_config(value) if value else RawCodec()
+
+
+def template_raw_codec(md_downloader: object, base: RawCodec | None = None) -> RawCodec:
+    """Return the codec a template's raw files are stored with.
+
+    The template's ``raw_codec`` / ``raw_level`` / ``raw_threads`` override
+    the global ``[raw_storage]`` config.
+
+    Args:
+        md_downloader: The template's MarketDataDownloader.
+        base: Codec the template settings apply to; defaults to
+            :func:`configured_raw_codec`.
+
+    Returns:
+        The effective RawCodec.
+    """
+    base = base or configured_raw_codec()
+    keys = {
+        key: getattr(md_downloader, f"raw_{key}", None)
+        for key in ("codec", "level", "threads")
+    }
+    keys = {key: value for key, value in keys.items() if value is not None}
+    return RawCodec.from_config(keys, base) if keys else base
+
+
+class _ValidatedStream:
+    """Chunk observer feeding a streaming validator and counting bytes.
+
+    With ``digest`` it also hashes the decoded content, which names the
+    file's blob in the content-addressed store.
+    """
+
+    def __init__(
+        self, name: str, validator: object | None, digest: bool = False
+    ) -> None:
+        self.name = name
+        self.validator = validator
+        self.size = 0
+        self.hash = hashlib.sha256() if digest else None
+
+    def __call__(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.validator is not None:
+            self.validator.update(chunk)
+        if self.hash is not None:
+            self.hash.update(chunk)
+
+
+def _iter_base64_decoded(chunks) -> object:
+    """Decode a base64 body chunk by chunk (whitespace is ignored)."""
+    pending = b""
+    for chunk in chunks:
+        pending += b"".join(chunk.split())
+        cut = len(pending) - len(pending) % 4
+        if cut:
+            yield base64.b64decode(pending[:cut])
+            pending = pending[cut:]
+    if pending:
+        yield base64.b64decode(pending)
+
+
+def _stage_raw_files(
     template: object,
-    file_rel_path: str,
-    man: CacheManager,
-    meta: CacheMetadata,
-) -> list:
-    """Process downloaded file based on format (zip, base64, or raw).
+    fp,
+    staging: Path,
+    stats: RawIOStats,
+    *,
+    checksum: str | None = None,
+    codec: RawCodec | None = None,
+    digest: bool = False,
+) -> tuple[str, list[_ValidatedStream]]:
+    """Checksum, validate and compress the downloaded body in a single read.
+
+    With the default gzip codec, zip members are extracted as
+    ``<name>.gz``, base64 bodies are decoded into
+    ``decoded.<decoded_format>.gz`` and other formats are stored as
+    ``downloaded.<format>.gz``, all inside *staging*. Other codecs use
+    their own suffix.
 
     Args:
         template: Template with downloader configuration.
-        file_rel_path: Relative path to downloaded file.
-        man: Cache manager instance.
-        meta: Cache metadata object.
+        fp: File pointer returned by the acquisition function.
+        staging: Empty folder receiving the compressed files.
+        stats: Receives the bytes moved by each stage.
+        checksum: The body's MD5 when already known (streamed downloads);
+            skips hashing it again.
+        codec: Compression of the stored files (default: gzip).
+        digest: Hash each file's decoded content (SHA-256) for the blob
+            store.
 
     Returns:
-        List of processed file paths.
-
-    Raises:
-        Exception: If zip file is empty.
+        Tuple of (checksum, one stream per stored file, in order).
     """
-    downloaded_files = []
-    if template.downloader.format == "zip":
-        filenames = unzip_recursive(man.cache_path(file_rel_path))
-        if len(filenames) == 0:
-            raise NoDataException("Market data download failed: empty zip file")
-        for filename in filenames:
-            fname = Path(filename).name
-            _file_rel_path = str(Path(meta.download_folder) / fname)
-            shutil.move(filename, man.cache_path(_file_rel_path))
-            downloaded_files.append(_file_rel_path)
-        Path(man.cache_path(file_rel_path)).unlink()
-    elif template.downloader.format == "base64":
-        with Path(man.cache_path(file_rel_path)).open("rb") as fp:
-            fname = f"decoded.{template.downloader.decoded_format}"
-            _file_rel_path = str(Path(meta.download_folder) / fname)
-            with Path(man.cache_path(_file_rel_path)).open("wb") as fp_dest:
-                base64.decode(fp, fp_dest)
-            downloaded_files.append(_file_rel_path)
-        Path(man.cache_path(file_rel_path)).unlink()
+    downloader = template.downloader
+    codec = codec or RawCodec()
+    streams: list[_ValidatedStream] = []
+
+    def on_file(name: str) -> _ValidatedStream:
+        stream = _ValidatedStream(name, downloader.stream_validator(), digest)
+        streams.append(stream)
+        return stream
+
+    body_size = 0
+
+    def body_chunks():
+        nonlocal body_size
+        while chunk := fp.read(_RAW_CHUNK_SIZE):
+            body_size += len(chunk)
+            yield chunk
+
+    body_hash = hashlib.md5()
+    if downloader.format == "zip":
+        checksum, files = checksum_and_extract_zip(
+            fp, staging, lambda name: on_file(Path(name).name + codec.suffix), codec
+        )
+        # Members are read in name order; report them in archive order
+        by_name = {stream.name: stream for stream in streams}
+        streams = [by_name[Path(fname).name] for fname in files]
+        body_size = fp.seek(0, 2)
+        stats.add("checksum", read=body_size)
+        stats.add("decode", read=body_size, written=sum(s.size for s in streams))
+    elif downloader.format == "base64":
+        target = staging / f"decoded.{downloader.decoded_format}{codec.suffix}"
+        stream = on_file(target.name)
+        chunks = (body_hash.update(chunk) or chunk for chunk in body_chunks())
+        compress_chunks(_iter_base64_decoded(chunks), target, [stream], codec)
+        checksum = body_hash.hexdigest()
+        stats.add("checksum", read=body_size)
+        stats.add("decode", read=body_size, written=stream.size)
     else:
-        downloaded_files.append(file_rel_path)
-    return downloaded_files
+        target = staging / f"downloaded.{downloader.format}{codec.suffix}"
+        observers = [on_file(target.name)]
+        if checksum is None:
+            observers.append(body_hash.update)
+        compress_chunks(body_chunks(), target, observers, codec)
+        stats.add("checksum", read=0 if checksum else body_size)
+        checksum = checksum or body_hash.hexdigest()
+    stats.passes += 1
+    decoded = sum(stream.size for stream in streams)
+    compressed = sum((staging / s.name).stat().st_size for s in streams)
+    stats.add("validate", read=decoded)
+    stats.add("compress", read=decoded, written=compressed)
+    return checksum, streams
 
 
-def _validate_downloaded_files(
+def _validate_stored_files(
     template: object,
-    files: list,
+    streams: list[_ValidatedStream],
+    files: list[str],
     man: CacheManager,
+    stats: RawIOStats,
 ) -> None:
-    """Validate downloaded files.
+    """Finish the streaming validators of the stored files.
 
-    Args:
-        template: Template with downloader configuration.
-        files: List of file paths to validate.
-        man: Cache manager instance.
+    Validators without a streaming counterpart are run on the stored
+    files, which costs another read.
 
     Raises:
         InvalidContentException: If validation fails.
     """
-    for fname in files:
+    reread = False
+    for stream, fname in zip(streams, files, strict=True):
         try:
-            template.downloader.validate(man.cache_path(fname))
+            if stream.validator is not None:
+                stream.validator.finish()
+            else:
+                reread = True
+                stats.add("validate", read=stream.size)
+                template.downloader.validate(man.cache_path(fname))
         except Exception as e:
             raise InvalidContentException(
                 f"Downloaded content validation failed for {fname}: {e!s}"
             ) from e
+    if reread:
+        stats.passes += 1
 
 
-def _gzip_downloaded_files(
-    files: list,
-    man: CacheManager,
+def _create_download_folder(man: CacheManager, meta: CacheMetadata) -> None:
+    """Create the entry's download folder, which must not exist yet.
+
+    Raises:
+        DuplicatedFolderException: If the download folder already exists.
+    """
+    try:
+        man.create_download_folder(meta, exist_ok=False)
+    except FileExistsError as e:
+        raise _duplicated_folder(meta) from e
+
+
+def _duplicated_folder(meta: CacheMetadata) -> DuplicatedFolderException:
+    return DuplicatedFolderException(
+        f"Market data download failed: download folder {meta.download_folder} already exists"
+    )
+
+
+def _store_raw_files(
+    template: object,
+    fp,
     meta: CacheMetadata,
+    stats: RawIOStats,
 ) -> None:
-    """Compress downloaded files with gzip.
+    """Store the downloaded body as validated, compressed files in one pass.
+
+    The download folder is named after the content checksum, which is only
+    known once the body has been read, so the files are written to a
+    staging folder next to it and moved in afterwards. Validation errors
+    are raised after the duplicate check, as when each stage read the
+    files on its own. The codec comes from :func:`template_raw_codec`.
+    With ``dedup`` enabled in ``[raw_storage]``, the files are moved into
+    the content-addressed :class:`~brasa.engine.blobstore.BlobStore` and
+    the download folder holds hardlinks to them.
 
     Args:
-        files: List of file paths to compress.
-        man: Cache manager instance.
-        meta: Cache metadata object.
+        template: Template with downloader configuration.
+        fp: File pointer returned by the acquisition function.
+        meta: Cache metadata; its checksum and downloaded files are set here.
+        stats: Receives the bytes moved by each stage.
+
+    Raises:
+        DuplicatedFolderException: If the download folder already exists.
+        NoDataException: If a zip body holds no files.
+        InvalidContentException: If validation fails.
     """
-    files_to_gzip = list(files)
-    for fname in files_to_gzip:
-        _fname = man.cache_path(fname)
-        with Path(_fname).open("rb") as f_in, gzip.open(_fname + ".gz", "wb") as f_out:
-            shutil.copyfileobj(f_in, f_out)
-        meta.add_downloaded_file(fname + ".gz")
-        meta.remove_downloaded_file(fname)
-        Path(_fname).unlink()
+    man = CacheManager()
+    known = None
+    if isinstance(fp, DownloadedFile) and template.downloader.format != "zip":
+        # Streamed bodies were hashed while written: check for a duplicate
+        # before reading them at all.
+        known = fp.md5
+        meta.download_checksum = known
+        if Path(man.cache_path(meta.download_folder)).exists():
+            raise _duplicated_folder(meta)
+    staging = Path(man.create_staging_folder(meta))
+    try:
+        codec = template_raw_codec(template.downloader)
+        store = BlobStore(man) if raw_dedup_enabled() else None
+        checksum, streams = _stage_raw_files(
+            template,
+            fp,
+            staging,
+            stats,
+            checksum=known,
+            codec=codec,
+            digest=store is not None,
+        )
+        meta.download_checksum = checksum
+        # DownloadException must be raised before creating download folder
+        # after this any exception can be raised and it will clean up the
+        # download folder
+        _create_download_folder(man, meta)
+        files = []
+        for stream in streams:
+            fname = str(Path(meta.download_folder) / stream.name)
+            if store is not None:
+                key = blob_key(stream.hash.hexdigest(), codec.suffix)
+                store.add(staging / stream.name, key, fname)
+            else:
+                (staging / stream.name).replace(man.cache_path(fname))
+            files.append(fname)
+        meta.downloaded_files = files
+        if not files:
+            raise NoDataException("Market data download failed: empty zip file")
+        _validate_stored_files(template, streams, files, man, stats)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
 
 
 def _download_marketdata(
@@ -121,15 +376,15 @@ def _download_marketdata(
     on_attempt_failure=None,
     acquisition_function=None,
     retry_attempts_override=None,
+    io_stats=None,
     **kwargs,
 ):
     """Download market data for a cache entry.
 
     Handles the complete download workflow:
     1. Execute download using template configuration
-    2. Handle file formats (zip, base64, raw)
-    3. Validate downloaded files
-    4. Compress files with gzip
+    2. In one read of the body: checksum it, handle its format (zip,
+       base64, raw), validate it and compress it with gzip
 
     Args:
         meta: Cache metadata to update with download results.
@@ -140,6 +395,8 @@ def _download_marketdata(
             call without mutating the cached template.
         retry_attempts_override: Override for retry attempts count. Passed
             through to downloader.download().
+        io_stats: Optional RawIOStats receiving the bytes read and written
+            by each raw-file stage.
         **kwargs: Download arguments to pass to the download function.
 
     Returns:
@@ -148,43 +405,42 @@ def _download_marketdata(
 
     Raises:
         DownloadException: If download fails.
-        DuplicatedFolderException: If download folder already exists.
+        DuplicatedFolderException: If download folder already exists, or
+            (NotModifiedException) the source answered 304 to a conditional
+            request.
     """
+    from brasa.downloaders.transport import conditional_request, resumable_download
+
     template = retrieve_template(meta.template)
     meta.download_args = DownloadArgs(kwargs)
     meta.extra_key = template.downloader.extra_key
-    fp, response, retry_info = template.downloader.download(
-        on_attempt_failure=on_attempt_failure,
-        acquisition_function=acquisition_function,
-        retry_attempts=retry_attempts_override,
-        **meta.download_args.to_dict(),
+    # Snapshot templates (extra-key) refetch unchanged payloads: send the
+    # previous snapshot's validators so an unchanged source answers 304.
+    previous_response = (
+        CacheManager().load_previous_response(meta) if meta.extra_key else None
+    )
+    # Streamed downloads keep partial bodies in raw/<template>/<id>.part so
+    # a retry (or the next run) resumes instead of starting over.
+    part_path = (
+        CacheManager().partial_download_path(meta)
+        if template.downloader.stream
+        else None
     )
+    with conditional_request(previous_response), resumable_download(part_path):
+        fp, response, retry_info = template.downloader.download(
+            on_attempt_failure=on_attempt_failure,
+            acquisition_function=acquisition_function,
+            retry_attempts=retry_attempts_override,
+            **meta.download_args.to_dict(),
+        )
     if fp is None:
         raise DownloadException("Market data download failed: null file pointer")
     meta.response = response
 
-    if template.downloader.format == "zip":
-        checksum = generate_checksum_from_zip(fp)
-    else:
-        checksum = generate_checksum_from_file(fp)
-    meta.download_checksum = checksum
-    man = CacheManager()
-    if Path(man.cache_path(meta.download_folder)).exists():
-        raise DuplicatedFolderException(
-            f"Market data download failed: download folder {meta.download_folder} already exists"
-        )
-    # DownloadException must be raised before creating download folder
-    # after this any exception can be raised and it will clean up the download folder
-    man.create_download_folder(meta)
-
-    fname = f"downloaded.{template.downloader.format}"
-    file_rel_path = str(Path(meta.download_folder) / fname)
-    with Path(man.cache_path(file_rel_path)).open("wb") as fp_dest:
-        shutil.copyfileobj(fp, fp_dest)
-    fp.close()
-
-    downloaded_files = _process_downloaded_format(template, file_rel_path, man, meta)
-    meta.downloaded_files = downloaded_files
-    _validate_downloaded_files(template, downloaded_files, man)
-    _gzip_downloaded_files(downloaded_files, man, meta)
+    try:
+        _store_raw_files(template, fp, meta, io_stats or RawIOStats())
+    finally:
+        fp.close()
+        if isinstance(fp, DownloadedFile):
+            Path(fp.name).unlink(missing_ok=True)
     return retry_info
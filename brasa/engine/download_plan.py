@@ -10,7 +10,8 @@ Classes:
     DownloadPlanReport: Aggregated report from executing a download plan.
 
 Functions:
-    execute_download_plan: Execute all tasks in a download plan.
+    execute_download_plan: Execute all tasks in a download plan, running up
+        to ``parallelism`` independent tasks at a time.
     resolve_plan_args: Resolve dynamic argument values (symbols, date ranges).
 """
 
@@ -19,7 +20,10 @@ from __future__ import annotations
 import json
 import logging
 import re
+import time
 from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -49,12 +53,14 @@ class DownloadPlanDefaults:
         calendar: Business calendar name for date parsing (default: "B3").
         force: Force redownload flag (default: False).
         smart_update: Enable smart update mode (default: False).
+        parallelism: Number of tasks run concurrently (default: 1, serial).
     """
 
     refdate: str | None = None
     calendar: str = "B3"
     force: bool = False
     smart_update: bool = False
+    parallelism: int = 1
 
 
 @dataclass
@@ -116,6 +122,7 @@ class DownloadPlan:
                 defaults_data.get("force", defaults_data.get("reprocess", False))
             ),
             smart_update=bool(defaults_data.get("smart_update", False)),
+            parallelism=max(1, int(defaults_data.get("parallelism", 1))),
         )
 
         tasks = []
@@ -193,11 +200,15 @@ class DownloadPlanReport:
     Attributes:
         plan_name: Name of the download plan.
         task_reports: Mapping of template name to TaskReport.
+        task_durations: Mapping of template name to the seconds its task ran.
+        parallelism: Number of tasks that were allowed to run concurrently.
     """
 
     plan_name: str
     task_reports: dict[str, TaskReport] = field(default_factory=dict)
     implicit_task_reports: dict[str, TaskReport] = field(default_factory=dict)
+    task_durations: dict[str, float] = field(default_factory=dict)
+    parallelism: int = 1
     _start_time: datetime | None = field(default=None, repr=False)
     _end_time: datetime | None = field(default=None, repr=False)
 
@@ -208,6 +219,11 @@ class DownloadPlanReport:
             return (self._end_time - self._start_time).total_seconds()
         return 0.0
 
+    @property
+    def cumulative_duration(self) -> float:
+        """Sum of the task durations in seconds (serial-equivalent time)."""
+        return sum(self.task_durations.values())
+
     @property
     def success(self) -> bool:
         """True if no task produced an ERROR or FAILED result."""
@@ -287,6 +303,14 @@ class DownloadPlanReport:
         lines.append(
             f"Download plan '{self.plan_name}': {n} tasks{auto_str} in {time_str}"
         )
+        if self.parallelism > 1:
+            cumulative = self.cumulative_duration
+            speedup = cumulative / self.total_duration if self.total_duration else 0.0
+            lines.append(
+                f"Wall-clock {time_str}, cumulative "
+                f"{self._format_elapsed(cumulative)} "
+                f"({self.parallelism} jobs, {speedup:.1f}x)"
+            )
         if fail_count:
             lines.append(
                 f"Overall: {ok_count} templates ok, {fail_count} with failures"
@@ -307,10 +331,13 @@ class DownloadPlanReport:
             data = {
                 "plan_name": self.plan_name,
                 "total_duration": self.total_duration,
+                "cumulative_duration": self.cumulative_duration,
+                "parallelism": self.parallelism,
                 "success": self.success,
                 "tasks": [
                     {
                         "template": template,
+                        "duration": self.task_durations.get(template, 0.0),
                         "results": [r.to_dict() for r in report.results],
                     }
                     for template, report in self.task_reports.items()
@@ -568,6 +595,83 @@ def _execute_task(
         return report
 
 
+def _plan_task_dependencies(
+    tasks: list[DownloadPlanTask], graph=None
+) -> list[set[int]]:
+    """Find, for each task, the tasks it must wait for in a parallel run.
+
+    A task waits for:
+
+    - tasks whose template is one of its upstream templates in the
+      ``TemplateDependencyGraph`` (the relations ``resolve_dependencies``
+      follows);
+    - earlier tasks for the same template, or sharing an upstream template,
+      so a template (or its implicit upstream run) never executes twice at
+      once;
+    - every earlier task when one of its args reads ``symbols:``, since the
+      symbols may come from data an earlier task downloads.
+
+    "Earlier" is plan order, adjusted so upstream tasks come first. If the
+    dependency graph cannot be built, tasks are chained in plan order.
+
+    Args:
+        tasks: The plan tasks.
+        graph: Dependency graph to query (built on demand when None).
+
+    Returns:
+        List aligned with *tasks* of sets of task indices to wait for.
+    """
+    n = len(tasks)
+    if graph is None:
+        from .dependency_graph import TemplateDependencyGraph
+
+        try:
+            graph = TemplateDependencyGraph()
+        except Exception as exc:
+            logger.warning(
+                "Could not build the dependency graph (%s); running plan "
+                "tasks in order",
+                exc,
+            )
+            return [{i - 1} if i else set() for i in range(n)]
+
+    ancestors: list[set[str]] = []
+    for task in tasks:
+        try:
+            ancestors.append(graph.get_ancestors(task.template))
+        except KeyError:
+            ancestors.append(set())
+    waits_for = [
+        {j for j in range(n) if j != i and tasks[j].template in ancestors[i]}
+        for i in range(n)
+    ]
+
+    # Plan order, with upstream tasks moved ahead of their dependents.
+    order: list[int] = []
+    remaining = list(range(n))
+    while remaining:
+        i = next(
+            (i for i in remaining if waits_for[i] <= set(order)),
+            remaining[0],
+        )
+        remaining.remove(i)
+        order.append(i)
+
+    for pos, i in enumerate(order):
+        reads_symbols = any(
+            isinstance(v, str) and v.startswith("symbols:")
+            for v in tasks[i].args.values()
+        )
+        for j in order[:pos]:
+            if (
+                reads_symbols
+                or tasks[j].template == tasks[i].template
+                or ancestors[i] & ancestors[j]
+            ):
+                waits_for[i].add(j)
+    return waits_for
+
+
 # ---------------------------------------------------------------------------
 # Execution
 # ---------------------------------------------------------------------------
@@ -606,6 +710,93 @@ def _validate_plan_flags(
             raise ValueError(f"--arg '{key}' is not accepted by any task in the plan")
 
 
+def _run_plan_tasks(
+    tasks: list[DownloadPlanTask],
+    run_task: Callable[[int], tuple[TaskReport, float]],
+    parallelism: int,
+    on_done: Callable[[DownloadPlanTask, TaskReport, float], None] | None = None,
+) -> dict[int, tuple[TaskReport, float]]:
+    """Run every task, at most *parallelism* at a time, honouring dependencies.
+
+    Args:
+        tasks: The plan tasks.
+        run_task: Runs the task at an index; returns its report and duration.
+        parallelism: Number of concurrent tasks (1 runs them in plan order).
+        on_done: Called for each task finished in a parallel run.
+
+    Returns:
+        Mapping of task index to ``(report, seconds)``.
+    """
+    outcomes: dict[int, tuple[TaskReport, float]] = {}
+    if parallelism == 1:
+        for index in range(len(tasks)):
+            outcomes[index] = run_task(index)
+        return outcomes
+
+    waits_for = _plan_task_dependencies(tasks)
+    waiting = set(range(len(tasks)))
+    running: dict[Future, int] = {}
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        while waiting or running:
+            for index in sorted(waiting):
+                if waits_for[index] <= outcomes.keys():
+                    waiting.discard(index)
+                    running[executor.submit(run_task, index)] = index
+            if not running:
+                raise RuntimeError("Download plan tasks depend on each other")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=running.__getitem__):
+                index = running.pop(future)
+                outcomes[index] = future.result()
+                if on_done is not None:
+                    on_done(tasks[index], *outcomes[index])
+    return outcomes
+
+
+def _resolve_task_args(
+    plan: DownloadPlan,
+    task: DownloadPlanTask,
+    refdate_override: Any | None,
+    extra_args: dict,
+    calendar: str,
+) -> dict:
+    """Build the ``download_marketdata`` kwargs for one task.
+
+    Args:
+        plan: The DownloadPlan being executed.
+        task: The task to resolve.
+        refdate_override: CLI ``--date`` value (highest priority).
+        extra_args: Non-refdate ``--arg`` values to inject.
+        calendar: Effective business calendar.
+
+    Returns:
+        Resolved keyword arguments for the task's template.
+    """
+    # 1. Build merged args: defaults.refdate as base, then per-task args
+    merged_args: dict[str, Any] = {}
+    if plan.defaults.refdate is not None:
+        merged_args["refdate"] = plan.defaults.refdate
+    merged_args.update(task.args)
+
+    # 2. Resolve refdate with priority ordering
+    refdate = _resolve_task_refdate(merged_args, refdate_override, calendar)
+
+    # 3. Resolve remaining args (symbols, integer ranges), excluding refdate
+    non_refdate = {k: v for k, v in merged_args.items() if k != "refdate"}
+    resolved_args = resolve_plan_args(non_refdate, calendar=calendar)
+
+    # 4. Smart injection: only pass refdate if the template actually wants it
+    if refdate is not None and _template_requires_refdate(task.template):
+        resolved_args["refdate"] = refdate
+
+    # 4b. Smart-inject global --arg overrides: only into declaring templates.
+    # CLI --arg wins over the task's YAML value.
+    for key, value in extra_args.items():
+        if _template_accepts_arg(task.template, key):
+            resolved_args[key] = value
+    return resolved_args
+
+
 def execute_download_plan(
     plan: DownloadPlan,
     refdate_override: Any | None = None,
@@ -616,6 +807,8 @@ def execute_download_plan(
     calendar_override: Any | None = None,
     verbosity: Verbosity = Verbosity.NORMAL,
     report_file: str | Path | None = None,
+    *,
+    parallelism: int | None = None,
 ) -> DownloadPlanReport:
     """Execute all tasks in a download plan.
 
@@ -630,11 +823,18 @@ def execute_download_plan(
 
     Tasks are independent — one failure does not abort the plan.
 
+    With ``parallelism > 1`` up to that many tasks run at once on a thread
+    pool. A task still waits for the tasks it depends on (see
+    ``_plan_task_dependencies``), and the report keeps plan order. Per-task
+    progress bars are replaced by one line per finished task.
+
     Args:
         plan: The DownloadPlan to execute.
         refdate_override: CLI ``--date`` value (highest priority).
         verbosity: Output verbosity level.
         report_file: Optional path to save the aggregate plan report.
+        parallelism: Number of concurrent tasks; defaults to
+            ``plan.defaults.parallelism``.
 
     Returns:
         DownloadPlanReport with results from all tasks.
@@ -650,41 +850,25 @@ def execute_download_plan(
     extra_args = extra_args or {}
     effective_calendar = calendar_override or plan.defaults.calendar
     _validate_plan_flags(plan, since, smart_update_override, extra_args)
+    parallelism = max(1, parallelism or plan.defaults.parallelism)
+    task_verbosity = verbosity
+    if parallelism > 1 and verbosity == Verbosity.NORMAL:
+        task_verbosity = Verbosity.QUIET
 
-    plan_report = DownloadPlanReport(plan_name=plan.name)
+    plan_report = DownloadPlanReport(plan_name=plan.name, parallelism=parallelism)
     plan_report._start_time = datetime.now()
 
-    for task in plan.tasks:
-        # 1. Build merged args: defaults.refdate as base, then per-task args
-        merged_args: dict[str, Any] = {}
-        if plan.defaults.refdate is not None:
-            merged_args["refdate"] = plan.defaults.refdate
-        merged_args.update(task.args)
-
-        # 2. Resolve refdate with priority ordering
-        refdate = _resolve_task_refdate(
-            merged_args, refdate_override, effective_calendar
+    def run_task(index: int) -> tuple[TaskReport, float]:
+        task = plan.tasks[index]
+        resolved_args = _resolve_task_args(
+            plan, task, refdate_override, extra_args, effective_calendar
         )
-
-        # 3. Resolve remaining args (symbols, integer ranges), excluding refdate
-        non_refdate = {k: v for k, v in merged_args.items() if k != "refdate"}
-        resolved_args = resolve_plan_args(non_refdate, calendar=effective_calendar)
-
-        # 4. Smart injection: only pass refdate if the template actually wants it
-        if refdate is not None and _template_requires_refdate(task.template):
-            resolved_args["refdate"] = refdate
-
-        # 4b. Smart-inject global --arg overrides: only into declaring templates.
-        # CLI --arg wins over the task's YAML value.
-        for key, value in extra_args.items():
-            if _template_accepts_arg(task.template, key):
-                resolved_args[key] = value
-
+        started = time.perf_counter()
         # 5. Execute — continue on any error
-        plan_report.task_reports[task.template] = _execute_task(
+        report = _execute_task(
             task,
             resolved_args,
-            verbosity,
+            task_verbosity,
             plan_calendar=effective_calendar,
             smart_update=_effective_smart_update(
                 task, smart_update_override, plan.defaults.smart_update
@@ -692,8 +876,22 @@ def execute_download_plan(
             force=_effective_force(task, force_override),
             since=since,
         )
+        return report, time.perf_counter() - started
+
+    outcomes = _run_plan_tasks(
+        plan.tasks,
+        run_task,
+        parallelism,
+        on_done=_print_task_done if verbosity == Verbosity.NORMAL else None,
+    )
+
+    for index, task in enumerate(plan.tasks):
+        task_report, elapsed = outcomes[index]
+        plan_report.task_reports[task.template] = task_report
+        plan_report.task_durations[task.template] = (
+            plan_report.task_durations.get(task.template, 0.0) + elapsed
+        )
         # Collect dependency reports from the task
-        task_report = plan_report.task_reports[task.template]
         for dep_report in getattr(task_report, "dependency_reports", []):
             name = dep_report.template_name
             if name not in plan_report.implicit_task_reports:
@@ -712,3 +910,15 @@ def execute_download_plan(
         plan_report.save_report(filepath, format=fmt)
 
     return plan_report
+
+
+def _print_task_done(
+    task: DownloadPlanTask, report: TaskReport, elapsed: float
+) -> None:
+    """Print the one-line status of a task finished in a parallel run."""
+    from rich.console import Console
+
+    status_str = DownloadPlanReport._report_status_str(report, include_duplicated=True)
+    Console(stderr=True).print(
+        f"Download {task.template}  {status_str} ({elapsed:.1f}s)"
+    )
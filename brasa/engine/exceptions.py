@@ -13,6 +13,16 @@ class DuplicatedFolderException(Exception):
     pass
 
 
+class NotModifiedException(DuplicatedFolderException):
+    """Raised when the source answers a conditional request with HTTP 304.
+
+    The content is unchanged since the previous download, so the outcome is
+    the same as a duplicated download folder, without transferring a body.
+    """
+
+    pass
+
+
 class InvalidContentException(Exception):
     """Raised when downloaded content is invalid or fails validation.
 
@@ -79,6 +89,7 @@ class BrasaNotConfiguredError(Exception):
 DOMAIN_EXCEPTIONS: tuple[type[Exception], ...] = (
     DownloadException,
     DuplicatedFolderException,
+    NotModifiedException,
     InvalidContentException,
     CorruptedContentException,
     DependencyResolutionError,
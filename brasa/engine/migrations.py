@@ -0,0 +1,213 @@
+"""Versioned schema migrations of the metadata database.
+
+The schema version of ``meta.db`` is kept in SQLite's ``user_version``
+header field. :func:`migrate_meta_db` runs, in order, every migration
+newer than that version, each in its own immediate transaction together
+with the version bump, so an interrupted upgrade resumes where it stopped
+and concurrent ``brasa`` processes apply each migration once.
+
+A migration must also be correct on a database just created from
+``create-meta-db.sql``, since new databases go through the same path.
+To change the schema, append a function to :data:`MIGRATIONS`; never
+edit or reorder the existing ones.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Callable
+from contextlib import closing
+
+from .resources import package_path
+
+
+def _script_statements(name: str) -> list[str]:
+    # executescript() would commit the migration's transaction, so the
+    # script is run statement by statement; split on complete statements
+    # because comments may hold semicolons.
+    statements, pending = [], ""
+    for line in package_path("sql", name).read_text().splitlines(keepends=True):
+        pending += line
+        if sqlite3.complete_statement(pending):
+            statements.append(pending)
+            pending = ""
+    return statements
+
+
+def _drop_checksum_unique_constraint(conn: sqlite3.Connection) -> None:
+    """Let several templates store the same download checksum.
+
+    Older databases declared ``download_checksum`` unique across all
+    templates, so a payload served to two templates could only be saved
+    once. The table is rebuilt without the constraint; within a template
+    the checksum folder still rejects duplicates.
+    """
+    unique = [
+        row[1] for row in conn.execute("pragma index_list(cache_metadata)") if row[2]
+    ]
+    columns = {
+        tuple(info[2] for info in conn.execute(f"pragma index_info('{name}')"))
+        for name in unique
+    }
+    if ("download_checksum",) not in columns:
+        return
+    old = [row[1] for row in conn.execute("pragma table_info(cache_metadata)")]
+    conn.execute("alter table cache_metadata rename to _cache_metadata_old")
+    for statement in _script_statements("create-meta-db.sql"):
+        conn.execute(statement)
+    cols = ", ".join(old)
+    conn.execute(
+        f"insert into cache_metadata ({cols}) select {cols} from _cache_metadata_old"
+    )
+    conn.execute("drop table _cache_metadata_old")
+
+
+def _create_blob_store(conn: sqlite3.Connection) -> None:
+    """Create the reference table of the content-addressed raw store."""
+    for statement in _script_statements("create-blob-store.sql"):
+        conn.execute(statement)
+
+
+def _add_lookup_indexes(conn: sqlite3.Connection) -> None:
+    """Index the columns the download and processing lookups filter on.
+
+    ``cache_metadata`` is queried by template (process_marketdata, the
+    update strategies, sibling snapshots by download args), and
+    ``download_trials`` by cache id (latest status, successful trial,
+    trial counts since a timestamp).
+    """
+    conn.execute(
+        "create index if not exists idx_cache_metadata_template_args "
+        "on cache_metadata(template, download_args)"
+    )
+    conn.execute(
+        "create index if not exists idx_download_trials_cache_id_timestamp "
+        "on download_trials(cache_id, timestamp)"
+    )
+
+
+# Download args promoted to columns of cache_metadata: (column, arg key).
+# Dates are stored as ISO ``YYYY-MM-DD`` strings, so they sort and compare
+# in SQL; ``start``/``end`` are renamed because END is an SQL keyword.
+PROMOTED_DATE_ARGS = (
+    ("refdate", "refdate"),
+    ("start_date", "start"),
+    ("end_date", "end"),
+)
+
+
+def _promoted_values(row: str) -> str:
+    """SQL assignments deriving the promoted columns from *row*'s columns.
+
+    *row* is ``new`` inside a trigger, or the table name in a plain update.
+    Rows whose ``download_args`` is not valid JSON get NULLs.
+    """
+    args = (
+        f"(case when json_valid({row}.download_args) "
+        f"then {row}.download_args else '{{}}' end)"
+    )
+    assignments = []
+    for column, key in PROMOTED_DATE_ARGS:
+        value = f"json_extract({args}, '$.{key}')"
+        assignments.append(
+            f"{column} = case when {value} glob "
+            "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*' "
+            f"then substr({value}, 1, 10) end"
+        )
+    year = f"json_extract({args}, '$.year')"
+    assignments.append(
+        f"year = case when typeof({year}) = 'integer' then {year} "
+        f"when {year} glob '[0-9][0-9][0-9][0-9]' then cast({year} as integer) end"
+    )
+    # processed_files holds JSON true/false, or a dict of parquet files in
+    # the pre-bool format (non-empty means processed)
+    processed = f"{row}.processed_files"
+    assignments.append(
+        f"is_processed = case when {processed} in ('true', '1') "
+        f"or ({processed} like '{{%' and {processed} != '{{}}') then 1 else 0 end"
+    )
+    return ", ".join(assignments)
+
+
+def _add_typed_columns(conn: sqlite3.Connection) -> None:
+    """Promote date args and the processing state to typed, indexed columns.
+
+    Triggers keep the columns in step with ``download_args`` and
+    ``processed_files`` on every insert and update, whoever the writer is;
+    existing rows are backfilled.
+    """
+    existing = {row[1] for row in conn.execute("pragma table_info(cache_metadata)")}
+    columns = [(column, "TEXT") for column, _ in PROMOTED_DATE_ARGS]
+    columns += [("year", "INTEGER"), ("is_processed", "INTEGER NOT NULL DEFAULT 0")]
+    for column, decl in columns:
+        if column not in existing:
+            conn.execute(f"alter table cache_metadata add column {column} {decl}")
+    conn.execute(
+        "create trigger if not exists cache_metadata_typed_insert "
+        "after insert on cache_metadata begin "
+        f"update cache_metadata set {_promoted_values('new')} "
+        "where rowid = new.rowid; end"
+    )
+    conn.execute(
+        "create trigger if not exists cache_metadata_typed_update "
+        "after update of download_args, processed_files on cache_metadata begin "
+        f"update cache_metadata set {_promoted_values('new')} "
+        "where rowid = new.rowid; end"
+    )
+    conn.execute(f"update cache_metadata set {_promoted_values('cache_metadata')}")
+    for column in ("refdate", "end_date", "is_processed"):
+        conn.execute(
+            f"create index if not exists idx_cache_metadata_template_{column} "
+            f"on cache_metadata(template, {column})"
+        )
+
+
+def _create_trial_summary(conn: sqlite3.Connection) -> None:
+    """Create the tables of trial compaction (``brasa cache compact``)."""
+    for statement in _script_statements("create-trial-summary.sql"):
+        conn.execute(statement)
+
+
+# Migration N upgrades the schema from version N-1 to version N.
+MIGRATIONS: list[Callable[[sqlite3.Connection], None]] = [
+    _drop_checksum_unique_constraint,
+    _create_blob_store,
+    _add_lookup_indexes,
+    _add_typed_columns,
+    _create_trial_summary,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in the database."""
+    return conn.execute("pragma user_version").fetchone()[0]
+
+
+def migrate_meta_db(db_path: str) -> list[int]:
+    """Upgrade the metadata database at *db_path* to :data:`SCHEMA_VERSION`.
+
+    Args:
+        db_path: Path of ``meta.db``; its tables must exist.
+
+    Returns:
+        Versions applied by this call (empty when already up to date).
+    """
+    applied = []
+    with closing(sqlite3.connect(db_path, timeout=30, isolation_level=None)) as conn:
+        if schema_version(conn) >= SCHEMA_VERSION:
+            return applied
+        for version, migration in enumerate(MIGRATIONS, start=1):
+            conn.execute("begin immediate")
+            try:
+                # Another process may have applied it since the last check
+                if schema_version(conn) < version:
+                    migration(conn)
+                    conn.execute(f"pragma user_version = {version}")
+                    applied.append(version)
+                conn.execute("commit")
+            except BaseException:
+                conn.execute("rollback")
+                raise
+    return applied
@@ -0,0 +1,178 @@
+"""Overlapped download and processing (``download_marketdata(process=True)``).
+
+Entries are handed to a :class:`ProcessingQueue` as soon as they are
+acquired, and a few processing threads parse them while the next entries
+are still downloading. The queue is bounded: when processing falls behind,
+``put`` blocks the acquiring thread, so at most ``maxsize`` acquired but
+unprocessed entries are held in memory.
+
+Each entry keeps a single TaskResult, its download result, to which the
+processing outcome is attached (see :func:`attach_processing_result`):
+
+- ``extra_info["download_seconds"]``: time to acquire the entry;
+- ``extra_info["queue_seconds"]``: time it waited for a processing thread;
+- ``extra_info["process_seconds"]``: time to parse and write it;
+- ``extra_info["process_status"]``: status of the processing step.
+
+Results reach the report through :class:`OrderedResults`, which holds an
+entry (and the entries after it) until its processing outcome is attached,
+so the report and its progress display only show finished entries.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .reporting import TaskResult, TaskStatus
+
+if TYPE_CHECKING:
+    from .cache import CacheMetadata
+
+# Acquired entries waiting for a processing thread, per thread.
+DEFAULT_QUEUE_DEPTH = 2
+
+_STOP = object()
+
+
+def attach_processing_result(
+    result: TaskResult, processed: TaskResult, queue_seconds: float
+) -> None:
+    """Merge the processing outcome of an entry into its download result.
+
+    A failed processing step turns the entry's result into that failure, so
+    the report lists it with the processing error and traceback.
+
+    Args:
+        result: The entry's download result, updated in place.
+        processed: Result of processing the entry.
+        queue_seconds: Seconds the entry waited in the queue.
+    """
+    result.extra_info["download_seconds"] = str(round(result.duration_seconds, 6))
+    result.extra_info["queue_seconds"] = str(round(queue_seconds, 6))
+    result.extra_info["process_seconds"] = str(round(processed.duration_seconds, 6))
+    result.extra_info["process_status"] = processed.status.value
+    result.is_processed = processed.is_processed
+    result.warnings.extend(w for w in processed.warnings if w not in result.warnings)
+    if processed.status in (TaskStatus.ERROR, TaskStatus.FAILED):
+        result.status = processed.status
+        result.operation = processed.operation
+        result.error_type = processed.error_type
+        result.error_message = processed.error_message
+        result.error_traceback = processed.error_traceback
+
+
+class ProcessingQueue:
+    """Bounded queue of acquired entries drained by processing threads.
+
+    Args:
+        process: Processes one entry and returns its TaskResult; it must
+            not raise for ordinary processing errors.
+        workers: Number of processing threads.
+        maxsize: Entries that may wait for a thread before ``put`` blocks;
+            ``DEFAULT_QUEUE_DEPTH`` per thread by default.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[CacheMetadata], TaskResult],
+        workers: int = 4,
+        maxsize: int | None = None,
+    ) -> None:
+        self.process = process
+        self.workers = max(1, workers)
+        self.maxsize = maxsize or DEFAULT_QUEUE_DEPTH * self.workers
+        self.results: list[TaskResult] = []
+        self._pending: set[int] = set()
+        self._queue: queue.Queue = queue.Queue(maxsize=self.maxsize)
+        self._lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._threads = [
+            threading.Thread(target=self._run, name=f"brasa-process-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, meta: CacheMetadata, result: TaskResult) -> None:
+        """Queue an acquired entry, blocking while the queue is full.
+
+        Args:
+            meta: The entry, as saved by the acquisition.
+            result: Its download result; the processing outcome is attached
+                to it.
+        """
+        self._raise_error()
+        with self._lock:
+            self._pending.add(id(result))
+        self._queue.put((meta, result, time.perf_counter()))
+
+    def is_pending(self, result: TaskResult) -> bool:
+        """Return whether *result* is queued or still being processed."""
+        with self._lock:
+            return id(result) in self._pending
+
+    def close(self) -> None:
+        """Process everything still queued and stop the threads."""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not _STOP:
+            meta, result, queued_at = item
+            try:
+                if self._error is None:
+                    waited = time.perf_counter() - queued_at
+                    processed = self.process(meta)
+                    attach_processing_result(result, processed, waited)
+                    with self._lock:
+                        self.results.append(processed)
+            except BaseException as exc:  # re-raised by put and close
+                self._error = exc
+            finally:
+                with self._lock:
+                    self._pending.discard(id(result))
+
+
+class OrderedResults:
+    """Pass results on in acquisition order once they are final.
+
+    A result handed to the :class:`ProcessingQueue` is held, together with
+    every result after it, until its processing outcome has been attached.
+
+    Args:
+        add: Receives each final result, e.g. ``TaskReport.add_result``.
+        processing: The queue entries may be handed to, if any.
+    """
+
+    def __init__(
+        self,
+        add: Callable[[TaskResult], None],
+        processing: ProcessingQueue | None = None,
+    ) -> None:
+        self.add = add
+        self.processing = processing
+        self._held: deque[TaskResult] = deque()
+
+    def append(self, result: TaskResult) -> None:
+        """Queue the next result and pass on those that are final."""
+        self._held.append(result)
+        self.release()
+
+    def release(self) -> None:
+        """Pass on the leading results whose processing has finished."""
+        while self._held and not (
+            self.processing is not None and self.processing.is_pending(self._held[0])
+        ):
+            self.add(self._held.popleft())
@@ -7,9 +7,12 @@ of steps and manages the data flow between them.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Iterator
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
+import pyarrow as pa
 
 from ..exceptions import DOMAIN_EXCEPTIONS
 from .context import PipelineContext
@@ -24,6 +27,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Values of the reader's ``engine`` key, see ReaderPipeline.execute
+READER_ENGINES = ("pandas", "arrow")
+
 
 class ReaderPipeline:
     """Executes a sequence of pipeline steps.
@@ -89,25 +95,41 @@ class ReaderPipeline:
         fields: Fieldset | None = None,
         datasets: dict[str, DatasetConfig] | None = None,
         template_id: str = "",
-    ) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        *,
+        engine: str = "pandas",
+    ) -> pd.DataFrame | pa.Table | dict[str, pd.DataFrame | pa.Table]:
         """Execute the pipeline and return the result.
 
         Creates a context and runs each step in sequence, passing the
         output of each step as input to the next.
 
+        With the ``arrow`` engine, steps with an Arrow implementation
+        (``arrow_native``) run on PyArrow Tables and the result is a Table
+        (or a dictionary of Tables). The other steps still get a DataFrame:
+        the data is converted before them, and back to Arrow before the
+        next Arrow step, so a pipeline of Arrow steps never goes through
+        pandas.
+
         Args:
             meta: Cache metadata with file paths and download context.
             reader_config: Reader configuration from template.
             fields: Optional field definitions for type conversion.
             datasets: Optional dataset configurations for multi-output templates.
             template_id: The template ID being processed.
+            engine: ``pandas`` (default) or ``arrow``.
 
         Returns:
-            DataFrame or dictionary of DataFrames with the processed data.
+            DataFrame, Table or dictionary of them with the processed data.
 
         Raises:
+            ValueError: If *engine* is unknown.
             Exception: If any step fails during execution.
         """
+        if engine not in READER_ENGINES:
+            raise ValueError(
+                f"Unknown reader engine '{engine}'; expected one of {READER_ENGINES}"
+            )
+        arrow = engine == "arrow"
         context = PipelineContext(
             meta=meta,
             reader_config=reader_config,
@@ -118,22 +140,103 @@ class ReaderPipeline:
 
         data: Any = None
         for i, step in enumerate(self.steps):
-            step_name = step.name or step.__class__.__name__
-            logger.debug(f"Executing step {i + 1}/{len(self.steps)}: {step_name}")
-            try:
-                data = step.execute(data, context)
-            except DOMAIN_EXCEPTIONS:
-                # typed exceptions drive expected/unexpected classification
-                # upstream — re-raise unwrapped so callers can match on type
-                logger.error(f"Step '{step_name}' failed with domain exception")
-                raise
-            except Exception as e:
-                logger.error(f"Step '{step_name}' failed: {e}")
-                raise RuntimeError(
-                    f"Pipeline failed at step {i + 1} ({step_name}): {e}"
-                ) from e
-
-        return data
+            logger.debug(
+                f"Executing step {i + 1}/{len(self.steps)}: {self._step_name(step)}"
+            )
+            if not arrow:
+                run = partial(step.execute, data, context)
+            elif step.arrow_native:
+                run = partial(step.execute_arrow, _to_arrow(data), context)
+            else:
+                run = partial(step.execute, _to_pandas(data), context)
+            data = self._run_step(i, step, run)
+
+        return _to_arrow(data) if arrow else data
+
+    @property
+    def supports_chunks(self) -> bool:
+        """Whether the pipeline can run with :meth:`iter_chunks`.
+
+        True when the first step reads its input in chunks (``read_csv``,
+        ``read_fwf``) and every other step is row-wise.
+        """
+        return (
+            bool(self.steps)
+            and self.steps[0].chunked_read
+            and all(step.row_wise for step in self.steps[1:])
+        )
+
+    def iter_chunks(
+        self,
+        meta: CacheMetadata,
+        reader_config: dict[str, Any],
+        chunksize: int,
+        fields: Fieldset | None = None,
+        template_id: str = "",
+    ) -> Iterator[pd.DataFrame]:
+        """Execute the pipeline over consecutive chunks of the input.
+
+        The read step yields DataFrames of at most *chunksize* rows and the
+        remaining steps run on each of them, so memory depends on the chunk
+        size rather than on the file size. Concatenating the chunks gives
+        the result of :meth:`execute`.
+
+        Args:
+            meta: Cache metadata with file paths and download context.
+            reader_config: Reader configuration from template.
+            chunksize: Maximum rows read per chunk.
+            fields: Optional field definitions for type conversion.
+            template_id: The template ID being processed.
+
+        Yields:
+            The processed DataFrame of each chunk.
+
+        Raises:
+            ValueError: If the pipeline does not support chunks.
+        """
+        if not self.supports_chunks:
+            raise ValueError(f"{self!r} cannot run in chunks")
+        context = PipelineContext(
+            meta=meta,
+            reader_config=reader_config,
+            fields=fields,
+            template_id=template_id,
+        )
+
+        reader, *steps = self.steps
+        chunks = reader.iter_chunks(context, chunksize)
+        try:
+            while True:
+                # Read errors surface while iterating, so they are wrapped here
+                chunk = self._run_step(0, reader, lambda: next(chunks, None))
+                if chunk is None:
+                    return
+                for i, step in enumerate(steps, 1):
+                    chunk = self._run_step(
+                        i, step, partial(step.execute, chunk, context)
+                    )
+                yield chunk
+        finally:
+            chunks.close()  # closes the raw file when stopped early
+
+    def _step_name(self, step: PipelineStep) -> str:
+        return step.name or step.__class__.__name__
+
+    def _run_step(self, index: int, step: PipelineStep, run: Callable[[], Any]) -> Any:
+        """Call *run* for the step at *index*, wrapping unexpected errors."""
+        step_name = self._step_name(step)
+        try:
+            return run()
+        except DOMAIN_EXCEPTIONS:
+            # typed exceptions drive expected/unexpected classification
+            # upstream — re-raise unwrapped so callers can match on type
+            logger.error(f"Step '{step_name}' failed with domain exception")
+            raise
+        except Exception as e:
+            logger.error(f"Step '{step_name}' failed: {e}")
+            raise RuntimeError(
+                f"Pipeline failed at step {index + 1} ({step_name}): {e}"
+            ) from e
 
     def __repr__(self) -> str:
         step_names = [s.name or s.__class__.__name__ for s in self.steps]
@@ -141,3 +244,23 @@ class ReaderPipeline:
 
     def __len__(self) -> int:
         return len(self.steps)
+
+
+def _to_arrow(data: Any) -> Any:
+    """Convert DataFrames (also inside a dictionary) to PyArrow Tables."""
+    if isinstance(data, pd.DataFrame):
+        return pa.Table.from_pandas(data, preserve_index=False)
+    if isinstance(data, dict):
+        return {name: _to_arrow(value) for name, value in data.items()}
+    return data
+
+
+def _to_pandas(data: Any) -> Any:
+    """Convert a PyArrow Table to a DataFrame with Arrow-backed dtypes.
+
+    The pandas readers use ``dtype_backend="pyarrow"``, so a step falling
+    back to pandas sees the same dtypes under both engines.
+    """
+    if isinstance(data, pa.Table):
+        return data.to_pandas(types_mapper=pd.ArrowDtype)
+    return data
@@ -7,7 +7,11 @@ Both reader pipelines and ETL pipelines use this base class with the unified Ste
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 class PipelineStep(ABC):
@@ -27,9 +31,19 @@ class PipelineStep(ABC):
     Attributes:
         name: The registered name of this step type.
         params: Configuration parameters for this step instance.
+        row_wise: Whether the step transforms every row on its own, so
+            applying it to consecutive chunks of a file and concatenating
+            the results equals applying it to the whole file.
+        chunked_read: Whether the step is a read step that implements
+            :meth:`iter_chunks`.
+        arrow_native: Whether the step implements :meth:`execute_arrow`,
+            used by the ``arrow`` engine of ``ReaderPipeline``.
     """
 
     name: str = ""
+    row_wise: bool = False
+    chunked_read: bool = False
+    arrow_native: bool = False
 
     def __init__(self, params: dict[str, Any] | None = None) -> None:
         """Initialize the step with configuration parameters.
@@ -52,6 +66,36 @@ class PipelineStep(ABC):
         """
         ...
 
+    def iter_chunks(self, context: Any, chunksize: int) -> Iterator[Any]:
+        """Read the input in chunks of at most *chunksize* rows.
+
+        Only read steps with ``chunked_read = True`` implement this; see
+        ``ReaderPipeline.iter_chunks``.
+
+        Args:
+            context: Pipeline context.
+            chunksize: Maximum rows per chunk.
+
+        Yields:
+            Consecutive chunks of the input.
+        """
+        raise NotImplementedError(f"Step '{self.name}' cannot read in chunks")
+
+    def execute_arrow(self, data: pa.Table | None, context: Any) -> pa.Table:
+        """Execute the step on a PyArrow Table.
+
+        Only steps with ``arrow_native = True`` implement this; see the
+        ``arrow`` engine of ``ReaderPipeline.execute``.
+
+        Args:
+            data: Table from the previous step (or None for the first step).
+            context: Pipeline context.
+
+        Returns:
+            The transformed Table.
+        """
+        raise NotImplementedError(f"Step '{self.name}' has no Arrow implementation")
+
     def get_param(self, key: str, default: Any = None) -> Any:
         """Get a parameter value with an optional default.
 
@@ -5,7 +5,6 @@ Custom steps for processing B3 (Brazilian Stock Exchange) data.
 
 from __future__ import annotations
 
-import gzip
 import logging
 from typing import Any
 
@@ -16,6 +15,7 @@ from lxml import etree
 from brasa.engine.pipeline.context import PipelineContext
 from brasa.engine.pipeline.registry import StepRegistry
 from brasa.engine.pipeline.step import PipelineStep
+from brasa.util import open_raw_file
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,8 @@ class B3ParseRefdateFromHtmlStep(PipelineStep):
         attribute = self.get_param("attribute", "value")
         store_as = self.get_param("store_as", "refdate")
 
-        tree = etree.parse(filepath, etree.HTMLParser())
+        with open_raw_file(filepath) as f:
+            tree = etree.parse(f, etree.HTMLParser())
         elements = tree.xpath(xpath)
 
         if elements:
@@ -104,7 +105,7 @@ class B3CreateSymbolStep(PipelineStep):
 
 @StepRegistry.register("b3_read_bvbg086_xml")
 class B3ReadBVBG086XmlStep(PipelineStep):
-    """Read and parse B3 BVBG086 gzipped XML file.
+    """Read and parse B3 BVBG086 compressed XML file.
 
     Extracts price report data from the BVBG086 XML format using XPath
     based on field tags defined in the template.
@@ -125,7 +126,7 @@ class B3ReadBVBG086XmlStep(PipelineStep):
 
         Some B3 BVBG086 zip bundles pack the same message twice — once as a
         flat XML entry and once as a redundant zip-compressed duplicate that
-        `unzip_recursive` (a general zip-of-zips limitation) may leave
+        zip extraction (a general zip-of-zips limitation) may leave
         un-extracted. Those leftovers are not valid XML; skip them here
         instead of crashing the whole pipeline.
 
@@ -135,7 +136,7 @@ class B3ReadBVBG086XmlStep(PipelineStep):
         """
         ns_bvmf052 = {None: self.NS_052}
         try:
-            with gzip.open(filepath) as f:
+            with open_raw_file(filepath) as f:
                 tree = etree.parse(f)
         except etree.XMLSyntaxError:
             logger.debug("Skipping non-XML downloaded file: %s", filepath)
@@ -259,7 +260,7 @@ class B3ReadBVBG086XmlStep(PipelineStep):
 
 @StepRegistry.register("b3_read_bvbg028_xml")
 class B3ReadBVBG028XmlStep(PipelineStep):
-    """Read and parse B3 BVBG028 gzipped XML file.
+    """Read and parse B3 BVBG028 compressed XML file.
 
     Parses the file ONCE and returns Dict[str, DataFrame] for each
     instrument type. The output keys are the dataset output names (e.g., 'equities')
@@ -317,8 +318,8 @@ class B3ReadBVBG028XmlStep(PipelineStep):
         filepath = context.downloaded_file
         logger.debug(f"Reading BVBG028 XML file: {filepath}")
 
-        # Parse the gzipped XML
-        with gzip.open(filepath) as f:
+        # Parse the compressed XML
+        with open_raw_file(filepath) as f:
             tree = etree.parse(f)
 
         exchange = tree.getroot()[0][0]
@@ -391,7 +392,7 @@ class B3ReadBVBG028XmlStep(PipelineStep):
 
 @StepRegistry.register("b3_read_bvbg087_xml")
 class B3ReadBVBG087XmlStep(PipelineStep):
-    """Read and parse B3 BVBG087 gzipped XML file.
+    """Read and parse B3 BVBG087 compressed XML file.
 
     Parses the file ONCE and returns Dict[str, DataFrame] for each
     index type. The output keys are the dataset output names (e.g., 'indexes_info')
@@ -431,8 +432,8 @@ class B3ReadBVBG087XmlStep(PipelineStep):
         filepath = context.downloaded_file
         logger.debug(f"Reading BVBG087 XML file: {filepath}")
 
-        # Parse the gzipped XML
-        with gzip.open(filepath) as f:
+        # Parse the compressed XML
+        with open_raw_file(filepath) as f:
             tree = etree.parse(f)
 
         ns = {None: "urn:bvmf.218.01.xsd"}
@@ -485,7 +486,7 @@ class B3ReadBVBG087XmlStep(PipelineStep):
 
 @StepRegistry.register("b3_read_company_info_json")
 class B3ReadCompanyInfoJsonStep(PipelineStep):
-    """Read and parse B3 company info gzipped JSON file.
+    """Read and parse B3 company info compressed JSON file.
 
     Parses the file and returns Dict[str, DataFrame] for each
     dataset type. The output keys are the dataset output names.
@@ -506,8 +507,8 @@ class B3ReadCompanyInfoJsonStep(PipelineStep):
         filepath = context.downloaded_file
         logger.debug(f"Reading B3 company info JSON file: {filepath}")
 
-        # Parse the gzipped JSON
-        with gzip.open(filepath) as f:
+        # Parse the compressed JSON
+        with open_raw_file(filepath) as f:
             obj = json.load(f)
 
         results: dict[str, pd.DataFrame] = {}
@@ -541,7 +542,7 @@ class B3ReadCompanyInfoJsonStep(PipelineStep):
 
 @StepRegistry.register("b3_read_company_details_json")
 class B3ReadCompanyDetailsJsonStep(PipelineStep):
-    """Read and parse B3 company details gzipped JSON file.
+    """Read and parse B3 company details compressed JSON file.
 
     Reads the JSON and expands the otherCodes nested array by duplicating
     rows. Each row gets a code and isin from the otherCodes array.
@@ -556,8 +557,8 @@ class B3ReadCompanyDetailsJsonStep(PipelineStep):
         filepath = context.downloaded_file
         logger.debug(f"Reading B3 company details JSON file: {filepath}")
 
-        # Parse the gzipped JSON
-        with gzip.open(filepath) as f:
+        # Parse the compressed JSON
+        with open_raw_file(filepath) as f:
             obj = json.load(f)
 
         # Create DataFrame from JSON
@@ -591,19 +592,13 @@ class B3AddColumnsFromJsonFieldsStep(PipelineStep):
     """
 
     def execute(self, data: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
-        import gzip
         import json
-        from pathlib import Path
 
         filepath = context.downloaded_file
         map_param = self.require_param("mapping")
 
-        if str(filepath).endswith(".gz"):
-            with gzip.open(filepath, "rt", encoding=context.encoding) as f:
-                json_data = json.load(f)
-        else:
-            with Path(filepath).open(encoding=context.encoding) as f:
-                json_data = json.load(f)
+        with open_raw_file(filepath, "rt", encoding=context.encoding) as f:
+            json_data = json.load(f)
 
         for store_as, json_path in map_param.items():
             json_data_copy = json_data  # Use a copy to traverse
@@ -641,15 +636,9 @@ class B3ReadBdinFwfStep(PipelineStep):
     """
 
     def _read_lines(self, filepath: str, encoding: str) -> list[str]:
-        """Read the file (plain or gzip) and split it into lines."""
-        from pathlib import Path
-
-        if str(filepath).endswith(".gz"):
-            with gzip.open(filepath, "rt", encoding=encoding) as f:
-                text = f.read()
-        else:
-            with Path(filepath).open(encoding=encoding) as f:
-                text = f.read()
+        """Read the file (plain or compressed) and split it into lines."""
+        with open_raw_file(filepath, "rt", encoding=encoding) as f:
+            text = f.read()
         return text.splitlines()
 
     def _extract_refdate(
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
 
 from ..context import PipelineContext
 from ..registry import StepRegistry
@@ -24,6 +25,8 @@ class SetColumnsStep(PipelineStep):
         names: List of column names to assign
     """
 
+    row_wise = True
+
     def execute(self, data: pd.DataFrame, _context: PipelineContext) -> pd.DataFrame:
         names = self.require_param("names")
 
@@ -45,12 +48,19 @@ class RenameColumnsStep(PipelineStep):
         mapping: Dictionary mapping old names to new names
     """
 
+    row_wise = True
+    arrow_native = True
+
     def execute(self, data: pd.DataFrame, _context: Any) -> pd.DataFrame:
         from . import shared_transforms
 
         mapping = self.require_param("mapping")
         return shared_transforms.rename_columns(data, mapping)
 
+    def execute_arrow(self, data: pa.Table, _context: Any) -> pa.Table:
+        mapping = self.require_param("mapping")
+        return data.rename_columns([mapping.get(c, c) for c in data.column_names])
+
 
 @StepRegistry.register("select_columns")
 class SelectColumnsStep(PipelineStep):
@@ -60,12 +70,18 @@ class SelectColumnsStep(PipelineStep):
         columns: List of column names to keep
     """
 
+    row_wise = True
+    arrow_native = True
+
     def execute(self, data: pd.DataFrame, _context: Any) -> pd.DataFrame:
         from . import shared_transforms
 
         columns = self.require_param("columns")
         return shared_transforms.select_columns(data, columns)
 
+    def execute_arrow(self, data: pa.Table, _context: Any) -> pa.Table:
+        return data.select(self.require_param("columns"))
+
 
 @StepRegistry.register("add_column")
 class AddColumnStep(PipelineStep):
@@ -80,6 +96,9 @@ class AddColumnStep(PipelineStep):
         only_if_missing: Whether to only set the column if it doesn't already exist (default: False)
     """
 
+    row_wise = True
+    arrow_native = True
+
     def _resolve_value(self, context: PipelineContext) -> Any:
         """Resolve the column value from params or context.
 
@@ -120,6 +139,17 @@ class AddColumnStep(PipelineStep):
             data[name] = value
         return data
 
+    def execute_arrow(self, data: pa.Table, context: PipelineContext) -> pa.Table:
+        name = self.require_param("name")
+        value = self._resolve_value(context)
+        index = data.schema.get_field_index(name)
+        if index >= 0 and self.get_param("only_if_missing", False):
+            return data
+        column = pa.repeat(value, data.num_rows)
+        if index >= 0:
+            return data.set_column(index, name, column)
+        return data.append_column(name, column)
+
 
 @StepRegistry.register("add_column_multi")
 class AddColumnMultiStep(AddColumnStep):
@@ -136,6 +166,9 @@ class AddColumnMultiStep(AddColumnStep):
         only_if_missing: Whether to only set the column if it doesn't already exist (default: False)
     """
 
+    row_wise = False  # operates on a dict of DataFrames
+    arrow_native = False
+
     def execute(
         self, data: dict[str, pd.DataFrame], context: PipelineContext
     ) -> dict[str, pd.DataFrame]:
@@ -0,0 +1,347 @@
+"""Vectorized reader for fixed-width files (``read_fwf`` with ``engine: fast``).
+
+Fixed-width files such as COTAHIST have records of a single length, so the
+file is viewed as a two-dimensional NumPy array with one row per record
+and one byte per column, and fields are slices of its columns:
+
+- uncompressed files are memory-mapped, compressed ones are decompressed
+  into one buffer, or ``chunksize`` records at a time when chunked;
+- record-type filters (``where``) compare the raw bytes of a field, before
+  anything is decoded;
+- each field becomes a string column built from its bytes without a Python
+  loop. Only fields holding non-ASCII bytes are decoded with the file
+  encoding.
+
+Columns are strings stripped of their padding, with blank fields as null,
+so the output matches ``pd.read_fwf(dtype=str)`` and ``apply_fields``
+converts the types. Files whose lines differ in length are not handled
+here: :func:`fixed_width_records` returns None and the caller falls back
+to pandas. A chunked compressed file is only checked one block at a time;
+a block past the first that is not fixed width raises
+:class:`NotFixedWidthError`, and the caller reads the rest with pandas.
+"""
+
+from __future__ import annotations
+
+import codecs
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from brasa.util import open_raw_file, raw_file_codec
+
+_LF, _CR, _EOF = 0x0A, 0x0D, 0x1A
+
+# Longest line searched for the first line break
+_MAX_WIDTH = 1 << 16
+
+
+class NotFixedWidthError(ValueError):
+    """A chunked read met records of another length after the first block.
+
+    Attributes:
+        records: Records (after ``skip``) already returned, from which the
+            caller can resume with another reader.
+    """
+
+    def __init__(self, path: str, records: int) -> None:
+        super().__init__(f"{path} is not a fixed-width file after {records} records")
+        self.records = records
+
+
+def load_buffer(path: str) -> np.ndarray:
+    """Return the bytes of a raw file as a uint8 array.
+
+    Uncompressed files are memory-mapped; gzip and zstd files are
+    decompressed into memory (see :func:`read_fixed_width` for chunked
+    reads, which do not hold the whole file).
+    """
+    if raw_file_codec(path) is None:
+        if Path(path).stat().st_size == 0:
+            return np.empty(0, dtype=np.uint8)
+        return np.memmap(path, dtype=np.uint8, mode="r")
+    with open_raw_file(path) as f:
+        return np.frombuffer(f.read(), dtype=np.uint8)
+
+
+def fixed_width_records(buf: np.ndarray) -> np.ndarray | None:
+    """View a buffer of equal-length lines as an (n_records, width) array.
+
+    Lines end with LF or CRLF; the last one may lack its terminator, and
+    trailing line breaks and DOS end-of-file marks are ignored.
+
+    Args:
+        buf: File contents, as returned by :func:`load_buffer`.
+
+    Returns:
+        A read-only view of the records without their line terminators, or
+        None if the lines are not all of the same length.
+    """
+    end = len(buf)
+    while end and buf[end - 1] in (_LF, _CR, _EOF):
+        end -= 1
+    if end == 0:
+        return np.empty((0, 0), dtype=np.uint8)
+
+    first = np.flatnonzero(buf[: min(end, _MAX_WIDTH)] == _LF)
+    if len(first) == 0:
+        return buf[:end].reshape(1, end) if end <= _MAX_WIDTH else None
+    stride = int(first[0]) + 1
+    term = 2 if stride > 1 and buf[stride - 2] == _CR else 1
+    width = stride - term
+    n = (end + term) // stride
+    if n * stride - term != end:
+        return None
+    if not np.all(buf[width + term - 1 : end : stride] == _LF):
+        return None
+    if term == 2 and not np.all(buf[width:end:stride] == _CR):
+        return None
+    return np.lib.stride_tricks.as_strided(
+        buf, shape=(n, width), strides=(stride, 1), writeable=False
+    )
+
+
+def _is_utf(encoding: str) -> bool:
+    return codecs.lookup(encoding).name.startswith("utf")
+
+
+def _string_column(block: np.ndarray, encoding: str) -> pa.Array:
+    """Build a stripped string column from an (n, width) block of bytes."""
+    n, width = block.shape
+    if block.size and block.max() >= 0x80:
+        # np.char.decode only for fields that hold non-ASCII bytes
+        text = np.char.decode(block.view(f"S{width}").ravel(), encoding)
+        column = pa.array(text, type=pa.string())
+    else:
+        large = n * width >= 2**31
+        offsets = np.arange(n + 1, dtype=np.int64) * width
+        column = pa.Array.from_buffers(
+            pa.large_string() if large else pa.string(),
+            n,
+            [
+                None,
+                pa.py_buffer(offsets if large else offsets.astype(np.int32)),
+                pa.py_buffer(block),
+            ],
+        )
+    value = pc.utf8_trim(column, characters=" \t").cast(pa.string())
+    return pc.if_else(pc.equal(value, ""), pa.scalar(None, pa.string()), value)
+
+
+def _where_mask(
+    records: np.ndarray,
+    specs: dict[str, tuple[int, int]],
+    where: dict[str, list[str]],
+    encoding: str,
+) -> np.ndarray:
+    """Rows whose raw field bytes equal one of the ``where`` values.
+
+    A value matches its field padded with spaces on either side.
+    """
+    mask = np.ones(len(records), dtype=bool)
+    for name, values in where.items():
+        start, stop = specs[name]
+        width = stop - start
+        field = np.ascontiguousarray(records[:, start:stop]).view(f"S{width}").ravel()
+        patterns = set()
+        for value in values:
+            raw = value.encode(encoding)
+            patterns.update({raw.ljust(width), raw.rjust(width)})
+        mask &= np.isin(field, list(patterns))
+    return mask
+
+
+def decode_records(
+    records: np.ndarray,
+    colspecs: list[tuple[int, int]],
+    names: list[str],
+    encoding: str,
+    where: dict[str, list[str]] | None = None,
+) -> pa.Table:
+    """Slice records into fields and decode them as string columns.
+
+    Args:
+        records: Array from :func:`fixed_width_records`.
+        colspecs: (start, stop) byte positions of each field.
+        names: Field names.
+        encoding: File encoding.
+        where: Optional mapping of field name to the values to keep,
+            compared on the raw bytes.
+
+    Returns:
+        A Table with one string column per field.
+
+    Raises:
+        ValueError: If ``where`` names an unknown field.
+    """
+    specs = dict(zip(names, colspecs, strict=True))
+    if where:
+        unknown = set(where) - set(specs)
+        if unknown:
+            raise ValueError(f"Unknown fields in where: {sorted(unknown)}")
+        records = records[_where_mask(records, specs, where, encoding)]
+    return pa.table(
+        {
+            name: _string_column(np.ascontiguousarray(records[:, start:stop]), encoding)
+            for name, (start, stop) in specs.items()
+        }
+    )
+
+
+def _read_block(f: Any, size: int) -> bytes:
+    """Read *size* bytes from *f*, fewer only at the end of the file."""
+    parts = []
+    while size > 0 and (part := f.read(size)):
+        parts.append(part)
+        size -= len(part)
+    return b"".join(parts)
+
+
+def _block_records(block: bytes, encoding: str) -> np.ndarray | None:
+    """Records of one decompressed block, or None if it is not fixed width."""
+    buf = np.frombuffer(block, dtype=np.uint8)
+    if _is_utf(encoding) and len(buf) and buf.max() >= 0x80:
+        return None
+    return fixed_width_records(buf)
+
+
+def _read_compressed_chunks(
+    path: str,
+    colspecs: list[tuple[int, int]],
+    names: list[str],
+    encoding: str,
+    *,
+    skip: int,
+    where: dict[str, list[str]] | None,
+    chunksize: int,
+) -> Iterator[pa.Table] | None:
+    """Decompress and decode a raw file ``chunksize`` records at a time.
+
+    The record length is taken from the first line and every block read
+    holds ``chunksize`` whole records, so only one block of the
+    decompressed file is in memory at a time.
+    """
+    f = open_raw_file(path)
+    carry = b""
+
+    def take(size: int) -> bytes:
+        nonlocal carry
+        if len(carry) >= size:
+            block, carry = carry[:size], carry[size:]
+            return block
+        block = carry + _read_block(f, size - len(carry))
+        carry = b""
+        return block
+
+    try:
+        carry = _read_block(f, _MAX_WIDTH)
+        stride = carry.find(b"\n") + 1
+        if stride == 0 and len(carry) == _MAX_WIDTH:
+            f.close()
+            return None
+        stride = stride or max(len(carry), 1)
+        size = (skip + chunksize) * stride
+        block = take(size)
+        more = len(block) == size
+        first = _block_records(block, encoding)
+        if (
+            first is None
+            or (more and len(first) != skip + chunksize)
+            or (first.size and max(stop for _, stop in colspecs) > first.shape[1])
+        ):
+            f.close()
+            return None
+    except BaseException:
+        f.close()
+        raise
+
+    def tables() -> Iterator[pa.Table]:
+        with f:
+            yield decode_records(first[skip:], colspecs, names, encoding, where)
+            done = max(0, len(first) - skip)
+            size = chunksize * stride
+            more_blocks = more
+            while more_blocks:
+                block = take(size)
+                more_blocks = len(block) == size
+                records = _block_records(block, encoding)
+                if records is not None and not records.size:
+                    return  # only line breaks or end-of-file marks were left
+                if (
+                    records is None
+                    or records.shape[1] != first.shape[1]
+                    or (more_blocks and len(records) != chunksize)
+                ):
+                    raise NotFixedWidthError(path, done)
+                yield decode_records(records, colspecs, names, encoding, where)
+                done += len(records)
+
+    return tables()
+
+
+def read_fixed_width(
+    path: str,
+    colspecs: list[tuple[int, int]],
+    names: list[str],
+    encoding: str,
+    *,
+    skip: int = 0,
+    where: dict[str, list[str]] | None = None,
+    chunksize: int | None = None,
+) -> Iterator[pa.Table] | None:
+    """Read a fixed-width file into string Tables.
+
+    Positions are bytes, which equal the characters of ``pd.read_fwf`` for
+    single-byte encodings; UTF files are only read when they are ASCII.
+
+    With *chunksize*, compressed files are decompressed one block of
+    ``chunksize`` records at a time. Only the first block is checked before
+    returning; a later block that is not fixed width raises
+    :class:`NotFixedWidthError` from the iterator.
+
+    Args:
+        path: Raw file, possibly compressed.
+        colspecs: (start, stop) positions of each field.
+        names: Field names.
+        encoding: File encoding.
+        skip: Lines to skip at the start of the file.
+        where: Optional record filter, see :func:`decode_records`.
+        chunksize: Records decoded per Table; all at once by default.
+
+    Returns:
+        An iterator of Tables, or None if the file cannot be read as fixed
+        width (lines of different lengths, records shorter than the fields,
+        non-ASCII UTF text).
+    """
+    if chunksize and raw_file_codec(path) is not None:
+        return _read_compressed_chunks(
+            path,
+            colspecs,
+            names,
+            encoding,
+            skip=skip,
+            where=where,
+            chunksize=chunksize,
+        )
+    buf = load_buffer(path)
+    if _is_utf(encoding) and len(buf) and buf.max() >= 0x80:
+        return None
+    records = fixed_width_records(buf)
+    if records is None or (
+        records.size and max(stop for _, stop in colspecs) > records.shape[1]
+    ):
+        return None
+    records = records[skip:]
+    step = chunksize or max(len(records), 1)
+
+    def tables() -> Iterator[pa.Table]:
+        for start in range(0, max(len(records), 1), step):
+            yield decode_records(
+                records[start : start + step], colspecs, names, encoding, where
+            )
+
+    return tables()
@@ -9,6 +9,8 @@ from typing import Any
 
 import pandas as pd
 
+from brasa.util import open_raw_file
+
 from ..context import PipelineContext
 from ..registry import StepRegistry
 from ..step import PipelineStep
@@ -44,7 +46,8 @@ class ReadHtmlStep(PipelineStep):
         if flavor:
             kwargs["flavor"] = flavor
 
-        return pd.read_html(filepath, **kwargs)
+        with open_raw_file(filepath) as f:
+            return pd.read_html(f, **kwargs)
 
 
 @StepRegistry.register("first_table")
@@ -5,14 +5,23 @@ Steps for reading data from various file formats.
 
 from __future__ import annotations
 
+import logging
+from collections.abc import Iterator
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+from brasa.util import open_raw_file
 
 from ..context import PipelineContext
 from ..registry import StepRegistry
 from ..step import PipelineStep
 
+logger = logging.getLogger(__name__)
+
 
 @StepRegistry.register("read_csv")
 class ReadCsvStep(PipelineStep):
@@ -28,9 +37,52 @@ class ReadCsvStep(PipelineStep):
         converters: Dict of column converters (optional)
     """
 
+    chunked_read = True
+    arrow_native = True
+
     def execute(self, _data: Any, context: PipelineContext) -> pd.DataFrame:
-        from pathlib import Path
+        with open_raw_file(context.downloaded_file) as f:
+            return pd.read_csv(f, **self._read_kwargs(context))
+
+    def execute_arrow(self, _data: Any, context: PipelineContext) -> pa.Table:
+        kwargs = self._read_kwargs(context)
+        header = kwargs["header"]
+        if (
+            "converters" in kwargs
+            or len(kwargs["sep"]) != 1
+            or not isinstance(kwargs["skiprows"], int)
+            or not (header is None or isinstance(header, int))
+        ):
+            # converters, regex separators and the like are pandas-only
+            return pa.Table.from_pandas(
+                self.execute(_data, context), preserve_index=False
+            )
 
+        names = kwargs.get("names")
+        read_options = pacsv.ReadOptions(
+            encoding=kwargs["encoding"],
+            skip_rows=kwargs["skiprows"] + (header or 0),
+            column_names=names,
+            autogenerate_column_names=header is None and not names,
+        )
+        with open_raw_file(context.downloaded_file) as f:
+            return pacsv.read_csv(
+                f,
+                read_options=read_options,
+                parse_options=pacsv.ParseOptions(delimiter=kwargs["sep"]),
+                convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+            )
+
+    def iter_chunks(
+        self, context: PipelineContext, chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        with (
+            open_raw_file(context.downloaded_file) as f,
+            pd.read_csv(f, chunksize=chunksize, **self._read_kwargs(context)) as reader,
+        ):
+            yield from reader
+
+    def _read_kwargs(self, context: PipelineContext) -> dict[str, Any]:
         filepath = context.downloaded_file
 
         separator = self.get_param("separator", context.get_config("separator", ","))
@@ -41,14 +93,8 @@ class ReadCsvStep(PipelineStep):
         converters = self.get_param("converters")
 
         if skip_if_startswith is not None:
-            import gzip
-
-            if str(filepath).endswith(".gz"):
-                with gzip.open(filepath, "rt", encoding=context.encoding) as f:
-                    first_line = f.readline()
-            else:
-                with Path(filepath).open(encoding=context.encoding) as f:
-                    first_line = f.readline()
+            with open_raw_file(filepath, "rt", encoding=context.encoding) as f:
+                first_line = f.readline()
             skip = skip if first_line.startswith(skip_if_startswith) else 0
 
         kwargs: dict[str, Any] = {
@@ -67,14 +113,14 @@ class ReadCsvStep(PipelineStep):
         if converters:
             kwargs["converters"] = converters
 
-        return pd.read_csv(filepath, **kwargs)
+        return kwargs
 
 
 @StepRegistry.register("read_fwf")
 class ReadFwfStep(PipelineStep):
     """Read a fixed-width format file into a DataFrame.
 
-    Supports both plain and gzip-compressed files.
+    Supports plain and compressed (gzip, zstd) files.
 
     Derives column specifications from field widths if available in context.
     Widths are extracted from field.get_attribute('width') to build colspecs.
@@ -85,13 +131,156 @@ class ReadFwfStep(PipelineStep):
         skip: Number of rows to skip (default: 0)
         dtype: Data type for columns. Can be a single type (e.g., str) or a dict mapping
             column names to types. (optional)
+        engine: 'pandas' (default) or 'fast', the vectorized reader of
+            ``fixed_width`` for string columns (``dtype: str``) of files whose
+            lines all have the same length. Other files are read with pandas.
+        where: Dict mapping a column to the value, or list of values, of the
+            records to keep (optional). The fast engine compares the raw bytes
+            before decoding the records.
     """
 
+    chunked_read = True
+    arrow_native = True
+
+    # Does not occur in fixed-width files, so read_csv reads whole lines
+    _LINE_DELIMITER = "\x1f"
+
     def execute(self, _data: Any, context: PipelineContext) -> pd.DataFrame:
-        import gzip
+        tables = self._read_fast(context)
+        if tables is not None:
+            return pa.concat_tables(tables).to_pandas(types_mapper=pd.ArrowDtype)
+        with open_raw_file(
+            context.downloaded_file, "rt", encoding=context.encoding
+        ) as f:
+            return self._filter_where(pd.read_fwf(f, **self._read_kwargs(context)))
+
+    def execute_arrow(self, _data: Any, context: PipelineContext) -> pa.Table:
+        """Slice the lines of the file into string columns with Arrow kernels.
+
+        Only string columns (``dtype: str``) with integer colspecs are read
+        this way; pandas infers the other column types, so those pipelines
+        read with pandas.
+        """
+        tables = self._read_fast(context)
+        if tables is not None:
+            return pa.concat_tables(tables)
+        kwargs = self._read_kwargs(context)
+        if not self._reads_strings(kwargs):
+            return pa.Table.from_pandas(
+                self.execute(_data, context), preserve_index=False
+            )
 
-        filepath = context.downloaded_file
+        with open_raw_file(context.downloaded_file) as f:
+            lines = pacsv.read_csv(
+                f,
+                read_options=pacsv.ReadOptions(
+                    encoding=kwargs["encoding"],
+                    skip_rows=kwargs["skiprows"],
+                    column_names=["line"],
+                ),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=self._LINE_DELIMITER, quote_char=False
+                ),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={"line": pa.string()}
+                ),
+            ).column(0)
+
+        columns = {}
+        for name, (start, stop) in zip(
+            kwargs["names"], kwargs["colspecs"], strict=True
+        ):
+            # read_fwf strips the padding and reads blank fields as null
+            value = pc.utf8_trim(
+                pc.utf8_slice_codeunits(lines, start, stop), characters=" \t"
+            )
+            columns[name] = pc.if_else(
+                pc.equal(value, ""), pa.scalar(None, pa.string()), value
+            )
+        table = pa.table(columns)
+        for name, values in self._where().items():
+            table = table.filter(pc.is_in(table[name], value_set=pa.array(values)))
+        return table
+
+    def iter_chunks(
+        self, context: PipelineContext, chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        from .fixed_width import NotFixedWidthError
+
+        kwargs = self._read_kwargs(context)
+        tables = self._read_fast(context, chunksize)
+        if tables is not None:
+            try:
+                for table in tables:
+                    yield table.to_pandas(types_mapper=pd.ArrowDtype)
+                return
+            except NotFixedWidthError as exc:
+                # Resume with pandas after the records already read
+                logger.debug("%s, reading the rest with pandas", exc)
+                kwargs["skiprows"] += exc.records
+        with (
+            open_raw_file(
+                context.downloaded_file, "rt", encoding=context.encoding
+            ) as f,
+            pd.read_fwf(f, chunksize=chunksize, **kwargs) as reader,
+        ):
+            for chunk in reader:
+                yield self._filter_where(chunk)
+
+    def _read_fast(
+        self, context: PipelineContext, chunksize: int | None = None
+    ) -> Iterator[pa.Table] | None:
+        """Read with the fast engine, or return None to read with pandas."""
+        engine = self.get_param("engine", "pandas")
+        if engine not in ("pandas", "fast"):
+            raise ValueError(f"Unknown read_fwf engine: {engine}")
+        kwargs = self._read_kwargs(context)
+        if engine == "pandas" or not self._reads_strings(kwargs):
+            return None
+
+        from .fixed_width import read_fixed_width
+
+        tables = read_fixed_width(
+            context.downloaded_file,
+            kwargs["colspecs"],
+            kwargs["names"],
+            kwargs["encoding"],
+            skip=kwargs["skiprows"],
+            where=self._where(),
+            chunksize=chunksize,
+        )
+        if tables is None:
+            logger.debug(
+                "%s is not a fixed-width file, reading it with pandas",
+                context.downloaded_file,
+            )
+        return tables
+
+    @staticmethod
+    def _reads_strings(kwargs: dict[str, Any]) -> bool:
+        """Whether the columns are strings at integer positions (``dtype: str``)."""
+        colspecs = kwargs.get("colspecs")
+        return (
+            kwargs.get("dtype") in (str, "str")
+            and bool(colspecs)
+            and bool(kwargs.get("names"))
+            and isinstance(kwargs["skiprows"], int)
+            and all(isinstance(pos, int) for spec in colspecs for pos in spec)
+        )
 
+    def _where(self) -> dict[str, list[str]]:
+        """The ``where`` parameter, with a list of strings per column."""
+        return {
+            name: [str(v) for v in (values if isinstance(values, list) else [values])]
+            for name, values in (self.get_param("where") or {}).items()
+        }
+
+    def _filter_where(self, df: pd.DataFrame) -> pd.DataFrame:
+        for name, values in self._where().items():
+            df = df[df[name].isin(values)]
+        return df
+
+    def _read_kwargs(self, context: PipelineContext) -> dict[str, Any]:
         colspecs = self.get_param("colspecs")
         names = self.get_param("names")
         skip = self.get_param("skip", 0)
@@ -125,12 +314,7 @@ class ReadFwfStep(PipelineStep):
         if dtype is not None:
             kwargs["dtype"] = dtype
 
-        # Handle gzip-compressed files
-        if str(filepath).endswith(".gz"):
-            with gzip.open(filepath, "rt", encoding=context.encoding) as f:
-                return pd.read_fwf(f, **kwargs)
-        else:
-            return pd.read_fwf(filepath, **kwargs)
+        return kwargs
 
 
 @StepRegistry.register("read_json")
@@ -143,20 +327,13 @@ class ReadJsonStep(PipelineStep):
     """
 
     def execute(self, _data: Any, context: PipelineContext) -> pd.DataFrame:
-        import gzip
         import json
-        from pathlib import Path
 
         filepath = context.downloaded_file
         json_path = self.get_param("path")
 
-        # Handle gzip-compressed files
-        if str(filepath).endswith(".gz"):
-            with gzip.open(filepath, "rt", encoding=context.encoding) as f:
-                json_data = json.load(f)
-        else:
-            with Path(filepath).open(encoding=context.encoding) as f:
-                json_data = json.load(f)
+        with open_raw_file(filepath, "rt", encoding=context.encoding) as f:
+            json_data = json.load(f)
 
         if json_path:
             # Navigate to the specified path
@@ -193,17 +370,14 @@ class ReadExcelStep(PipelineStep):
         skip = self.get_param("skip", 0)
         header = self.get_param("header", 0)
 
-        # Cached files are gzip-compressed; pandas does not transparently
+        # Cached files are compressed; pandas does not transparently
         # decompress Excel inputs, so hand it a decompressed in-memory buffer.
         # pandas sniffs the magic bytes to pick the engine, so the original
         # extension (e.g. ".xls" for files that are actually xlsx) is irrelevant.
-        source: Any = filepath
-        if str(filepath).endswith(".gz"):
-            import gzip
-            import io
+        import io
 
-            with gzip.open(filepath, "rb") as f:
-                source = io.BytesIO(f.read())
+        with open_raw_file(filepath) as f:
+            source = io.BytesIO(f.read())
 
         return pd.read_excel(
             source,
@@ -9,6 +9,8 @@ from __future__ import annotations
 from typing import Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..context import PipelineContext
 from ..registry import StepRegistry
@@ -28,6 +30,9 @@ class ApplyFieldsStep(PipelineStep):
         set_columns: Whether to set DataFrame columns to field names
     """
 
+    row_wise = True
+    arrow_native = True
+
     def execute(self, data: pd.DataFrame, context: PipelineContext) -> pd.DataFrame:
         if context.fields is None:
             return data
@@ -40,6 +45,16 @@ class ApplyFieldsStep(PipelineStep):
             data.columns = context.fields.get_field_names()
         return adapter.apply_types(data)
 
+    def execute_arrow(self, data: pa.Table, context: PipelineContext) -> pa.Table:
+        if context.fields is None:
+            return data
+
+        from brasa.fieldsets import ArrowAdapter
+
+        if self.get_param("set_columns", False):
+            data = data.rename_columns(context.fields.get_field_names())
+        return ArrowAdapter(context.fields).apply_types(data)
+
 
 @StepRegistry.register("apply_fields_multi")
 class ApplyFieldsMultiStep(PipelineStep):
@@ -100,6 +115,8 @@ class DropNaStep(PipelineStep):
         how: 'any' or 'all' (default: 'any')
     """
 
+    row_wise = True
+
     def execute(self, data: pd.DataFrame, _context: PipelineContext) -> pd.DataFrame:
         columns = self.get_param("columns")
         how = self.get_param("how", "any")
@@ -119,6 +136,9 @@ class FilterRowsStep(PipelineStep):
         value: Value to compare against (not needed for 'notna', 'isna')
     """
 
+    row_wise = True
+    arrow_native = True
+
     def execute(self, data: pd.DataFrame, _context: PipelineContext) -> pd.DataFrame:
         column = self.require_param("column")
         operator = self.require_param("operator")
@@ -151,6 +171,37 @@ class FilterRowsStep(PipelineStep):
 
         return data[mask]
 
+    def execute_arrow(self, data: pa.Table, _context: PipelineContext) -> pa.Table:
+        column = self.require_param("column")
+        operator = self.require_param("operator")
+        value = self.get_param("value")
+
+        col = data[column]
+
+        if operator in ("eq", "ne", "gt", "lt", "ge", "le"):
+            compare = {
+                "eq": pc.equal,
+                "ne": pc.not_equal,
+                "gt": pc.greater,
+                "lt": pc.less,
+                "ge": pc.greater_equal,
+                "le": pc.less_equal,
+            }[operator]
+            mask = compare(col, pa.scalar(value).cast(col.type))
+        elif operator == "in":
+            mask = pc.is_in(col, value_set=pa.array(value).cast(col.type))
+        elif operator == "notin":
+            mask = pc.invert(pc.is_in(col, value_set=pa.array(value).cast(col.type)))
+        elif operator == "notna":
+            mask = pc.is_valid(col)
+        elif operator == "isna":
+            mask = pc.is_null(col, nan_is_null=True)
+        else:
+            raise ValueError(f"Unknown operator: {operator}")
+
+        # Rows where the comparison is null are dropped, as pandas does
+        return data.filter(mask)
+
 
 @StepRegistry.register("melt")
 class MeltStep(PipelineStep):
@@ -228,6 +279,8 @@ class MakeDateStep(PipelineStep):
         errors: How to handle errors ('raise', 'coerce', 'ignore', default: 'coerce')
     """
 
+    row_wise = True
+
     def execute(self, data: pd.DataFrame, _context: PipelineContext) -> pd.DataFrame:
         year_col = self.require_param("year_column")
         month_col = self.require_param("month_column")
@@ -259,6 +312,8 @@ class StrReplaceStep(PipelineStep):
         regex: Whether pattern is a regex (default: False)
     """
 
+    row_wise = True
+
     def execute(self, data: pd.DataFrame, _context: PipelineContext) -> pd.DataFrame:
         column = self.require_param("column")
         pattern = self.require_param("pattern")
@@ -280,6 +335,8 @@ class CastStep(PipelineStep):
         errors: How to handle errors ('raise', 'coerce', 'ignore', default: 'coerce')
     """
 
+    row_wise = True
+
     def execute(self, data: pd.DataFrame, _context: PipelineContext) -> pd.DataFrame:
         columns = self.require_param("column")
         dtype = self.require_param("dtype")
@@ -5,10 +5,15 @@ and saving to parquet format.
 """
 
 import logging
+import uuid
+from collections.abc import Iterator
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from brasa.fieldsets.adapters import get_target_schema
@@ -18,11 +23,32 @@ from .template import retrieve_template
 
 logger = logging.getLogger(__name__)
 
+# Catalog registrations collected instead of written; set by worker processes
+# so that meta.db is only written by the parent (see _read_marketdata_in_worker)
+_deferred_registrations: ContextVar[list[dict[str, Any]] | None] = ContextVar(
+    "deferred_registrations", default=None
+)
+
+
+def _register_dataset(**registration: Any) -> None:
+    """Register a written dataset in the catalog, or defer it to the parent.
+
+    Args:
+        **registration: Arguments of :meth:`DatasetCatalog.register_dataset`.
+    """
+    deferred = _deferred_registrations.get()
+    if deferred is not None:
+        deferred.append(registration)
+        return
+    from .catalog import DatasetCatalog
+
+    DatasetCatalog().register_dataset(**registration)
+
 
 def save_partitioned_parquet_file(
     meta: CacheMetadata,
     folder: str,
-    df: pd.DataFrame,
+    df: pd.DataFrame | pa.Table,
     partition_cols: list[str],
     schema: pa.Schema = None,
     layer: str | None = None,
@@ -31,17 +57,29 @@ def save_partitioned_parquet_file(
 ) -> None:
     """Save DataFrame as partitioned parquet dataset with optional schema.
 
+    PyArrow Tables (from ``engine: arrow`` readers) are written as they are,
+    after selecting and casting the *schema* columns.
+
     Args:
         meta: Cache metadata to update with processed file info.
         folder: Target folder for parquet files.
-        df: DataFrame to save.
+        df: DataFrame or Table to save.
         partition_cols: Columns to use for partitioning.
         schema: Optional PyArrow schema for type enforcement.
         layer: Optional data layer for catalog registration.
         dataset_name: Optional dataset name for catalog registration.
         source_template: Optional source template ID for catalog registration.
     """
-    if schema:
+    if isinstance(df, pa.Table):
+        tb = df.select(schema.names).cast(schema) if schema else df
+        pq.write_to_dataset(
+            tb,
+            root_path=folder,
+            partition_cols=partition_cols,
+            schema=schema,
+            existing_data_behavior="delete_matching",
+        )
+    elif schema:
         tb = pa.Table.from_pandas(df, schema=schema)
         pq.write_to_dataset(
             tb,
@@ -62,11 +100,8 @@ def save_partitioned_parquet_file(
 
     # Register dataset in catalog if layer and dataset_name are provided
     if layer and dataset_name:
-        from .catalog import DatasetCatalog
-
-        catalog = DatasetCatalog()
         # Use the table's schema (preserves actual written types)
-        catalog.register_dataset(
+        _register_dataset(
             layer=layer,
             dataset_name=dataset_name,
             schema=tb.schema,
@@ -75,6 +110,69 @@ def save_partitioned_parquet_file(
         )
 
 
+def save_partitioned_parquet_chunks(
+    meta: CacheMetadata,
+    folder: str,
+    chunks: Iterator[pd.DataFrame],
+    partition_cols: list[str],
+    *,
+    schema: pa.Schema = None,
+    layer: str | None = None,
+    dataset_name: str | None = None,
+    source_template: str | None = None,
+) -> None:
+    """Stream DataFrame chunks into a partitioned parquet dataset.
+
+    Chunked counterpart of :func:`save_partitioned_parquet_file`: chunks are
+    converted and written one at a time, so only one chunk is in memory.
+    Partitions are replaced the first time a chunk writes to them and
+    appended to afterwards. Without *schema* every chunk is cast to the
+    schema of the first one.
+
+    Args:
+        meta: Cache metadata to update with processed file info.
+        folder: Target folder for parquet files.
+        chunks: DataFrames to save, in order.
+        partition_cols: Columns to use for partitioning.
+        schema: Optional PyArrow schema for type enforcement.
+        layer: Optional data layer for catalog registration.
+        dataset_name: Optional dataset name for catalog registration.
+        source_template: Optional source template ID for catalog registration.
+    """
+    first = next(chunks, None)
+    if first is not None:
+        tb = pa.Table.from_pandas(first, schema=schema, preserve_index=False)
+        schema = tb.schema
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            yield from tb.to_batches()
+            for df in chunks:
+                yield from pa.Table.from_pandas(
+                    df, schema=schema, preserve_index=False
+                ).to_batches()
+
+        ds.write_dataset(
+            batches(),
+            folder,
+            schema=schema,
+            format="parquet",
+            partitioning=partition_cols or None,
+            partitioning_flavor="hive" if partition_cols else None,
+            basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="delete_matching",
+        )
+    meta.mark_as_processed()
+
+    if layer and dataset_name and schema is not None:
+        _register_dataset(
+            layer=layer,
+            dataset_name=dataset_name,
+            schema=schema,
+            partitioning=partition_cols,
+            source_template=source_template,
+        )
+
+
 def _get_schema_from_fields(fields):
     """Generate PyArrow schema from fields if available.
 
@@ -164,12 +262,32 @@ def _read_marketdata(meta: CacheMetadata) -> None:
         meta: Cache metadata containing download info and to update with processed files.
     """
     template = retrieve_template(meta.template)
-    df = template.reader.read(meta)
     man = CacheManager()
 
+    if template.reader.chunksize is not None:
+        chunks = template.reader.read_chunks(meta)
+        try:
+            save_partitioned_parquet_chunks(
+                meta,
+                man.cache_path(man.db_folder(template)),
+                chunks,
+                template.writer.partitioning,
+                schema=_get_schema_from_fields(
+                    template.fields if hasattr(template, "fields") else None
+                ),
+                layer=template.writer.layer.value,
+                dataset_name=template.writer.dataset,
+                source_template=template.id,
+            )
+        finally:
+            chunks.close()
+        return
+
+    df = template.reader.read(meta)
+
     if isinstance(df, dict):
         _process_multi_dataset_output(meta, df, template, man)
-    elif isinstance(df, pd.DataFrame):
+    elif isinstance(df, pd.DataFrame | pa.Table):
         # Single dataset output
         schema = _get_schema_from_fields(
             template.fields if hasattr(template, "fields") else None
@@ -187,3 +305,52 @@ def _read_marketdata(meta: CacheMetadata) -> None:
             dataset_name=dataset_name,
             source_template=template.id,
         )
+
+
+def _init_process_worker(cache_folder: str, template_name: str) -> None:
+    """Initialize a worker process of ``process_marketdata(executor="process")``.
+
+    Points the CacheManager singleton at the parent's cache folder and loads
+    the template into a fresh template cache, so a bad template fails when
+    the pool starts rather than on every entry.
+
+    Args:
+        cache_folder: The parent's ``CacheManager.cache_folder``.
+        template_name: Template being processed.
+    """
+    import os
+
+    from .template import clear_template_cache
+
+    os.environ["BRASA_DATA_PATH"] = cache_folder
+    CacheManager.__it__ = None
+    clear_template_cache()
+    retrieve_template(template_name)
+
+
+def _read_marketdata_in_worker(
+    meta: CacheMetadata,
+) -> tuple[bool, list[str], list[dict[str, Any]]]:
+    """Run :func:`_read_marketdata` in a worker process.
+
+    The parquet files are written by the worker; the metadata row and the
+    catalog registrations are left to the parent, so ``meta.db`` is only
+    written by one process.
+
+    Args:
+        meta: Cache entry to process (a pickled copy of the parent's).
+
+    Returns:
+        Whether the entry is now processed, the warnings raised, and the
+        ``DatasetCatalog.register_dataset`` arguments of the datasets written.
+    """
+    from .reporting import capture_warnings
+
+    registrations: list[dict[str, Any]] = []
+    token = _deferred_registrations.set(registrations)
+    try:
+        with capture_warnings() as captured:
+            _read_marketdata(meta)
+    finally:
+        _deferred_registrations.reset(token)
+    return meta.is_processed, list(captured), registrations
@@ -16,6 +16,7 @@ Classes:
 from __future__ import annotations
 
 import json
+import threading
 import traceback
 import warnings
 from collections import Counter
@@ -496,6 +497,12 @@ class TaskReport:
         retries = sum(
             int(r.extra_info.get("retry_attempts_used") or 0) for r in self.results
         )
+        # Entries processed as they downloaded (download --process)
+        processed = sum(
+            1
+            for r in self.results
+            if r.extra_info.get("process_status") in ("passed", "warning")
+        )
 
         elapsed = 0.0
         if self._start_time and self._end_time:
@@ -512,6 +519,7 @@ class TaskReport:
             (corrupted, f"[yellow]{corrupted} corrupted[/yellow]"),
             (warnings_count, f"[yellow]{warnings_count} warning[/yellow]"),
             (retries, f"[yellow]{retries} retries[/yellow]"),
+            (processed, f"[green]{processed} processed[/green]"),
         ]
         parts = [text for count, text in counts if count]
 
@@ -593,26 +601,65 @@ class TaskReport:
                 self.console = original
 
 
+_capture_state = threading.local()
+
+
+class _ShowwarningHook:
+    """Reference-counted install of the per-thread ``warnings.showwarning``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._depth = 0
+        self.original = None
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._depth == 0:
+                self.original = warnings.showwarning
+                warnings.showwarning = _dispatch_showwarning
+            self._depth += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._depth -= 1
+            if self._depth == 0:
+                warnings.showwarning = self.original
+
+
+_showwarning_hook = _ShowwarningHook()
+
+
+def _dispatch_showwarning(  # noqa: PLR0917 - warnings.showwarning signature
+    message, category, filename, lineno, file=None, line=None
+):
+    """Route a warning to the capturing list of the current thread, if any."""
+    captured = getattr(_capture_state, "captured", None)
+    if captured is None:
+        _showwarning_hook.original(message, category, filename, lineno, file, line)
+        return
+    captured.append(f"{category.__name__}: {message} ({filename}:{lineno})")
+
+
 @contextmanager
 def capture_warnings():
     """Context manager to capture Python warnings.
 
+    Captures are per thread: warnings raised while a worker thread is inside
+    its own ``capture_warnings()`` block land in that worker's list only, so
+    concurrent downloads/processing report their own warnings.
+
     Yields:
         A list that will be populated with warning messages.
     """
     captured: list[str] = []
-    original_showwarning = warnings.showwarning
-
-    def capture_showwarning(
-        message, category, filename, lineno, _file=None, _line=None
-    ):
-        captured.append(f"{category.__name__}: {message} ({filename}:{lineno})")
-
-    warnings.showwarning = capture_showwarning
+    _showwarning_hook.acquire()
+    previous = getattr(_capture_state, "captured", None)
+    _capture_state.captured = captured
     try:
         yield captured
     finally:
-        warnings.showwarning = original_showwarning
+        _capture_state.captured = previous
+        _showwarning_hook.release()
 
 
 def create_task_result_from_exception(
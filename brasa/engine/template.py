@@ -13,7 +13,7 @@ import time
 from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, ClassVar
+from typing import IO, TYPE_CHECKING, Any
 
 import pandas as pd
 import yaml
@@ -26,6 +26,10 @@ from .layers import DEFAULT_ETL_LAYER, DEFAULT_LAYER, DataLayer
 from .resources import package_path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    import pyarrow as pa
+
     from .cache import CacheMetadata
 
 
@@ -102,11 +106,34 @@ class MarketDataReader:
         self.datasets: dict[str, DatasetConfig] | None = None
         self.output_filename_format = reader.get("output-filename-format", "%Y-%m-%d")
 
+        self.chunksize: int | None = reader.get("chunksize")
+        self.engine: str = reader.get("engine", "pandas")
+
         self._pipeline = None
         if "pipeline" in reader:
             from .pipeline import ReaderPipeline
 
             self._pipeline = ReaderPipeline.from_config(reader["pipeline"])
+        from .pipeline.executor import READER_ENGINES
+
+        if self.engine not in READER_ENGINES:
+            raise ValueError(
+                f"Template '{template_id}': unknown reader.engine "
+                f"'{self.engine}'; expected one of {READER_ENGINES}"
+            )
+        if self.chunksize is not None and self.engine != "pandas":
+            raise ValueError(
+                f"Template '{template_id}': reader.chunksize is only supported "
+                "by the pandas engine"
+            )
+        if self.chunksize is not None and not (
+            self._pipeline is not None and self._pipeline.supports_chunks
+        ):
+            raise ValueError(
+                f"Template '{template_id}': reader.chunksize needs a pipeline "
+                "that starts with read_csv or read_fwf followed by row-wise "
+                "steps only"
+            )
 
     @property
     def has_pipeline(self) -> bool:
@@ -137,14 +164,17 @@ class MarketDataReader:
         """Get an attribute from the reader configuration."""
         return self.attributes.get(key, default)
 
-    def read(self, meta: CacheMetadata) -> pd.DataFrame | dict[str, pd.DataFrame]:
+    def read(
+        self, meta: CacheMetadata
+    ) -> pd.DataFrame | pa.Table | dict[str, pd.DataFrame | pa.Table]:
         """Read data using the configured pipeline.
 
         Args:
             meta: Cache metadata containing file paths and context.
 
         Returns:
-            DataFrame or dictionary of DataFrames with the read data.
+            DataFrame or dictionary of DataFrames with the read data; PyArrow
+            Tables with ``engine: arrow``.
         """
         if self._pipeline is None:
             raise ValueError("Reader has no pipeline configured")
@@ -154,6 +184,29 @@ class MarketDataReader:
             fields=self.fields,
             datasets=self.datasets,
             template_id=self._template_id,
+            engine=self.engine,
+        )
+
+    def read_chunks(self, meta: CacheMetadata) -> Iterator[pd.DataFrame]:
+        """Read data in chunks of ``chunksize`` rows using the pipeline.
+
+        Args:
+            meta: Cache metadata containing file paths and context.
+
+        Yields:
+            Consecutive DataFrames whose concatenation equals :meth:`read`.
+
+        Raises:
+            ValueError: If ``chunksize`` is not set.
+        """
+        if self.chunksize is None or self._pipeline is None:
+            raise ValueError("Reader has no chunksize configured")
+        yield from self._pipeline.iter_chunks(
+            meta=meta,
+            reader_config=self.attributes,
+            chunksize=self.chunksize,
+            fields=self.fields,
+            template_id=self._template_id,
         )
 
 
@@ -297,15 +350,157 @@ def _is_retriable_failure(
     return retry_on_download_exception if is_dl_exc else False
 
 
+# HTTP status codes retried unless the template sets retry_on_status_codes
+DEFAULT_RETRY_STATUS_CODES = (408, 425, 429, 500, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy of a downloader (REQ-001).
+
+    Built by :meth:`MarketDataDownloader.retry_policy` from the template's
+    ``retry_*`` keys, and shared by the engine's download loop and by
+    downloaders that retry parts of a download on their own.
+
+    Attributes:
+        attempts: Additional attempts after the first failure.
+        delay: Initial delay in seconds before retry #1.
+        backoff: Multiplier applied to the delay after each failed retry.
+        on_status_codes: HTTP status codes considered transient.
+        on_download_exception: Retry DownloadExceptions without a status code.
+    """
+
+    attempts: int = 0
+    delay: float = 0.0
+    backoff: float = 1.0
+    on_status_codes: tuple[int, ...] = DEFAULT_RETRY_STATUS_CODES
+    on_download_exception: bool = True
+
+    def call(
+        self, func: Callable[[], Any], on_attempt_failure: Any | None = None
+    ) -> tuple[Any, int]:
+        """Call *func* until it succeeds, retrying transient failures.
+
+        Non-retriable exceptions (InvalidContentException,
+        CorruptedContentException, DuplicatedFolderException,
+        NoDataException) propagate immediately (RTRY-003); other exceptions
+        are wrapped in a DownloadException.
+
+        Args:
+            func: Callable performing one attempt.
+            on_attempt_failure: Optional callback invoked after each failed
+                retriable attempt **before** the next retry. Signature:
+                ``(attempt: int, err: Exception, status_code: int | None)
+                -> None``.
+
+        Returns:
+            Tuple of (result of *func*, 1-based attempt that succeeded).
+
+        Raises:
+            DownloadException: If every attempt failed.
+        """
+        from .exceptions import (
+            CorruptedContentException,
+            DownloadException,
+            DuplicatedFolderException,
+            InvalidContentException,
+            NoDataException,
+        )
+
+        max_attempts = 1 + self.attempts
+        current_delay = self.delay
+        last_err: Exception | None = None
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return func(), attempt
+            except (
+                InvalidContentException,
+                CorruptedContentException,
+                DuplicatedFolderException,
+                NoDataException,
+            ):
+                # RTRY-003: non-retriable exceptions propagate immediately,
+                # without wrapping
+                raise
+            except Exception as err:
+                last_err = err
+                wrapped = (
+                    err
+                    if isinstance(err, DownloadException)
+                    else DownloadException("Problem downloading data.")
+                )
+                if not isinstance(err, DownloadException):
+                    wrapped.__cause__ = err
+
+                status_code = _extract_status_code_from_exception(wrapped)
+                retriable = _is_retriable_failure(
+                    wrapped,
+                    status_code,
+                    list(self.on_status_codes),
+                    self.on_download_exception,
+                )
+                if not retriable or attempt == max_attempts:
+                    if isinstance(err, DownloadException):
+                        raise
+                    raise wrapped from err
+
+                # RSTS-005: persist intermediate failed attempt
+                if on_attempt_failure is not None:
+                    on_attempt_failure(attempt, wrapped, status_code)
+
+                logger.info(
+                    "Download attempt %d/%d failed "
+                    "(status_code=%s), retrying in %.1fs: %s",
+                    attempt,
+                    max_attempts,
+                    status_code,
+                    current_delay,
+                    str(err),
+                )
+            if current_delay > 0:
+                # jitter avoids thundering-herd retries across a batch
+                time.sleep(current_delay * random.uniform(0.5, 1.5))
+            current_delay *= self.backoff
+
+        # Should never reach here, but satisfy type checker
+        raise DownloadException("Problem downloading data.") from last_err
+
+
 class MarketDataDownloader:
     """Configuration for downloading market data from remote sources.
 
     Defines URL patterns, download functions, and file format handling.
 
     Attributes:
-        download_delay: Delay in seconds between consecutive downloads.
-            Used to avoid rate limiting on APIs that restrict request frequency.
-            Default is 0 (no delay).
+        download_delay: Minimum spacing in seconds between the starts of
+            consecutive requests to the same host, i.e. a rate limit of
+            ``1 / download_delay`` requests per second. Ignored when
+            ``rate_limit`` is set. Default is 0 (no delay).
+        rate_limit: Requests per second allowed per host, enforced by a
+            token bucket shared across threads and processes. None falls
+            back to ``download_delay`` and then to the global
+            ``[rate_limits]`` config.
+        rate_burst: Token bucket capacity for ``rate_limit``. Default is 1.
+        host_concurrency: Maximum simultaneous requests to each host the
+            downloader sends requests to. None uses the built-in per-host
+            default.
+        pool_size: Keep-alive connections kept open per host by the shared
+            HTTP transport. None uses the transport default.
+        stream: Write the response body to disk in chunks instead of holding
+            it in memory. Meant for large archives. Default is False.
+        page_concurrency: Maximum pages fetched at once by paged downloaders
+            after the first page. None uses the downloader default (4).
+        window_days: Maximum days per request for BCB range downloaders,
+            which split long ``start..end`` spans into windows. None uses the
+            downloader default (SGS 3650, PTAX 365).
+        window_concurrency: Maximum windows fetched at once by BCB range
+            downloaders. None uses the downloader default (2).
+        raw_codec: Compression of the stored raw files, ``gzip`` or
+            ``zstd``. None uses the global ``[raw_storage]`` config
+            (default gzip).
+        raw_level: Compression level for ``raw_codec``. None uses the
+            config or codec default.
+        raw_threads: zstd worker threads for large files (-1: one per CPU).
         retry_attempts: Number of additional attempts after the first failure.
             Total attempts = 1 + retry_attempts. Default is 0 (no retries).
         retry_delay: Initial delay in seconds before retry #1. Default is 0.0.
@@ -317,16 +512,6 @@ class MarketDataDownloader:
             without explicit HTTP status extraction. Default is True.
     """
 
-    _DEFAULT_RETRY_STATUS_CODES: ClassVar[list[int]] = [
-        408,
-        425,
-        429,
-        500,
-        502,
-        503,
-        504,
-    ]
-
     def __init__(self, downloader: dict) -> None:
         self.url = None
         self.format = ""
@@ -337,8 +522,25 @@ class MarketDataDownloader:
         self.encoding = downloader.get("encoding", "utf-8")
         self.verify_ssl = downloader.get("verify_ssl", True)
         self.download_delay = downloader.get("download_delay", 0)
+        self.rate_limit = downloader.get("rate_limit")
+        self.rate_burst = downloader.get("rate_burst")
+        self.host_concurrency = downloader.get("host_concurrency")
         # Request timeout (None → downloader default); scalar or (connect, read).
         self.timeout = downloader.get("timeout")
+        # Keep-alive connections pooled per host (None → transport default).
+        self.pool_size = downloader.get("pool_size")
+        # Stream the response body to disk instead of buffering it in memory.
+        self.stream = downloader.get("stream", False)
+        # Pages fetched at once by paged downloaders (None → downloader default).
+        self.page_concurrency = downloader.get("page_concurrency")
+        # Window length and concurrency of BCB range downloaders (None →
+        # downloader default).
+        self.window_days = downloader.get("window_days")
+        self.window_concurrency = downloader.get("window_concurrency")
+        # Raw-file compression (None → [raw_storage] config, then gzip).
+        self.raw_codec = downloader.get("raw_codec")
+        self.raw_level = downloader.get("raw_level")
+        self.raw_threads = downloader.get("raw_threads")
         self.download_function = load_function_by_name(downloader["function"])
         validator: str = downloader.get(
             "validator", "brasa.downloaders.validate_empty_file"
@@ -357,7 +559,7 @@ class MarketDataDownloader:
         self.retry_delay: float = downloader.get("retry_delay", 0.0)
         self.retry_backoff: float = downloader.get("retry_backoff", 1.0)
         self.retry_on_status_codes: list[int] = downloader.get(
-            "retry_on_status_codes", self._DEFAULT_RETRY_STATUS_CODES
+            "retry_on_status_codes", list(DEFAULT_RETRY_STATUS_CODES)
         )
         self.retry_on_download_exception: bool = downloader.get(
             "retry_on_download_exception", True
@@ -431,113 +633,60 @@ class MarketDataDownloader:
         Raises:
             DownloadException: If download fails after all retry attempts.
         """
-        from .exceptions import (
-            CorruptedContentException,
-            DownloadException,
-            DuplicatedFolderException,
-            InvalidContentException,
-            NoDataException,
-        )
+        from .exceptions import DownloadException
 
         args = self.download_args(**kwargs)
-        effective_retry = (
-            retry_attempts if retry_attempts is not None else self.retry_attempts
+        policy = self.retry_policy(retry_attempts)
+        acquire = acquisition_function or self.download_function
+        (fp, response), attempt = policy.call(
+            lambda: acquire(self, **args), on_attempt_failure
         )
-        max_attempts = 1 + effective_retry
-        current_delay = self.retry_delay
-
-        last_err: Exception | None = None
-        for attempt in range(1, max_attempts + 1):
-            fp: IO | None = None
-            response: Any = None
-            caught_err: Exception | None = None
-
-            try:
-                acquire = acquisition_function or self.download_function
-                fp, response = acquire(self, **args)
-            except Exception as err:
-                caught_err = err
-
-            # --- Soft failure: fp is None — never retry ---
-            if caught_err is None and fp is None:
-                raise DownloadException("Download returned null file pointer.")
-
-            # --- Exception-based failure ---
-            if caught_err is not None:
-                # RTRY-003: non-retriable exceptions propagate immediately, without wrapping
-                if isinstance(
-                    caught_err,
-                    (
-                        InvalidContentException,
-                        CorruptedContentException,
-                        DuplicatedFolderException,
-                        NoDataException,
-                    ),
-                ):
-                    raise caught_err
-
-                last_err = caught_err
-                wrapped = (
-                    caught_err
-                    if isinstance(caught_err, DownloadException)
-                    else DownloadException("Problem downloading data.")
-                )
-                if not isinstance(caught_err, DownloadException):
-                    wrapped.__cause__ = caught_err
-
-                status_code = _extract_status_code_from_exception(wrapped)
-                retriable = _is_retriable_failure(
-                    wrapped,
-                    status_code,
-                    self.retry_on_status_codes,
-                    self.retry_on_download_exception,
-                )
-
-                if not retriable or attempt == max_attempts:
-                    if isinstance(caught_err, DownloadException):
-                        raise caught_err
-                    raise wrapped from caught_err
-
-                # RSTS-005: persist intermediate failed attempt
-                if on_attempt_failure is not None:
-                    on_attempt_failure(attempt, wrapped, status_code)
-
-                logger.info(
-                    "Download attempt %d/%d failed "
-                    "(status_code=%s), retrying in %.1fs: %s",
-                    attempt,
-                    max_attempts,
-                    status_code,
-                    current_delay,
-                    str(last_err),
-                )
-                if current_delay > 0:
-                    # jitter avoids thundering-herd retries across a batch
-                    time.sleep(current_delay * random.uniform(0.5, 1.5))
-                current_delay *= self.retry_backoff
-                continue
+        # Soft failure: fp is None — never retried
+        if fp is None:
+            raise DownloadException("Download returned null file pointer.")
+        if attempt > 1:
+            logger.info(
+                "Download succeeded on attempt %d/%d", attempt, 1 + policy.attempts
+            )
+        retry_info = {
+            "attempts_used": attempt - 1,
+            "attempts_configured": policy.attempts,
+            "success_on_attempt": attempt,
+        }
+        return fp, response, retry_info
 
-            # --- Success ---
-            if attempt > 1:
-                logger.info(
-                    "Download succeeded on attempt %d/%d",
-                    attempt,
-                    max_attempts,
-                )
-            retry_info = {
-                "attempts_used": attempt - 1,
-                "attempts_configured": effective_retry,
-                "success_on_attempt": attempt,
-            }
-            return fp, response, retry_info
+    def retry_policy(self, retry_attempts: int | None = None) -> RetryPolicy:
+        """Return the template's retry policy.
 
-        # Should never reach here, but satisfy type checker
-        raise DownloadException("Problem downloading data.") from last_err
+        Args:
+            retry_attempts: Override for ``retry_attempts``, or None.
+        """
+        return RetryPolicy(
+            attempts=self.retry_attempts if retry_attempts is None else retry_attempts,
+            delay=self.retry_delay,
+            backoff=self.retry_backoff,
+            on_status_codes=tuple(self.retry_on_status_codes),
+            on_download_exception=self.retry_on_download_exception,
+        )
 
     def validate(self, fname: str) -> None:
         """Validate a downloaded file."""
         return self.validate_function(fname)
 
+    def stream_validator(self) -> Any:
+        """Return a fresh streaming validator for the template's validator.
+
+        The validator function may name its streaming counterpart in a
+        ``stream_validator`` attribute: a class whose instances take the
+        body through ``update(chunk)`` and raise from ``finish()``.
+
+        Returns:
+            A validator instance, or None when the validator only checks
+            stored files.
+        """
+        factory = getattr(self.validate_function, "stream_validator", None)
+        return factory() if factory is not None else None
+
 
 class MarketDataTemplate:
     """Main template class that loads and represents a complete data source configuration.
@@ -0,0 +1,313 @@
+"""Per-host concurrency limits and rate limiting for HTTP requests.
+
+A single process-wide :class:`HostThrottle` coordinates every request the
+downloaders send, so concurrent downloads
+(``download_marketdata(max_workers=...)``), paged downloads and windowed BCB
+downloads never have more than a fixed number of requests in flight against
+one host. The shared HTTP transport takes a slot (:func:`request_slot`) for
+each request, keyed by the host of the request URL; the template being
+acquired sets the cap and rate through :func:`acquisition_limits`.
+
+Request starts are paced by a token bucket per host (:class:`TokenBucket`).
+Its state lives in a SQLite database in the brasa data folder, so the limit
+holds across threads, download plans and separate ``brasa`` processes that
+share the same data path.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, closing, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import load_config
+from .core import Singleton
+
+# Simultaneous requests allowed per host. B3's legacy bvmf host and the BCB
+# API throttle aggressively; arquivos.b3.com.br serves static files.
+DEFAULT_HOST_CONCURRENCY: dict[str, int] = {
+    "bvmf.bmfbovespa.com.br": 2,
+    "arquivos.b3.com.br": 4,
+    "api.bcb.gov.br": 2,
+}
+_FALLBACK_HOST_CONCURRENCY = 4
+
+_RATE_LIMIT_DB = "ratelimit.db"
+
+# (host_concurrency, template rate limit) of the acquisition running in this
+# context; see acquisition_limits().
+_acquisition_limits: ContextVar[tuple[int | None, RateLimit | None] | None] = (
+    ContextVar("acquisition_limits", default=None)
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token-bucket parameters for one host.
+
+    Attributes:
+        rate: Tokens (request starts) added per second.
+        burst: Bucket capacity, i.e. requests allowed back to back after an
+            idle period.
+    """
+
+    rate: float
+    burst: int = 1
+
+    @classmethod
+    def from_config(cls, value: Any) -> RateLimit | None:
+        """Build a RateLimit from a config value.
+
+        Args:
+            value: A number (requests per second) or a mapping with ``rate``
+                and optional ``burst``.
+
+        Returns:
+            The RateLimit, or None when *value* does not set a positive rate.
+        """
+        if isinstance(value, dict):
+            rate, burst = value.get("rate"), value.get("burst", 1)
+        else:
+            rate, burst = value, 1
+        if not rate or float(rate) <= 0:
+            return None
+        return cls(float(rate), max(1, int(burst)))
+
+
+def template_rate_limit(md_downloader: Any) -> RateLimit | None:
+    """Return the rate limit a template sets for its host, if any.
+
+    ``rate_limit`` (requests per second, with optional ``rate_burst``) wins;
+    otherwise a ``download_delay`` of *d* seconds means one request every
+    *d* seconds.
+
+    Args:
+        md_downloader: The template's MarketDataDownloader.
+
+    Returns:
+        The template's RateLimit, or None when it sets none.
+    """
+    rate = getattr(md_downloader, "rate_limit", None)
+    if rate:
+        burst = getattr(md_downloader, "rate_burst", None) or 1
+        return RateLimit.from_config({"rate": rate, "burst": burst})
+    delay = getattr(md_downloader, "download_delay", 0)
+    if delay and delay > 0:
+        return RateLimit(1.0 / delay)
+    return None
+
+
+def configured_rate_limits() -> dict[str, RateLimit]:
+    """Load the global per-host rate limits from the user config file.
+
+    Read from the ``[rate_limits]`` table of ``config.toml``; the key
+    ``default`` applies to hosts without an entry of their own::
+
+        [rate_limits]
+        default = 5.0
+        "api.bcb.gov.br" = { rate = 1.0, burst = 2 }
+
+    Returns:
+        Mapping of host (or ``default``) to RateLimit.
+    """
+    limits = {}
+    for host, value in load_config().get("rate_limits", {}).items():
+        limit = RateLimit.from_config(value)
+        if limit is not None:
+            limits[host] = limit
+    return limits
+
+
+class TokenBucket:
+    """Token bucket per host persisted in SQLite.
+
+    Every :meth:`reserve` takes one token inside an immediate transaction, so
+    threads and processes sharing the database draw from the same bucket.
+    Tokens may go negative: a negative balance is a queue of reservations,
+    and each caller waits until its own token has been refilled.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "create table if not exists rate_buckets ("
+                "host TEXT primary key, tokens REAL, updated REAL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def reserve(self, host: str, limit: RateLimit) -> float:
+        """Take one token for *host*.
+
+        Args:
+            host: Host key.
+            limit: Rate and burst applied to the bucket.
+
+        Returns:
+            Seconds the caller must wait before starting its request.
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("begin immediate")
+            try:
+                now = time.time()
+                row = conn.execute(
+                    "select tokens, updated from rate_buckets where host = ?",
+                    (host,),
+                ).fetchone()
+                if row is None:
+                    tokens = float(limit.burst)
+                else:
+                    elapsed = max(0.0, now - row[1])
+                    tokens = min(float(limit.burst), row[0] + elapsed * limit.rate)
+                tokens -= 1
+                conn.execute(
+                    "insert into rate_buckets (host, tokens, updated) "
+                    "values (?, ?, ?) on conflict(host) do update set "
+                    "tokens = excluded.tokens, updated = excluded.updated",
+                    (host, tokens, now),
+                )
+                conn.execute("commit")
+            except BaseException:
+                conn.execute("rollback")
+                raise
+        return max(0.0, -tokens / limit.rate)
+
+
+class HostThrottle(Singleton):
+    """Process-wide per-host semaphore plus a shared token bucket.
+
+    The concurrency limit of a host is fixed the first time that host is
+    seen; later calls with a different ``limit`` reuse the existing
+    semaphore.
+    """
+
+    def init(self) -> None:
+        """Initialize the throttle state."""
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._rate_limits: dict[str, RateLimit] | None = None
+
+    def _semaphore(self, host: str, limit: int | None) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                if limit is None:
+                    limit = DEFAULT_HOST_CONCURRENCY.get(
+                        host, _FALLBACK_HOST_CONCURRENCY
+                    )
+                sem = threading.BoundedSemaphore(max(1, int(limit)))
+                self._semaphores[host] = sem
+            return sem
+
+    def _bucket(self) -> TokenBucket:
+        from .cache import CacheManager
+
+        man = CacheManager()
+        db_path = man.cache_path(str(Path(man.meta_folder) / _RATE_LIMIT_DB))
+        with self._lock:
+            bucket = self._buckets.get(db_path)
+            if bucket is None:
+                bucket = TokenBucket(db_path)
+                self._buckets[db_path] = bucket
+            return bucket
+
+    def rate_limit(
+        self, host: str, template_limit: RateLimit | None
+    ) -> RateLimit | None:
+        """Resolve the rate limit for *host*.
+
+        Precedence: the template's own limit, then the host entry of the
+        global ``[rate_limits]`` config, then its ``default`` entry.
+
+        Args:
+            host: Host key.
+            template_limit: Limit set by the template, if any.
+
+        Returns:
+            The effective RateLimit, or None for an unlimited host.
+        """
+        if template_limit is not None:
+            return template_limit
+        with self._lock:
+            if self._rate_limits is None:
+                self._rate_limits = configured_rate_limits()
+            limits = self._rate_limits
+        return limits.get(host, limits.get("default"))
+
+    @contextmanager
+    def slot(
+        self,
+        host: str,
+        limit: int | None = None,
+        rate_limit: RateLimit | None = None,
+    ) -> Iterator[None]:
+        """Hold one request slot on *host* for the duration of the block.
+
+        Blocks until fewer than ``limit`` requests are in flight on the host,
+        then waits for a token from the host's bucket.
+
+        Args:
+            host: Host key, the ``host[:port]`` of the request URL.
+            limit: Concurrency cap for the host; defaults to
+                ``DEFAULT_HOST_CONCURRENCY`` (4 for unknown hosts).
+            rate_limit: The template's rate limit (see
+                :func:`template_rate_limit`); the global config applies when
+                None.
+        """
+        sem = self._semaphore(host, limit)
+        with sem:
+            effective = self.rate_limit(host, rate_limit)
+            if effective is not None:
+                wait = self._bucket().reserve(host, effective)
+                if wait > 0:
+                    time.sleep(wait)
+            yield
+
+
+@contextmanager
+def acquisition_limits(md_downloader: Any) -> Iterator[None]:
+    """Apply a template's throttling settings to requests made in this block.
+
+    Requests sent through the shared HTTP transport inside the block (and in
+    threads started with a copy of this context) use the template's
+    ``host_concurrency`` and rate limit (see :func:`template_rate_limit`).
+
+    Args:
+        md_downloader: The template's MarketDataDownloader.
+    """
+    token = _acquisition_limits.set(
+        (
+            getattr(md_downloader, "host_concurrency", None),
+            template_rate_limit(md_downloader),
+        )
+    )
+    try:
+        yield
+    finally:
+        _acquisition_limits.reset(token)
+
+
+def request_slot(host: str) -> AbstractContextManager[None]:
+    """Return the :meth:`HostThrottle.slot` one HTTP request to *host* holds.
+
+    The concurrency cap and rate limit come from the enclosing
+    :func:`acquisition_limits` block, if any.
+
+    Args:
+        host: ``host[:port]`` of the request URL.
+
+    Returns:
+        A context manager holding the slot.
+    """
+    limit, rate_limit = _acquisition_limits.get() or (None, None)
+    return HostThrottle().slot(host, limit=limit, rate_limit=rate_limit)
@@ -6,15 +6,14 @@ incremental updates based on template YAML structure.
 
 from __future__ import annotations
 
-import json
 import logging
-from contextlib import closing, suppress
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from brasa.util import DateRange, DownloadArgs
+from brasa.util import DateRange
 
 if TYPE_CHECKING:
     from .template import MarketDataTemplate
@@ -261,36 +260,10 @@ def _resolve_no_auto_update(template_name: str) -> ResolvedStrategy:
 def _get_last_downloaded_date(template_name: str) -> date | None:
     """Get the max refdate from cache_metadata for a template.
 
-    Deserializes download_args in Python, not SQL.
+    Reads the indexed ``refdate`` column promoted from download_args.
     Returns None if no entries found.
     """
-    from .cache import CacheManager
-
-    cache = CacheManager()
-    with closing(cache.meta_db_connection) as conn:
-        c = conn.cursor()
-        c.execute(
-            "SELECT download_args FROM cache_metadata WHERE template = ? "
-            "ORDER BY ROWID DESC LIMIT 100",
-            (template_name,),
-        )
-        rows = c.fetchall()
-
-    max_date = None
-    for (download_args_json,) in rows:
-        try:
-            args = DownloadArgs.from_json(download_args_json)
-            if "refdate" in args:
-                # Extract date from canonical form (YYYY-MM-DDTHH:MM:SS)
-                refdate_val = args.get_object("refdate")
-                if isinstance(refdate_val, datetime):
-                    refdate_date = refdate_val.date()
-                    if max_date is None or refdate_date > max_date:
-                        max_date = refdate_date
-        except (json.JSONDecodeError, ValueError):
-            continue
-
-    return max_date
+    return _max_promoted_date(template_name, "refdate")
 
 
 def _get_last_downloaded_end_date(template_name: str) -> date | None:
@@ -298,32 +271,34 @@ def _get_last_downloaded_end_date(template_name: str) -> date | None:
 
     Uses max() to find the furthest point downloaded so far, so the next
     incremental update continues from there (minus overlap buffer).
-    Deserializes download_args in Python, not SQL.
     Returns None if no entries found.
     """
+    return _max_promoted_date(template_name, "end_date")
+
+
+def _max_promoted_date(template_name: str, column: str) -> date | None:
+    """Return the max of a promoted date column of a template's entries.
+
+    Args:
+        template_name: Template id.
+        column: ``refdate`` or ``end_date``; both are ISO ``YYYY-MM-DD``
+            strings indexed together with the template.
+
+    Returns:
+        The latest date, or None if no entry has one.
+    """
     from .cache import CacheManager
 
     cache = CacheManager()
-    with closing(cache.meta_db_connection) as conn:
-        c = conn.cursor()
-        # Use SQL MAX on the JSON field to avoid scanning all rows in Python.
-        # json_extract returns the value as a string; MAX() gives lexicographic
-        # max which works correctly for ISO-8601 datetime strings.
-        c.execute(
-            "SELECT MAX(json_extract(download_args, '$.end')) "
-            "FROM cache_metadata WHERE template = ?",
+    with cache.meta_db() as conn:
+        row = conn.execute(
+            f"SELECT MAX({column}) FROM cache_metadata WHERE template = ?",
             (template_name,),
-        )
-        row = c.fetchone()
-
+        ).fetchone()
     if not row or row[0] is None:
         return None
-
-    with suppress(json.JSONDecodeError, ValueError):
-        end_val = DownloadArgs.from_json(f'{{"end": "{row[0]}"}}').get_object("end")
-        if isinstance(end_val, datetime):
-            return end_val.date()
-
+    with suppress(ValueError):
+        return date.fromisoformat(row[0])
     return None
 
 
@@ -338,7 +313,7 @@ def _is_today_cached(template_name: str) -> bool:
     today = datetime.now().isoformat()[:10]
     cache = CacheManager()
 
-    with closing(cache.meta_db_connection) as conn:
+    with cache.meta_db() as conn:
         c = conn.cursor()
         c.execute(
             "SELECT 1 FROM cache_metadata WHERE template = ? AND extra_key = ?",
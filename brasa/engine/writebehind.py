@@ -0,0 +1,166 @@
+"""Write-behind buffer for metadata and trial writes.
+
+While a :class:`MetaWriteBuffer` is installed on the CacheManager (see
+``CacheManager.write_behind``), ``save_meta``, ``save_trial`` and the
+metadata/trial deletes only enqueue their rows. One writer thread drains
+the queue in order and applies it with ``executemany``, at most
+``batch_size`` operations per transaction, so a run over thousands of
+entries costs a few dozen transactions instead of one or two per entry.
+
+Crash safety is unchanged: callers enqueue ``save_meta`` only after the
+entry's files are on disk, so a row is never marked processed before its
+parquet exists. Writes still buffered when the process dies are lost, and
+the affected entries are simply processed (or downloaded) again.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from itertools import count, groupby
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache import CacheManager
+
+# Operations per transaction.
+DEFAULT_BATCH_SIZE = 500
+# Seconds the writer waits for more operations before committing a batch.
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+_STOP = object()
+_FLUSH = object()
+
+
+class MetaWriteBuffer:
+    """Ordered queue of metadata writes drained by a single writer thread.
+
+    Operations are ``(sql, params)`` pairs applied in enqueue order;
+    consecutive operations with the same statement share one
+    ``executemany``. Pending ``cache_metadata`` rows stay readable through
+    :meth:`pending_meta` until they are committed.
+
+    Args:
+        man: CacheManager whose metadata database receives the writes.
+        batch_size: Maximum operations per transaction.
+        flush_interval: Seconds to wait for a batch to fill before writing.
+    """
+
+    def __init__(
+        self,
+        man: CacheManager,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        self.man = man
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.transactions = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._seq = count()
+        # id -> (sequence, row or None when deleted) of unwritten metadata
+        self._pending: dict[str, tuple[int, tuple | None]] = {}
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="brasa-meta-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(
+        self,
+        sql: str,
+        params: tuple,
+        *,
+        meta_id: str | None = None,
+        row: tuple | None = None,
+    ) -> None:
+        """Enqueue one write.
+
+        Args:
+            sql: Statement to execute.
+            params: Its parameters.
+            meta_id: Id of the entry whose ``cache_metadata`` row the write
+                changes, if any.
+            row: The entry's row after the write (in table column order),
+                or None when the write deletes it.
+        """
+        self._raise_error()
+        seq = next(self._seq)
+        if meta_id is not None:
+            with self._lock:
+                self._pending[meta_id] = (seq, row)
+        self._queue.put((seq, sql, params, meta_id))
+
+    def pending_meta(self, meta_id: str) -> tuple[bool, tuple | None]:
+        """Return the unwritten ``cache_metadata`` row of an entry.
+
+        Returns:
+            ``(True, row)`` when a write of the entry is pending, with
+            *row* None if that write deletes it; ``(False, None)`` when the
+            database is up to date for the entry.
+        """
+        with self._lock:
+            pending = self._pending.get(meta_id)
+        if pending is None:
+            return False, None
+        return True, pending[1]
+
+    def flush(self) -> None:
+        """Block until every write enqueued so far is committed."""
+        self._queue.put(_FLUSH)
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write everything still queued and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _next_batch(self) -> tuple[list, bool]:
+        """Collect the next batch; also return whether the writer stops."""
+        batch: list = []
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get(timeout=self.flush_interval if batch else None)
+            except queue.Empty:
+                break
+            if item is _STOP or item is _FLUSH:
+                self._queue.task_done()
+                return batch, item is _STOP
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            if not batch:
+                continue
+            try:
+                if self._error is None:
+                    self._write(batch)
+            except BaseException as exc:  # re-raised by put, flush and close
+                self._error = exc
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: list) -> None:
+        with self.man._write_lock, self.man.meta_db() as conn:
+            for sql, items in groupby(batch, key=lambda item: item[1]):
+                conn.executemany(sql, [item[2] for item in items])
+        self.transactions += 1
+        with self._lock:
+            for seq, _sql, _params, meta_id in batch:
+                if (
+                    meta_id is not None
+                    and self._pending.get(meta_id, (None,))[0] == seq
+                ):
+                    del self._pending[meta_id]
@@ -2,15 +2,17 @@
 Declarative field/type system for brasa templates.
 
 Defines dataset schemas (Fieldset/Field) and applies them via the
-pandas adapter (type coercion) and the pyarrow schema builder.
+pandas and pyarrow adapters (type coercion) and the pyarrow schema
+builder.
 """
 
 from .adapters.pandas_adapter import PandasAdapter
-from .adapters.pyarrow_adapter import get_target_schema
+from .adapters.pyarrow_adapter import ArrowAdapter, get_target_schema
 from .field import Field
 from .fieldset import Fieldset
 
 __all__ = [
+    "ArrowAdapter",
     "Field",
     "Fieldset",
     "PandasAdapter",
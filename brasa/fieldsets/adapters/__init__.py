@@ -1,9 +1,10 @@
 """Adapters for integrating Fieldset with external data processing libraries."""
 
 from .pandas_adapter import PandasAdapter
-from .pyarrow_adapter import get_target_schema
+from .pyarrow_adapter import ArrowAdapter, get_target_schema
 
 __all__ = [
+    "ArrowAdapter",
     "PandasAdapter",
     "get_target_schema",
 ]
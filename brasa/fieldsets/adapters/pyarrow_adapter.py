@@ -1,9 +1,19 @@
-"""PyArrow schema builder for Fieldset."""
+"""
+PyArrow adapter for Fieldset.
 
+Builds the target PyArrow schema of a fieldset and applies its types to
+PyArrow Tables with compute kernels.
+"""
+
+import warnings
+
+import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from ..field import Field
 from ..fieldset import Fieldset
+from .pandas_adapter import PandasAdapter
 
 _TYPE_MAPPING = {
     "integer": pa.int64(),
@@ -15,6 +25,9 @@ _TYPE_MAPPING = {
     "character": pa.string(),
 }
 
+_BOOL_TRUE = ["true", "t", "yes", "y", "1", "on"]
+_BOOL_FALSE = ["false", "f", "no", "n", "0", "off"]
+
 
 def _pyarrow_type(field: Field) -> pa.DataType:
     if field.type_name == "numeric":
@@ -30,3 +43,154 @@ def get_target_schema(fieldset: Fieldset) -> pa.Schema:
             for f in fieldset.get_all_fields()
         ]
     )
+
+
+def _is_text(column: pa.ChunkedArray) -> bool:
+    return pa.types.is_string(column.type) or pa.types.is_large_string(column.type)
+
+
+def _clean_strings(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Cast to string, strip whitespace and turn empty strings into nulls."""
+    text = pc.utf8_trim_whitespace(column.cast(pa.string()))
+    return pc.if_else(pc.equal(text, ""), pa.scalar(None, pa.string()), text)
+
+
+class ArrowAdapter:
+    """
+    Adapter to apply Fieldset types to PyArrow Tables.
+
+    Arrow counterpart of :class:`PandasAdapter`: columns are converted with
+    compute kernels straight to the types of :func:`get_target_schema`.
+    When the kernels cannot convert a column (custom types, dates without
+    a format that are not ISO 8601, values a kernel rejects but pandas
+    coerces to null) that column is converted by the PandasAdapter, so
+    both adapters give the same values.
+    """
+
+    def __init__(self, fieldset: Fieldset, verbose_warnings: bool = True):
+        """
+        Initialize ArrowAdapter.
+
+        Args:
+            fieldset: Fieldset instance defining the schema
+            verbose_warnings: Show detailed warnings for conversion errors
+        """
+        self.fieldset = fieldset
+        self.verbose_warnings = verbose_warnings
+
+    def _convert_date_type(
+        self, column: pa.ChunkedArray, field: Field, target: pa.DataType
+    ) -> pa.ChunkedArray:
+        """Date/datetime conversion with ``strptime``."""
+        if not (pa.types.is_temporal(column.type) or pa.types.is_null(column.type)):
+            fmt = field.parser.parameters.get("format")
+            text = _clean_strings(column)
+            if fmt is None:
+                # ISO 8601 only; anything else raises and goes to pandas
+                column = text.cast(pa.timestamp("us"))
+            else:
+                column = pc.strptime(text, format=fmt, unit="us", error_is_null=True)
+        return column.cast(target, safe=False)
+
+    def _convert_integer_type(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """Integer conversion."""
+        if _is_text(column):
+            column = _clean_strings(column)
+        return column.cast(pa.int64())
+
+    def _convert_numeric_type(
+        self, column: pa.ChunkedArray, field: Field
+    ) -> pa.ChunkedArray:
+        """Numeric (float) conversion with separators, implied decimals and sign."""
+        params = field.parser.parameters
+        if _is_text(column):
+            column = _clean_strings(column)
+            thousands = params.get("thousands")
+            decimal_sep = params.get("decimal", ".")
+            if thousands:
+                column = pc.replace_substring(column, thousands, "")
+            if decimal_sep != ".":
+                column = pc.replace_substring(column, decimal_sep, ".")
+        result = column.cast(pa.float64())
+        dec = int(params.get("dec", 0))
+        sign = str(params.get("sign", "+"))
+        if dec > 0:
+            result = pc.divide(result, 10.0**dec)
+        if sign == "-":
+            result = pc.negate(result)
+        return result
+
+    def _convert_boolean_type(self, column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """Boolean conversion; unrecognized values become null."""
+        if not _is_text(column):
+            return column.cast(pa.bool_())
+        lower = pc.utf8_lower(pc.utf8_trim_whitespace(column))
+        return pc.if_else(
+            pc.is_in(lower, value_set=pa.array(_BOOL_TRUE)),
+            True,
+            pc.if_else(
+                pc.is_in(lower, value_set=pa.array(_BOOL_FALSE)),
+                False,
+                pa.scalar(None, pa.bool_()),
+            ),
+        )
+
+    def _convert_with_pandas(
+        self, column: pa.ChunkedArray, field: Field, target: pa.DataType
+    ) -> pa.ChunkedArray:
+        """Convert a column with the PandasAdapter (fallback path)."""
+        df = pd.DataFrame({field.name: column.to_pandas(types_mapper=pd.ArrowDtype)})
+        df = PandasAdapter(self.fieldset, self.verbose_warnings).apply_types(df)
+        schema = pa.schema([pa.field(field.name, target)])
+        return pa.Table.from_pandas(df, schema=schema, preserve_index=False).column(0)
+
+    def _convert(self, column: pa.ChunkedArray, field: Field) -> pa.ChunkedArray:
+        target = _pyarrow_type(field)
+        type_name = field.type_name
+        try:
+            if type_name in ("date", "datetime"):
+                return self._convert_date_type(column, field, target)
+            if type_name == "numeric":
+                return self._convert_numeric_type(column, field)
+            if type_name == "integer":
+                return self._convert_integer_type(column)
+            if type_name == "boolean":
+                return self._convert_boolean_type(column)
+            if type_name in ("string", "character"):
+                return column.cast(pa.string())
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            pass
+        return self._convert_with_pandas(column, field, target)
+
+    def apply_types(self, table: pa.Table) -> pa.Table:
+        """
+        Apply type conversions to a Table using fieldset schema.
+
+        Args:
+            table: Table with columns to be type-converted
+
+        Returns:
+            Table with converted column types
+        """
+        for field_obj in self.fieldset.get_all_fields():
+            field_name = field_obj.name
+
+            # Skip if column doesn't exist in the Table
+            index = table.schema.get_field_index(field_name)
+            if index < 0:
+                continue
+
+            try:
+                column = self._convert(table.column(index), field_obj)
+            except Exception as e:
+                if self.verbose_warnings:
+                    warnings.warn(
+                        f"Error converting field '{field_name}' to type "
+                        f"'{field_obj.type_definition}': {e}",
+                        UserWarning,
+                        stacklevel=2,
+                    )
+                continue
+            table = table.set_column(index, field_name, column)
+
+        return table
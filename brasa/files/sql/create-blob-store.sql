@@ -0,0 +1,11 @@
+-- References from raw download files to content-addressed blobs.
+-- One row per file in raw/<template>/<checksum>/ that is a hardlink to a
+-- blob in blobs/; the number of rows per blob is its reference count.
+
+create table if not exists raw_blob_refs (
+    path TEXT PRIMARY KEY,            -- Raw file path relative to the cache
+    blob TEXT NOT NULL                -- Blob key: content sha256 + codec suffix
+);
+
+-- Index for reference counts by blob
+create index if not exists idx_raw_blob_refs_blob on raw_blob_refs(blob);
@@ -1,6 +1,6 @@
 create table if not exists cache_metadata (
     id TEXT unique,
-    download_checksum TEXT unique,
+    download_checksum TEXT,
     timestamp TEXT,
     response TEXT,
     download_args TEXT,
@@ -0,0 +1,23 @@
+-- Download trials rolled up by `brasa cache compact`.
+-- One row per cache id and status code, counting the trials older than the
+-- retention window that were removed from download_trials.
+
+create table if not exists download_trials_summary (
+    cache_id TEXT NOT NULL,
+    template TEXT,                    -- NULL when the entry had no metadata row
+    status_code TEXT NOT NULL,
+    trials INTEGER NOT NULL,
+    first_timestamp TEXT,
+    last_timestamp TEXT,
+    PRIMARY KEY (cache_id, status_code)
+);
+
+-- Index for per-template reports
+create index if not exists idx_download_trials_summary_template
+    on download_trials_summary(template);
+
+-- Last run of periodic maintenance tasks (ISO timestamps)
+create table if not exists cache_maintenance (
+    task TEXT PRIMARY KEY,
+    last_run TEXT NOT NULL
+);
@@ -1,16 +1,21 @@
+import gzip
 import hashlib
+import io
 import itertools
 import json
 import logging
 import pickle
 import re
+import shutil
 import warnings
 import zipfile
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from io import BytesIO
 from pathlib import Path
-from tempfile import gettempdir
+from tempfile import SpooledTemporaryFile, gettempdir
 from typing import IO, Any
 
 from bizdays import Calendar, get_option, set_option
@@ -128,7 +133,24 @@ def generate_checksum_from_file(fp: IO) -> str:
     return file_hash.hexdigest()
 
 
+class DownloadedFile(io.FileIO):
+    """Download body spooled to a file on disk by a streaming downloader.
+
+    Acquisition functions may return it instead of an in-memory buffer. The
+    engine moves the file into the download folder rather than copying it.
+
+    Attributes:
+        md5: Hex MD5 digest of the raw bytes, computed while they were
+            written, so plain files need not be re-read for their checksum.
+    """
+
+    def __init__(self, path: str | Path, md5: str) -> None:
+        super().__init__(str(path), "rb")
+        self.md5 = md5
+
+
 _ZIP_CHECKSUM_MAX_DEPTH = 8
+_ZIP_CHECKSUM_CHUNK_SIZE = 1 << 16
 
 
 def _hash_zip_contents(fp: IO, depth: int) -> str:
@@ -142,12 +164,20 @@ def _hash_zip_contents(fp: IO, depth: int) -> str:
         for name in sorted(zf.namelist()):
             file_hash.update(name.encode("utf-8"))
             file_hash.update(b"\x00")
-            content = zf.read(name)
-            if zipfile.is_zipfile(BytesIO(content)):
-                inner = _hash_zip_contents(BytesIO(content), depth + 1)
-                file_hash.update(inner.encode("ascii"))
-            else:
-                file_hash.update(content)
+            with zf.open(name) as member:
+                head = member.read(_ZIP_CHECKSUM_CHUNK_SIZE)
+                if head.startswith(b"PK"):
+                    # Possibly a nested zip: needs the whole entry in memory
+                    content = head + member.read()
+                    if zipfile.is_zipfile(BytesIO(content)):
+                        inner = _hash_zip_contents(BytesIO(content), depth + 1)
+                        file_hash.update(inner.encode("ascii"))
+                    else:
+                        file_hash.update(content)
+                else:
+                    file_hash.update(head)
+                    while chunk := member.read(_ZIP_CHECKSUM_CHUNK_SIZE):
+                        file_hash.update(chunk)
             file_hash.update(b"\x00")
     return file_hash.hexdigest()
 
@@ -160,6 +190,8 @@ def generate_checksum_from_zip(fp: IO) -> str:
     non-deterministic zip metadata (modification timestamps, OS byte, extra
     fields, central-directory ordering). Inner zips are hashed structurally
     via recursion (cap: 8 levels) rather than by their container bytes.
+    Entries that are not zips are hashed in chunks, so large members are never
+    held in memory.
 
     The file pointer is rewound to position 0 before returning (even on
     error), so callers can still stream the original bytes downstream.
@@ -212,6 +244,340 @@ def unzip_recursive(fname):
         return fname
 
 
+# Nested zip members larger than this are spooled to a temporary file
+# instead of memory while they are unwrapped.
+_ZIP_SPOOL_MAX_SIZE = 64 << 20
+
+ChunkObserver = Callable[[bytes], None]
+
+
+# Suffix and default level of each raw-file codec.
+RAW_CODEC_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+_RAW_CODEC_LEVELS = {"gzip": 6, "zstd": 3}
+_RAW_CODEC_MAGIC = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "the zstd raw codec requires the zstandard package "
+            "(pip install 'brasa-marketdata[zstd]')"
+        ) from e
+    return zstandard
+
+
+@dataclass(frozen=True)
+class RawCodec:
+    """Compression applied to raw files stored in the cache.
+
+    Attributes:
+        name: ``gzip`` or ``zstd`` (needs the ``zstandard`` package).
+        level: Compression level; None uses the codec default (gzip 6,
+            zstd 3).
+        threads: zstd worker threads, -1 for one per CPU. Bodies are split
+            into jobs of a few MiB, so only large files use more than one
+            thread. Ignored by gzip.
+    """
+
+    name: str = "gzip"
+    level: int | None = None
+    threads: int = 0
+
+    def __post_init__(self) -> None:
+        if self.name not in RAW_CODEC_SUFFIXES:
+            raise ValueError(
+                f"unknown raw codec {self.name!r}; "
+                f"expected one of {sorted(RAW_CODEC_SUFFIXES)}"
+            )
+
+    @property
+    def suffix(self) -> str:
+        """File suffix of the codec, e.g. ``.gz``."""
+        return RAW_CODEC_SUFFIXES[self.name]
+
+    @classmethod
+    def from_config(cls, value: Any, base: "RawCodec | None" = None) -> "RawCodec":
+        """Build a RawCodec from a config value.
+
+        Args:
+            value: A codec name, or a mapping with ``codec`` and optional
+                ``level`` / ``threads``.
+            base: Codec whose settings fill the keys *value* leaves out.
+                Its level only carries over when the codec is unchanged.
+
+        Returns:
+            The RawCodec.
+        """
+        base = base or cls()
+        if not isinstance(value, dict):
+            value = {"codec": value}
+        name = value.get("codec") or base.name
+        level = value.get("level", base.level if name == base.name else None)
+        threads = value.get("threads", base.threads)
+        return cls(name, None if level is None else int(level), int(threads or 0))
+
+    def open(self, fname: str | Path) -> IO:
+        """Open *fname* for writing compressed bytes."""
+        level = self.level if self.level is not None else _RAW_CODEC_LEVELS[self.name]
+        if self.name == "gzip":
+            return gzip.open(fname, "wb", compresslevel=level)
+        compressor = _zstandard().ZstdCompressor(level=level, threads=self.threads)
+        return compressor.stream_writer(Path(fname).open("wb"), closefd=True)
+
+
+def raw_file_codec(fname: str | Path) -> str | None:
+    """Return the codec a raw file is stored with.
+
+    Known suffixes decide; other files are identified by their magic bytes.
+
+    Args:
+        fname: Path to the file.
+
+    Returns:
+        ``gzip``, ``zstd``, or None for an uncompressed file.
+    """
+    for name, suffix in RAW_CODEC_SUFFIXES.items():
+        if str(fname).endswith(suffix):
+            return name
+    with Path(fname).open("rb") as fp:
+        head = fp.read(4)
+    for magic, name in _RAW_CODEC_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_raw_file(
+    fname: str | Path, mode: str = "rb", encoding: str | None = None
+) -> IO:
+    """Open a raw download file, decompressing it transparently.
+
+    Gzip (``.gz``, the format of existing caches) and zstd (``.zst``) files
+    are recognized by suffix or magic bytes; anything else is opened as is.
+
+    Args:
+        fname: Path to the file.
+        mode: ``"rb"`` or a text mode such as ``"rt"``.
+        encoding: Text encoding for text modes.
+
+    Returns:
+        An open file object.
+    """
+    text = "b" not in mode
+    codec = raw_file_codec(fname)
+    if codec == "gzip":
+        return gzip.open(fname, "rt" if text else "rb", encoding=encoding)
+    if codec == "zstd":
+        # The source file is closed together with the returned reader
+        source = Path(fname).open("rb")  # noqa: SIM115
+        reader = _zstandard().ZstdDecompressor().stream_reader(source, closefd=True)
+        buffered = io.BufferedReader(reader)
+        return io.TextIOWrapper(buffered, encoding=encoding) if text else buffered
+    return Path(fname).open("r" if text else "rb", encoding=encoding)
+
+
+def compress_chunks(
+    chunks: Iterable[bytes],
+    target: str | Path,
+    observers: Iterable[ChunkObserver] = (),
+    codec: RawCodec | None = None,
+) -> int:
+    """Write *chunks* to a compressed file, passing each one to *observers* first.
+
+    Lets a single read of a body feed checksums and validators while it is
+    being compressed.
+
+    Args:
+        chunks: Uncompressed content.
+        target: Path of the file to create.
+        observers: Callables receiving every chunk, e.g. ``hashlib`` updates.
+        codec: Compression to apply (default: gzip).
+
+    Returns:
+        Number of uncompressed bytes written.
+    """
+    observers = list(observers)
+    size = 0
+    with (codec or RawCodec()).open(target) as fp:
+        for chunk in chunks:
+            for observe in observers:
+                observe(chunk)
+            fp.write(chunk)
+            size += len(chunk)
+    return size
+
+
+def iter_chunks(fp: IO, first: bytes = b"") -> Iterator[bytes]:
+    """Yield *first* (when non-empty) and then the rest of *fp* in chunks."""
+    if first:
+        yield first
+    while chunk := fp.read(_ZIP_CHECKSUM_CHUNK_SIZE):
+        yield chunk
+
+
+def _extract_zip_members(
+    source: IO | str,
+    dest_root: Path,
+    depth: int,
+    on_member: Callable[[str], ChunkObserver] | None,
+    codec: RawCodec,
+) -> tuple[str, list[str]]:
+    """Recursive helper for checksum_and_extract_zip.
+
+    Members are visited in name order, as in _hash_zip_contents, so the
+    checksum is the same; the files are returned in archive order.
+    """
+    if depth > _ZIP_CHECKSUM_MAX_DEPTH:
+        raise RecursionError(
+            f"zip nesting exceeds maximum depth ({_ZIP_CHECKSUM_MAX_DEPTH})"
+        )
+    file_hash = hashlib.md5()
+    extracted: dict[int, list[str]] = {}
+    with zipfile.ZipFile(source) as zf:
+        infos = zf.infolist()
+        members = [info for info in infos if not info.is_dir()]
+        for info in members:
+            target = (dest_root / info.filename).resolve()
+            if not target.is_relative_to(dest_root):
+                raise ValueError(
+                    f"zip member {info.filename!r} would extract outside "
+                    f"destination {str(dest_root)!r}"
+                )
+        # A lone member that is itself a zip is unwrapped like unzip_recursive
+        unwrap = len(members) == 1
+        order = sorted(range(len(infos)), key=lambda i: infos[i].filename)
+        for index in order:
+            info = infos[index]
+            file_hash.update(info.filename.encode("utf-8"))
+            file_hash.update(b"\x00")
+            if info.is_dir():
+                file_hash.update(b"\x00")
+                continue
+            logging.debug("zipped file %s", info.filename)
+            with zf.open(info) as member:
+                inner, extracted[index] = _extract_zip_member(
+                    member,
+                    info.filename,
+                    dest_root=dest_root,
+                    depth=depth,
+                    file_hash=file_hash,
+                    on_member=on_member,
+                    unwrap=unwrap,
+                    codec=codec,
+                )
+            if inner is not None:
+                file_hash.update(inner.encode("ascii"))
+            file_hash.update(b"\x00")
+    files = [fname for index in sorted(extracted) for fname in extracted[index]]
+    return file_hash.hexdigest(), files
+
+
+def _extract_zip_member(
+    member: IO,
+    name: str,
+    *,
+    dest_root: Path,
+    depth: int,
+    file_hash: Any,
+    on_member: Callable[[str], ChunkObserver] | None,
+    unwrap: bool,
+    codec: RawCodec,
+) -> tuple[str | None, list[str]]:
+    """Compress one zip member; returns its nested-zip hash and files.
+
+    A nested zip is hashed by its contents, so its container bytes are not
+    passed to *file_hash*.
+    """
+    target = dest_root / f"{Path(name).name}{codec.suffix}"
+
+    def observers(hashed: bool = True) -> list[ChunkObserver]:
+        found = [file_hash.update] if hashed else []
+        if on_member is not None:
+            found.append(on_member(name))
+        return found
+
+    head = member.read(_ZIP_CHECKSUM_CHUNK_SIZE)
+    if not head.startswith(b"PK"):
+        compress_chunks(iter_chunks(member, head), target, observers(), codec)
+        return None, [str(target)]
+    # Possibly a nested zip: spool the whole entry
+    with SpooledTemporaryFile(_ZIP_SPOOL_MAX_SIZE) as spool:
+        spool.write(head)
+        shutil.copyfileobj(member, spool)
+        spool.seek(0)
+        is_zip = zipfile.is_zipfile(spool)
+        spool.seek(0)
+        if not is_zip:
+            compress_chunks(iter_chunks(spool), target, observers(), codec)
+            return None, [str(target)]
+        if unwrap:
+            return _extract_zip_members(spool, dest_root, depth + 1, on_member, codec)
+        inner = _hash_zip_contents(spool, depth + 1)
+        spool.seek(0)
+        compress_chunks(iter_chunks(spool), target, observers(hashed=False), codec)
+        return inner, [str(target)]
+
+
+def checksum_and_extract_zip(
+    fp: str | Path | IO,
+    dest: str | Path,
+    on_member: Callable[[str], ChunkObserver] | None = None,
+    codec: RawCodec | None = None,
+) -> tuple[str, list[str]]:
+    """Extract a zip archive into compressed files and checksum it in one pass.
+
+    Every member is read once: the bytes feed the content checksum (equal
+    to :func:`generate_checksum_from_zip`), the optional per-member
+    observer, and the ``dest/<basename><suffix>`` file being written. As in
+    :func:`unzip_recursive`, an archive whose only member is itself a zip
+    is unwrapped (cap: 8 levels) and the extracted files are flattened into
+    *dest*. Member names escaping *dest* are rejected before anything is
+    written.
+
+    Args:
+        fp: Path to (or seekable file object of) the zip archive.
+        dest: Existing destination folder.
+        on_member: Called with each extracted member name; returns a
+            callable that receives the member's uncompressed chunks.
+        codec: Compression of the extracted files (default: gzip).
+
+    Returns:
+        Tuple of (hex MD5 checksum, paths of the files written in archive
+        order).
+
+    Raises:
+        ValueError: If a member name would extract outside *dest*.
+        RecursionError: If zip nesting exceeds the depth cap.
+        zipfile.BadZipFile: If *fp* is not a valid zip.
+    """
+    return _extract_zip_members(
+        fp, Path(dest).resolve(), 0, on_member, codec or RawCodec()
+    )
+
+
+def unzip_to_gzip(fname: str | Path | IO, dest: str | Path) -> list[str]:
+    """Extract a zip archive straight into gzip-compressed files.
+
+    See :func:`checksum_and_extract_zip`, which also returns the
+    archive's content checksum.
+
+    Args:
+        fname: Path to (or seekable file object of) the zip archive.
+        dest: Existing destination folder.
+
+    Returns:
+        Paths of the ``.gz`` files written, in archive order.
+
+    Raises:
+        ValueError: If a member name would extract outside *dest*.
+        RecursionError: If zip nesting exceeds the depth cap.
+        zipfile.BadZipFile: If *fname* is not a valid zip.
+    """
+    return checksum_and_extract_zip(fname, dest)[1]
+
+
 def unzip_and_get_content(fname, index=-1, encode=False, encoding="latin1"):
     with zipfile.ZipFile(fname) as zf:
         name = zf.namelist()[index]
@@ -0,0 +1,198 @@
+"""Benchmark of the ``pandas`` and ``arrow`` reader engines.
+
+Runs the reader pipelines of ``b3-cotahist-daily`` (fixed-width text) and
+``b3-bvbg086`` (XML) on synthetic files with the layout of those templates,
+and writes the result with ``save_partitioned_parquet_file``, as
+``process_marketdata`` does. Each file holds ``--rows`` records; COTAHIST
+files also carry a header, a trailer and ``regtype`` records other than
+``01``, which the pipeline filters out. Each engine runs ``--repeat``
+times and the fastest run is kept: the XML parsing of BVBG086, identical
+under both engines, varies more between runs than the rest takes.
+
+Run from the repository root::
+
+    python -m tests.benchmark_arrow_reader --rows 200000 --repeat 3
+
+Not collected by pytest; ``tests/test_arrow_reader.py`` runs a tiny
+instance so the harness keeps working.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests.benchmark_meta_db import _fresh_cache
+
+TEMPLATES = ("b3-cotahist-daily", "b3-bvbg086")
+ENGINES = ("pandas", "arrow")
+
+_BVBG086_HEADER = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<Document xmlns="urn:bvmf.052.01.xsd"><BizFileHdr><Xchg><BizGrpDesc>'
+    "<BizGrpDtls><CreDtAndTm>2026-06-19T20:00:00</CreDtAndTm></BizGrpDtls>"
+    '</BizGrpDesc><BizGrp><Document xmlns="urn:bvmf.217.01.xsd">'
+)
+_BVBG086_FOOTER = "</Document></BizGrp></Xchg></BizFileHdr></Document>"
+
+
+@dataclass
+class ReaderResult:
+    """Read and write time of one template under one engine.
+
+    Attributes:
+        template: Template whose pipeline was run.
+        engine: Reader engine.
+        rows: Rows written.
+        seconds: Wall-clock duration of reading and writing (fastest run).
+    """
+
+    template: str
+    engine: str
+    rows: int
+    seconds: float
+
+    def row(self, baseline: ReaderResult | None = None) -> str:
+        """Format the result as one table row."""
+        speedup = baseline.seconds / self.seconds if baseline and self.seconds else 1.0
+        return (
+            f"{self.template:<18} {self.engine:<7} {self.rows:>8} "
+            f"{self.seconds:>8.3f} {speedup:>7.1f}x"
+        )
+
+
+HEADER = f"{'template':<18} {'engine':<7} {'rows':>8} {'seconds':>8} {'speedup':>8}"
+
+
+def _value(field, i: int) -> str:
+    """A valid value of *field* for record *i*."""
+    type_name = field.type_name
+    if type_name in ("date", "datetime"):
+        fmt = field.parser.parameters.get("format", "%Y-%m-%d")
+        return time.strftime(fmt, (2026, 6, 19, 0, 0, 0, 0, 0, 0))
+    if type_name in ("integer", "numeric"):
+        return str(i % 100_000 + 1)
+    return f"S{i % 5000:05d}"
+
+
+def write_cotahist(template, path: Path, rows: int) -> None:
+    """Write a COTAHIST-like fixed-width file with *rows* records."""
+    fields = list(template.fields)
+    width = sum(f.get_attribute("width") for f in fields)
+    with path.open("w", encoding="latin1") as f:
+        f.write("00COTAHIST.2026BOVESPA 20260619".ljust(width) + "\n")
+        for i in range(rows):
+            values = [_value(field, i) for field in fields]
+            # One record in ten is of a type the pipeline drops
+            values[0] = "01" if i % 10 else "02"
+            line = ""
+            for value, field in zip(values, fields, strict=True):
+                w = field.get_attribute("width")
+                numeric = field.type_name in ("integer", "numeric")
+                line += value.rjust(w)[-w:] if numeric else value.ljust(w)[:w]
+            f.write(line + "\n")
+        f.write(f"99COTAHIST.2026BOVESPA 20260619{rows + 2:011d}".ljust(width) + "\n")
+
+
+def write_bvbg086(template, path: Path, rows: int) -> None:
+    """Write a gzipped BVBG086-like XML message with *rows* price reports."""
+    fields = list(template.fields)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(_BVBG086_HEADER)
+        for i in range(rows):
+            nodes: dict = {}
+            for field in fields:
+                node = nodes
+                *parents, leaf = field.get_attribute("tag").split("/")
+                for parent in parents:
+                    node = node.setdefault(parent, {})
+                node[leaf] = _value(field, i)
+            f.write(f"<PricRpt>{_xml(nodes)}</PricRpt>")
+        f.write(_BVBG086_FOOTER)
+
+
+def _xml(nodes: dict) -> str:
+    return "".join(
+        f"<{tag}>{_xml(value) if isinstance(value, dict) else value}</{tag}>"
+        for tag, value in nodes.items()
+    )
+
+
+def run_template(template_id: str, rows: int, repeat: int = 1) -> list[ReaderResult]:
+    """Time the reader of *template_id* on *rows* records under each engine.
+
+    Args:
+        template_id: One of :data:`TEMPLATES`.
+        rows: Records in the synthetic input file.
+        repeat: Runs per engine; the fastest is reported.
+
+    Returns:
+        One result per engine; the first is the pandas baseline.
+    """
+    from brasa.engine.cache import CacheMetadata
+    from brasa.engine.processing import (
+        _get_schema_from_fields,
+        save_partitioned_parquet_file,
+    )
+    from brasa.engine.template import retrieve_template
+
+    template = retrieve_template(template_id)
+    reader = template.reader
+    original_engine = reader.engine
+    results = []
+    with tempfile.TemporaryDirectory() as folder, _fresh_cache(folder):
+        src = Path(folder, "input")
+        if template_id == "b3-bvbg086":
+            write_bvbg086(template, src, rows)
+        else:
+            write_cotahist(template, src, rows)
+        try:
+            for engine in ENGINES:
+                reader.engine = engine
+                timings = []
+                for _ in range(max(1, repeat)):
+                    meta = CacheMetadata(template_id)
+                    meta.downloaded_files = [str(src)]
+                    started = time.perf_counter()
+                    data = reader.read(meta)
+                    save_partitioned_parquet_file(
+                        meta,
+                        str(Path(folder, engine)),
+                        data,
+                        template.writer.partitioning,
+                        schema=_get_schema_from_fields(template.fields),
+                    )
+                    timings.append(time.perf_counter() - started)
+                results.append(
+                    ReaderResult(template_id, engine, len(data), min(timings))
+                )
+        finally:
+            reader.engine = original_engine
+    return results
+
+
+def run(rows: int = 100_000, repeat: int = 1) -> list[ReaderResult]:
+    """Run every template under every engine."""
+    return [result for tid in TEMPLATES for result in run_template(tid, rows, repeat)]
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="input records")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per engine")
+    args = parser.parse_args(argv)
+
+    print(HEADER)
+    for template_id in TEMPLATES:
+        results = run_template(template_id, args.rows, args.repeat)
+        for result in results:
+            print(result.row(results[0]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""Download throughput benchmark against the local stub server.
+
+Drives ``download_marketdata`` and ``execute_download_plan`` against
+:class:`tests.stub_server.StubServer` routes that serve COTAHIST zips, BVBG
+XML zips, B3 paged JSON and SGS JSON, and reports files/s, MB/s and the time
+spent writing cache metadata and download trials.
+
+Run from the repository root (the data path defaults to a throwaway
+temporary folder)::
+
+    python -m tests.benchmark_downloads --files 50 --jobs 4 --latency 0.05
+
+Not collected by pytest; ``tests/test_stub_server.py`` runs a tiny instance
+so the harness keeps working.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from tests.stub_server import StubServer, bvbg_zip, cotahist_zip, paged_json, sgs_json
+
+SCENARIOS = ("cotahist", "bvbg", "paged", "sgs")
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput figures for one benchmark run.
+
+    Attributes:
+        name: Scenario name.
+        files: Entries downloaded successfully.
+        bytes: Body bytes served by the stub server.
+        seconds: Wall-clock duration.
+        trial_writes: Calls to ``save_trial`` / ``save_meta``.
+        trial_seconds: Time spent in those calls.
+        stored: Compressed raw bytes written to the cache.
+        raw_passes: Reads over the downloaded content, over all entries.
+    """
+
+    name: str
+    files: int
+    bytes: int
+    seconds: float
+    trial_writes: int
+    trial_seconds: float
+    stored: int = 0
+    raw_passes: int = 0
+
+    @property
+    def files_per_second(self) -> float:
+        """Downloaded entries per second."""
+        return self.files / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        """Served megabytes per second."""
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+    @property
+    def trial_overhead(self) -> float:
+        """Share of the wall-clock time spent writing metadata and trials."""
+        return self.trial_seconds / self.seconds if self.seconds else 0.0
+
+    def row(self) -> str:
+        """Format the result as one table row."""
+        return (
+            f"{self.name:<12} {self.files:>6} {self.files_per_second:>9.1f} "
+            f"{self.mb_per_second:>8.2f} {self.trial_writes:>7} "
+            f"{self.trial_overhead:>8.1%} {self.stored / 1e6:>9.2f} "
+            f"{self.raw_passes:>6}"
+        )
+
+
+HEADER = (
+    f"{'scenario':<12} {'files':>6} {'files/s':>9} {'MB/s':>8} {'trials':>7} "
+    f"{'trial %':>8} {'stored MB':>9} {'passes':>6}"
+)
+
+
+@contextmanager
+def timed_trial_writes() -> Iterator[list[float]]:
+    """Time every ``CacheManager.save_trial`` / ``save_meta`` call in the block.
+
+    Yields:
+        A list that receives the duration of each call.
+    """
+    from brasa.engine.cache import CacheManager
+
+    durations: list[float] = []
+    originals = {
+        name: getattr(CacheManager, name) for name in ("save_trial", "save_meta")
+    }
+
+    def timed(original):
+        def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                durations.append(time.perf_counter() - started)
+
+        return wrapper
+
+    for name, original in originals.items():
+        setattr(CacheManager, name, timed(original))
+    try:
+        yield durations
+    finally:
+        for name, original in originals.items():
+            setattr(CacheManager, name, original)
+
+
+def _register_template(folder: Path, template_id: str, downloader: str) -> None:
+    from brasa.engine.template import MarketDataTemplate, _template_cache
+
+    path = folder / f"{template_id}.yaml"
+    path.write_text(f"id: {template_id}\ndownloader:\n{downloader}")
+    _template_cache[template_id] = MarketDataTemplate(str(path))
+
+
+def setup_scenarios(
+    server: StubServer,
+    folder: Path,
+    n_records: int = 2000,
+    jobs: int = 4,
+    fail_every: int = 0,
+    **route_options: Any,
+) -> dict[str, tuple[str, str]]:
+    """Register the stub routes and a benchmark template per scenario.
+
+    Args:
+        server: A started stub server.
+        folder: Where the template YAML files are written.
+        n_records: Records per synthetic payload.
+        jobs: Host concurrency granted to the benchmark templates.
+        fail_every: Inject a 503 on every N-th request of a route (0: never).
+        **route_options: ``latency`` / ``bandwidth`` for every route.
+
+    Returns:
+        Mapping of scenario name to ``(template id, download arg name)``.
+    """
+    errors = {}
+    if fail_every:
+        errors = dict.fromkeys(range(fail_every, 100_000, fail_every), 503)
+    options = {"errors": errors, "prefix": True, **route_options}
+
+    # Bodies differ per entry: identical content would be stored once and
+    # reported as DUPLICATED.
+    @cache
+    def cotahist(path: str) -> bytes:
+        day = datetime.strptime(path[-12:-4], "%d%m%Y")
+        return cotahist_zip(n_records, day)
+
+    @cache
+    def bvbg(path: str) -> bytes:
+        return bvbg_zip(n_records, datetime.strptime(path[-12:-4], "%Y%m%d"))
+
+    def sgs(path: str) -> bytes:
+        offset = int(path.rsplit("/", 1)[-1].removesuffix(".json")[1:])
+        return sgs_json(n_records, date(2000, 1, 3) + timedelta(days=offset))
+
+    server.add("/cotahist/", cotahist, **options)
+    server.add("/bvbg/", bvbg, **options)
+    server.add("/paged/", paged_json(n_records), **options)
+    server.add("/sgs/", sgs, **options)
+
+    common = (
+        f"  host_concurrency: {jobs}\n"
+        f"  pool_size: {4 * jobs * len(SCENARIOS)}\n"
+        "  retry_attempts: 3\n"
+        "  retry_delay: 0\n"
+        "  retry_on_status_codes: [503]\n"
+    )
+    _register_template(
+        folder,
+        "bench-cotahist",
+        "  function: brasa.downloaders.datetime_download\n"
+        f"  url: {server.url('/cotahist/COTAHIST_D%d%m%Y.ZIP')}\n"
+        "  format: zip\n"
+        "  args:\n    refdate: ~\n" + common,
+    )
+    _register_template(
+        folder,
+        "bench-bvbg",
+        "  function: brasa.downloaders.datetime_download\n"
+        f"  url: {server.url('/bvbg/BVBG_%Y%m%d.zip')}\n"
+        "  format: zip\n"
+        "  args:\n    refdate: ~\n" + common,
+    )
+    _register_template(
+        folder,
+        "bench-paged",
+        "  function: brasa.downloaders.b3_paged_url_encoded_download\n"
+        f"  url: {server.url('/paged/index')}\n"
+        "  format: json\n"
+        "  args:\n    index: ~\n" + common,
+    )
+    _register_template(
+        folder,
+        "bench-sgs",
+        "  function: brasa.downloaders.format_download\n"
+        f"  url: {server.url('/sgs/{code}.json')}\n"
+        "  format: json\n"
+        "  args:\n    code: ~\n" + common,
+    )
+    return {
+        "cotahist": ("bench-cotahist", "refdate"),
+        "bvbg": ("bench-bvbg", "refdate"),
+        "paged": ("bench-paged", "index"),
+        "sgs": ("bench-sgs", "code"),
+    }
+
+
+def scenario_args(arg_name: str, n_files: int) -> dict[str, list]:
+    """Return download args yielding *n_files* distinct entries."""
+    if arg_name == "refdate":
+        start = datetime(2024, 1, 1)
+        return {arg_name: [start + timedelta(days=i) for i in range(n_files)]}
+    return {arg_name: [f"S{i:05d}" for i in range(n_files)]}
+
+
+def _passed(report) -> int:
+    from brasa.engine.reporting import TaskStatus
+
+    return sum(r.status == TaskStatus.PASSED for r in report.results)
+
+
+def _raw_io(report) -> tuple[int, int]:
+    """Sum the stored bytes and raw-file passes of a report's downloads."""
+    stored = passes = 0
+    for result in report.results:
+        stored += int(result.extra_info.get("raw_bytes_written") or 0)
+        passes += int(result.extra_info.get("raw_passes") or 0)
+    return stored, passes
+
+
+def run_download_benchmark(
+    server: StubServer,
+    name: str,
+    template_id: str,
+    args: dict[str, list],
+    jobs: int = 1,
+) -> BenchmarkResult:
+    """Time ``download_marketdata`` for one scenario."""
+    from brasa.engine.api import download_marketdata
+    from brasa.engine.reporting import Verbosity
+
+    server.reset_stats()
+    with timed_trial_writes() as trials:
+        started = time.perf_counter()
+        report = download_marketdata(
+            template_id,
+            force=True,
+            verbosity=Verbosity.QUIET,
+            max_workers=jobs,
+            **args,
+        )
+        seconds = time.perf_counter() - started
+    return BenchmarkResult(
+        name,
+        _passed(report),
+        server.bytes_sent,
+        seconds,
+        len(trials),
+        sum(trials),
+        *_raw_io(report),
+    )
+
+
+def run_plan_benchmark(
+    server: StubServer,
+    scenarios: dict[str, tuple[str, str]],
+    n_files: int,
+    parallelism: int = 1,
+) -> BenchmarkResult:
+    """Time ``execute_download_plan`` over one task per scenario."""
+    from brasa.engine.download_plan import (
+        DownloadPlan,
+        DownloadPlanDefaults,
+        DownloadPlanTask,
+        execute_download_plan,
+    )
+    from brasa.engine.reporting import Verbosity
+
+    plan = DownloadPlan(
+        name="benchmark",
+        description="",
+        defaults=DownloadPlanDefaults(force=True, parallelism=parallelism),
+        tasks=[
+            DownloadPlanTask(
+                template=template_id,
+                args=scenario_args(arg_name, n_files),
+                force=True,
+            )
+            for template_id, arg_name in scenarios.values()
+        ],
+    )
+    server.reset_stats()
+    with timed_trial_writes() as trials:
+        started = time.perf_counter()
+        report = execute_download_plan(plan, verbosity=Verbosity.QUIET)
+        seconds = time.perf_counter() - started
+    files = sum(_passed(r) for r in report.task_reports.values())
+    raw_io = [_raw_io(r) for r in report.task_reports.values()]
+    return BenchmarkResult(
+        "plan",
+        files,
+        server.bytes_sent,
+        seconds,
+        len(trials),
+        sum(trials),
+        sum(stored for stored, _ in raw_io),
+        sum(passes for _, passes in raw_io),
+    )
+
+
+def run(
+    n_files: int = 20,
+    jobs: int = 1,
+    n_records: int = 2000,
+    fail_every: int = 0,
+    scenarios: tuple[str, ...] = SCENARIOS,
+    **route_options: Any,
+) -> list[BenchmarkResult]:
+    """Run every scenario and then a plan of all of them.
+
+    Returns:
+        One result per scenario, followed by the plan result.
+    """
+    with tempfile.TemporaryDirectory() as folder, StubServer() as server:
+        registered = setup_scenarios(
+            server, Path(folder), n_records, jobs, fail_every, **route_options
+        )
+        results = [
+            run_download_benchmark(
+                server,
+                name,
+                registered[name][0],
+                scenario_args(registered[name][1], n_files),
+                jobs,
+            )
+            for name in scenarios
+        ]
+        selected = {name: registered[name] for name in scenarios}
+        results.append(run_plan_benchmark(server, selected, n_files, jobs))
+        return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20, help="entries per scenario")
+    parser.add_argument("--jobs", type=int, default=1, help="concurrent downloads")
+    parser.add_argument("--records", type=int, default=2000, help="rows per payload")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds/request")
+    parser.add_argument("--bandwidth", type=float, default=None, help="bytes/second")
+    parser.add_argument(
+        "--fail-every", type=int, default=0, help="inject a 503 every N requests"
+    )
+    parser.add_argument(
+        "--scenario", action="append", choices=SCENARIOS, help="repeatable"
+    )
+    args = parser.parse_args(argv)
+
+    data_path = os.environ.get("BRASA_BENCH_DATA_PATH")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["BRASA_DATA_PATH"] = data_path or tmp
+        results = run(
+            n_files=args.files,
+            jobs=args.jobs,
+            n_records=args.records,
+            fail_every=args.fail_every,
+            scenarios=tuple(args.scenario or SCENARIOS),
+            latency=args.latency,
+            bandwidth=args.bandwidth,
+        )
+    print(HEADER)
+    for result in results:
+        print(result.row())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark of the ``read_fwf`` engines on a COTAHIST-like file.
+
+Runs the reader pipeline of ``b3-cotahist-daily`` with ``read_fwf`` set to
+the ``pandas`` and ``fast`` engines, under both reader engines, and writes
+the result with ``save_partitioned_parquet_file``. The synthetic file comes
+from :func:`tests.benchmark_arrow_reader.write_cotahist`: ``--rows``
+records, one in ten of a type that ``where: {regtype: '01'}`` drops. It is
+stored gzipped, as raw files are in the cache, unless ``--plain`` is given.
+
+Run from the repository root::
+
+    python -m tests.benchmark_fwf_reader --rows 200000
+
+Not collected by pytest; ``tests/test_fixed_width.py`` runs a tiny
+instance so the harness keeps working.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests.benchmark_arrow_reader import write_cotahist
+from tests.benchmark_meta_db import _fresh_cache
+
+TEMPLATE = "b3-cotahist-daily"
+# (read_fwf engine, reader engine)
+MODES = (
+    ("pandas", "pandas"),
+    ("fast", "pandas"),
+    ("pandas", "arrow"),
+    ("fast", "arrow"),
+)
+
+
+@dataclass
+class FwfResult:
+    """Read and write time of one engine combination.
+
+    Attributes:
+        fwf_engine: ``read_fwf`` engine.
+        reader_engine: Reader pipeline engine.
+        rows: Rows written.
+        seconds: Wall-clock duration of reading and writing (fastest run).
+    """
+
+    fwf_engine: str
+    reader_engine: str
+    rows: int
+    seconds: float
+
+    def row(self, baseline: FwfResult | None = None) -> str:
+        """Format the result as one table row."""
+        speedup = baseline.seconds / self.seconds if baseline and self.seconds else 1.0
+        return (
+            f"{self.fwf_engine:<7} {self.reader_engine:<7} {self.rows:>8} "
+            f"{self.seconds:>8.3f} {speedup:>7.1f}x"
+        )
+
+
+HEADER = f"{'fwf':<7} {'reader':<7} {'rows':>8} {'seconds':>8} {'speedup':>8}"
+
+
+def run(rows: int = 100_000, repeat: int = 1, plain: bool = False) -> list[FwfResult]:
+    """Time every engine combination on *rows* records.
+
+    Args:
+        rows: Records in the synthetic input file.
+        repeat: Runs per combination; the fastest is reported.
+        plain: Read an uncompressed file (memory-mapped by the fast engine)
+            instead of a gzipped one.
+
+    Returns:
+        One result per entry of :data:`MODES`; the first is the baseline.
+    """
+    from brasa.engine.cache import CacheMetadata
+    from brasa.engine.processing import (
+        _get_schema_from_fields,
+        save_partitioned_parquet_file,
+    )
+    from brasa.engine.template import retrieve_template
+
+    template = retrieve_template(TEMPLATE)
+    reader = template.reader
+    read_fwf = reader._pipeline.steps[0]
+    original = reader.engine, dict(read_fwf.params)
+    results = []
+    with tempfile.TemporaryDirectory() as folder, _fresh_cache(folder):
+        src = Path(folder, "COTAHIST.TXT")
+        write_cotahist(template, src, rows)
+        if not plain:
+            with src.open("rb") as f, gzip.open(f"{src}.gz", "wb") as out:
+                shutil.copyfileobj(f, out)
+            src = Path(f"{src}.gz")
+        try:
+            for fwf_engine, reader_engine in MODES:
+                read_fwf.params["engine"] = fwf_engine
+                reader.engine = reader_engine
+                timings = []
+                for _ in range(max(1, repeat)):
+                    meta = CacheMetadata(TEMPLATE)
+                    meta.downloaded_files = [str(src)]
+                    started = time.perf_counter()
+                    data = reader.read(meta)
+                    save_partitioned_parquet_file(
+                        meta,
+                        str(Path(folder, f"{fwf_engine}-{reader_engine}")),
+                        data,
+                        template.writer.partitioning,
+                        schema=_get_schema_from_fields(template.fields),
+                    )
+                    timings.append(time.perf_counter() - started)
+                results.append(
+                    FwfResult(fwf_engine, reader_engine, len(data), min(timings))
+                )
+        finally:
+            reader.engine, read_fwf.params = original
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="input records")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per engine")
+    parser.add_argument("--plain", action="store_true", help="uncompressed input")
+    args = parser.parse_args(argv)
+
+    results = run(args.rows, args.repeat, args.plain)
+    print(HEADER)
+    for result in results:
+        print(result.row(results[0]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Micro-benchmark of metadata database writes (``save_meta`` / ``save_trial``).
+
+Compares the long-lived WAL connections of ``CacheManager.meta_db`` with
+the previous behaviour (a fresh ``sqlite3.connect`` per call on a database
+in the default rollback-journal mode) and with the batched writes of
+``CacheManager.write_behind``. Each operation is one
+``save_trial`` or ``save_meta`` call on its own entry; with ``--threads``
+they are issued from a thread pool, as threaded processing does.
+
+Run from the repository root::
+
+    python -m tests.benchmark_meta_db --ops 2000 --threads 4
+
+Not collected by pytest; ``tests/test_connections.py`` runs a tiny
+instance so the harness keeps working.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from unittest.mock import patch
+
+MODES = ("per-call", "pooled", "write-behind")
+
+
+@dataclass
+class MetaDbResult:
+    """Write throughput for one connection mode.
+
+    Attributes:
+        mode: ``per-call`` (connection per query, rollback journal),
+            ``pooled`` (thread-local WAL connections) or ``write-behind``
+            (queued writes, batched by one writer thread).
+        threads: Threads issuing the writes.
+        ops: ``save_trial`` plus ``save_meta`` calls.
+        seconds: Wall-clock duration.
+    """
+
+    mode: str
+    threads: int
+    ops: int
+    seconds: float
+
+    @property
+    def ops_per_second(self) -> float:
+        """Writes per second."""
+        return self.ops / self.seconds if self.seconds else 0.0
+
+    def row(self, baseline: MetaDbResult | None = None) -> str:
+        """Format the result as one table row."""
+        speedup = (
+            self.ops_per_second / baseline.ops_per_second
+            if baseline and baseline.ops_per_second
+            else 1.0
+        )
+        return (
+            f"{self.mode:<12} {self.threads:>7} {self.ops:>7} "
+            f"{self.seconds:>8.3f} {self.ops_per_second:>10.0f} {speedup:>7.1f}x"
+        )
+
+
+HEADER = f"{'mode':<12} {'threads':>7} {'ops':>7} {'seconds':>8} {'ops/s':>10} {'speedup':>8}"
+
+
+@contextmanager
+def _per_call_connections() -> Iterator[None]:
+    """Make ``CacheManager.meta_db`` open a connection per call, as before."""
+    from brasa.engine.cache import CacheManager
+
+    @contextmanager
+    def meta_db(self):
+        conn = sqlite3.connect(self.cache_path(self.meta_db_filename))
+        conn.execute("pragma foreign_keys = on")
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    with patch.object(CacheManager, "meta_db", meta_db):
+        yield
+
+
+@contextmanager
+def _fresh_cache(folder: str) -> Iterator[object]:
+    """Swap the CacheManager singleton for one on *folder*."""
+    from brasa.engine.cache import CacheManager
+
+    original = CacheManager.__dict__.get("__it__")
+    previous_path = os.environ.get("BRASA_DATA_PATH")
+    os.environ["BRASA_DATA_PATH"] = folder
+    CacheManager.__it__ = None
+    try:
+        yield CacheManager()
+    finally:
+        CacheManager.__it__ = original
+        if previous_path is None:
+            os.environ.pop("BRASA_DATA_PATH", None)
+        else:
+            os.environ["BRASA_DATA_PATH"] = previous_path
+
+
+def run_mode(mode: str, n_ops: int, threads: int = 1) -> MetaDbResult:
+    """Time *n_ops* metadata writes in one connection mode.
+
+    Args:
+        mode: One of :data:`MODES`.
+        n_ops: ``save_trial`` plus ``save_meta`` calls (half each).
+        threads: Threads issuing the writes.
+
+    Returns:
+        The measured throughput.
+    """
+    from brasa.engine.cache import CacheMetadata
+    from brasa.util import DownloadArgs
+
+    with tempfile.TemporaryDirectory() as folder, _fresh_cache(folder) as man:
+        if mode == "per-call":
+            # A database created before WAL stays in rollback-journal mode
+            with sqlite3.connect(man.cache_path(man.meta_db_filename)) as conn:
+                conn.execute("pragma journal_mode = delete")
+            connections = _per_call_connections()
+        elif mode == "write-behind":
+            connections = man.write_behind()
+        else:
+            connections = nullcontext()
+
+        def write(i: int) -> None:
+            meta = CacheMetadata("bench-meta-db")
+            meta.download_args = DownloadArgs({"i": i})
+            meta.download_checksum = f"{i:032x}"
+            man.save_trial(meta, downloaded=True)
+            man.save_meta(meta)
+
+        # Timed until the last write is committed
+        started = time.perf_counter()
+        with connections:
+            if threads <= 1:
+                for i in range(n_ops // 2):
+                    write(i)
+            else:
+                with ThreadPoolExecutor(max_workers=threads) as executor:
+                    list(executor.map(write, range(n_ops // 2)))
+        seconds = time.perf_counter() - started
+    return MetaDbResult(mode, threads, n_ops // 2 * 2, seconds)
+
+
+def run(n_ops: int = 2000, threads: int = 1) -> list[MetaDbResult]:
+    """Run every mode; the first result is the per-call baseline."""
+    return [run_mode(mode, n_ops, threads) for mode in MODES]
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=2000, help="writes per mode")
+    parser.add_argument("--threads", type=int, default=1, help="writer threads")
+    args = parser.parse_args(argv)
+
+    results = run(args.ops, args.threads)
+    print(HEADER)
+    for result in results:
+        print(result.row(results[0]))
+
+
+if __name__ == "__main__":
+    main()
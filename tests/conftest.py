@@ -81,6 +81,11 @@ def cleanup_cache_between_tests():
         if raw_path.exists():
             shutil.rmtree(raw_path, ignore_errors=True)
 
+        # Remove blobs folder (content-addressed raw files)
+        blobs_path = cache_path / "blobs"
+        if blobs_path.exists():
+            shutil.rmtree(blobs_path, ignore_errors=True)
+
         # Remove db folder (processed files)
         db_path = cache_path / "db"
         if db_path.exists():
@@ -94,6 +99,9 @@ def cleanup_cache_between_tests():
                 c = conn.cursor()
                 c.execute("DELETE FROM cache_metadata")
                 c.execute("DELETE FROM download_trials")
+                c.execute("DELETE FROM raw_blob_refs")
+                c.execute("DELETE FROM download_trials_summary")
+                c.execute("DELETE FROM cache_maintenance")
         except Exception:
             # If there's an issue with the database, just continue
             pass
@@ -110,11 +118,13 @@ def temp_cache():
     Resets the singleton for the duration of the test and restores the
     previous instance afterwards.
     """
-    from brasa.engine import CacheManager
+    from brasa.engine import CacheManager, DatasetCatalog
 
     with tempfile.TemporaryDirectory() as tmpdir:
         original_cache = CacheManager.__dict__.get("__it__")
         CacheManager.__it__ = None
+        # The catalog table has to be created in the new meta.db
+        DatasetCatalog()._initialized = False
 
         cache = CacheManager()
         cache._cache_folder = tmpdir
@@ -129,3 +139,19 @@ def temp_cache():
             CacheManager.__it__ = original_cache
         else:
             CacheManager.__it__ = None
+
+
+@pytest.fixture
+def stub_server():
+    """Local stand-in HTTP server (see ``tests/stub_server.py``).
+
+    Register payloads with ``stub_server.add(path, payload, ...)`` and point
+    templates at ``stub_server.url(path)``. Pooled connections to it are
+    closed afterwards.
+    """
+    from brasa.downloaders import transport
+    from tests.stub_server import StubServer
+
+    with StubServer() as server:
+        yield server
+    transport.HTTPTransport().reset()
@@ -0,0 +1,274 @@
+"""Local stand-in HTTP server for download tests and benchmarks.
+
+:class:`StubServer` serves recorded or synthetic payloads from
+``127.0.0.1`` so acquisition code can be exercised end to end without
+reaching B3 or the BCB. Each route can add latency, cap bandwidth and inject
+failures (an HTTP status such as 429/503, or ``"empty"`` for a 200 with an
+empty body) on chosen requests.
+
+The payload builders produce the shapes the real sources serve:
+:func:`cotahist_zip`, :func:`bvbg_zip`, :func:`paged_json` (B3's base64
+URL-encoded paged endpoints) and :func:`sgs_json`.
+
+Example::
+
+    with StubServer() as server:
+        server.add("/COTAHIST_D02012024.ZIP", cotahist_zip(1000), latency=0.05)
+        url = server.url("/COTAHIST_D%d%m%Y.ZIP")
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+import threading
+import time
+import zipfile
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlparse
+
+# A payload is fixed bytes or a callable building the body from the request
+# path (used by paged endpoints).
+Payload = bytes | Callable[[str], bytes]
+
+
+@dataclass
+class StubRoute:
+    """How the server answers one path (or path prefix).
+
+    Attributes:
+        payload: Body bytes, or a callable taking the request path.
+        content_type: ``Content-Type`` header.
+        latency: Seconds to wait before sending the response.
+        bandwidth: Maximum bytes per second for the body (None: unlimited).
+        errors: Failure injected per request number (1-based) for this route:
+            an HTTP status code, or ``"empty"`` for a 200 with no body.
+        prefix: Match every path starting with the route path.
+    """
+
+    payload: Payload
+    content_type: str = "application/octet-stream"
+    latency: float = 0.0
+    bandwidth: float | None = None
+    errors: dict[int, int | str] = field(default_factory=dict)
+    prefix: bool = False
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StubHTTPServer
+
+    def do_GET(self):
+        self.server.stub._serve(self)
+
+    def do_POST(self):
+        self.server.stub._serve(self)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: StubServer
+
+
+class StubServer:
+    """Threaded local HTTP server answering from registered :class:`StubRoute` s.
+
+    Attributes:
+        hits: Requests received per route path.
+        bytes_sent: Total body bytes written.
+    """
+
+    def __init__(self) -> None:
+        self._routes: dict[str, StubRoute] = {}
+        self._lock = threading.Lock()
+        self.hits: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._httpd: _StubHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> StubServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start serving on a free local port."""
+        self._httpd = _StubHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._httpd.stub = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server and close its socket."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    @property
+    def host(self) -> str:
+        """``host:port`` the server listens on."""
+        assert self._httpd is not None, "server not started"
+        return f"127.0.0.1:{self._httpd.server_port}"
+
+    def url(self, path: str) -> str:
+        """Return the absolute URL of *path* on this server."""
+        return f"http://{self.host}{path}"
+
+    def add(self, path: str, payload: Payload, **options: Any) -> StubRoute:
+        """Register a route; *options* are :class:`StubRoute` fields."""
+        route = StubRoute(payload, **options)
+        with self._lock:
+            self._routes[path] = route
+        return route
+
+    def reset_stats(self) -> None:
+        """Clear the hit counters and the byte count."""
+        with self._lock:
+            self.hits.clear()
+            self.bytes_sent = 0
+
+    def _match(self, path: str) -> tuple[str, StubRoute] | None:
+        with self._lock:
+            if path in self._routes:
+                return path, self._routes[path]
+            for key, route in self._routes.items():
+                if route.prefix and path.startswith(key):
+                    return key, route
+        return None
+
+    def _serve(self, handler: _StubHandler) -> None:
+        path = urlparse(handler.path).path
+        matched = self._match(path)
+        if matched is None:
+            self._send(handler, 404, b"")
+            return
+        key, route = matched
+        with self._lock:
+            self.hits[key] += 1
+            hit = self.hits[key]
+        if route.latency:
+            time.sleep(route.latency)
+        error = route.errors.get(hit)
+        if error == "empty":
+            self._send(handler, 200, b"", route.content_type)
+            return
+        if error is not None:
+            self._send(handler, int(error), b"", route.content_type)
+            return
+        body = route.payload(path) if callable(route.payload) else route.payload
+        self._send(handler, 200, body, route.content_type, route.bandwidth)
+
+    def _send(
+        self,
+        handler: _StubHandler,
+        status: int,
+        body: bytes,
+        content_type: str = "text/plain",
+        bandwidth: float | None = None,
+    ) -> None:
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        if status == 429:
+            handler.send_header("Retry-After", "0")
+        handler.end_headers()
+        chunk = len(body) or 1
+        if bandwidth:
+            chunk = max(1, int(bandwidth / 20))  # ~20 writes per second
+        for offset in range(0, len(body), chunk):
+            handler.wfile.write(body[offset : offset + chunk])
+            if bandwidth:
+                time.sleep(chunk / bandwidth)
+        with self._lock:
+            self.bytes_sent += len(body)
+
+
+# ---------------------------------------------------------------------------
+# Synthetic payloads
+# ---------------------------------------------------------------------------
+
+
+def _zip_bytes(name: str, content: bytes) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(name, content)
+    return buf.getvalue()
+
+
+def cotahist_zip(n_records: int, refdate: date = date(2024, 1, 2)) -> bytes:
+    """Build a COTAHIST-style zip with *n_records* 245-column quote lines."""
+    day = refdate.strftime("%Y%m%d")
+    lines = [f"00COTAHIST.{refdate.year}BOVESPA {day}".ljust(245)]
+    for i in range(n_records):
+        ticker = f"TST{i % 10000:04d}".ljust(12)
+        price = f"{1000 + i % 5000:013d}"
+        lines.append(
+            f"01{day}02{ticker}010{'STUB SA':<12}{'ON':<10}".ljust(56) + price * 5
+        )
+    lines.append(f"99COTAHIST.{refdate.year}BOVESPA {day}{n_records + 2:011d}")
+    text = "\r\n".join(line[:245].ljust(245) for line in lines) + "\r\n"
+    return _zip_bytes(f"COTAHIST_D{refdate:%d%m%Y}.TXT", text.encode("latin1"))
+
+
+def bvbg_zip(n_records: int, refdate: date = date(2024, 1, 2)) -> bytes:
+    """Build a BVBG-style zip holding one XML document of *n_records* entries."""
+    rows = "".join(
+        f"<PricRpt><TradDt><Dt>{refdate:%Y-%m-%d}</Dt></TradDt>"
+        f"<SctyId><TckrSymb>TST{i:05d}</TckrSymb></SctyId>"
+        f"<FinInstrmAttrbts><LastPric>{10 + i % 100}.00</LastPric>"
+        "</FinInstrmAttrbts></PricRpt>"
+        for i in range(n_records)
+    )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f"<Document><BizGrpDtls>{rows}</BizGrpDtls></Document>"
+    )
+    return _zip_bytes(f"BVBG.086.01_{refdate:%Y%m%d}.xml", xml.encode("utf8"))
+
+
+def paged_json(n_results: int) -> Callable[[str], bytes]:
+    """Build a B3 paged endpoint answering ``.../<base64 json args>`` paths.
+
+    Returns:
+        A payload callable; register it with ``prefix=True``.
+    """
+
+    def page(path: str) -> bytes:
+        args = json.loads(base64.b64decode(path.rsplit("/", 1)[-1]))
+        number, size = int(args["pageNumber"]), int(args["pageSize"])
+        total_pages = max(1, -(-n_results // size))
+        start = (number - 1) * size
+        results = [
+            {"code": f"TST{i:05d}", "value": i}
+            for i in range(start, min(start + size, n_results))
+        ]
+        return json.dumps(
+            {
+                "page": {"pageNumber": number, "totalPages": total_pages},
+                "header": {"index": args.get("index")},
+                "results": results,
+            }
+        ).encode("utf8")
+
+    return page
+
+
+def sgs_json(n_days: int, start: date = date(2000, 1, 3)) -> bytes:
+    """Build an SGS series payload with one value per day."""
+    rows = [
+        {"data": f"{start + timedelta(days=i):%d/%m/%Y}", "valor": f"{i % 100},25"}
+        for i in range(n_days)
+    ]
+    return json.dumps(rows).encode("utf8")
@@ -0,0 +1,296 @@
+"""Tests for the Arrow engine of reader pipelines (``reader.engine: arrow``)."""
+
+import warnings
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pytest
+
+import brasa
+from brasa.engine.cache import CacheMetadata
+from brasa.engine.pipeline import ReaderPipeline
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.fieldsets import ArrowAdapter, Field, Fieldset, PandasAdapter
+from brasa.fieldsets.adapters import get_target_schema
+from tests import benchmark_arrow_reader
+
+CSV_ROWS = [
+    "refdate,symbol,kind,price,volume",
+    '2026-06-19,PETR4,A,"10,5",100',
+    '2026-06-19,VALE3,X,"1,0",',
+    '2026-06-19,ITUB4,A,"30,25",300',
+    '2026-06-22,PETR4,A,"11,0",400',
+    "2026-06-22,VALE3,A,bad,500",
+]
+
+# regtype(2) refdate(8) symbol(6) price(8, 2 implied decimals)
+FWF_ROWS = [
+    "00COTAHIST.2026",
+    "0120260619PETR4 00001050",
+    "0120260619VALE3 00006200",
+    "0220260619XXXXX 00000000",
+    "0120260622ITUB4 00003025",
+    "99COTAHIST.2026",
+]
+
+CSV_PIPELINE = """\
+    - step: read_csv
+    - step: filter_rows
+      column: kind
+      operator: eq
+      value: A
+    - step: rename_columns
+      mapping: {volume: qty}
+    - step: str_replace
+      column: symbol
+      pattern: '4'
+      replacement: '-4'
+    - step: select_columns
+      columns: [refdate, symbol, price, qty]
+    - step: add_column
+      name: source
+      value: csv
+    - step: apply_fields
+"""
+CSV_FIELDS = """\
+  - name: refdate
+    description: refdate
+    type: date
+  - name: symbol
+    description: symbol
+    type: character
+  - name: price
+    description: price
+    type: numeric(decimal=',')
+  - name: qty
+    description: qty
+    type: integer
+  - name: source
+    description: source
+    type: character
+"""
+
+FWF_PIPELINE = """\
+    - step: read_fwf
+      dtype: str
+    - step: filter_rows
+      column: regtype
+      operator: eq
+      value: '01'
+    - step: apply_fields
+"""
+FWF_FIELDS = """\
+  - name: regtype
+    description: regtype
+    type: character
+    width: 2
+  - name: refdate
+    description: refdate
+    type: date(format='%Y%m%d')
+    width: 8
+  - name: symbol
+    description: symbol
+    type: character
+    width: 6
+  - name: price
+    description: price
+    type: numeric(dec=2)
+    width: 8
+"""
+
+
+def _template(tmp_path, template_id, pipeline, fields, engine=None):
+    tpl_yaml = tmp_path / f"{template_id}.yaml"
+    tpl_yaml.write_text(
+        f"id: {template_id}\n"
+        "importer:\n"
+        "  format: csv\n"
+        "  args:\n"
+        "    refdate: ~\n"
+        "reader:\n"
+        + (f"  engine: {engine}\n" if engine else "")
+        + "  pipeline:\n"
+        + pipeline
+        + "writer:\n"
+        "  partitioning: [refdate]\n"
+        "fields:\n" + fields
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template_id] = template
+    return template
+
+
+def _process(cache, template, src) -> pa.Table:
+    brasa.import_marketdata(
+        template.id,
+        path=str(src),
+        refdate="2026-06-22",
+        verbosity=brasa.Verbosity.QUIET,
+    )
+    report = brasa.process_marketdata(
+        template.id, reprocess=True, verbosity=brasa.Verbosity.QUIET
+    )
+    assert [r.status.name for r in report.results] == ["PASSED"]
+    folder = cache.cache_path(cache.db_folder(template))
+    table = ds.dataset(folder, format="parquet", partitioning="hive").to_table()
+    return table.sort_by([("refdate", "ascending"), ("symbol", "ascending")])
+
+
+def test_arrow_adapter_matches_pandas_adapter():
+    fs = Fieldset()
+    fs.add_fields(
+        Field(name="d", description="d", type_definition="date(format='%Y%m%d')"),
+        Field(name="iso", description="iso", type_definition="date"),
+        Field(name="n", description="n", type_definition="numeric(dec=2)"),
+        Field(
+            name="br",
+            description="br",
+            type_definition="numeric(thousands='.', decimal=',', sign='-')",
+        ),
+        Field(name="i", description="i", type_definition="integer"),
+        Field(name="b", description="b", type_definition="boolean"),
+        Field(name="s", description="s", type_definition="character"),
+        Field(name="t", description="t", type_definition="time(format='%H%M')"),
+    )
+    table = pa.table(
+        {
+            "d": ["20260619", "bad", None],
+            "iso": ["2026-06-19", "19/06/2026", None],
+            "n": ["0000001050", " 12 ", "x"],
+            "br": ["1.234,5", "", None],
+            "i": ["01", " 7", None],
+            "b": ["Yes", "0", "maybe"],
+            "s": [1, 2, None],
+            "t": ["1030", "1100", None],
+        }
+    )
+    schema = get_target_schema(fs)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = ArrowAdapter(fs).apply_types(table)
+    expected = PandasAdapter(fs).apply_types(
+        table.to_pandas(types_mapper=pd.ArrowDtype)
+    )
+
+    assert result.schema == schema
+    assert (
+        result.to_pylist()
+        == pa.Table.from_pandas(
+            expected, schema=schema, preserve_index=False
+        ).to_pylist()
+    )
+
+
+def test_arrow_engine_falls_back_to_pandas_for_other_steps(tmp_path):
+    src = tmp_path / "src.csv"
+    src.write_text("\n".join(CSV_ROWS) + "\n")
+    meta = CacheMetadata("test-arrow")
+    meta.downloaded_files = [str(src)]
+    pipeline = ReaderPipeline.from_config(
+        [
+            "read_csv",
+            {"step": "filter_rows", "column": "kind", "operator": "eq", "value": "A"},
+            {"step": "sort", "by": "symbol"},
+            {"step": "select_columns", "columns": ["symbol", "price"]},
+        ]
+    )
+    seen = []
+
+    def spy(step, run):
+        def wrapper(data, context):
+            seen.append((step.name, type(data).__name__))
+            return run(data, context)
+
+        return wrapper
+
+    for step in pipeline.steps:
+        step.execute = spy(step, step.execute)
+        step.execute_arrow = spy(step, step.execute_arrow)
+
+    result = pipeline.execute(meta, {}, engine="arrow")
+
+    assert seen == [
+        ("read_csv", "NoneType"),
+        ("filter_rows", "Table"),
+        ("sort", "DataFrame"),
+        ("select_columns", "Table"),
+    ]
+    assert isinstance(result, pa.Table)
+    assert result.column("symbol").to_pylist() == ["ITUB4", "PETR4", "PETR4", "VALE3"]
+
+
+def test_arrow_read_fwf_reads_blank_fields_as_null(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("\n".join([*FWF_ROWS, "0120260622      00000100"]) + "\n")
+    meta = CacheMetadata("test-arrow")
+    meta.downloaded_files = [str(src)]
+    pipeline = ReaderPipeline.from_config([{"step": "read_fwf", "dtype": "str"}])
+
+    fields = Fieldset()
+    fields.add_fields(
+        *(
+            Field(name=name, description=name, type_definition="character", width=w)
+            for name, w in [("regtype", 2), ("refdate", 8), ("symbol", 6)]
+        )
+    )
+
+    table = pipeline.execute(meta, {}, fields=fields, engine="arrow")
+
+    # pd.read_fwf(dtype=str) gives the string "<NA>" here
+    assert table.num_rows == len(FWF_ROWS) + 1
+    assert table.column("symbol").to_pylist()[-2:] == [".2026", None]
+    assert table.column("regtype").to_pylist()[:2] == ["00", "01"]
+
+
+def test_unknown_engine_and_chunked_arrow_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="unknown reader.engine"):
+        _template(tmp_path, "test-arrow-bad", FWF_PIPELINE, FWF_FIELDS, "polars")
+    with pytest.raises(ValueError, match="chunksize"):
+        _template(
+            tmp_path,
+            "test-arrow-chunked",
+            FWF_PIPELINE,
+            FWF_FIELDS,
+            "arrow\n  chunksize: 10",
+        )
+    with pytest.raises(ValueError, match="Unknown reader engine"):
+        ReaderPipeline.from_config(["read_csv"]).execute(None, {}, engine="polars")
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(("csv", CSV_ROWS, CSV_PIPELINE, CSV_FIELDS, 4), id="csv"),
+        pytest.param(("fwf", FWF_ROWS, FWF_PIPELINE, FWF_FIELDS, 3), id="fwf"),
+    ],
+)
+def test_arrow_engine_matches_pandas_engine(tmp_path, temp_cache, case):
+    name, rows, pipeline, fields, expected_rows = case
+    src = tmp_path / f"src.{name}"
+    src.write_text("\n".join(rows) + "\n")
+    pandas_tpl = _template(tmp_path, f"test-{name}-pandas", pipeline, fields)
+    arrow_tpl = _template(tmp_path, f"test-{name}-arrow", pipeline, fields, "arrow")
+    try:
+        expected = _process(temp_cache, pandas_tpl, src)
+        result = _process(temp_cache, arrow_tpl, src)
+    finally:
+        _template_cache.pop(pandas_tpl.id, None)
+        _template_cache.pop(arrow_tpl.id, None)
+
+    assert result.num_rows == expected_rows
+    assert result.schema == expected.schema
+    assert result.to_pylist() == expected.to_pylist()
+
+
+def test_benchmark_harness_reports_every_engine():
+    results = benchmark_arrow_reader.run(rows=50)
+
+    assert [(r.template, r.engine) for r in results] == [
+        (template, engine)
+        for template in benchmark_arrow_reader.TEMPLATES
+        for engine in benchmark_arrow_reader.ENGINES
+    ]
+    assert [r.rows for r in results] == [45, 45, 50, 50]
+    assert all(r.seconds > 0 for r in results)
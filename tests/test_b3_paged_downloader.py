@@ -1,9 +1,16 @@
 """Unit tests for B3PagedURLEncodedDownloader."""
 
+import base64
 import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from brasa.downloaders.downloaders import B3PagedURLEncodedDownloader
+from brasa.engine.exceptions import DownloadException
+from brasa.engine.template import RetryPolicy
 
 
 def _make_response(data: dict, status_code: int = 200) -> MagicMock:
@@ -20,7 +27,7 @@ class TestB3PagedURLEncodedDownloaderEmptyResults:
         response_data = {"page": {"totalPages": 1}, "results": []}
         mock_response = _make_response(response_data)
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("brasa.downloaders.transport.get", return_value=mock_response):
             downloader = B3PagedURLEncodedDownloader(
                 "http://example.com/api", verify_ssl=False
             )
@@ -34,7 +41,7 @@ class TestB3PagedURLEncodedDownloaderEmptyResults:
         response_data = {"page": {"totalPages": 1}, "results": None}
         mock_response = _make_response(response_data)
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("brasa.downloaders.transport.get", return_value=mock_response):
             downloader = B3PagedURLEncodedDownloader(
                 "http://example.com/api", verify_ssl=False
             )
@@ -47,7 +54,7 @@ class TestB3PagedURLEncodedDownloaderEmptyResults:
         response_data = {"page": {"totalPages": None}, "results": None}
         mock_response = _make_response(response_data)
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("brasa.downloaders.transport.get", return_value=mock_response):
             downloader = B3PagedURLEncodedDownloader(
                 "http://example.com/api", verify_ssl=False
             )
@@ -65,7 +72,7 @@ class TestB3PagedURLEncodedDownloaderSinglePage:
         }
         mock_response = _make_response(response_data)
 
-        with patch("requests.get", return_value=mock_response):
+        with patch("brasa.downloaders.transport.get", return_value=mock_response):
             downloader = B3PagedURLEncodedDownloader(
                 "http://example.com/api", verify_ssl=False
             )
@@ -91,7 +98,10 @@ class TestB3PagedURLEncodedDownloaderMultiPage:
         mock_response1 = _make_response(page1_data)
         mock_response2 = _make_response(page2_data)
 
-        with patch("requests.get", side_effect=[mock_response1, mock_response2]):
+        with patch(
+            "brasa.downloaders.transport.get",
+            side_effect=[mock_response1, mock_response2],
+        ):
             downloader = B3PagedURLEncodedDownloader(
                 "http://example.com/api", verify_ssl=False
             )
@@ -101,3 +111,85 @@ class TestB3PagedURLEncodedDownloaderMultiPage:
         content = json.loads(result.read())
         assert len(content["results"]) == 4
         assert [r["id"] for r in content["results"]] == [1, 2, 3, 4]
+
+
+class TestB3PagedURLEncodedDownloaderParallelPages:
+    @staticmethod
+    def _page_of(url: str) -> int:
+        params = json.loads(base64.b64decode(url.rsplit("/", 1)[1]))
+        return params["pageNumber"]
+
+    def test_pages_fetched_concurrently_and_kept_in_order(self):
+        total = 8
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_get(url, **kwargs):
+            nonlocal active, peak
+            page = self._page_of(url)
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            # Later pages answer first
+            time.sleep(0.01 * (total - page))
+            with lock:
+                active -= 1
+            return _make_response(
+                {
+                    "page": {"totalPages": total},
+                    "results": [{"id": page}],
+                    "header": {"page": page},
+                }
+            )
+
+        downloader = B3PagedURLEncodedDownloader(
+            "http://example.com/api", verify_ssl=False
+        )
+        downloader.page_concurrency = 3
+        with patch("brasa.downloaders.transport.get", side_effect=fake_get):
+            content = json.loads(downloader.download().read())
+
+        assert [r["id"] for r in content["results"]] == list(range(1, total + 1))
+        assert content["header"] == {"page": total}
+        assert 1 < peak <= 3
+
+    def test_failed_page_is_retried_alone(self):
+        calls = []
+
+        def fake_get(url, **kwargs):
+            page = self._page_of(url)
+            calls.append(page)
+            if page == 3 and calls.count(3) == 1:
+                return _make_response({}, status_code=503)
+            return _make_response(
+                {"page": {"totalPages": 4}, "results": [{"id": page}]}
+            )
+
+        downloader = B3PagedURLEncodedDownloader(
+            "http://example.com/api", verify_ssl=False
+        )
+        downloader.retry_policy = RetryPolicy(attempts=1)
+        with patch("brasa.downloaders.transport.get", side_effect=fake_get):
+            content = json.loads(downloader.download().read())
+
+        assert [r["id"] for r in content["results"]] == [1, 2, 3, 4]
+        assert sorted(calls) == [1, 2, 3, 3, 4]
+
+    def test_page_failure_without_retries_raises(self):
+        def fake_get(url, **kwargs):
+            page = self._page_of(url)
+            if page == 2:
+                return _make_response({}, status_code=503)
+            return _make_response(
+                {"page": {"totalPages": 2}, "results": [{"id": page}]}
+            )
+
+        downloader = B3PagedURLEncodedDownloader(
+            "http://example.com/api", verify_ssl=False
+        )
+        with (
+            patch("brasa.downloaders.transport.get", side_effect=fake_get),
+            pytest.raises(DownloadException, match="status_code = 503"),
+        ):
+            downloader.download()
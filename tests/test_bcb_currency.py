@@ -61,6 +61,32 @@ def test_bcb_currency_downloader_serializes_dataframe_to_json():
     assert data[0]["cotacaoVenda"] == 6.1240
 
 
+def test_bcb_currency_downloader_fetches_one_year_per_request():
+    def collect_for(**params):
+        query = MagicMock()
+        query.collect.return_value = pd.DataFrame(
+            [{"dataHoraCotacao": params["dataInicial"], "cotacaoVenda": 1.0}]
+        )
+        return query
+
+    fake_query = MagicMock()
+    fake_query.parameters.side_effect = collect_for
+    fake_ptax = MagicMock()
+    fake_ptax.get_endpoint.return_value.query.return_value = fake_query
+
+    with patch("brasa.downloaders.downloaders.PTAX", return_value=fake_ptax):
+        downloader = BCBCurrencyDownloader(
+            currency="USD", start=date(2022, 1, 1), end=date(2024, 6, 30)
+        )
+        data = json.loads(downloader.download().read().decode("utf8"))
+
+    assert [row["dataHoraCotacao"] for row in data] == [
+        "01/01/2022",
+        "01/01/2023",
+        "01/01/2024",
+    ]
+
+
 def test_bcb_currency_downloader_raises_download_exception_on_error():
     with patch("brasa.downloaders.downloaders.PTAX", side_effect=Exception("boom")):
         downloader = BCBCurrencyDownloader(
@@ -37,7 +37,7 @@ def test_bcb_currency_downloader_wraps_errors(monkeypatch):
 
 def test_b3_files_downloader_raises_on_non_200(monkeypatch):
     fake_res = SimpleNamespace(status_code=404)
-    monkeypatch.setattr(dl.requests, "get", lambda *a, **kw: fake_res)
+    monkeypatch.setattr(dl.transport, "get", lambda *a, **kw: fake_res)
 
     downloader = dl.B3FilesURLDownloader(
         "https://example.invalid/%Y%m%d", verify_ssl=True, refdate=datetime(2024, 1, 2)
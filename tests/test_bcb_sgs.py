@@ -5,8 +5,10 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from bcb.exceptions import SGSError
 
-from brasa.downloaders.downloaders import BCBSGSDownloader
+from brasa.downloaders import bcb_sgs_download
+from brasa.downloaders.downloaders import BCBSGSDownloader, date_windows
 from brasa.engine import (
     CacheManager,
     MarketDataTemplate,
@@ -61,6 +63,131 @@ def test_bcb_sgs_downloader_raises_download_exception_on_error():
 # Task 2: Template tests
 
 
+def test_date_windows_split_span_without_overlap():
+    windows = date_windows(date(2020, 1, 1), date(2020, 1, 10), 4)
+    assert windows == [
+        (date(2020, 1, 1), date(2020, 1, 4)),
+        (date(2020, 1, 5), date(2020, 1, 8)),
+        (date(2020, 1, 9), date(2020, 1, 10)),
+    ]
+    assert date_windows(date(2020, 1, 1), date(2020, 1, 4), 4) == [
+        (date(2020, 1, 1), date(2020, 1, 4))
+    ]
+    assert date_windows(date(2020, 1, 1), date(2020, 1, 10), None) == [
+        (date(2020, 1, 1), date(2020, 1, 10))
+    ]
+
+
+def test_bcb_sgs_downloader_merges_windows_in_order():
+    def fake_get_json(code, start, end):
+        return json.dumps(
+            [{"data": start.strftime("%d/%m/%Y"), "valor": "1"}]
+            + (
+                [{"data": end.strftime("%d/%m/%Y"), "valor": "2"}]
+                if end > start
+                else []
+            )
+        )
+
+    with patch(
+        "brasa.downloaders.downloaders.sgs.get_json", side_effect=fake_get_json
+    ) as mock_get:
+        downloader = BCBSGSDownloader(
+            code=433, start=date(2020, 1, 1), end=date(2020, 1, 10)
+        )
+        downloader.window_days = 4
+        data = json.loads(downloader.download().read().decode("utf8"))
+
+    assert mock_get.call_count == 3
+    assert [row["data"] for row in data] == [
+        "01/01/2020",
+        "04/01/2020",
+        "05/01/2020",
+        "08/01/2020",
+        "09/01/2020",
+        "10/01/2020",
+    ]
+
+
+def test_bcb_sgs_window_failure_raises_download_exception():
+    def fake_get_json(code, start, end):
+        if start == date(2020, 1, 5):
+            raise RuntimeError("timeout")
+        return "[]"
+
+    with patch("brasa.downloaders.downloaders.sgs.get_json", side_effect=fake_get_json):
+        downloader = BCBSGSDownloader(
+            code=433, start=date(2020, 1, 1), end=date(2020, 1, 10)
+        )
+        downloader.window_days = 4
+        with pytest.raises(DownloadException, match="433"):
+            downloader.download()
+
+
+def test_bcb_sgs_empty_window_is_skipped():
+    def fake_get_json(code, start, end):
+        if start == date(2020, 1, 5):
+            # What python-bcb raises for SGS's 404 on a range without values
+            raise SGSError("BCB error: Value(s) not found")
+        return json.dumps([{"data": start.strftime("%d/%m/%Y"), "valor": "1"}])
+
+    with patch("brasa.downloaders.downloaders.sgs.get_json", side_effect=fake_get_json):
+        downloader = BCBSGSDownloader(
+            code=433, start=date(2020, 1, 1), end=date(2020, 1, 10)
+        )
+        downloader.window_days = 4
+        data = json.loads(downloader.download().read().decode("utf8"))
+
+    assert [row["data"] for row in data] == ["01/01/2020", "09/01/2020"]
+
+
+def test_bcb_sgs_span_without_values_raises_download_exception():
+    with patch(
+        "brasa.downloaders.downloaders.sgs.get_json",
+        side_effect=SGSError("BCB error: Value(s) not found"),
+    ):
+        downloader = BCBSGSDownloader(
+            code=433, start=date(2020, 1, 1), end=date(2020, 1, 10)
+        )
+        downloader.window_days = 4
+        with pytest.raises(DownloadException, match="no values"):
+            downloader.download()
+
+
+def test_bcb_sgs_unknown_series_error_is_not_an_empty_window():
+    error = SGSError("SGS time series code=99999 not found (status 404)")
+    with patch("brasa.downloaders.downloaders.sgs.get_json", side_effect=error):
+        downloader = BCBSGSDownloader(
+            code=99999, start=date(2020, 1, 1), end=date(2020, 1, 10)
+        )
+        downloader.window_days = 4
+        with pytest.raises(DownloadException) as excinfo:
+            downloader.download()
+
+    assert excinfo.value.__cause__ is error
+    assert str(excinfo.value) == f"SGS download failed for code 99999: {error}"
+
+
+def test_bcb_sgs_window_config_from_template():
+    template = retrieve_template("bcb-sgs")
+    template.downloader.window_days = 30
+    template.downloader.window_concurrency = 3
+    try:
+        with patch(
+            "brasa.downloaders.downloaders.sgs.get_json", return_value="[]"
+        ) as mock_get:
+            bcb_sgs_download(
+                template.downloader,
+                code=433,
+                start=date(2020, 1, 1),
+                end=date(2020, 3, 31),
+            )
+        assert mock_get.call_count == 4
+    finally:
+        template.downloader.window_days = None
+        template.downloader.window_concurrency = None
+
+
 def test_load_bcb_sgs_template():
     tpl = MarketDataTemplate("brasa/files/templates/bcb/bcb-sgs.yaml")
 
@@ -0,0 +1,155 @@
+"""Tests for the content-addressed raw blob store (``[raw_storage] dedup``)."""
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from brasa.engine.blobstore import BlobStore
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.doctor import check_orphan_blobs, check_orphan_raw
+from brasa.engine.migrations import migrate_meta_db
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.util import DownloadArgs, open_raw_file
+
+_BODY = json.dumps({"rows": list(range(2000))}).encode()
+
+
+@pytest.fixture
+def dedup(monkeypatch):
+    monkeypatch.setattr(
+        "brasa.engine.blobstore.load_config",
+        lambda: {"raw_storage": {"dedup": True}},
+    )
+
+
+def _register(tmp_path, template_id, url):
+    tpl_yaml = tmp_path / f"{template_id}.yaml"
+    tpl_yaml.write_text(
+        f"id: {template_id}\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        f"  url: {url}\n"
+        "  format: json\n"
+    )
+    _template_cache[template_id] = MarketDataTemplate(str(tpl_yaml))
+
+
+def _download(template_id):
+    meta = CacheMetadata(template_id)
+    meta.download_args = DownloadArgs({})
+    result = CacheManager().download_marketdata(meta)
+    assert result.status_name == "PASSED", result.reason
+    return meta
+
+
+def _two_templates_same_payload(stub_server, tmp_path):
+    stub_server.add("/data.json", _BODY)
+    for template_id in ("test-blob-a", "test-blob-b"):
+        _register(tmp_path, template_id, stub_server.url("/data.json"))
+    return _download("test-blob-a"), _download("test-blob-b")
+
+
+def _raw_path(meta):
+    (fname,) = meta.downloaded_files
+    return Path(CacheManager().cache_path(fname))
+
+
+def test_identical_payloads_share_one_blob(dedup, stub_server, tmp_path):
+    meta_a, meta_b = _two_templates_same_payload(stub_server, tmp_path)
+    store = BlobStore()
+
+    (blob,) = store.root.glob("*/*")
+    assert _raw_path(meta_a).stat().st_ino == blob.stat().st_ino
+    assert _raw_path(meta_b).stat().st_ino == blob.stat().st_ino
+    assert store.refcount(blob.name) == 2
+    with open_raw_file(_raw_path(meta_b)) as fp:
+        assert fp.read() == _BODY
+
+
+def test_drop_deletes_blob_with_its_last_reference(dedup, stub_server, tmp_path):
+    meta_a, meta_b = _two_templates_same_payload(stub_server, tmp_path)
+    store = BlobStore()
+    (blob,) = store.root.glob("*/*")
+
+    CacheManager().drop(meta_a.id)
+    assert blob.exists()
+    assert store.refcount(blob.name) == 1
+    with open_raw_file(_raw_path(meta_b)) as fp:
+        assert fp.read() == _BODY
+
+    CacheManager().drop(meta_b.id)
+    assert not blob.exists()
+    assert store.refcount(blob.name) == 0
+
+
+def test_dedup_disabled_stores_plain_files(stub_server, tmp_path):
+    meta_a, meta_b = _two_templates_same_payload(stub_server, tmp_path)
+
+    assert not BlobStore().root.exists()
+    assert _raw_path(meta_a).stat().st_ino != _raw_path(meta_b).stat().st_ino
+
+
+def test_doctor_orphan_raw_fix_releases_blobs(dedup, stub_server, tmp_path):
+    meta_a, _ = _two_templates_same_payload(stub_server, tmp_path)
+    store = BlobStore()
+    (blob,) = store.root.glob("*/*")
+    CacheManager().clean_meta_db(meta_a)
+
+    (issue,) = check_orphan_raw()
+    issue.fix_fn()
+
+    assert store.refcount(blob.name) == 1
+    assert check_orphan_blobs() == []
+
+
+def test_doctor_finds_refs_to_deleted_folders_and_unreferenced_blobs(
+    dedup, stub_server, tmp_path
+):
+    meta_a, meta_b = _two_templates_same_payload(stub_server, tmp_path)
+    store = BlobStore()
+    (blob,) = store.root.glob("*/*")
+    stray = store.blob_path("ffstray.gz")
+    stray.parent.mkdir(parents=True, exist_ok=True)
+    stray.write_bytes(b"")
+    # Raw folders removed by hand keep their blob references
+    for meta in (meta_a, meta_b):
+        _raw_path(meta).unlink()
+
+    (issue,) = check_orphan_blobs()
+    assert issue.code == "orphan-blobs"
+    assert str(stray) in issue.details
+    assert len(issue.details) == 3
+
+    issue.fix_fn()
+    assert not blob.exists()
+    assert not stray.exists()
+    assert check_orphan_blobs() == []
+
+
+def test_old_meta_db_lets_templates_share_a_checksum(temp_cache):
+    db_path = temp_cache.cache_path(temp_cache.meta_db_filename)
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.execute("drop table cache_metadata")
+        conn.execute(
+            "create table cache_metadata (id TEXT unique, "
+            "download_checksum TEXT unique, template TEXT)"
+        )
+        conn.execute("insert into cache_metadata values ('a', 'same', 'tpl-a')")
+        conn.execute("pragma user_version = 0")
+
+    migrate_meta_db(db_path)
+
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.execute(
+            "insert into cache_metadata (id, download_checksum, template) "
+            "values ('b', 'same', 'tpl-b')"
+        )
+        rows = conn.execute(
+            "select id, download_checksum, template from cache_metadata order by id"
+        ).fetchall()
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("insert into cache_metadata (id) values ('a')")
+    assert rows == [("a", "same", "tpl-a"), ("b", "same", "tpl-b")]
@@ -0,0 +1,127 @@
+"""Tests for the batched cache-state prefetch behind ``_should_download``."""
+
+import sqlite3
+
+from brasa.engine.api import _run_acquisition, _should_download
+from brasa.engine.cache import CacheMetadata
+from brasa.engine.reporting import TaskStatus, Verbosity
+from brasa.engine.template import MarketDataTemplate, _template_cache
+
+
+def _meta(n):
+    meta = CacheMetadata("test-snapshot")
+    meta.download_args = {"n": n}
+    return meta
+
+
+def _seed(cache):
+    """One entry per skip/download branch of _should_download."""
+    passed = _meta(1)
+    passed.download_checksum = "chk-passed"
+    cache.save_trial(passed, downloaded=True)
+    cache.save_meta(passed)
+
+    duplicated = _meta(2)
+    duplicated.download_checksum = "chk-dup"
+    duplicated.downloaded_files = ["raw/test-snapshot/chk-dup/missing.gz"]
+    cache.save_meta(duplicated)
+    cache.save_trial(duplicated, downloaded=True, status_code="D", status_name="D")
+
+    cache.save_trial(_meta(3), downloaded=False, status_code="I", status_name="I")
+
+    invalid = _meta(4)
+    invalid.download_checksum = "chk-invalid"
+    invalid.is_invalid_download = True
+    cache.save_meta(invalid)
+
+    # A failed retry followed by success: the latest trial governs
+    retried = _meta(5)
+    cache.save_trial(retried, downloaded=False, status_code="F", status_name="F")
+    cache.save_trial(retried, downloaded=True)
+
+    cache.save_trial(_meta(6), downloaded=False, status_code="F", status_name="F")
+
+
+def test_snapshot_decisions_match_live_reads(temp_cache):
+    _seed(temp_cache)
+    snapshot = temp_cache.snapshot(_meta(n).id for n in range(1, 8))
+
+    for n in range(1, 8):
+        live = _should_download(temp_cache, _meta(n), force=False)
+        prefetched = _should_download(temp_cache, _meta(n), False, snapshot)
+        assert prefetched is live, n
+
+
+def test_forced_entry_is_loaded_from_snapshot_and_removed(temp_cache):
+    _seed(temp_cache)
+    snapshot = temp_cache.snapshot([_meta(1).id])
+    meta = _meta(1)
+
+    assert _should_download(temp_cache, meta, True, snapshot) is True
+    assert meta.download_checksum == "chk-passed"
+    assert not temp_cache.has_meta(meta)
+
+
+def test_snapshot_reads_uncovered_entries_from_cache(temp_cache):
+    _seed(temp_cache)
+    snapshot = temp_cache.snapshot([])
+
+    assert snapshot.has_meta(_meta(1))
+    assert snapshot.get_last_download_status(_meta(3))["code"] == "I"
+    assert snapshot.has_successful_trial(_meta(5))
+
+
+def test_snapshot_sees_writes_queued_by_write_behind(temp_cache):
+    ids = [_meta(n).id for n in range(1, 8)]
+    with temp_cache.write_behind(flush_interval=60):
+        _seed(temp_cache)
+        snapshot = temp_cache.snapshot(ids)
+
+    for n in range(1, 8):
+        live = _should_download(temp_cache, _meta(n), force=False)
+        assert _should_download(temp_cache, _meta(n), False, snapshot) is live, n
+    assert snapshot.has_meta(_meta(1))
+    assert snapshot.get_last_download_status(_meta(3))["code"] == "I"
+
+
+def test_skipped_grid_opens_a_handful_of_connections(temp_cache, tmp_path, monkeypatch):
+    tpl_yaml = tmp_path / "test-snapshot.yaml"
+    tpl_yaml.write_text(
+        "id: test-snapshot\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        "  url: http://127.0.0.1:9/never\n"
+        "  format: csv\n"
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template.id] = template
+    n_entries = 1200
+    with temp_cache.meta_db_connection as conn:
+        for n in range(n_entries):
+            meta = _meta(n)
+            conn.execute(
+                "insert into download_trials (cache_id, timestamp, downloaded, "
+                "status_code, status_name) values (?, '', '1', '.', 'PASSED')",
+                (meta.id,),
+            )
+    connects = []
+    real_connect = sqlite3.connect
+    monkeypatch.setattr(
+        sqlite3,
+        "connect",
+        lambda *a, **kw: connects.append(a) or real_connect(*a, **kw),
+    )
+
+    report = _run_acquisition(
+        template,
+        template.id,
+        {"n": list(range(n_entries))},
+        operation="download",
+        force=False,
+        verbosity=Verbosity.QUIET,
+        report_file=None,
+    )
+
+    assert len(report.results) == n_entries
+    assert all(r.status == TaskStatus.SKIPPED for r in report.results)
+    assert len(connects) <= 2
@@ -0,0 +1,130 @@
+"""Tests for chunked reader pipelines (``reader.chunksize``)."""
+
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+
+import brasa
+from brasa.engine.pipeline import ReaderPipeline
+from brasa.engine.template import MarketDataTemplate, _template_cache
+
+ROWS = [
+    "refdate,symbol,kind,price",
+    "2026-06-19,PETR4,A,10.5",
+    "2026-06-19,VALE3,X,1.0",
+    "2026-06-19,ITUB4,A,30.25",
+    "2026-06-22,PETR4,A,11.0",
+    "2026-06-22,VALE3,A,62.0",
+    "2026-06-22,BBDC4,X,2.0",
+    "2026-06-22,ABEV3,A,13.75",
+]
+
+
+def _template(tmp_path, template_id, reader_extra=""):
+    tpl_yaml = tmp_path / f"{template_id}.yaml"
+    tpl_yaml.write_text(
+        f"id: {template_id}\n"
+        "importer:\n"
+        "  format: csv\n"
+        "  args:\n"
+        "    refdate: ~\n"
+        "reader:\n"
+        f"{reader_extra}"
+        "  pipeline:\n"
+        "    - step: read_csv\n"
+        "    - step: filter_rows\n"
+        "      column: kind\n"
+        "      operator: eq\n"
+        "      value: A\n"
+        "    - step: select_columns\n"
+        "      columns: [refdate, symbol, price]\n"
+        "    - step: apply_fields\n"
+        "writer:\n"
+        "  partitioning: [refdate]\n"
+        "fields:\n"
+        "  - name: refdate\n"
+        "    description: refdate\n"
+        "    type: date\n"
+        "  - name: symbol\n"
+        "    description: symbol\n"
+        "    type: character\n"
+        "  - name: price\n"
+        "    description: price\n"
+        "    type: numeric\n"
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template_id] = template
+    return template
+
+
+def _process(cache, template, src) -> list[dict]:
+    brasa.import_marketdata(
+        template.id,
+        path=str(src),
+        refdate="2026-06-22",
+        verbosity=brasa.Verbosity.QUIET,
+    )
+    report = brasa.process_marketdata(
+        template.id, reprocess=True, verbosity=brasa.Verbosity.QUIET
+    )
+    assert [r.status.name for r in report.results] == ["PASSED"]
+    folder = cache.cache_path(cache.db_folder(template))
+    table = ds.dataset(folder, format="parquet", partitioning="hive").to_table()
+    return table.sort_by(
+        [("refdate", "ascending"), ("symbol", "ascending")]
+    ).to_pylist()
+
+
+def test_supports_chunks_requires_chunked_read_and_row_wise_steps():
+    def pipeline(*steps):
+        return ReaderPipeline.from_config(list(steps))
+
+    assert pipeline("read_csv", "apply_fields").supports_chunks
+    assert pipeline(
+        {"step": "read_fwf"},
+        {"step": "filter_rows", "column": "a", "operator": "notna"},
+        {"step": "rename_columns", "mapping": {"a": "b"}},
+    ).supports_chunks
+    assert not pipeline("read_csv", {"step": "sort", "by": "a"}).supports_chunks
+    assert not pipeline("read_html", "first_table").supports_chunks
+
+
+def test_chunksize_on_unsupported_pipeline_is_rejected(tmp_path):
+    tpl_yaml = tmp_path / "test-chunked-bad.yaml"
+    tpl_yaml.write_text(
+        "id: test-chunked-bad\n"
+        "importer:\n"
+        "  format: csv\n"
+        "reader:\n"
+        "  chunksize: 10\n"
+        "  pipeline:\n"
+        "    - step: read_csv\n"
+        "    - step: drop_duplicates\n"
+    )
+    with pytest.raises(ValueError, match="chunksize"):
+        MarketDataTemplate(str(tpl_yaml))
+
+
+def test_chunked_processing_matches_whole_file(tmp_path, temp_cache):
+    src = tmp_path / "src.csv"
+    src.write_text("\n".join(ROWS) + "\n")
+    whole = _template(tmp_path, "test-chunked-whole")
+    chunked = _template(tmp_path, "test-chunked-2", reader_extra="  chunksize: 2\n")
+    try:
+        expected = _process(temp_cache, whole, src)
+        # Processing twice replaces the partitions instead of appending
+        _process(temp_cache, chunked, src)
+        rows = _process(temp_cache, chunked, src)
+    finally:
+        _template_cache.pop(whole.id, None)
+        _template_cache.pop(chunked.id, None)
+
+    assert len(expected) == 5
+    assert rows == expected
+    folder = Path(temp_cache.cache_path(temp_cache.db_folder(chunked)))
+    # The second run replaced the partition; its chunks went to one file as
+    # separate row groups
+    (part,) = (folder / "refdate=2026-06-22").glob("*.parquet")
+    assert pq.ParquetFile(part).num_row_groups > 1
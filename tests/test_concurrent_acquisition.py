@@ -0,0 +1,248 @@
+"""Tests for concurrent acquisition (download_marketdata max_workers / --jobs)."""
+
+import io
+import itertools
+import threading
+import time
+import warnings
+from datetime import date
+
+import httpx
+
+import brasa
+from brasa import cli
+from brasa.downloaders import transport
+from brasa.downloaders.downloaders import _WindowedBCBDownloader
+from brasa.engine.api import _run_acquisition
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.reporting import capture_warnings
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.engine.throttle import HostThrottle, RateLimit, acquisition_limits
+from brasa.util import DownloadArgs
+
+
+def _register_template(tmp_path, template_id, extra=""):
+    tpl_yaml = tmp_path / f"{template_id}.yaml"
+    tpl_yaml.write_text(
+        f"id: {template_id}\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        "  url: http://concurrency.invalid/file\n"
+        "  format: csv\n"
+        f"{extra}"
+        "  args:\n"
+        "    code: ~\n"
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template_id] = template
+    return template
+
+
+class TestHostThrottle:
+    def test_slot_caps_concurrency_per_host(self):
+        throttle = HostThrottle()
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with throttle.slot("cap-test.invalid", limit=2):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.05)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak == 2
+
+    def test_slot_spaces_request_starts(self):
+        throttle = HostThrottle()
+        starts = []
+        for _ in range(3):
+            with throttle.slot("spacing-test.invalid", rate_limit=RateLimit(20.0)):
+                starts.append(time.monotonic())
+        gaps = [b - a for a, b in itertools.pairwise(starts)]
+        assert all(g >= 0.045 for g in gaps)
+
+
+class TestConcurrentRunAcquisition:
+    def test_report_order_matches_serial_run(self, tmp_path):
+        template = _register_template(tmp_path, "test-concurrent-order")
+        codes = list(range(8))
+
+        def acquire(_md, code):
+            # Earlier entries finish last, so completion order is reversed
+            time.sleep(0.01 * (len(codes) - code))
+            return io.BytesIO(f"code,value\n{code},1\n".encode()), {}
+
+        report = _run_acquisition(
+            template,
+            template.id,
+            {"code": codes},
+            operation="download",
+            force=False,
+            verbosity=brasa.Verbosity.QUIET,
+            report_file=None,
+            acquisition_function=acquire,
+            max_workers=4,
+        )
+
+        assert [r.args["code"] for r in report.results] == codes
+        assert all(r.status.name == "PASSED" for r in report.results)
+
+        cache = CacheManager()
+        for code in codes:
+            meta = CacheMetadata(template.id)
+            meta.download_args = DownloadArgs({"code": code})
+            assert cache.has_meta(meta)
+            assert cache.count_trials(meta) == 1
+
+    def test_identical_payloads_race_to_one_folder(self, tmp_path):
+        template = _register_template(tmp_path, "test-concurrent-dup")
+
+        def acquire(_md, code):
+            return io.BytesIO(b"same,payload\n1,2\n"), {}
+
+        report = _run_acquisition(
+            template,
+            template.id,
+            {"code": list(range(6))},
+            operation="download",
+            force=False,
+            verbosity=brasa.Verbosity.QUIET,
+            report_file=None,
+            acquisition_function=acquire,
+            max_workers=6,
+        )
+
+        statuses = [r.status.name for r in report.results]
+        assert statuses.count("PASSED") == 1
+        assert statuses.count("DUPLICATED") == 5
+
+    def test_host_concurrency_limits_in_flight_requests(self, tmp_path, stub_server):
+        template = _register_template(
+            tmp_path,
+            "test-concurrent-host-cap",
+            extra="  host_concurrency: 2\n",
+        )
+        tracker = _InFlight()
+        stub_server.add("/cap/", tracker.payload, prefix=True)
+
+        def acquire(_md, code):
+            # Two requests per acquisition: the cap counts requests
+            for part in ("a", "b"):
+                transport.get(stub_server.url(f"/cap/{code}{part}"))
+            return io.BytesIO(f"code\n{code}\n".encode()), {}
+
+        _run_acquisition(
+            template,
+            template.id,
+            {"code": list(range(6))},
+            operation="download",
+            force=False,
+            verbosity=brasa.Verbosity.QUIET,
+            report_file=None,
+            acquisition_function=acquire,
+            max_workers=6,
+        )
+        assert stub_server.hits["/cap/"] == 12
+        assert tracker.peak == 2
+
+
+class _InFlight:
+    """Stub payload that records how many requests are served at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def payload(self, _path):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return b"ok"
+
+
+class TestRequestSlots:
+    def test_downloader_threads_inherit_acquisition_limits(self, stub_server):
+        tracker = _InFlight()
+        stub_server.add("/window/", tracker.payload, prefix=True)
+
+        class _Windowed(_WindowedBCBDownloader):
+            window_days = 1
+            window_concurrency = 4
+
+        downloader = _Windowed(start=date(2024, 1, 1), end=date(2024, 1, 4))
+
+        def fetch(start, _end):
+            return transport.get(stub_server.url(f"/window/{start}")).content
+
+        class _Dl:
+            host_concurrency = 1
+
+        # The stub listens on a fresh port, so no other test shares this cap
+        with acquisition_limits(_Dl()):
+            assert downloader._fetch_windows(fetch) == [b"ok"] * 4
+        assert tracker.peak == 1
+
+    def test_httpx_requests_take_slots(self):
+        tracker = _InFlight()
+
+        def handler(request):
+            return httpx.Response(200, content=tracker.payload(request.url.path))
+
+        client = httpx.Client(
+            transport=transport.ThrottledHTTPXTransport(httpx.MockTransport(handler))
+        )
+
+        class _Dl:
+            host_concurrency = 1
+
+        def work():
+            with acquisition_limits(_Dl()):
+                assert client.get("http://httpx-cap.invalid/x").content == b"ok"
+
+        threads = [threading.Thread(target=work) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert tracker.peak == 1
+
+
+def test_capture_warnings_is_per_thread():
+    results = {}
+
+    def work(name):
+        with capture_warnings() as captured:
+            warnings.warn(f"from {name}", UserWarning, stacklevel=1)
+            time.sleep(0.02)
+        results[name] = captured
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in ("a", "b", "c")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for name, captured in results.items():
+        assert len(captured) == 1
+        assert f"from {name}" in captured[0]
+
+
+def test_cli_download_jobs_flag():
+    args = cli.parser.parse_args(["download", "b3-cotahist-daily", "-j", "8"])
+    assert args.jobs == 8
+    args = cli.parser.parse_args(["download", "b3-cotahist-daily"])
+    assert args.jobs is None
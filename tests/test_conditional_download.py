@@ -0,0 +1,102 @@
+"""Tests for conditional (ETag / Last-Modified) downloads of snapshot templates."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+
+from brasa.downloaders import transport
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.util import DownloadArgs
+
+
+class _SnapshotHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    body = b"code,value\n1,2\n"
+    seen_if_none_match: ClassVar[list] = []
+
+    def do_GET(self):
+        type(self).seen_if_none_match.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def snapshot_template(tmp_path):
+    _SnapshotHandler.seen_if_none_match = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SnapshotHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    tpl_yaml = tmp_path / "test-conditional-snapshot.yaml"
+    tpl_yaml.write_text(
+        "id: test-conditional-snapshot\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        f"  url: http://127.0.0.1:{httpd.server_port}/snapshot.csv\n"
+        "  format: csv\n"
+        "  extra-key: date\n"
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template.id] = template
+    yield template
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _download(template, day):
+    template.downloader.extra_key = day
+    meta = CacheMetadata(template.id)
+    meta.download_args = DownloadArgs({})
+    meta.extra_key = day
+    return meta, CacheManager().download_marketdata(meta)
+
+
+def test_unchanged_snapshot_maps_304_to_duplicated(snapshot_template):
+    meta1, first = _download(snapshot_template, "2024-01-01")
+    assert first.status_name == "PASSED"
+
+    meta2, second = _download(snapshot_template, "2024-01-02")
+    assert second.status_code == "D"
+    assert second.status_name == "DUPLICATED"
+    assert "304" in second.reason
+    assert _SnapshotHandler.seen_if_none_match == [None, '"v1"']
+
+    cache = CacheManager()
+    assert cache.has_meta(meta1)
+    assert not cache.has_meta(meta2)
+
+
+def test_changed_snapshot_downloads_again(snapshot_template, monkeypatch):
+    _download(snapshot_template, "2024-01-01")
+    monkeypatch.setattr(_SnapshotHandler, "etag", '"v2"')
+    monkeypatch.setattr(_SnapshotHandler, "body", b"code,value\n1,3\n")
+
+    _, second = _download(snapshot_template, "2024-01-02")
+    assert second.status_name == "PASSED"
+    assert _SnapshotHandler.seen_if_none_match == [None, '"v1"']
+
+
+def test_conditional_request_maps_validators():
+    with transport.conditional_request(
+        {"etag": '"abc"', "Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}
+    ):
+        assert transport.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 02 Jan 2024 00:00:00 GMT",
+        }
+    assert transport.conditional_headers() == {}
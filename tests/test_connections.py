@@ -0,0 +1,76 @@
+"""Tests for the long-lived SQLite connections of the metadata database."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from brasa.engine.cache import CacheMetadata
+from brasa.engine.connections import ConnectionPool, connection_pool
+from tests import benchmark_meta_db
+
+
+def test_thread_reuses_its_connection(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "test.db"))
+    conn = pool.connection()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    assert pool.connection() is conn
+    assert other[0] is not conn
+    assert conn.execute("pragma journal_mode").fetchone() == ("wal",)
+    assert conn.execute("pragma synchronous").fetchone() == (1,)  # NORMAL
+    assert connection_pool(pool.db_path) is connection_pool(pool.db_path)
+
+
+def test_nested_transactions_commit_or_roll_back_together(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "test.db"))
+    with pool.transaction() as conn:
+        conn.execute("create table t (x)")
+
+    with pytest.raises(RuntimeError), pool.transaction() as conn:
+        conn.execute("insert into t values (1)")
+        with pool.transaction() as inner:
+            inner.execute("insert into t values (2)")
+        raise RuntimeError("boom")
+
+    with pool.transaction() as conn:
+        conn.execute("insert into t values (3)")
+    assert conn.execute("select x from t").fetchall() == [(3,)]
+
+
+def test_replaced_database_file_is_reopened(tmp_path):
+    db_path = tmp_path / "test.db"
+    pool = ConnectionPool(str(db_path))
+    with pool.transaction() as conn:
+        conn.execute("create table old (x)")
+    pool.close()
+    db_path.unlink()
+    with sqlite3.connect(db_path) as fresh:
+        fresh.execute("create table new (x)")
+    fresh.close()
+
+    tables = pool.connection().execute("select name from sqlite_master").fetchall()
+    assert tables == [("new",)]
+
+
+def test_cache_writes_share_the_thread_connection(temp_cache):
+    meta = CacheMetadata("test-connections")
+    meta.download_args = {"a": 1}
+    meta.download_checksum = "chk"
+    temp_cache.save_trial(meta, downloaded=True)
+    temp_cache.save_meta(meta)
+
+    with temp_cache.meta_db() as first, temp_cache.meta_db() as second:
+        assert first is second
+    assert temp_cache.has_meta(meta)
+    assert temp_cache.has_successful_trial(meta)
+
+
+def test_benchmark_harness_reports_every_mode():
+    results = benchmark_meta_db.run(n_ops=20, threads=2)
+
+    assert [r.mode for r in results] == ["per-call", "pooled", "write-behind"]
+    assert all(r.ops == 20 and r.ops_per_second > 0 for r in results)
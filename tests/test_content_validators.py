@@ -2,7 +2,12 @@
 
 import pytest
 
-from brasa.downloaders.helpers import validate_empty_file, validate_json_empty_file
+from brasa.downloaders.helpers import (
+    EmptyFileValidator,
+    JSONEmptyFileValidator,
+    validate_empty_file,
+    validate_json_empty_file,
+)
 from brasa.engine.exceptions import InvalidContentException
 
 
@@ -55,3 +60,22 @@ def test_validate_json_without_results_key_passes(tmp_path):
         f = tmp_path / "data.json"
         f.write_bytes(content)
         validate_json_empty_file(str(f))
+
+
+def _stream(validator_cls, content, chunk=3):
+    validator = validator_cls()
+    for i in range(0, len(content), chunk):
+        validator.update(content[i : i + chunk])
+    validator.finish()
+
+
+def test_stream_validators_match_file_validators():
+    assert validate_empty_file.stream_validator is EmptyFileValidator
+    assert validate_json_empty_file.stream_validator is JSONEmptyFileValidator
+    with pytest.raises(InvalidContentException):
+        _stream(EmptyFileValidator, b"")
+    _stream(EmptyFileValidator, b"x")
+    for content in (b"", b"{}", b"[]", b'{"results": []}'):
+        with pytest.raises(InvalidContentException):
+            _stream(JSONEmptyFileValidator, content)
+    _stream(JSONEmptyFileValidator, b'{"results": [{"a": 1}]}')
@@ -1103,109 +1103,57 @@ class TestExecutionPlan:
 
 
 class TestCheckDownloadTemplateStaleness:
-    """Verify _check_download_template_staleness with mocked CacheManager."""
+    """Verify _check_download_template_staleness against a temporary cache."""
 
     def _make_graph(self):
         """Build a simple graph with one download template."""
         src = _make_download_template("dl-src")
         return _build_graph_from_templates([src])
 
-    def test_no_cache_entries_means_not_stale(self):
+    def _insert(self, cache, *processed_files):
+        """Insert one dl-src cache row per processed_files value."""
+        with cache.meta_db() as conn:
+            for i, value in enumerate(processed_files):
+                conn.execute(
+                    "INSERT INTO cache_metadata "
+                    "(id, template, download_args, processed_files) "
+                    "VALUES (?, 'dl-src', '{}', ?)",
+                    (f"dl-src-{i}", value),
+                )
+
+    def test_no_cache_entries_means_not_stale(self, temp_cache):
         """No cache rows → nothing downloaded → not stale."""
         g = self._make_graph()
+        assert g._check_download_template_staleness("dl-src") is False
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = []
-        mock_conn.cursor.return_value = mock_cursor
-        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = MagicMock(return_value=False)
-
-        with patch("brasa.engine.dependency_graph.CacheManager") as MockCacheManager:
-            mock_cache = MagicMock()
-            mock_cache.meta_db_connection = mock_conn
-            MockCacheManager.return_value = mock_cache
-
-            assert g._check_download_template_staleness("dl-src") is False
-
-    def test_empty_processed_files_means_stale(self):
+    def test_empty_processed_files_means_stale(self, temp_cache):
         """Cache row with empty processed_files JSON → stale."""
         g = self._make_graph()
+        self._insert(temp_cache, "{}")
+        assert g._check_download_template_staleness("dl-src") is True
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [("{}",)]
-        mock_conn.cursor.return_value = mock_cursor
-        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = MagicMock(return_value=False)
-
-        with patch("brasa.engine.dependency_graph.CacheManager") as MockCacheManager:
-            mock_cache = MagicMock()
-            mock_cache.meta_db_connection = mock_conn
-            MockCacheManager.return_value = mock_cache
-
-            assert g._check_download_template_staleness("dl-src") is True
-
-    def test_null_processed_files_means_stale(self):
+    def test_null_processed_files_means_stale(self, temp_cache):
         """Cache row with null/empty string → stale."""
         g = self._make_graph()
+        self._insert(temp_cache, "", None)
+        assert g._check_download_template_staleness("dl-src") is True
 
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [("",)]
-        mock_conn.cursor.return_value = mock_cursor
-        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = MagicMock(return_value=False)
-
-        with patch("brasa.engine.dependency_graph.CacheManager") as MockCacheManager:
-            mock_cache = MagicMock()
-            mock_cache.meta_db_connection = mock_conn
-            MockCacheManager.return_value = mock_cache
-
-            assert g._check_download_template_staleness("dl-src") is True
-
-    def test_populated_processed_files_means_not_stale(self):
+    def test_populated_processed_files_means_not_stale(self, temp_cache):
         """Cache row with populated processed_files → not stale."""
         import json
 
         g = self._make_graph()
-        processed = json.dumps({"data": "/path/to/file.parquet"})
-
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [(processed,)]
-        mock_conn.cursor.return_value = mock_cursor
-        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = MagicMock(return_value=False)
-
-        with patch("brasa.engine.dependency_graph.CacheManager") as MockCacheManager:
-            mock_cache = MagicMock()
-            mock_cache.meta_db_connection = mock_conn
-            MockCacheManager.return_value = mock_cache
+        self._insert(temp_cache, json.dumps({"data": "/path/to/file.parquet"}), "true")
+        assert g._check_download_template_staleness("dl-src") is False
 
-            assert g._check_download_template_staleness("dl-src") is False
-
-    def test_mixed_rows_one_unprocessed_means_stale(self):
+    def test_mixed_rows_one_unprocessed_means_stale(self, temp_cache):
         """Multiple cache rows, one unprocessed → stale."""
         import json
 
         g = self._make_graph()
-        processed = json.dumps({"data": "/path/to/file.parquet"})
-
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
         # First row is processed, second is not
-        mock_cursor.fetchall.return_value = [(processed,), ("{}",)]
-        mock_conn.cursor.return_value = mock_cursor
-        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
-        mock_conn.__exit__ = MagicMock(return_value=False)
-
-        with patch("brasa.engine.dependency_graph.CacheManager") as MockCacheManager:
-            mock_cache = MagicMock()
-            mock_cache.meta_db_connection = mock_conn
-            MockCacheManager.return_value = mock_cache
-
-            assert g._check_download_template_staleness("dl-src") is True
+        self._insert(temp_cache, json.dumps({"data": "/path/to/file.parquet"}), "{}")
+        assert g._check_download_template_staleness("dl-src") is True
 
 
 # ===================================================================
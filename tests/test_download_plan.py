@@ -771,3 +771,124 @@ def test_plan_success_true_when_only_no_data():
     plan_report = DownloadPlanReport(plan_name="p")
     plan_report.task_reports["t"] = report
     assert plan_report.success is True
+
+
+# ---------------------------------------------------------------------------
+# Parallel execution
+# ---------------------------------------------------------------------------
+
+import threading  # noqa: E402
+import time  # noqa: E402
+
+from brasa.engine.download_plan import _plan_task_dependencies  # noqa: E402
+
+
+class _FakeGraph:
+    """Minimal TemplateDependencyGraph stand-in: template -> ancestors."""
+
+    def __init__(self, ancestors: dict[str, set[str]]):
+        self.ancestors = ancestors
+
+    def get_ancestors(self, template_id: str) -> set[str]:
+        if template_id not in self.ancestors:
+            raise KeyError(template_id)
+        return set(self.ancestors[template_id])
+
+
+def _tasks(*templates, **args_by_template):
+    plan = DownloadPlan.from_dict(
+        {
+            "name": "p",
+            "tasks": [
+                {"template": t, "args": args_by_template.get(t.replace("-", "_"), {})}
+                for t in templates
+            ],
+        }
+    )
+    return plan.tasks
+
+
+def test_parallelism_parsed_from_defaults():
+    plan = DownloadPlan.from_dict({**VALID_PLAN_DICT, "defaults": {"parallelism": 4}})
+    assert plan.defaults.parallelism == 4
+    assert DownloadPlan.from_dict(VALID_PLAN_DICT).defaults.parallelism == 1
+
+
+def test_plan_task_dependencies_follow_graph():
+    graph = _FakeGraph({"etl": {"src"}, "src": set(), "other": set()})
+    waits = _plan_task_dependencies(_tasks("etl", "other", "src"), graph)
+    assert waits == [{2}, set(), set()]
+
+
+def test_plan_task_dependencies_serialize_shared_upstream_and_symbols():
+    graph = _FakeGraph({"a": {"up"}, "b": {"up"}, "c": set()})
+    tasks = _tasks("a", "b", "c", "a", c={"index": "symbols:index"})
+    waits = _plan_task_dependencies(tasks, graph)
+    assert waits[0] == set()
+    assert waits[1] == {0}
+    assert waits[2] == {0, 1}
+    assert waits[3] == {0, 1}
+
+
+def _run_parallel(templates, graph, fake_execute, parallelism=2):
+    plan = DownloadPlan.from_dict(
+        {"name": "p", "tasks": [{"template": t} for t in templates]}
+    )
+    with (
+        patch("brasa.engine.download_plan._execute_task", side_effect=fake_execute),
+        patch(
+            "brasa.engine.dependency_graph.TemplateDependencyGraph",
+            return_value=graph,
+        ),
+        patch(
+            "brasa.engine.download_plan._template_requires_refdate", return_value=False
+        ),
+    ):
+        return execute_download_plan(
+            plan, verbosity=Verbosity.QUIET, parallelism=parallelism
+        )
+
+
+def test_independent_tasks_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_execute(task, resolved_args, verbosity, plan_calendar="B3", **kwargs):
+        barrier.wait()  # deadlocks (BrokenBarrierError) if run serially
+        time.sleep(0.05)
+        return _make_task_report(task.template, [TaskStatus.PASSED])
+
+    result = _run_parallel(
+        ["tmpl-b", "tmpl-a"], _FakeGraph({}), fake_execute, parallelism=2
+    )
+    assert list(result.task_reports) == ["tmpl-b", "tmpl-a"]
+    assert result.parallelism == 2
+    assert result.cumulative_duration >= 0.1
+    assert result.total_duration < result.cumulative_duration
+    assert "cumulative" in result.summary()
+
+
+def test_dependent_task_waits_for_upstream_task():
+    events = []
+
+    def fake_execute(task, resolved_args, verbosity, plan_calendar="B3", **kwargs):
+        events.append(("start", task.template))
+        time.sleep(0.05)
+        events.append(("end", task.template))
+        return _make_task_report(task.template, [TaskStatus.PASSED])
+
+    graph = _FakeGraph({"etl": {"src"}, "src": set()})
+    result = _run_parallel(["etl", "src"], graph, fake_execute, parallelism=4)
+    assert events.index(("end", "src")) < events.index(("start", "etl"))
+    assert list(result.task_reports) == ["etl", "src"]
+
+
+def test_json_report_has_cumulative_duration(tmp_path):
+    report = DownloadPlanReport(plan_name="p", parallelism=3)
+    report.task_reports["tmpl-a"] = _make_task_report("tmpl-a", [TaskStatus.PASSED])
+    report.task_durations["tmpl-a"] = 2.5
+    out = tmp_path / "report.json"
+    report.save_report(out)
+    data = json.loads(out.read_text())
+    assert data["cumulative_duration"] == 2.5
+    assert data["parallelism"] == 3
+    assert data["tasks"][0]["duration"] == 2.5
@@ -1,6 +1,7 @@
 import io
 import time
 from datetime import datetime
+from pathlib import Path
 
 import pytest
 
@@ -150,3 +151,45 @@ def test_download_retry_override_zero_means_no_retry():
         dl.download(acquisition_function=failing, retry_attempts=0)
 
     assert attempts["n"] == 1
+
+
+def test_zip_download_extracts_members_into_gzip_files(stub_server, tmp_path):
+    import gzip
+    import zipfile
+
+    from brasa.engine import CacheManager
+    from brasa.engine.template import MarketDataTemplate, _template_cache
+
+    inner = io.BytesIO()
+    with zipfile.ZipFile(inner, "w") as zf:
+        zf.writestr("BVBG.086.01_a.xml", "<a/>")
+        zf.writestr("BVBG.086.01_b.xml", "<b/>")
+    outer = io.BytesIO()
+    with zipfile.ZipFile(outer, "w") as zf:
+        zf.writestr("bundle.zip", inner.getvalue())
+    stub_server.add("/bundle.zip", outer.getvalue())
+    tpl_yaml = tmp_path / "test-zip-to-gzip.yaml"
+    tpl_yaml.write_text(
+        "id: test-zip-to-gzip\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        f"  url: {stub_server.url('/bundle.zip')}\n"
+        "  format: zip\n"
+    )
+    _template_cache["test-zip-to-gzip"] = MarketDataTemplate(str(tpl_yaml))
+
+    meta = CacheMetadata("test-zip-to-gzip")
+    _download_marketdata(meta)
+
+    man = CacheManager()
+    assert [f.rsplit("/", 1)[-1] for f in meta.downloaded_files] == [
+        "BVBG.086.01_a.xml.gz",
+        "BVBG.086.01_b.xml.gz",
+    ]
+    with gzip.open(man.cache_path(meta.downloaded_files[1])) as fp:
+        assert fp.read() == b"<b/>"
+    folder = man.cache_path(meta.download_folder)
+    assert sorted(p.name for p in Path(folder).iterdir()) == [
+        "BVBG.086.01_a.xml.gz",
+        "BVBG.086.01_b.xml.gz",
+    ]
@@ -0,0 +1,234 @@
+"""Tests for the vectorized fixed-width reader (``read_fwf`` with ``engine: fast``)."""
+
+import gzip
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from brasa.engine.cache import CacheMetadata
+from brasa.engine.pipeline import ReaderPipeline
+from brasa.engine.pipeline.steps.fixed_width import (
+    NotFixedWidthError,
+    fixed_width_records,
+    read_fixed_width,
+)
+from brasa.engine.template import retrieve_template
+from brasa.fieldsets import Field, Fieldset
+from tests import benchmark_fwf_reader
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# regtype(2) refdate(8) symbol(6) price(8)
+ROWS = [
+    "00COTAHIST.2026         ",
+    "0120260619PETR4 00001050",
+    "0120260619VALE3 00006200",
+    "0220260619XXXXX 00000000",
+    "0120260622ITUB4 00003025",
+    "0120260622      00000100",
+    "99COTAHIST.2026         ",
+]
+COLSPECS = [(0, 2), (2, 10), (10, 16), (16, 24)]
+NAMES = ["regtype", "refdate", "symbol", "price"]
+
+
+def _fields() -> Fieldset:
+    fields = Fieldset()
+    fields.add_fields(
+        *(
+            Field(name=name, description=name, type_definition="character", width=w)
+            for name, w in [("regtype", 2), ("refdate", 8), ("symbol", 6), ("price", 8)]
+        )
+    )
+    return fields
+
+
+def _read(src, engine, **params) -> pd.DataFrame:
+    meta = CacheMetadata("test-fwf")
+    meta.downloaded_files = [str(src)]
+    pipeline = ReaderPipeline.from_config(
+        [{"step": "read_fwf", "dtype": "str", "engine": engine, **params}]
+    )
+    return pipeline.execute(meta, {"encoding": "latin1"}, fields=_fields())
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"abc\ndef\nghi\n", id="lf"),
+        pytest.param(b"abc\r\ndef\r\nghi\r\n", id="crlf"),
+        pytest.param(b"abc\ndef\nghi", id="no-final-newline"),
+        pytest.param(b"abc\r\ndef\r\nghi\r\n\x1a", id="dos-eof"),
+    ],
+)
+def test_fixed_width_records_views_lines_as_rows(content):
+    records = fixed_width_records(np.frombuffer(content, dtype=np.uint8))
+
+    assert records.shape == (3, 3)
+    assert [bytes(row) for row in records] == [b"abc", b"def", b"ghi"]
+    assert not records.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"abc\nde\nghij\n", id="ragged"),
+        pytest.param(b"abc\ndefg\n", id="longer-last-line"),
+        pytest.param(b"abc\r\ndef\nghi\r\n", id="mixed-terminators"),
+    ],
+)
+def test_fixed_width_records_rejects_ragged_lines(content):
+    assert fixed_width_records(np.frombuffer(content, dtype=np.uint8)) is None
+
+
+def test_read_fixed_width_filters_raw_records_in_chunks(tmp_path):
+    src = tmp_path / "src.txt.gz"
+    with gzip.open(src, "wt", encoding="latin1") as f:
+        f.write("\n".join(ROWS) + "\n")
+
+    tables = read_fixed_width(
+        str(src),
+        COLSPECS,
+        NAMES,
+        "latin1",
+        skip=1,
+        where={"regtype": ["01"]},
+        chunksize=2,
+    )
+
+    # Chunks hold the records read, before the filter
+    assert [t.num_rows for t in tables] == [2, 1, 1]
+    tables = read_fixed_width(
+        str(src), COLSPECS, NAMES, "latin1", where={"regtype": ["01"]}
+    )
+    (table,) = tables
+    assert table.column("symbol").to_pylist() == ["PETR4", "VALE3", "ITUB4", None]
+    assert table.column("price").to_pylist()[0] == "00001050"
+
+
+def test_chunked_compressed_read_holds_one_block(tmp_path):
+    src = tmp_path / "big.txt.gz"
+    record = ROWS[1] + "\n"
+    rows = 200_000
+    with gzip.open(src, "wt", encoding="latin1", compresslevel=1) as f:
+        f.write(ROWS[0] + "\n" + record * rows)
+    raw_size = (rows + 1) * len(record)
+
+    tracemalloc.start()
+    try:
+        tables = read_fixed_width(
+            str(src), COLSPECS, NAMES, "latin1", skip=1, chunksize=2_000
+        )
+        total = sum(t.num_rows for t in tables)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert total == rows
+    # A block is 2,000 records (50 KB); the file is 5 MB decompressed
+    assert peak < raw_size / 10
+
+
+def test_chunked_compressed_read_resumes_with_pandas(tmp_path):
+    src = tmp_path / "src.txt.gz"
+    rows = [*ROWS[:-1], ROWS[1] + "X", ROWS[-1]]
+    with gzip.open(src, "wt", encoding="latin1") as f:
+        f.write("\n".join(rows) + "\n")
+
+    tables = read_fixed_width(str(src), COLSPECS, NAMES, "latin1", skip=1, chunksize=2)
+    assert next(tables).num_rows == 2
+    with pytest.raises(NotFixedWidthError) as excinfo:
+        list(tables)
+    assert excinfo.value.records == 4
+
+    meta = CacheMetadata("test-fwf")
+    meta.downloaded_files = [str(src)]
+    pipeline = ReaderPipeline.from_config(
+        [{"step": "read_fwf", "dtype": "str", "engine": "fast", "skip": 1}]
+    )
+    chunks = list(
+        pipeline.iter_chunks(meta, {"encoding": "latin1"}, 2, fields=_fields())
+    )
+    symbols = [s for chunk in chunks for s in chunk["symbol"].tolist()]
+    assert symbols[:4] == ["PETR4", "VALE3", "XXXXX", "ITUB4"]
+    assert len(symbols) == 7
+
+
+def test_fast_engine_matches_pandas_engine(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("\n".join(ROWS).replace("PETR4", "PETRÇ") + "\n", "latin1")
+
+    for where in ({}, {"where": {"regtype": ["01", "99"]}}):
+        expected = _read(src, "pandas", **where)
+        result = _read(src, "fast", **where)
+        # pd.read_fwf(dtype=str) gives the string "<NA>" for blank fields
+        expected = expected.replace("<NA>", pd.NA)
+        pd.testing.assert_frame_equal(
+            result.reset_index(drop=True),
+            expected.reset_index(drop=True),
+            check_dtype=False,
+        )
+    assert len(result) == 5
+    assert result["symbol"].iloc[0] == "PETRÇ"
+
+
+def test_fast_engine_falls_back_to_pandas_on_ragged_files(tmp_path, caplog):
+    src = tmp_path / "src.txt"
+    src.write_text("\n".join(row.rstrip() for row in ROWS) + "\n")
+
+    with caplog.at_level("DEBUG", logger="brasa.engine.pipeline.steps.io_steps"):
+        result = _read(src, "fast", where={"regtype": "01"})
+
+    assert "not a fixed-width file" in caplog.text
+    assert result["symbol"].tolist() == ["PETR4", "VALE3", "ITUB4", "<NA>"]
+    with pytest.raises(RuntimeError, match="Unknown read_fwf engine"):
+        _read(src, "numpy")
+
+
+@pytest.mark.parametrize(
+    ("template_id", "fixture"),
+    [
+        ("b3-derivatives-daily", "BD_Arbit.txt"),
+        ("b3-registered-contracts", "CONTRCAD.TXT"),
+    ],
+)
+@pytest.mark.parametrize("reader_engine", ["pandas", "arrow"])
+def test_fast_templates_match_pandas_engine(
+    temp_cache, template_id, fixture, reader_engine
+):
+    path = DATA_DIR / fixture
+    if not path.exists():
+        pytest.skip(f"Test data file not found: {path}")
+    template = retrieve_template(template_id)
+    reader = template.reader
+    read_fwf = reader._pipeline.steps[0]
+    original = reader.engine, dict(read_fwf.params)
+    meta = CacheMetadata(template_id)
+    meta.downloaded_files = [str(path)]
+    results = {}
+    try:
+        reader.engine = reader_engine
+        for engine in ("pandas", "fast"):
+            read_fwf.params["engine"] = engine
+            data = reader.read(meta)
+            if reader_engine == "arrow":
+                data = data.to_pandas()
+            results[engine] = data.replace("<NA>", None).reset_index(drop=True)
+    finally:
+        reader.engine, read_fwf.params = original
+
+    assert len(results["fast"]) == 45
+    pd.testing.assert_frame_equal(results["fast"], results["pandas"])
+
+
+def test_benchmark_harness_reports_every_mode():
+    results = benchmark_fwf_reader.run(rows=50)
+
+    assert [(r.fwf_engine, r.reader_engine) for r in results] == list(
+        benchmark_fwf_reader.MODES
+    )
+    assert all(r.rows == 45 for r in results)
+    assert all(r.seconds > 0 for r in results)
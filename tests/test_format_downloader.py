@@ -58,14 +58,20 @@ class TestFormatDownloadHelper:
         mock_md.verify_ssl = False
         mock_md.format = ""
         mock_md.timeout = None
+        mock_md.pool_size = None
+        mock_md.stream = False
 
-        with patch("requests.get", return_value=mock_response) as mock_get:
+        with patch(
+            "brasa.downloaders.transport.get", return_value=mock_response
+        ) as mock_get:
             fp, headers = format_download(mock_md, year=2024)
 
         mock_get.assert_called_once_with(
             "https://example.com/COTAHIST_A2024.ZIP",
+            headers=None,
             verify=False,
             timeout=(10, 120),
+            pool_size=None,
         )
         assert fp is not None
         assert headers["Content-Type"] == "application/zip"
@@ -119,7 +125,7 @@ def test_validate_non_zip_format_only_checks_empty():
         validate_download_content(b"", "json")
 
 
-@patch("brasa.downloaders.downloaders.requests.get")
+@patch("brasa.downloaders.transport.get")
 def test_simple_downloader_passes_timeout_and_validates_zip(mock_get):
     mock_get.return_value = Mock(status_code=200, content=_zip_bytes(["a.txt"]))
     d = SimpleDownloader("http://x/y.zip", verify_ssl=True)
@@ -130,7 +136,7 @@ def test_simple_downloader_passes_timeout_and_validates_zip(mock_get):
     assert fp.read() == _zip_bytes(["a.txt"])
 
 
-@patch("brasa.downloaders.downloaders.requests.get")
+@patch("brasa.downloaders.transport.get")
 def test_simple_downloader_empty_zip_raises_no_data(mock_get):
     mock_get.return_value = Mock(status_code=200, content=_zip_bytes([]))
     d = SimpleDownloader("http://x/y.zip", verify_ssl=True)
@@ -0,0 +1,158 @@
+"""Tests for the single-pass checksum/validate/compress raw-file stage."""
+
+import base64
+import gzip
+import hashlib
+import io
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.download import _download_marketdata
+from brasa.engine.exceptions import (
+    DuplicatedFolderException,
+    InvalidContentException,
+)
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.util import generate_checksum_from_zip
+
+
+def _register(tmp_path, template_id, url, fmt, extra=""):
+    tpl_yaml = tmp_path / f"{template_id}.yaml"
+    tpl_yaml.write_text(
+        f"id: {template_id}\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        f"  url: {url}\n"
+        f"  format: {fmt}\n" + extra
+    )
+    _template_cache[template_id] = MarketDataTemplate(str(tpl_yaml))
+
+
+def _download(template_id, io_stats=None):
+    from brasa.engine.download import RawIOStats
+
+    stats = io_stats or RawIOStats()
+    meta = CacheMetadata(template_id)
+    _download_marketdata(meta, io_stats=stats)
+    return meta, stats
+
+
+def _read(rel_path):
+    with gzip.open(CacheManager().cache_path(rel_path)) as fp:
+        return fp.read()
+
+
+def _staging_folders(template_id):
+    folder = Path(CacheManager().cache_path(f"raw/{template_id}"))
+    return list(folder.glob("*.staging"))
+
+
+def test_plain_body_is_hashed_validated_and_compressed_in_one_pass(
+    stub_server, tmp_path
+):
+    body = json.dumps({"rows": list(range(5000))}).encode()
+    stub_server.add("/data.json", body)
+    _register(
+        tmp_path,
+        "test-fused-json",
+        stub_server.url("/data.json"),
+        "json",
+        "  validator: brasa.downloaders.validate_json_empty_file\n",
+    )
+
+    meta, stats = _download("test-fused-json")
+
+    assert meta.download_checksum == hashlib.md5(body).hexdigest()
+    assert meta.downloaded_files == [
+        str(Path(meta.download_folder) / "downloaded.json.gz")
+    ]
+    assert _read(meta.downloaded_files[0]) == body
+    assert stats.passes == 1
+    stages = stats.to_dict()["stages"]
+    assert stages["checksum"]["read"] == len(body)
+    assert stages["validate"]["read"] == len(body)
+    assert stages["compress"]["read"] == len(body)
+    assert 0 < stats.bytes_written < len(body)
+    assert not _staging_folders("test-fused-json")
+
+
+def test_zip_checksum_matches_structural_checksum(stub_server, tmp_path):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("b.txt", "beta")
+        zf.writestr("a.txt", "alpha")
+    stub_server.add("/bundle.zip", buf.getvalue())
+    _register(tmp_path, "test-fused-zip", stub_server.url("/bundle.zip"), "zip")
+
+    meta, stats = _download("test-fused-zip")
+
+    assert meta.download_checksum == generate_checksum_from_zip(buf)
+    assert [Path(f).name for f in meta.downloaded_files] == ["b.txt.gz", "a.txt.gz"]
+    assert _read(meta.downloaded_files[1]) == b"alpha"
+    assert stats.passes == 1
+    assert stats.stages["decode"].written == len("alphabeta")
+
+
+def test_base64_body_is_decoded_while_compressed(stub_server, tmp_path):
+    decoded = b"code,value\n" + b"1,2\n" * 500
+    encoded = base64.encodebytes(decoded)  # wrapped lines
+    stub_server.add("/data.b64", encoded)
+    _register(
+        tmp_path,
+        "test-fused-base64",
+        stub_server.url("/data.b64"),
+        "base64",
+        "  decoded_format: csv\n",
+    )
+
+    meta, stats = _download("test-fused-base64")
+
+    assert meta.download_checksum == hashlib.md5(encoded).hexdigest()
+    assert [Path(f).name for f in meta.downloaded_files] == ["decoded.csv.gz"]
+    assert _read(meta.downloaded_files[0]) == decoded
+    assert stats.stages["decode"].read == len(encoded)
+    assert stats.stages["decode"].written == len(decoded)
+
+
+def test_invalid_body_fails_after_the_duplicate_check(stub_server, tmp_path):
+    stub_server.add("/empty.json", b"[]")
+    _register(
+        tmp_path,
+        "test-fused-invalid",
+        stub_server.url("/empty.json"),
+        "json",
+        "  validator: brasa.downloaders.validate_json_empty_file\n",
+    )
+
+    with pytest.raises(InvalidContentException, match="JSON file is empty"):
+        _download("test-fused-invalid")
+    # The folder exists now (cleanup is the cache manager's job), so the
+    # same content is reported as a duplicate rather than as invalid.
+    with pytest.raises(DuplicatedFolderException):
+        _download("test-fused-invalid")
+    assert not _staging_folders("test-fused-invalid")
+
+
+def _gz_only_validator(fname):
+    if not fname.endswith(".gz"):
+        raise AssertionError(fname)
+
+
+def test_validator_without_stream_counterpart_rereads_stored_file(
+    stub_server, tmp_path
+):
+    stub_server.add("/data.csv", b"a,b\n1,2\n")
+    _register(tmp_path, "test-fused-custom", stub_server.url("/data.csv"), "csv")
+    _template_cache[
+        "test-fused-custom"
+    ].downloader.validate_function = _gz_only_validator
+
+    meta, stats = _download("test-fused-custom")
+
+    assert stats.passes == 2
+    assert stats.stages["validate"].read == 2 * len(b"a,b\n1,2\n")
+    assert _read(meta.downloaded_files[0]) == b"a,b\n1,2\n"
@@ -0,0 +1,164 @@
+"""Tests for the versioned migrations of the metadata database."""
+
+import sqlite3
+from contextlib import closing
+from datetime import date
+
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.migrations import SCHEMA_VERSION, migrate_meta_db, schema_version
+from brasa.engine.resources import package_path
+from brasa.engine.update_strategy import (
+    _get_last_downloaded_date,
+    _get_last_downloaded_end_date,
+)
+from brasa.util import DownloadArgs
+
+
+def _plan(conn, sql, params=()):
+    return " ".join(row[3] for row in conn.execute(f"explain query plan {sql}", params))
+
+
+def test_new_meta_db_is_at_current_version(temp_cache):
+    db_path = temp_cache.cache_path(temp_cache.meta_db_filename)
+    with closing(sqlite3.connect(db_path)) as conn:
+        assert schema_version(conn) == SCHEMA_VERSION
+        tables = {
+            row[0]
+            for row in conn.execute(
+                "select name from sqlite_master where type = 'table'"
+            )
+        }
+    assert "raw_blob_refs" in tables
+    assert migrate_meta_db(db_path) == []
+
+
+def test_lookups_use_indexes(temp_cache):
+    db_path = temp_cache.cache_path(temp_cache.meta_db_filename)
+    with closing(sqlite3.connect(db_path)) as conn:
+        plan = _plan(conn, "select id from cache_metadata where template = ?", ("tpl",))
+        assert "INDEX idx_cache_metadata_template_" in plan
+        plan = _plan(
+            conn,
+            "select id from cache_metadata where template = ? and download_args = ?",
+            ("tpl", "{}"),
+        )
+        assert "idx_cache_metadata_template_args" in plan
+        plan = _plan(
+            conn,
+            "select count(*) from download_trials where cache_id = ? and timestamp >= ?",
+            ("id", "2024-01-01"),
+        )
+        assert "idx_download_trials_cache_id_timestamp" in plan
+
+
+def test_unversioned_meta_db_is_upgraded_in_place(tmp_path, monkeypatch):
+    (tmp_path / "meta").mkdir()
+    db_path = tmp_path / "meta" / "meta.db"
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.executescript(package_path("sql", "create-meta-db.sql").read_text())
+        conn.execute(
+            "insert into cache_metadata (id, template, download_args) "
+            "values ('a', 'tpl', '{}')"
+        )
+        conn.execute(
+            "insert into download_trials (cache_id, timestamp, downloaded) "
+            "values ('a', '2024-01-01', '1')"
+        )
+        assert schema_version(conn) == 0
+
+    original = CacheManager.__dict__.get("__it__")
+    monkeypatch.setenv("BRASA_DATA_PATH", str(tmp_path))
+    CacheManager.__it__ = None
+    try:
+        CacheManager()
+    finally:
+        CacheManager.__it__ = original
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        assert schema_version(conn) == SCHEMA_VERSION
+        indexes = {
+            row[0]
+            for row in conn.execute(
+                "select name from sqlite_master where type = 'index'"
+            )
+        }
+        assert conn.execute("select id from cache_metadata").fetchall() == [("a",)]
+        assert conn.execute("select count(*) from download_trials").fetchone() == (1,)
+    assert {
+        "idx_cache_metadata_template_args",
+        "idx_download_trials_cache_id_timestamp",
+    } <= indexes
+
+
+def test_migrations_resume_from_recorded_version(tmp_path):
+    db_path = str(tmp_path / "meta.db")
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.executescript(package_path("sql", "create-meta-db.sql").read_text())
+        conn.execute(f"pragma user_version = {SCHEMA_VERSION - 1}")
+
+    assert migrate_meta_db(db_path) == [SCHEMA_VERSION]
+    assert migrate_meta_db(db_path) == []
+
+
+def _typed_columns(conn, meta_id):
+    return conn.execute(
+        "select refdate, start_date, end_date, year, is_processed "
+        "from cache_metadata where id = ?",
+        (meta_id,),
+    ).fetchone()
+
+
+def test_save_meta_fills_typed_columns(temp_cache):
+    meta = CacheMetadata("tpl")
+    meta.download_args = DownloadArgs(
+        {"refdate": date(2024, 3, 1), "start": "2024-01-01", "year": 2024}
+    )
+    temp_cache.save_meta(meta)
+    with temp_cache.meta_db() as conn:
+        assert _typed_columns(conn, meta.id) == (
+            "2024-03-01",
+            "2024-01-01",
+            None,
+            2024,
+            0,
+        )
+
+    meta.mark_as_processed()
+    temp_cache.save_meta(meta)
+    with temp_cache.meta_db() as conn:
+        assert _typed_columns(conn, meta.id)[4] == 1
+
+
+def test_typed_columns_are_backfilled(tmp_path):
+    db_path = str(tmp_path / "meta.db")
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.executescript(package_path("sql", "create-meta-db.sql").read_text())
+        conn.executemany(
+            "insert into cache_metadata (id, template, download_args, processed_files) "
+            "values (?, 'tpl', ?, ?)",
+            [
+                ("a", '{"refdate": "2024-01-02T00:00:00"}', "true"),
+                ("b", '{"end": "2024-02-01", "year": "2021"}', '{"f.parquet": "x"}'),
+                ("c", "not json", "{}"),
+            ],
+        )
+        # Before the typed columns (migration 4)
+        conn.execute("pragma user_version = 3")
+
+    migrate_meta_db(db_path)
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        assert _typed_columns(conn, "a") == ("2024-01-02", None, None, None, 1)
+        assert _typed_columns(conn, "b") == (None, None, "2024-02-01", 2021, 1)
+        assert _typed_columns(conn, "c") == (None, None, None, None, 0)
+
+
+def test_last_downloaded_dates_come_from_typed_columns(temp_cache):
+    for refdate in ("2024-01-05", "2024-03-01", "2023-12-29"):
+        meta = CacheMetadata("tpl")
+        meta.download_args = DownloadArgs({"refdate": refdate, "end": refdate})
+        temp_cache.save_meta(meta)
+
+    assert _get_last_downloaded_date("tpl") == date(2024, 3, 1)
+    assert _get_last_downloaded_end_date("tpl") == date(2024, 3, 1)
+    assert _get_last_downloaded_date("other") is None
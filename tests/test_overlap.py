@@ -0,0 +1,168 @@
+"""Tests for overlapped download and processing (``download --process``)."""
+
+import io
+import threading
+from functools import partial
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import pytest
+from rich.console import Console
+
+import brasa
+from brasa import cli
+from brasa.engine.api import _run_acquisition
+from brasa.engine.overlap import (
+    OrderedResults,
+    ProcessingQueue,
+    attach_processing_result,
+)
+from brasa.engine.reporting import TaskReport, TaskResult, TaskStatus, Verbosity
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _result(status=TaskStatus.PASSED, operation="download", duration=1.0):
+    return TaskResult(
+        status=status,
+        operation=operation,
+        template_name="t",
+        duration_seconds=duration,
+    )
+
+
+def test_queue_blocks_acquisition_while_full():
+    release = threading.Event()
+
+    def process(meta):
+        release.wait(5)
+        return _result(operation="process", duration=0.5)
+
+    processing = ProcessingQueue(process, workers=1, maxsize=1)
+    results = [_result() for _ in range(3)]
+    processing.put("a", results[0])  # taken by the thread, which blocks
+    processing.put("b", results[1])  # fills the queue
+
+    third = threading.Thread(target=processing.put, args=("c", results[2]))
+    third.start()
+    third.join(0.2)
+    assert third.is_alive()
+
+    release.set()
+    third.join(5)
+    processing.close()
+
+    assert len(processing.results) == 3
+    for result in results:
+        assert result.extra_info["process_status"] == "passed"
+        assert result.extra_info["download_seconds"] == "1.0"
+        assert result.extra_info["process_seconds"] == "0.5"
+        assert float(result.extra_info["queue_seconds"]) >= 0
+
+
+def test_processing_error_becomes_the_entry_result():
+    result = _result()
+    failed = _result(TaskStatus.ERROR, operation="process")
+    failed.error_type = "ValueError"
+    failed.error_message = "bad field"
+
+    attach_processing_result(result, failed, 0.0)
+
+    assert result.status == TaskStatus.ERROR
+    assert result.operation == "process"
+    assert result.error_message == "bad field"
+    assert result.extra_info["process_status"] == "error"
+
+
+def test_report_summary_counts_processed_entries():
+    buf = io.StringIO()
+    report = TaskReport(
+        "download",
+        "tpl",
+        Verbosity.NORMAL,
+        console=Console(file=buf, force_terminal=False, width=200),
+    )
+    report.start(total=2)
+    for _ in range(2):
+        result = _result()
+        attach_processing_result(result, _result(operation="process"), 0.0)
+        report.add_result(result)
+    report.finish()
+    assert "2 passed, 2 processed" in buf.getvalue()
+
+
+def test_results_reach_the_report_after_processing():
+    release = threading.Event()
+
+    def process(meta):
+        release.wait(5)
+        return _result(operation="process")
+
+    processing = ProcessingQueue(process, workers=1)
+    added = []
+    results = OrderedResults(
+        lambda r: added.append((r, r.extra_info.get("process_status"))), processing
+    )
+    queued, skipped = _result(), _result(TaskStatus.SKIPPED)
+    processing.put("a", queued)
+    results.append(queued)
+    results.append(skipped)  # not queued, but after a pending entry
+    assert added == []
+
+    release.set()
+    processing.close()
+    results.release()
+
+    assert added == [(queued, "passed"), (skipped, None)]
+
+
+def test_unexpected_errors_surface_on_close():
+    processing = ProcessingQueue(partial(dict.__getitem__, {}), workers=2)
+    processing.put("missing", _result())
+    with pytest.raises(KeyError):
+        processing.close()
+
+
+def test_acquired_entries_are_processed(temp_cache):
+    from brasa.downloaders import local_file_import
+
+    fixture = DATA_DIR / "BD_Arbit.txt"
+    if not fixture.exists():
+        pytest.skip(f"Test data file not found: {fixture}")
+    template = brasa.retrieve_template("b3-derivatives-daily")
+
+    report = _run_acquisition(
+        template,
+        template.id,
+        {"refdate": "2015-09-25"},
+        operation="import",
+        force=False,
+        verbosity=brasa.Verbosity.QUIET,
+        report_file=None,
+        acquisition_function=partial(local_file_import, _import_path=str(fixture)),
+        retry_attempts_override=0,
+        process=True,
+        process_workers=2,
+    )
+
+    (result,) = report.results
+    assert result.status == TaskStatus.PASSED
+    assert result.is_processed
+    assert result.extra_info["process_status"] == "passed"
+    assert {"download_seconds", "queue_seconds", "process_seconds"} <= set(
+        result.extra_info
+    )
+    folder = temp_cache.cache_path(temp_cache.db_folder(template))
+    assert ds.dataset(folder, format="parquet", partitioning="hive").count_rows() == 45
+    with temp_cache.meta_db() as conn:
+        assert conn.execute(
+            "select count(*) from cache_metadata where is_processed = 1"
+        ).fetchone() == (1,)
+
+
+def test_cli_rejects_process_with_plan(tmp_path, capsys):
+    plan = tmp_path / "plan.yaml"
+    plan.write_text("templates: []\n")
+    with pytest.raises(SystemExit):
+        cli.main(["download", "--plan", str(plan), "--process"])
+    assert "--process is not supported with --plan" in capsys.readouterr().err
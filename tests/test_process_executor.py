@@ -0,0 +1,101 @@
+"""Tests for ``process_marketdata(executor="process")``."""
+
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import pytest
+
+import brasa
+from brasa.engine.api import process_marketdata
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.catalog import DatasetCatalog
+from brasa.engine.processing import _read_marketdata_in_worker
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+TEMPLATE = "b3-derivatives-daily"
+
+
+def test_unknown_executor_is_rejected():
+    with pytest.raises(ValueError, match="Unknown executor"):
+        process_marketdata(TEMPLATE, executor="fiber")
+
+
+def _import_fixture(tmp_path, copies=1):
+    fixture = DATA_DIR / "BD_Arbit.txt"
+    if not fixture.exists():
+        pytest.skip(f"Test data file not found: {fixture}")
+    content = fixture.read_bytes()
+    for n in range(copies):
+        # Trailing blank lines give each copy its own checksum
+        path = tmp_path / f"BD_Arbit-{n}.txt"
+        path.write_bytes(content + b"\n" * n)
+        brasa.import_marketdata(
+            TEMPLATE,
+            path=str(path),
+            refdate=f"2015-09-{25 + n}",
+            verbosity=brasa.Verbosity.QUIET,
+        )
+
+
+def test_process_executor_end_to_end(tmp_path):
+    _import_fixture(tmp_path)
+
+    report = process_marketdata(
+        TEMPLATE,
+        reprocess=True,
+        verbosity=brasa.Verbosity.QUIET,
+        max_workers=2,
+        executor="process",
+    )
+
+    assert report.results
+    assert all(r.status.name == "PASSED" for r in report.results)
+    cache = CacheManager()
+    folder = cache.cache_path(cache.db_folder(brasa.retrieve_template(TEMPLATE)))
+    table = ds.dataset(folder, format="parquet", partitioning="hive").to_table()
+    assert table.num_rows == 45
+    with cache.meta_db() as conn:
+        assert conn.execute(
+            "select count(*) from cache_metadata "
+            "where template = ? and is_processed = 0",
+            (TEMPLATE,),
+        ).fetchone() == (0,)
+
+
+def test_worker_defers_catalog_registration(tmp_path):
+    _import_fixture(tmp_path)
+    cache = CacheManager()
+    with cache.meta_db() as conn:
+        (meta_id,) = conn.execute(
+            "select id from cache_metadata where template = ?", (TEMPLATE,)
+        ).fetchone()
+    meta = CacheMetadata(TEMPLATE)
+    meta.from_dict(cache._load_meta_dict_by_id(meta_id))
+    dataset = brasa.retrieve_template(TEMPLATE).writer.dataset
+    before = DatasetCatalog().get_dataset_info("input", dataset)
+
+    is_processed, _, registrations = _read_marketdata_in_worker(meta)
+
+    assert is_processed
+    assert DatasetCatalog().get_dataset_info("input", dataset) == before
+    assert [(r["layer"], r["dataset_name"]) for r in registrations] == [
+        ("input", dataset)
+    ]
+
+
+def test_several_workers_register_through_parent(tmp_path):
+    _import_fixture(tmp_path, copies=3)
+
+    report = process_marketdata(
+        TEMPLATE,
+        reprocess=True,
+        verbosity=brasa.Verbosity.QUIET,
+        max_workers=3,
+        executor="process",
+    )
+
+    assert [r.status.name for r in report.results] == ["PASSED"] * 3
+    dataset = brasa.retrieve_template(TEMPLATE).writer.dataset
+    info = DatasetCatalog().get_dataset_info("input", dataset)
+    assert info is not None
+    assert info.source_template == TEMPLATE
@@ -0,0 +1,90 @@
+"""Tests for the shared per-host token-bucket rate limiter."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from brasa.engine import throttle
+from brasa.engine.template import MarketDataDownloader
+from brasa.engine.throttle import (
+    HostThrottle,
+    RateLimit,
+    TokenBucket,
+    template_rate_limit,
+)
+
+
+def _downloader(**extra):
+    return MarketDataDownloader(
+        {
+            "function": "brasa.downloaders.simple_download",
+            "url": "https://example.invalid/x",
+            **extra,
+        }
+    )
+
+
+def _reserve(db_path):
+    return TokenBucket(db_path).reserve("proc.invalid", RateLimit(10.0))
+
+
+class TestTokenBucket:
+    def test_burst_then_spaced_reservations(self, tmp_path):
+        bucket = TokenBucket(str(tmp_path / "rl.db"))
+        limit = RateLimit(rate=10.0, burst=2)
+        waits = [bucket.reserve("host.invalid", limit) for _ in range(4)]
+        assert waits[0] == 0
+        assert waits[1] == 0
+        assert waits[2] == pytest.approx(0.1, abs=0.02)
+        assert waits[3] == pytest.approx(0.2, abs=0.02)
+
+    def test_hosts_have_independent_buckets(self, tmp_path):
+        bucket = TokenBucket(str(tmp_path / "rl.db"))
+        assert bucket.reserve("a.invalid", RateLimit(1.0)) == 0
+        assert bucket.reserve("b.invalid", RateLimit(1.0)) == 0
+        assert bucket.reserve("a.invalid", RateLimit(1.0)) > 0.9
+
+    def test_bucket_is_shared_across_processes(self, tmp_path):
+        db_path = str(tmp_path / "rl.db")
+        TokenBucket(db_path)
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=3, mp_context=ctx) as pool:
+            waits = sorted(pool.map(_reserve, [db_path] * 3))
+        assert waits[0] == 0
+        assert waits[1] == pytest.approx(0.1, abs=0.05)
+        assert waits[2] == pytest.approx(0.2, abs=0.05)
+
+
+class TestRateLimitResolution:
+    def test_template_rate_limit_precedence(self):
+        assert template_rate_limit(_downloader()) is None
+        assert template_rate_limit(_downloader(download_delay=2)) == RateLimit(0.5)
+        assert template_rate_limit(
+            _downloader(download_delay=2, rate_limit=4, rate_burst=3)
+        ) == RateLimit(4.0, 3)
+
+    def test_global_config_applies_per_host_and_default(self, monkeypatch):
+        monkeypatch.setattr(
+            throttle,
+            "load_config",
+            lambda: {
+                "rate_limits": {
+                    "default": 5,
+                    "api.bcb.gov.br": {"rate": 1.0, "burst": 2},
+                }
+            },
+        )
+        host_throttle = HostThrottle()
+        monkeypatch.setattr(host_throttle, "_rate_limits", None)
+
+        assert host_throttle.rate_limit("api.bcb.gov.br", None) == RateLimit(1.0, 2)
+        assert host_throttle.rate_limit("other.invalid", None) == RateLimit(5.0)
+        assert host_throttle.rate_limit("api.bcb.gov.br", RateLimit(0.5)) == (
+            RateLimit(0.5)
+        )
+
+    def test_from_config_rejects_non_positive_rates(self):
+        assert RateLimit.from_config(0) is None
+        assert RateLimit.from_config({"burst": 3}) is None
+        assert RateLimit.from_config({"rate": 2, "burst": 0}) == RateLimit(2.0, 1)
@@ -0,0 +1,149 @@
+"""Tests for configurable raw-file codecs (gzip / zstd) and transparent readers."""
+
+import gzip
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.download import RawIOStats, _download_marketdata, template_raw_codec
+from brasa.engine.pipeline.context import PipelineContext
+from brasa.engine.pipeline.steps.b3_steps import B3ReadBdinFwfStep
+from brasa.engine.pipeline.steps.io_steps import ReadCsvStep, ReadFwfStep, ReadJsonStep
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.util import RawCodec, compress_chunks, open_raw_file, raw_file_codec
+
+zstandard = pytest.importorskip("zstandard")
+
+
+def test_raw_codec_from_config_fills_missing_keys_from_base():
+    base = RawCodec("zstd", level=9, threads=4)
+
+    assert RawCodec.from_config("gzip") == RawCodec("gzip")
+    assert RawCodec.from_config({"level": 1}, base) == RawCodec("zstd", 1, 4)
+    # The base level belongs to the base codec
+    assert RawCodec.from_config({"codec": "gzip"}, base) == RawCodec("gzip", None, 4)
+    with pytest.raises(ValueError, match="unknown raw codec"):
+        RawCodec("lz4")
+
+
+@pytest.mark.parametrize("codec", [RawCodec("gzip", 1), RawCodec("zstd", 3, -1)])
+def test_compressed_file_round_trips_through_open_raw_file(tmp_path, codec):
+    target = tmp_path / f"data.csv{codec.suffix}"
+    seen = []
+
+    size = compress_chunks([b"a,b\n", b"1,2\n"], target, [seen.append], codec)
+
+    assert size == 8
+    assert seen == [b"a,b\n", b"1,2\n"]
+    assert raw_file_codec(target) == codec.name
+    with open_raw_file(target, "rt", encoding="utf-8") as fp:
+        assert fp.readline() == "a,b\n"
+        assert fp.read() == "1,2\n"
+
+
+def test_codec_is_sniffed_from_magic_bytes_without_suffix(tmp_path):
+    gz = tmp_path / "gzip-body"
+    gz.write_bytes(gzip.compress(b"gzipped"))
+    zst = tmp_path / "zstd-body"
+    zst.write_bytes(zstandard.ZstdCompressor().compress(b"zstd"))
+    plain = tmp_path / "plain-body"
+    plain.write_bytes(b"plain")
+
+    assert [raw_file_codec(f) for f in (gz, zst, plain)] == ["gzip", "zstd", None]
+    for fname, content in ((gz, b"gzipped"), (zst, b"zstd"), (plain, b"plain")):
+        with open_raw_file(fname) as fp:
+            assert fp.read() == content
+
+
+def _context(path, reader_config=None):
+    meta = MagicMock()
+    meta.downloaded_files = [str(path)]
+    context = PipelineContext(meta=meta, reader_config=reader_config or {})
+    return context, patch.object(
+        PipelineContext, "downloaded_file", property(lambda self: str(path))
+    )
+
+
+def _zst(tmp_path, name, content):
+    target = tmp_path / name
+    compress_chunks([content], target, codec=RawCodec("zstd"))
+    return target
+
+
+def test_reader_steps_read_zstd_files(tmp_path):
+    csv_file = _zst(tmp_path, "data.csv.zst", b"# note\na;b\n1;2\n")
+    context, downloaded = _context(csv_file, {"separator": ";"})
+    with downloaded:
+        df = ReadCsvStep({"skip_if_startswith": "#", "skip": 1}).execute(None, context)
+    assert df.to_dict("list") == {"a": [1], "b": [2]}
+
+    fwf_file = _zst(tmp_path, "data.txt.zst", b"AB12\nCD34\n")
+    context, downloaded = _context(fwf_file)
+    with downloaded:
+        df = ReadFwfStep(
+            {"colspecs": [[0, 2], [2, 4]], "names": ["code", "value"]}
+        ).execute(None, context)
+    assert df["code"].tolist() == ["AB", "CD"]
+
+    json_file = _zst(tmp_path, "data.json.zst", json.dumps({"r": [{"x": 1}]}).encode())
+    context, downloaded = _context(json_file)
+    with downloaded:
+        df = ReadJsonStep({"path": "r"}).execute(None, context)
+    assert df["x"].tolist() == [1]
+
+    lines = B3ReadBdinFwfStep({})._read_lines(str(fwf_file), "latin1")
+    assert lines == ["AB12", "CD34"]
+
+
+def _register(tmp_path, url, extra=""):
+    tpl_yaml = tmp_path / "test-raw-codec.yaml"
+    tpl_yaml.write_text(
+        "id: test-raw-codec\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        f"  url: {url}\n"
+        "  format: csv\n" + extra
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template.id] = template
+    return template
+
+
+def test_template_codec_overrides_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "brasa.engine.download.load_config",
+        lambda: {"raw_storage": {"codec": "zstd", "level": 7, "threads": 2}},
+    )
+    template = _register(tmp_path, "http://localhost/x.csv")
+    assert template_raw_codec(template.downloader) == RawCodec("zstd", 7, 2)
+
+    template = _register(
+        tmp_path, "http://localhost/x.csv", "  raw_codec: gzip\n  raw_level: 1\n"
+    )
+    assert template_raw_codec(template.downloader) == RawCodec("gzip", 1, 2)
+
+
+def test_download_stores_zstd_raw_file(stub_server, tmp_path):
+    body = b"code,value\n" + b"ABC,1\n" * 1000
+    stub_server.add("/data.csv", body)
+    _register(tmp_path, stub_server.url("/data.csv"), "  raw_codec: zstd\n")
+
+    meta = CacheMetadata("test-raw-codec")
+    stats = RawIOStats()
+    _download_marketdata(meta, io_stats=stats)
+
+    (fname,) = meta.downloaded_files
+    assert fname.endswith("downloaded.csv.zst")
+    with open_raw_file(CacheManager().cache_path(fname)) as fp:
+        assert fp.read() == body
+    assert 0 < stats.bytes_written < len(body)
+
+
+def test_open_raw_file_reads_binary_buffers(tmp_path):
+    target = _zst(tmp_path, "blob.bin.zst", bytes(range(256)) * 10)
+    with open_raw_file(target) as fp:
+        assert isinstance(fp, io.BufferedReader)
+        assert fp.read(3) == b"\x00\x01\x02"
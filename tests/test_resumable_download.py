@@ -0,0 +1,179 @@
+"""Tests for resumable streamed downloads (``.part`` files + HTTP Range)."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.util import DownloadArgs
+
+_BODY = bytes(range(256)) * 2048  # 512 KiB
+_NEW_BODY = bytes(reversed(_BODY))
+
+
+class _FlakyRangeHandler(BaseHTTPRequestHandler):
+    """Breaks the first transfer halfway; honours Range when enabled.
+
+    With ``change_body`` the remote file is replaced by ``_NEW_BODY`` (and a
+    new ETag) right after the first request.
+    """
+
+    protocol_version = "HTTP/1.1"
+    accept_ranges = True
+    honour_range = True
+    etag = '"v1"'
+    body = _BODY
+    change_body = False
+    range_shift = 0
+    requests_seen: ClassVar[list] = []
+    if_range_seen: ClassVar[list] = []
+
+    def do_GET(self):
+        cls = type(self)
+        cls.requests_seen.append(self.headers.get("Range"))
+        cls.if_range_seen.append(self.headers.get("If-Range"))
+        first = len(cls.requests_seen) == 1
+        body, etag = cls.body, cls.etag
+        if first and cls.change_body:
+            cls.body, cls.etag = _NEW_BODY, '"v2"'
+        start = 0
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and cls.honour_range and if_range in (None, etag):
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            start -= cls.range_shift
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+            )
+        else:
+            self.send_response(200)
+        if cls.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if etag:
+            self.send_header("ETag", etag)
+        payload = body[start:]
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if first:
+            self.wfile.write(payload[: len(payload) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_template(tmp_path):
+    _FlakyRangeHandler.requests_seen = []
+    _FlakyRangeHandler.if_range_seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyRangeHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    tpl_yaml = tmp_path / "test-resumable.yaml"
+    tpl_yaml.write_text(
+        "id: test-resumable\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        f"  url: http://127.0.0.1:{httpd.server_port}/archive.bin\n"
+        "  format: bin\n"
+        "  stream: true\n"
+        "  retry_attempts: 1\n"
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template.id] = template
+    yield template
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _download(template):
+    meta = CacheMetadata(template.id)
+    meta.download_args = DownloadArgs({})
+    result = CacheManager().download_marketdata(meta)
+    return meta, result
+
+
+def _stored_body(meta):
+    import gzip
+
+    (fname,) = meta.downloaded_files
+    with gzip.open(CacheManager().cache_path(fname), "rb") as fp:
+        return fp.read()
+
+
+def test_interrupted_transfer_resumes_with_range(flaky_template):
+    meta, result = _download(flaky_template)
+
+    assert result.status_name == "PASSED"
+    assert result.retry_attempts_used == 1
+    assert _FlakyRangeHandler.requests_seen == [None, f"bytes={len(_BODY) // 2}-"]
+    assert _FlakyRangeHandler.if_range_seen == [None, '"v1"']
+    assert _stored_body(meta) == _BODY
+    part = CacheManager().partial_download_path(meta)
+    assert not Path(part).exists()
+    assert not Path(f"{part}.validator").exists()
+    assert CacheManager().count_trials(meta) == 2
+
+
+def test_server_ignoring_range_falls_back_to_full_fetch(flaky_template, monkeypatch):
+    monkeypatch.setattr(_FlakyRangeHandler, "honour_range", False)
+    meta, result = _download(flaky_template)
+
+    assert result.status_name == "PASSED"
+    assert _FlakyRangeHandler.requests_seen[1] is not None
+    assert _stored_body(meta) == _BODY
+
+
+def test_no_accept_ranges_restarts_from_zero(flaky_template, monkeypatch):
+    monkeypatch.setattr(_FlakyRangeHandler, "accept_ranges", False)
+    meta, result = _download(flaky_template)
+
+    assert result.status_name == "PASSED"
+    assert _FlakyRangeHandler.requests_seen == [None, None]
+    assert _stored_body(meta) == _BODY
+
+
+def test_changed_remote_file_is_fetched_in_full(flaky_template, monkeypatch):
+    monkeypatch.setattr(_FlakyRangeHandler, "change_body", True)
+    monkeypatch.setattr(_FlakyRangeHandler, "body", _BODY)
+    monkeypatch.setattr(_FlakyRangeHandler, "etag", '"v1"')
+    meta, result = _download(flaky_template)
+
+    # If-Range carries the old ETag, so the server sends the new file whole
+    assert result.status_name == "PASSED"
+    assert _FlakyRangeHandler.if_range_seen == [None, '"v1"']
+    assert _stored_body(meta) == _NEW_BODY
+
+
+def test_mismatched_content_range_discards_the_part(flaky_template, monkeypatch):
+    monkeypatch.setattr(_FlakyRangeHandler, "range_shift", 1)
+    meta, result = _download(flaky_template)
+
+    assert result.status_name == "FAILED"
+    assert not Path(CacheManager().partial_download_path(meta)).exists()
+
+
+def test_part_without_validator_from_earlier_run_is_dropped(
+    flaky_template, monkeypatch
+):
+    monkeypatch.setattr(_FlakyRangeHandler, "etag", None)
+    meta = CacheMetadata(flaky_template.id)
+    meta.download_args = DownloadArgs({})
+    part = Path(CacheManager().partial_download_path(meta))
+    part.parent.mkdir(parents=True, exist_ok=True)
+    part.write_bytes(b"stale bytes of another version")
+
+    meta, result = _download(flaky_template)
+
+    # Only the part written by the first attempt of this run is resumed
+    assert result.status_name == "PASSED"
+    assert _FlakyRangeHandler.requests_seen == [None, f"bytes={len(_BODY) // 2}-"]
+    assert _stored_body(meta) == _BODY
@@ -0,0 +1,137 @@
+"""Tests for streaming downloads written straight to disk (``stream: true``)."""
+
+import hashlib
+import io
+import tempfile
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+import brasa
+from brasa.downloaders.downloaders import SimpleDownloader
+from brasa.engine.api import _run_acquisition
+from brasa.engine.cache import CacheManager, CacheMetadata
+from brasa.engine.exceptions import DownloadException, NoDataException
+from brasa.engine.template import MarketDataTemplate, _template_cache
+from brasa.util import DownloadArgs, DownloadedFile
+
+
+def _zip_bytes(entries):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+_BODIES = {
+    "/data.zip": _zip_bytes({"data.txt": b"x" * 300_000}),
+    "/empty.zip": _zip_bytes({}),
+    "/html.zip": b"<html>maintenance</html>",
+    "/data.csv": b"code,value\n1,2\n" * 1000,
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = _BODIES.get(self.path)
+        self.send_response(200 if body is not None else 404)
+        body = body or b""
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _streaming(url, fmt):
+    dl = SimpleDownloader(url, verify_ssl=True)
+    dl.fmt = fmt
+    dl.stream = True
+    return dl
+
+
+def test_stream_writes_body_to_disk_with_md5(server):
+    fp = _streaming(f"{server}/data.csv", "csv").download()
+    try:
+        assert isinstance(fp, DownloadedFile)
+        assert fp.md5 == hashlib.md5(_BODIES["/data.csv"]).hexdigest()
+        assert fp.read() == _BODIES["/data.csv"]
+    finally:
+        fp.close()
+        Path(fp.name).unlink()
+
+
+def test_stream_empty_zip_raises_no_data_and_removes_file(server, monkeypatch):
+    created = []
+    real_mkstemp = tempfile.mkstemp
+
+    def spy(*args, **kwargs):
+        fd, path = real_mkstemp(*args, **kwargs)
+        created.append(path)
+        return fd, path
+
+    monkeypatch.setattr(tempfile, "mkstemp", spy)
+    with pytest.raises(NoDataException):
+        _streaming(f"{server}/empty.zip", "zip").download()
+    with pytest.raises(DownloadException, match="not a valid zip"):
+        _streaming(f"{server}/html.zip", "zip").download()
+    with pytest.raises(DownloadException, match="status_code = 404"):
+        _streaming(f"{server}/missing.zip", "zip").download()
+    assert len(created) == 3
+    assert not any(Path(p).exists() for p in created)
+
+
+def test_streamed_body_is_moved_into_download_folder(tmp_path):
+    tpl_yaml = tmp_path / "test-streamed-move.yaml"
+    tpl_yaml.write_text(
+        "id: test-streamed-move\n"
+        "downloader:\n"
+        "  function: brasa.downloaders.simple_download\n"
+        "  url: http://stream.invalid/file\n"
+        "  format: csv\n"
+        "  stream: true\n"
+        "  args:\n"
+        "    code: ~\n"
+    )
+    template = MarketDataTemplate(str(tpl_yaml))
+    _template_cache[template.id] = template
+    spooled = tmp_path / "spooled.part"
+    spooled.write_bytes(b"code,value\n1,2\n")
+
+    def acquire(_md, code):
+        return DownloadedFile(spooled, "d41d8cd98f00b204e9800998ecf8427e"), {}
+
+    report = _run_acquisition(
+        template,
+        template.id,
+        {"code": [1]},
+        operation="download",
+        force=False,
+        verbosity=brasa.Verbosity.QUIET,
+        report_file=None,
+        acquisition_function=acquire,
+    )
+
+    assert report.results[0].status.name == "PASSED"
+    assert not spooled.exists()
+    meta = CacheMetadata(template.id)
+    meta.download_args = DownloadArgs({"code": 1})
+    CacheManager().load_meta(meta)
+    assert meta.download_checksum == "d41d8cd98f00b204e9800998ecf8427e"
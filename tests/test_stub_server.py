@@ -0,0 +1,59 @@
+"""Tests for the local stub server and the download benchmark harness."""
+
+import time
+
+from brasa.downloaders import transport
+from tests import benchmark_downloads
+from tests.stub_server import cotahist_zip, paged_json
+
+
+def test_latency_and_error_injection(stub_server):
+    stub_server.add("/f.zip", b"PK-body", latency=0.05, errors={1: 503, 2: "empty"})
+
+    started = time.perf_counter()
+    first = transport.get(stub_server.url("/f.zip"), timeout=5)
+    assert time.perf_counter() - started >= 0.05
+    assert first.status_code == 503
+    second = transport.get(stub_server.url("/f.zip"), timeout=5)
+    assert (second.status_code, second.content) == (200, b"")
+    third = transport.get(stub_server.url("/f.zip"), timeout=5)
+    assert third.content == b"PK-body"
+    assert stub_server.hits["/f.zip"] == 3
+    assert transport.get(stub_server.url("/missing"), timeout=5).status_code == 404
+
+
+def test_bandwidth_cap_slows_body(stub_server):
+    stub_server.add("/big", b"x" * 20_000, bandwidth=100_000)
+    started = time.perf_counter()
+    assert len(transport.get(stub_server.url("/big"), timeout=5).content) == 20_000
+    assert time.perf_counter() - started >= 0.15
+
+
+def test_paged_json_serves_b3_paged_downloader(stub_server):
+    from brasa.downloaders.downloaders import B3PagedURLEncodedDownloader
+
+    stub_server.add("/paged/", paged_json(250), prefix=True)
+    downloader = B3PagedURLEncodedDownloader(
+        stub_server.url("/paged/index"), verify_ssl=True, index="X"
+    )
+    data = downloader.download().read()
+    assert data.count(b'"code"') == 250
+    assert stub_server.hits["/paged/"] == 3
+
+
+def test_cotahist_zip_is_valid_zip():
+    from brasa.downloaders.downloaders import validate_download_content
+
+    validate_download_content(cotahist_zip(10), "zip")
+
+
+def test_benchmark_harness_reports_throughput():
+    results = benchmark_downloads.run(
+        n_files=3, jobs=2, n_records=50, fail_every=4, scenarios=("cotahist", "sgs")
+    )
+    assert [r.name for r in results] == ["cotahist", "sgs", "plan"]
+    for result in results:
+        assert result.files == (6 if result.name == "plan" else 3)
+        assert result.bytes > 0
+        assert result.trial_writes > 0
+        assert result.files_per_second > 0
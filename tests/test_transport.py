@@ -0,0 +1,83 @@
+"""Tests for the pooled HTTP transport shared by the downloaders."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from brasa.downloaders import transport
+from brasa.downloaders.downloaders import SimpleDownloader
+from brasa.downloaders.helpers import _apply_download_config
+from brasa.engine.template import MarketDataDownloader
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"code,value\n1,2\n"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    transport.HTTPTransport().reset()
+    yield f"127.0.0.1:{httpd.server_port}"
+    transport.HTTPTransport().reset()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_consecutive_downloads_reuse_connection(server):
+    for i in range(5):
+        dl = SimpleDownloader(f"http://{server}/file{i}.csv", verify_ssl=True)
+        assert dl.download().read() == b"code,value\n1,2\n"
+
+    stats = transport.HTTPTransport().stats()[server]
+    assert stats.requests == 5
+    assert stats.new_connections == 1
+    assert stats.reused_connections == 4
+
+
+def test_pool_size_bounds_kept_connections(server):
+    barrier = threading.Barrier(4)
+
+    def fetch():
+        barrier.wait()
+        transport.get(f"http://{server}/f", pool_size=2, timeout=5)
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # At most two connections stay in the pool, so a second burst reuses
+    # those and opens new ones only for the rest.
+    before = transport.HTTPTransport().stats()[server].new_connections
+    for _ in range(2):
+        transport.get(f"http://{server}/f", timeout=5)
+    after = transport.HTTPTransport().stats()[server].new_connections
+    assert after == before
+
+
+def test_pool_size_applied_from_template():
+    md = MarketDataDownloader(
+        {
+            "function": "brasa.downloaders.simple_download",
+            "url": "http://example.invalid/x",
+            "pool_size": 3,
+            "timeout": 15,
+        }
+    )
+    dl = _apply_download_config(SimpleDownloader(md.url, md.verify_ssl), md)
+    assert dl.pool_size == 3
+    assert dl.timeout == 15
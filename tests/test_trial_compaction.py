@@ -0,0 +1,141 @@
+"""Tests for download trial retention and ``brasa cache compact``."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from brasa import cli
+from brasa.engine.cache import CacheMetadata
+from brasa.engine.compaction import compact_meta_db, maybe_compact
+from brasa.util import DownloadArgs
+
+_OLD = (datetime.now() - timedelta(days=200)).isoformat()
+_RECENT = (datetime.now() - timedelta(days=1)).isoformat()
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    values = {}
+    monkeypatch.setattr(
+        "brasa.engine.compaction.load_config",
+        lambda: {"trial_retention": values},
+    )
+    return values
+
+
+def _meta(i: int = 0) -> CacheMetadata:
+    meta = CacheMetadata("test-compaction")
+    meta.download_args = DownloadArgs({"i": i})
+    return meta
+
+
+def _add_trials(cache, meta, *trials) -> None:
+    with cache.meta_db() as conn:
+        conn.executemany(
+            "insert into download_trials (cache_id, timestamp, downloaded, "
+            "status_code, status_name) values (?, ?, ?, ?, ?)",
+            [(meta.id, *trial) for trial in trials],
+        )
+
+
+def _trial_rows(cache, meta) -> list[tuple]:
+    with cache.meta_db() as conn:
+        return conn.execute(
+            "select timestamp, status_code from download_trials "
+            "where cache_id = ? order by rowid",
+            (meta.id,),
+        ).fetchall()
+
+
+def test_compaction_keeps_authoritative_and_recent_trials(temp_cache):
+    meta = _meta()
+    temp_cache.save_meta(meta)
+    _add_trials(
+        temp_cache,
+        meta,
+        (_OLD, "0", "F", "FAILED"),
+        (_OLD, "1", ".", "PASSED"),
+        (_OLD, "1", ".", "PASSED"),
+        (_OLD, "0", "F", "FAILED"),
+        (_OLD, "0", "D", "DUPLICATED"),
+        (_RECENT, "0", "F", "FAILED"),
+        (_OLD, "0", "D", "DUPLICATED"),
+    )
+
+    result = compact_meta_db(temp_cache, days=90)
+
+    assert result.trials_before == 7
+    assert result.trials_summarized == 5
+    # The last successful trial and the recent one, which is the last trial
+    # by timestamp although an older one was inserted after it, are kept
+    assert _trial_rows(temp_cache, meta) == [
+        (_OLD, "."),
+        (_RECENT, "F"),
+    ]
+    assert temp_cache.count_trials(meta) == 7
+    assert temp_cache.count_trials(meta, since=_RECENT) == 1
+    assert temp_cache.get_last_download_status(meta)["code"] == "F"
+    assert temp_cache.has_successful_trial(meta)
+    with temp_cache.meta_db() as conn:
+        rows = conn.execute(
+            "select template, status_code, trials from download_trials_summary "
+            "order by status_code"
+        ).fetchall()
+    assert rows == [
+        ("test-compaction", ".", 1),
+        ("test-compaction", "D", 2),
+        ("test-compaction", "F", 2),
+    ]
+
+
+def test_compaction_ranks_trials_by_timestamp(temp_cache):
+    meta = _meta()
+    older = (datetime.now() - timedelta(days=300)).isoformat()
+    # Rows out of timestamp order, as after a VACUUM renumbered them
+    _add_trials(
+        temp_cache,
+        meta,
+        (_OLD, "1", ".", "PASSED"),
+        (older, "1", ".", "PASSED"),
+        (_OLD, "0", "F", "FAILED"),
+        (older, "0", "F", "FAILED"),
+    )
+
+    compact_meta_db(temp_cache, days=90, vacuum=False)
+
+    assert _trial_rows(temp_cache, meta) == [(_OLD, "."), (_OLD, "F")]
+
+
+def test_repeated_compaction_accumulates_summaries(temp_cache):
+    meta = _meta()
+    _add_trials(temp_cache, meta, *[(_OLD, "0", "F", "FAILED")] * 3)
+    compact_meta_db(temp_cache, days=90, vacuum=False)
+    _add_trials(temp_cache, meta, *[(_OLD, "0", "F", "FAILED")] * 3)
+    compact_meta_db(temp_cache, days=90, vacuum=False)
+
+    assert len(_trial_rows(temp_cache, meta)) == 1
+    assert temp_cache.count_trials(meta) == 6
+
+    temp_cache._delete_trials(meta)
+    assert temp_cache.count_trials(meta) == 0
+
+
+def test_automatic_policy_runs_once_per_interval(temp_cache, policy):
+    meta = _meta()
+    _add_trials(temp_cache, meta, *[(_OLD, "0", "F", "FAILED")] * 3)
+    assert maybe_compact(temp_cache) is None
+
+    policy.update(auto=True, days=30, interval_days=7)
+    result = maybe_compact(temp_cache)
+    assert result is not None and result.trials_summarized == 2
+    assert maybe_compact(temp_cache) is None
+
+
+def test_cli_cache_compact(temp_cache, policy, capsys):
+    meta = _meta()
+    _add_trials(temp_cache, meta, *[(_OLD, "0", "F", "FAILED")] * 4)
+
+    cli.main(["cache", "compact", "--days", "10", "--no-vacuum"])
+
+    assert "Summarized 3 of 4 download trials (1 kept)." in capsys.readouterr().out
+    assert temp_cache.count_trials(meta) == 4
@@ -20,9 +20,11 @@ from brasa.util import (
     generate_checksum_for_template,
     generate_checksum_from_zip,
     is_iterable,
+    open_raw_file,
     parse_arg_value,
     unzip_and_get_content,
     unzip_file_to,
+    unzip_to_gzip,
 )
 
 
@@ -193,6 +195,66 @@ def test_unzip_file_to_rejects_path_traversal(tmp_path):
     assert not (tmp_path / "evil.txt").exists()
 
 
+def _zip_bytes(members):
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+def test_unzip_to_gzip_writes_flat_gzip_members(tmp_path):
+    archive = _make_zip_file(
+        tmp_path / "ok.zip", {"a.txt": "alpha", "sub/b.txt": "beta"}
+    )
+    dest = tmp_path / "out"
+    dest.mkdir()
+
+    files = unzip_to_gzip(str(archive), dest)
+
+    assert [f.rsplit("/", 1)[-1] for f in files] == ["a.txt.gz", "b.txt.gz"]
+    with open_raw_file(dest / "b.txt.gz") as fp:
+        assert fp.read() == b"beta"
+    assert sorted(p.name for p in dest.iterdir()) == ["a.txt.gz", "b.txt.gz"]
+
+
+def test_unzip_to_gzip_unwraps_nested_single_zip(tmp_path):
+    inner = _zip_bytes({"x.xml": "<a/>", "y.xml": "<b/>"})
+    archive = _make_zip_file(tmp_path / "outer.zip", {"inner.zip": inner})
+    dest = tmp_path / "out"
+    dest.mkdir()
+
+    files = unzip_to_gzip(str(archive), dest)
+
+    assert [f.rsplit("/", 1)[-1] for f in files] == ["x.xml.gz", "y.xml.gz"]
+    with open_raw_file(dest / "y.xml.gz", "rt") as fp:
+        assert fp.read() == "<b/>"
+
+
+def test_unzip_to_gzip_rejects_path_traversal(tmp_path):
+    archive = _make_zip_file(
+        tmp_path / "evil.zip", {"../evil.txt": "gotcha", "ok.txt": "fine"}
+    )
+    dest = tmp_path / "out"
+    dest.mkdir()
+
+    with pytest.raises(ValueError, match="outside"):
+        unzip_to_gzip(str(archive), dest)
+
+    assert list(dest.iterdir()) == []
+
+
+def test_unzip_to_gzip_caps_nesting_depth(tmp_path):
+    payload = _zip_bytes({"leaf.txt": "x"})
+    for i in range(10):
+        payload = _zip_bytes({f"level{i}.zip": payload})
+    dest = tmp_path / "out"
+    dest.mkdir()
+
+    with pytest.raises(RecursionError):
+        unzip_to_gzip(BytesIO(payload), dest)
+
+
 def test_unzip_and_get_content_reads_member(tmp_path):
     archive = _make_zip_file(tmp_path / "ok.zip", {"a.txt": "alpha"})
     assert unzip_and_get_content(str(archive)) == b"alpha"
@@ -0,0 +1,112 @@
+"""Tests for the batched metadata writes of ``CacheManager.write_behind``."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from brasa.engine.cache import CacheMetadata
+from brasa.util import DownloadArgs
+
+
+def _meta(i: int) -> CacheMetadata:
+    meta = CacheMetadata("test-write-behind")
+    meta.download_args = DownloadArgs({"i": i})
+    meta.download_checksum = f"chk-{i}"
+    return meta
+
+
+def _count(cache, table: str) -> int:
+    with cache.meta_db() as conn:
+        return conn.execute(f"select count(*) from {table}").fetchone()[0]
+
+
+def _is_processed(cache, meta) -> bool:
+    loaded = CacheMetadata(meta.template)
+    loaded.download_args = meta.download_args
+    cache.load_meta(loaded)
+    return loaded.is_processed
+
+
+def test_writes_are_batched_and_committed_on_exit(temp_cache):
+    with temp_cache.write_behind(batch_size=500, flush_interval=5) as buffer:
+        for i in range(1200):
+            meta = _meta(i)
+            temp_cache.save_trial(meta, downloaded=True)
+            temp_cache.save_meta(meta)
+        # Queued rows are visible to the entry lookups
+        assert temp_cache.has_meta(_meta(1199))
+
+    assert _count(temp_cache, "cache_metadata") == 1200
+    assert _count(temp_cache, "download_trials") == 1200
+    assert buffer.transactions == 5
+
+
+def test_queued_rows_read_through_until_written(temp_cache):
+    meta = _meta(1)
+    with temp_cache.write_behind(flush_interval=5):
+        temp_cache.save_meta(meta)
+        meta.mark_as_processed()
+        temp_cache.save_meta(meta)
+
+        loaded = CacheMetadata(meta.template)
+        loaded.download_args = meta.download_args
+        temp_cache.load_meta(loaded)
+        assert loaded.is_processed
+
+        temp_cache.clean_meta_db(meta)
+        assert not temp_cache.has_meta(meta)
+        temp_cache.save_meta(meta)
+
+    assert temp_cache.has_meta(meta)
+    assert _count(temp_cache, "cache_metadata") == 1
+
+
+def test_trial_queries_flush_the_queue(temp_cache):
+    meta = _meta(1)
+    with temp_cache.write_behind(flush_interval=5):
+        temp_cache.save_trial(meta, downloaded=False, status_code="D")
+        assert temp_cache.get_last_download_status(meta)["code"] == "D"
+        assert temp_cache.count_trials(meta) == 1
+
+
+def test_nested_blocks_share_one_buffer(temp_cache):
+    with temp_cache.write_behind() as outer:
+        with temp_cache.write_behind() as inner:
+            assert inner is outer
+        temp_cache.save_meta(_meta(1))
+        assert temp_cache._write_buffer is outer
+    assert temp_cache._write_buffer is None
+    assert _count(temp_cache, "cache_metadata") == 1
+
+
+def test_writer_errors_surface_on_exit(temp_cache):
+    with (
+        pytest.raises(sqlite3.OperationalError),
+        temp_cache.write_behind(flush_interval=5),
+    ):
+        temp_cache._write("insert into missing_table values (?)", (1,))
+
+
+def test_process_marketdata_marks_entries_after_reading(temp_cache):
+    from brasa.engine.api import process_marketdata
+
+    template = "b3-cotahist-daily"
+    for i in range(3):
+        meta = _meta(i)
+        meta.template = template
+        temp_cache.save_meta(meta)
+
+    def fake_read(meta):
+        # Nothing is marked processed while the entry is being read
+        assert not temp_cache.has_meta(meta) or not _is_processed(temp_cache, meta)
+        meta.mark_as_processed()
+
+    with patch("brasa.engine.processing._read_marketdata", side_effect=fake_read):
+        report = process_marketdata(template, max_workers=2)
+
+    assert len(report.results) == 3
+    with temp_cache.meta_db() as conn:
+        assert conn.execute(
+            "select count(*) from cache_metadata where is_processed = 1"
+        ).fetchone() == (3,)